@@ -15,6 +15,8 @@ from .api import (
     GithubRelease,
     GithubReleaseAssets,
     GithubRepo,
+    GithubRequestScheduler,
+    GithubResponseCache,
     GithubTag,
     GithubWorkflows)
 from .abstract import (
@@ -29,10 +31,13 @@ from .abstract import (
     AGithubRelease,
     AGithubReleaseAssets,
     AGithubRepo,
+    AGithubRequestScheduler,
+    AGithubResponseCache,
     AGithubTag,
     AGithubTrackedIssue,
     AGithubTrackedIssues,
-    AGithubWorkflows)
+    AGithubWorkflows,
+    GithubScheduledAPI)
 from .interface import (
     IGithubActions,
     IGithubAPI,
@@ -45,6 +50,8 @@ from .interface import (
     IGithubRelease,
     IGithubReleaseAssets,
     IGithubRepo,
+    IGithubRequestScheduler,
+    IGithubResponseCache,
     IGithubTag,
     IGithubTrackedIssue,
     IGithubTrackedIssues,
@@ -64,6 +71,8 @@ __all__ = (
     "AGithubRelease",
     "AGithubReleaseAssets",
     "AGithubRepo",
+    "AGithubRequestScheduler",
+    "AGithubResponseCache",
     "AGithubTag",
     "AGithubTrackedIssue",
     "AGithubTrackedIssues",
@@ -79,6 +88,9 @@ __all__ = (
     "GithubRelease",
     "GithubReleaseAssets",
     "GithubRepo",
+    "GithubRequestScheduler",
+    "GithubResponseCache",
+    "GithubScheduledAPI",
     "GithubTag",
     "GithubWorkflows",
     "IGithubActions",
@@ -92,6 +104,8 @@ __all__ = (
     "IGithubRelease",
     "IGithubReleaseAssets",
     "IGithubRepo",
+    "IGithubRequestScheduler",
+    "IGithubResponseCache",
     "IGithubTag",
     "IGithubTrackedIssue",
     "IGithubTrackedIssues",
@@ -1,5 +1,6 @@
 
 from .actions import AGithubActions, AGithubWorkflows
+from .cache import AGithubResponseCache
 from .api import AGithubAPI
 from .commit import AGithubCommit
 from .issues import (
@@ -12,6 +13,7 @@ from .iterator import AGithubIterator
 from .label import AGithubLabel
 from .release import AGithubRelease, AGithubReleaseAssets
 from .repo import AGithubRepo
+from .scheduler import AGithubRequestScheduler, GithubScheduledAPI
 from .tag import AGithubTag
 
 
@@ -27,7 +29,10 @@ __all__ = (
     "AGithubRelease",
     "AGithubReleaseAssets",
     "AGithubRepo",
+    "AGithubResponseCache",
+    "AGithubRequestScheduler",
     "AGithubTag",
     "AGithubTrackedIssue",
     "AGithubTrackedIssues",
-    "AGithubWorkflows")
+    "AGithubWorkflows",
+    "GithubScheduledAPI")
@@ -1,7 +1,7 @@
 
 import abc
 from functools import cached_property
-from typing import Any, Type
+from typing import Any, Optional, Type
 
 import aiohttp
 
@@ -11,7 +11,7 @@ import gidgethub.aiohttp
 
 import abstracts
 
-from aio.api.github import interface
+from aio.api.github import abstract, interface
 
 
 @abstracts.implementer(interface.IGithubAPI)
@@ -28,6 +28,8 @@ class AGithubAPI(metaclass=abstracts.Abstraction):
             session: aiohttp.ClientSession,
             *args, **kwargs) -> None:
         self._session = session
+        self.scheduler: Optional[interface.IGithubRequestScheduler] = (
+            kwargs.pop("scheduler", None))
         self.args = args
         self.kwargs = kwargs
 
@@ -43,17 +45,25 @@ class AGithubAPI(metaclass=abstracts.Abstraction):
 
     @cached_property
     def api(self) -> gidgethub.aiohttp.GitHubAPI:
-        """Gidgethub API."""
+        """Gidgethub API.
+
+        If a `scheduler` was provided, requests made by the API are
+        scheduled with it.
+        """
+        kwargs = (
+            dict(self.kwargs, scheduler=self.scheduler)
+            if self.scheduler
+            else self.kwargs)
         return self.api_class(
             self.session,
             *self.args,
-            **self.kwargs)
+            **kwargs)
 
     @property
     @abc.abstractmethod
     def api_class(self) -> Type[gidgethub.aiohttp.GitHubAPI]:
         """API class."""
-        return gidgethub.aiohttp.GitHubAPI
+        return abstract.GithubScheduledAPI
 
     @property  # type:ignore
     @abstracts.interfacemethod
@@ -0,0 +1,148 @@
+
+import json
+import pathlib
+import sqlite3
+import time
+from functools import cached_property
+from typing import Iterator, MutableMapping, Optional, Union
+
+import abstracts
+
+from aio.api.github import interface, typing
+
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    data TEXT NOT NULL,
+    more TEXT,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS responses_accessed
+    ON responses (accessed_at);
+"""
+CACHE_TIMEOUT = 60
+# Responses are revalidated with every request, but are dropped if they
+# have not been stored for this long.
+DEFAULT_TTL = 60 * 60 * 24 * 7
+DEFAULT_MAX_SIZE = 100 * 2 ** 20
+
+
+@abstracts.implementer(interface.IGithubResponseCache)
+class AGithubResponseCache(
+        MutableMapping[str, "typing.GithubCachedResponse"],
+        metaclass=abstracts.Abstraction):
+    """On-disk cache of Github API responses.
+
+    This is a mapping of URLs to `(etag, last_modified, data, more)`, as
+    used by the `cache` of a gidgethub API. Gidgethub sends conditional
+    requests for cached URLs, and uses the cached data if the response is
+    `304 Not Modified`. These responses do not count against the rate
+    limit.
+
+    Responses expire after `ttl` seconds, and the least recently used are
+    evicted when the stored data exceeds `max_size` bytes.
+
+    If `bypass` is set, cached responses are not used, but responses are
+    still stored.
+    """
+
+    def __init__(
+            self,
+            path: Union[str, pathlib.Path],
+            ttl: Optional[float] = None,
+            max_size: Optional[int] = None,
+            bypass: bool = False) -> None:
+        self._path = path
+        self.ttl = (
+            ttl
+            if ttl is not None
+            else DEFAULT_TTL)
+        self.max_size = (
+            max_size
+            if max_size is not None
+            else DEFAULT_MAX_SIZE)
+        self.bypass = bypass
+
+    def __delitem__(self, url: str) -> None:
+        with self.connection:
+            deleted = self.connection.execute(
+                "DELETE FROM responses WHERE url = ?",
+                (url, )).rowcount
+        if not deleted:
+            raise KeyError(url)
+
+    def __getitem__(self, url: str) -> "typing.GithubCachedResponse":
+        if self.bypass:
+            raise KeyError(url)
+        row = self.connection.execute(
+            "SELECT etag, last_modified, data, more, stored_at "
+            "FROM responses WHERE url = ?",
+            (url, )).fetchone()
+        if not row:
+            raise KeyError(url)
+        etag, last_modified, data, more, stored_at = row
+        now = time.time()
+        if now - stored_at > self.ttl:
+            del self[url]
+            raise KeyError(url)
+        with self.connection:
+            self.connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?",
+                (now, url))
+        return etag, last_modified, json.loads(data), more
+
+    def __iter__(self) -> Iterator[str]:
+        for (url, ) in self.connection.execute("SELECT url FROM responses"):
+            yield url
+
+    def __len__(self) -> int:
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __setitem__(
+            self,
+            url: str,
+            response: "typing.GithubCachedResponse") -> None:
+        etag, last_modified, data, more = response
+        data = json.dumps(data)
+        now = time.time()
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, data, more,
+                 len(data), now, now))
+            self.evict(now)
+
+    @cached_property
+    def connection(self) -> sqlite3.Connection:
+        """Connection to the cache database, creating it if required."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=CACHE_TIMEOUT)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(CACHE_SCHEMA)
+        return connection
+
+    @cached_property
+    def path(self) -> pathlib.Path:
+        """Path to the cache database."""
+        return pathlib.Path(self._path)
+
+    def evict(self, now: float) -> None:
+        """Remove expired responses, and the least recently used responses
+        that exceed the `max_size`."""
+        self.connection.execute(
+            "DELETE FROM responses WHERE stored_at < ?",
+            (now - self.ttl, ))
+        self.connection.execute(
+            "DELETE FROM responses WHERE url IN ("
+            "SELECT url FROM ("
+            "SELECT url, SUM(size) OVER ("
+            "ORDER BY accessed_at DESC, url) AS total "
+            "FROM responses) "
+            "WHERE total > ?)",
+            (self.max_size, ))
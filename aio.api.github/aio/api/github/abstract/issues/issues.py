@@ -107,10 +107,12 @@ class AGithubIssues(metaclass=abstracts.Abstraction):
             self,
             query: str,
             repo: Optional[
-                interface.IGithubRepo] = None) -> interface.IGithubIterator:
+                interface.IGithubRepo] = None,
+            **kwargs) -> interface.IGithubIterator:
         return self.github.getiter(
             self.search_query(query),
-            inflate=self.inflater(repo))
+            inflate=self.inflater(repo),
+            **kwargs)
 
     def search_query(self, query: str) -> str:
         """Generate a search query."""
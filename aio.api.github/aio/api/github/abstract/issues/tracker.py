@@ -226,7 +226,8 @@ class AGithubTrackedIssues(metaclass=abstracts.Abstraction):
 
     def iter_issues(self) -> "interface.IGithubIterator":
         return self.repo.issues.search(
-            self.issues_search_tpl.format(self=self))
+            self.issues_search_tpl.format(self=self),
+            parallel=True)
 
     def track_issue(
             self,
@@ -1,5 +1,8 @@
 
-from typing import Any, AsyncGenerator, Dict, Mapping, Tuple
+import math
+import urllib.parse
+from functools import cached_property
+from typing import Any, AsyncGenerator, Dict, List, Mapping, Optional, Tuple
 
 import gidgethub.abc
 import gidgethub.sansio
@@ -7,13 +10,24 @@ import gidgethub.sansio
 import abstracts
 
 from aio.core.functional import async_property
+from aio.core.tasks import concurrent
 
 from aio.api.github import interface
 
 
+# Github's maximum page size.
+PARALLEL_PER_PAGE = 100
+
+
 @abstracts.implementer(interface.IGithubIterator)
 class AGithubIterator(metaclass=abstracts.Abstraction):
-    """Async iterator to wrap gidgethub API and provide `total_count`."""
+    """Async iterator to wrap gidgethub API and provide `total_count`.
+
+    If `parallel` is set, the number of pages is found from the
+    `total_count`, and the pages are then fetched concurrently, up to
+    `concurrency` at a time. Items are yielded in order, unless `ordered`
+    is `False`, in which case each page is yielded as it arrives.
+    """
 
     def __init__(
             self,
@@ -26,10 +40,16 @@ class AGithubIterator(metaclass=abstracts.Abstraction):
         self.args = args
         self.kwargs = kwargs
         self._inflate = kwargs.pop("inflate", None)
+        self.parallel = kwargs.pop("parallel", False)
+        self.ordered = kwargs.pop("ordered", True)
+        self.concurrency: Optional[int] = kwargs.pop("concurrency", None)
 
     async def __aiter__(self) -> AsyncGenerator[Any, None]:
-        aiter = self.api.getiter(
-            self.query, *self.args, **self.kwargs)
+        aiter = (
+            self.iter_pages()
+            if self.parallel
+            else self.api.getiter(
+                self.query, *self.args, **self.kwargs))
         async for item in aiter:
             yield self.inflate(item)
 
@@ -47,10 +67,20 @@ class AGithubIterator(metaclass=abstracts.Abstraction):
     def count_url(self) -> str:
         """Request URL for API call to get `total_count`."""
         return gidgethub.sansio.format_url(
-            f"{self.query}&per_page=1",
+            self.page_query(per_page=1),
             {},
             base_url=self.api.base_url)
 
+    @cached_property
+    def per_page(self) -> int:
+        """Page size, as set in the query or the maximum for parallel
+        requests."""
+        params = urllib.parse.parse_qs(urllib.parse.urlsplit(self.query).query)
+        return (
+            int(params["per_page"][-1])
+            if "per_page" in params
+            else PARALLEL_PER_PAGE)
+
     @async_property(cache=True)
     async def total_count(self) -> int:
         # https://github.com/brettcannon/gidgethub/discussions/153
@@ -80,20 +110,70 @@ class AGithubIterator(metaclass=abstracts.Abstraction):
     def count_from_response(
             self,
             response: Tuple[int, Mapping[str, str], bytes]) -> int:
-        """Get total count from the headers or data."""
+        """Get total count from the headers or data.
+
+        A list response without a `Link` header fits on a single page, and
+        its items are counted.
+        """
 
         (data,
          self.api.rate_limit,
          more) = gidgethub.sansio.decipher_response(*response)
 
+        if "Link" in response[1]:
+            return self.count_from_headers(response[1])
         return (
-            self.count_from_headers(response[1])
-            if "Link" in response[1]
+            len(data)
+            if isinstance(data, list)
             else self.count_from_data(data))
 
+    async def fetch_page(self, page: int) -> Tuple[int, List[Any]]:
+        """Fetch the items for a page."""
+        data = await self.api.getitem(
+            self.page_query(per_page=self.per_page, page=page),
+            *self.args,
+            **self.kwargs)
+        return (
+            page,
+            (data["items"]
+             if isinstance(data, dict)
+             else data))
+
     def inflate(self, result: Any) -> Any:
         """Inflate a result."""
         return (
             self._inflate(result)
             if self._inflate
             else result)
+
+    async def iter_pages(self) -> AsyncGenerator[Any, None]:
+        """Fetch pages concurrently, and yield their items."""
+        pages = math.ceil(await self.total_count / self.per_page)
+        fetched: Dict[int, List[Any]] = {}
+        next_page = 1
+        results = concurrent(
+            (self.fetch_page(page)
+             for page
+             in range(1, pages + 1)),
+            limit=self.concurrency)
+        async for page, items in results:
+            if not self.ordered:
+                for item in items:
+                    yield item
+                continue
+            fetched[page] = items
+            while next_page in fetched:
+                for item in fetched.pop(next_page):
+                    yield item
+                next_page += 1
+
+    def page_query(self, **params: int) -> str:
+        """Query with the provided paging params."""
+        parts = urllib.parse.urlsplit(self.query)
+        query = dict(urllib.parse.parse_qsl(parts.query))
+        query.update({k: str(v) for k, v in params.items()})
+        return urllib.parse.urlunsplit(
+            parts._replace(
+                query=urllib.parse.urlencode(
+                    query,
+                    quote_via=urllib.parse.quote)))
@@ -61,13 +61,15 @@ class AGithubRepo(metaclass=abstracts.Abstraction):
 
     def commits(
             self,
-            since: Optional[datetime] = None) -> "interface.IGithubIterator":
+            since: Optional[datetime] = None,
+            **kwargs) -> "interface.IGithubIterator":
         query = "commits"
         if since is not None:
             query = f"{query}?since={utils.dt_to_js_isoformat(since)}"
         return self.getiter(
             query,
-            inflate=partial(self.github.commit_class, self))
+            inflate=partial(self.github.commit_class, self),
+            **kwargs)
 
     async def create_release(
             self,
@@ -163,12 +165,13 @@ class AGithubRepo(metaclass=abstracts.Abstraction):
             self,
             await self.getitem(f"releases/tags/{name}"))
 
-    def releases(self) -> "interface.IGithubIterator":
+    def releases(self, **kwargs) -> "interface.IGithubIterator":
         """Iterate releases for this repo."""
         # TODO: make per_page configurable
         return self.iter_entities(
             self.github.release_class,
-            "releases?per_page=100")
+            "releases?per_page=100",
+            **kwargs)
 
     async def tag(self, name: str) -> "interface.IGithubTag":
         ref_tag = await self.getitem(f"git/ref/tags/{name}")
@@ -0,0 +1,184 @@
+
+import asyncio
+import functools
+import logging
+import time
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Dict, Mapping, Optional, Tuple
+
+import gidgethub
+import gidgethub.aiohttp
+import gidgethub.sansio
+
+import abstracts
+
+from aio.api.github import interface, typing
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 10
+DEFAULT_RETRIES = 3
+# Longest rate limit pause to wait for before giving up on a request.
+MAX_WAIT = 900
+# Github does not say how long to wait after hitting a secondary rate limit
+# without a `retry-after` header, other than "at least one minute".
+SECONDARY_RATE_LIMIT_WAIT = 60
+
+
+@abstracts.implementer(interface.IGithubRequestScheduler)
+class AGithubRequestScheduler(metaclass=abstracts.Abstraction):
+    """Limits, and pause state, for scheduling requests to the Github API.
+
+    Requests are scheduled by the `GithubScheduledAPI`, so that one
+    scheduler can be shared by several APIs.
+    """
+
+    def __init__(
+            self,
+            limit: Optional[int] = None,
+            retries: Optional[int] = None,
+            max_wait: Optional[float] = None) -> None:
+        self.limit = limit or DEFAULT_LIMIT
+        self.retries = (
+            retries
+            if retries is not None
+            else DEFAULT_RETRIES)
+        self.max_wait = (
+            max_wait
+            if max_wait is not None
+            else MAX_WAIT)
+        self._resume_at = 0.
+
+    @cached_property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore to limit concurrent requests."""
+        return asyncio.Semaphore(self.limit)
+
+    def pause(self, wait: float) -> None:
+        """Pause all requests for `wait` seconds."""
+        self._resume_at = max(
+            self._resume_at,
+            time.monotonic() + wait)
+
+    async def resumed(self) -> None:
+        """Wait until requests are no longer paused."""
+        while (wait := self._resume_at - time.monotonic()) > 0:
+            await asyncio.sleep(wait)
+
+
+class GithubScheduledAPI(gidgethub.aiohttp.GitHubAPI):
+    """Gidgethub API that schedules its requests with a `scheduler`.
+
+    Shares the responses of identical in-flight `GET` requests, limits the
+    number of concurrent requests, and pauses all requests when a rate
+    limit is hit, before retrying the rate-limited request.
+
+    Without a `scheduler`, requests are made as normal.
+    """
+
+    def __init__(
+            self,
+            *args,
+            scheduler: Optional[interface.IGithubRequestScheduler] = None,
+            **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.scheduler = scheduler
+        self._in_flight: Dict[Tuple, asyncio.Future] = {}
+
+    def backoff(self, exception: gidgethub.HTTPException) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited request, or `None`
+        if the request was not rate-limited."""
+        if exception.status_code not in (403, 429):
+            return None
+        if "retry-after" in exception.headers:
+            return float(exception.headers["retry-after"])
+        if isinstance(exception, gidgethub.RateLimitExceeded):
+            return max(self.until_reset(exception.rate_limit), 0) + 1
+        return (
+            SECONDARY_RATE_LIMIT_WAIT
+            if exception.status_code == 429
+            else None)
+
+    async def handle_rate_limit_error(
+            self,
+            *,
+            method: str,
+            url: str,
+            exception: gidgethub.HTTPException,
+            attempt: int) -> bool:
+        """Pause all requests, and retry the request, if it was
+        rate-limited."""
+        if not self.scheduler:
+            return await super().handle_rate_limit_error(
+                method=method,
+                url=url,
+                exception=exception,
+                attempt=attempt)
+        wait = self.backoff(exception)
+        should_retry = (
+            wait is not None
+            and attempt <= self.scheduler.retries
+            and wait <= self.scheduler.max_wait)
+        if should_retry:
+            logger.warning(
+                f"Github rate limit hit, pausing requests for {wait:.0f}s: "
+                f"{url}")
+            self.scheduler.pause(wait)
+        return should_retry
+
+    async def manage_rate_limit(self, *, method: str, url: str) -> None:
+        """Pause all requests until the rate limit resets, if it has been
+        used up."""
+        if not self.scheduler or self.rate_limit is None:
+            return
+        # `remaining` has already been decremented for this request.
+        if self.rate_limit.remaining < 0:
+            wait = self.until_reset(self.rate_limit)
+            if 0 < wait <= self.scheduler.max_wait:
+                self.scheduler.pause(wait + 1)
+
+    def until_reset(self, rate_limit: gidgethub.sansio.RateLimit) -> float:
+        """Seconds until a rate limit resets."""
+        return (
+            rate_limit.reset_datetime
+            - datetime.now(timezone.utc)).total_seconds()
+
+    async def _request(
+            self,
+            method: str,
+            url: str,
+            headers: Mapping[str, str],
+            body: bytes = b"") -> "typing.GithubResponseTuple":
+        if not self.scheduler:
+            return await super()._request(method, url, headers, body)
+        if method != "GET" or body:
+            return await self._scheduled_request(
+                self.scheduler, method, url, headers, body)
+        key = (url, tuple(sorted(headers.items())))
+        if key not in self._in_flight:
+            task = asyncio.ensure_future(
+                self._scheduled_request(
+                    self.scheduler, method, url, headers, body))
+            self._in_flight[key] = task
+            task.add_done_callback(
+                functools.partial(self._forget, key))
+        # Shielded so that a cancelled caller does not cancel the request
+        # for other callers.
+        return await asyncio.shield(self._in_flight[key])
+
+    def _forget(self, key: Tuple, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    async def _scheduled_request(
+            self,
+            scheduler: interface.IGithubRequestScheduler,
+            method: str,
+            url: str,
+            headers: Mapping[str, str],
+            body: bytes) -> "typing.GithubResponseTuple":
+        async with scheduler.semaphore:
+            await scheduler.resumed()
+            return await super()._request(method, url, headers, body)
@@ -16,6 +16,8 @@ from .abstract import (
     AGithubRelease,
     AGithubReleaseAssets,
     AGithubRepo,
+    AGithubRequestScheduler,
+    AGithubResponseCache,
     AGithubTag,
     AGithubWorkflows)
 from . import interface
@@ -74,6 +76,16 @@ class GithubRepo(AGithubRepo):
     pass
 
 
+@abstracts.implementer(interface.IGithubRequestScheduler)
+class GithubRequestScheduler(AGithubRequestScheduler):
+    pass
+
+
+@abstracts.implementer(interface.IGithubResponseCache)
+class GithubResponseCache(AGithubResponseCache):
+    pass
+
+
 @abstracts.implementer(interface.IGithubTag)
 class GithubTag(AGithubTag):
     pass
@@ -1,4 +1,5 @@
 
+import asyncio
 from datetime import datetime
 from typing import (
     Any, AsyncGenerator, Dict,
@@ -71,6 +72,42 @@ class IGithubIterator(metaclass=abstracts.Interface):
         raise NotImplementedError
 
 
+class IGithubResponseCache(metaclass=abstracts.Interface):
+
+    @abstracts.interfacemethod
+    def __getitem__(self, url: str) -> Tuple:
+        """Cached `(etag, last_modified, data, more)` for a URL."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def __setitem__(self, url: str, response: Tuple) -> None:
+        """Cache `(etag, last_modified, data, more)` for a URL."""
+        raise NotImplementedError
+
+
+class IGithubRequestScheduler(metaclass=abstracts.Interface):
+    # Number of times to retry a rate-limited request.
+    retries: int
+    # Longest rate limit pause to wait for before giving up on a request.
+    max_wait: float
+
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def semaphore(self) -> asyncio.Semaphore:
+        """Semaphore to limit concurrent requests."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def pause(self, wait: float) -> None:
+        """Pause all requests for `wait` seconds."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    async def resumed(self) -> None:
+        """Wait until requests are no longer paused."""
+        raise NotImplementedError
+
+
 class IGithubAPI(metaclass=abstracts.Interface):
 
     @abstracts.interfacemethod
@@ -202,7 +239,10 @@ class IGithubRepo(metaclass=abstracts.Interface):
         raise NotImplementedError
 
     @abstracts.interfacemethod
-    def commits(self, since: Optional[datetime] = None) -> IGithubIterator:
+    def commits(
+            self,
+            since: Optional[datetime] = None,
+            **kwargs) -> IGithubIterator:
         """Iterate commits for this repo."""
         raise NotImplementedError
 
@@ -241,7 +281,7 @@ class IGithubRepo(metaclass=abstracts.Interface):
         raise NotImplementedError
 
     @abstracts.interfacemethod
-    async def releases(self, name: str) -> "IGithubIterator":
+    def releases(self, **kwargs) -> "IGithubIterator":
         """Fetch releases for this repo."""
         raise NotImplementedError
 
@@ -328,7 +368,8 @@ class IGithubIssues(metaclass=abstracts.Interface):
     def search(
             self,
             query: str,
-            repo: Optional[IGithubRepo] = None) -> IGithubIterator:
+            repo: Optional[IGithubRepo] = None,
+            **kwargs) -> IGithubIterator:
         """Search for issues."""
         raise NotImplementedError
 
@@ -1,5 +1,14 @@
 
-from typing import Optional, TypedDict
+from typing import (
+    Any, Awaitable, Callable, Mapping, Optional, Tuple, TypedDict)
+
+
+# (etag, last_modified, data, more)
+GithubCachedResponse = Tuple[Optional[str], Optional[str], Any, Optional[str]]
+GithubResponseTuple = Tuple[int, Mapping[str, str], bytes]
+GithubRequest = Callable[
+    [str, str, Mapping[str, str], bytes],
+    Awaitable[GithubResponseTuple]]
 
 
 class AssetUploadResultDict(TypedDict, total=False):
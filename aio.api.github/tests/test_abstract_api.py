@@ -3,8 +3,6 @@ from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
 
-import gidgethub.aiohttp
-
 import abstracts
 
 from aio.api import github
@@ -71,6 +69,7 @@ def test_abstract_api_constructor(args, kwargs):
     assert api.session == "SESSION"
     assert api.args == args
     assert api.kwargs == kwargs
+    assert api.scheduler is None
     props = (
         "actions", "commit", "issue", "issues", "iterator",
         "label", "release", "repo", "tag", "workflows")
@@ -79,10 +78,17 @@ def test_abstract_api_constructor(args, kwargs):
         with pytest.raises(NotImplementedError):
             getattr(api, f"{prop}_class")
 
-    assert api.api_class == gidgethub.aiohttp.GitHubAPI
+    assert api.api_class == github.GithubScheduledAPI
     assert "api_class" not in api.__dict__
 
 
+def test_abstract_api_constructor_scheduler():
+    api = DummyGithubAPI("SESSION", "ARG", scheduler="SCHEDULER", K="V")
+    assert api.scheduler == "SCHEDULER"
+    assert api.args == ("ARG", )
+    assert api.kwargs == dict(K="V")
+
+
 def test_abstract_api_dunder_getitem(patches):
     api = DummyGithubAPI("SESSION")
     patched = patches(
@@ -98,10 +104,15 @@ def test_abstract_api_dunder_getitem(patches):
         == [(api, "REPO"), {}])
 
 
-def test_abstract_api_api(iters, patches):
+@pytest.mark.parametrize("scheduler", [True, False])
+def test_abstract_api_api(iters, patches, scheduler):
     args = iters(tuple, count=3)
     kwargs = iters(dict, count=3)
-    api = DummyGithubAPI("SESSION", *args, **kwargs)
+    _scheduler = (
+        MagicMock()
+        if scheduler
+        else None)
+    api = DummyGithubAPI("SESSION", *args, scheduler=_scheduler, **kwargs)
     patched = patches(
         ("AGithubAPI.api_class",
          dict(new_callable=PropertyMock)),
@@ -114,7 +125,10 @@ def test_abstract_api_api(iters, patches):
 
     assert (
         m_api_class.return_value.call_args
-        == [("SESSION", *args), kwargs])
+        == [("SESSION", *args),
+            (dict(kwargs, scheduler=_scheduler)
+             if scheduler
+             else kwargs)])
 
     assert "api" in api.__dict__
 
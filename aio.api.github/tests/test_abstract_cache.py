@@ -0,0 +1,198 @@
+
+import json
+from unittest.mock import PropertyMock
+
+import pytest
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import abstracts
+
+from aio.api import github
+from aio.api.github.abstract import cache as _cache
+
+
+@abstracts.implementer(github.AGithubResponseCache)
+class DummyGithubResponseCache:
+    pass
+
+
+@pytest.mark.parametrize("ttl", [None, 0, 23])
+@pytest.mark.parametrize("max_size", [None, 0, 17])
+@pytest.mark.parametrize("bypass", [None, False, True])
+def test_cache_constructor(ttl, max_size, bypass):
+    kwargs = {}
+    if ttl is not None:
+        kwargs["ttl"] = ttl
+    if max_size is not None:
+        kwargs["max_size"] = max_size
+    if bypass is not None:
+        kwargs["bypass"] = bypass
+    cache = DummyGithubResponseCache("PATH", **kwargs)
+    assert cache._path == "PATH"
+    assert (
+        cache.ttl
+        == (ttl
+            if ttl is not None
+            else _cache.DEFAULT_TTL))
+    assert (
+        cache.max_size
+        == (max_size
+            if max_size is not None
+            else _cache.DEFAULT_MAX_SIZE))
+    assert cache.bypass == bool(bypass)
+
+
+def test_cache_connection(patches):
+    cache = DummyGithubResponseCache("PATH")
+    patched = patches(
+        "sqlite3",
+        ("AGithubResponseCache.path",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.api.github.abstract.cache")
+
+    with patched as (m_sqlite, m_path):
+        connection = m_sqlite.connect.return_value
+        assert cache.connection == connection
+
+    assert (
+        m_path.return_value.parent.mkdir.call_args
+        == [(), dict(parents=True, exist_ok=True)])
+    assert (
+        m_sqlite.connect.call_args
+        == [(m_path.return_value, ),
+            dict(timeout=_cache.CACHE_TIMEOUT)])
+    assert (
+        connection.execute.call_args
+        == [("PRAGMA journal_mode=WAL", ), {}])
+    assert (
+        connection.executescript.call_args
+        == [(_cache.CACHE_SCHEMA, ), {}])
+    assert "connection" in cache.__dict__
+
+
+def test_cache_path(patches):
+    cache = DummyGithubResponseCache("PATH")
+    patched = patches(
+        "pathlib",
+        prefix="aio.api.github.abstract.cache")
+
+    with patched as (m_plib, ):
+        assert cache.path == m_plib.Path.return_value
+
+    assert (
+        m_plib.Path.call_args
+        == [("PATH", ), {}])
+    assert "path" in cache.__dict__
+
+
+def test_cache_roundtrip(tmp_path):
+    cache = DummyGithubResponseCache(tmp_path / "cache" / "github.db")
+    assert len(cache) == 0
+    with pytest.raises(KeyError):
+        cache["URL1"]
+    cache["URL1"] = ("ETAG1", None, dict(foo="bar"), None)
+    cache["URL2"] = (None, "MODIFIED2", ["baz"], "NEXT")
+    assert cache["URL1"] == ("ETAG1", None, dict(foo="bar"), None)
+    assert cache["URL2"] == (None, "MODIFIED2", ["baz"], "NEXT")
+    assert sorted(cache) == ["URL1", "URL2"]
+    assert len(cache) == 2
+    cache["URL1"] = ("ETAG3", None, "UPDATED", None)
+    assert cache["URL1"] == ("ETAG3", None, "UPDATED", None)
+    del cache["URL1"]
+    with pytest.raises(KeyError):
+        del cache["URL1"]
+    assert list(cache) == ["URL2"]
+
+    reopened = DummyGithubResponseCache(tmp_path / "cache" / "github.db")
+    assert reopened["URL2"] == (None, "MODIFIED2", ["baz"], "NEXT")
+    bypassed = DummyGithubResponseCache(
+        tmp_path / "cache" / "github.db",
+        bypass=True)
+    with pytest.raises(KeyError):
+        bypassed["URL2"]
+    bypassed["URL3"] = ("ETAG3", None, "DATA3", None)
+    assert reopened["URL3"] == ("ETAG3", None, "DATA3", None)
+
+
+def test_cache_ttl(patches, tmp_path):
+    cache = DummyGithubResponseCache(tmp_path / "github.db", ttl=10)
+    patched = patches(
+        "time",
+        prefix="aio.api.github.abstract.cache")
+
+    with patched as (m_time, ):
+        m_time.time.return_value = 1000
+        cache["URL1"] = ("ETAG1", None, "DATA1", None)
+        m_time.time.return_value = 1005
+        cache["URL2"] = ("ETAG2", None, "DATA2", None)
+        m_time.time.return_value = 1010
+        assert cache["URL1"] == ("ETAG1", None, "DATA1", None)
+        m_time.time.return_value = 1011
+        with pytest.raises(KeyError):
+            cache["URL1"]
+        assert list(cache) == ["URL2"]
+        m_time.time.return_value = 1016
+        cache["URL3"] = ("ETAG3", None, "DATA3", None)
+        assert list(cache) == ["URL3"]
+
+
+def test_cache_max_size(patches, tmp_path):
+    data = "X" * 8
+    size = len(json.dumps(data))
+    cache = DummyGithubResponseCache(
+        tmp_path / "github.db",
+        max_size=size * 3)
+    patched = patches(
+        "time",
+        prefix="aio.api.github.abstract.cache")
+
+    with patched as (m_time, ):
+        for i in range(0, 3):
+            m_time.time.return_value = 1000 + i
+            cache[f"URL{i}"] = (f"ETAG{i}", None, data, None)
+        assert sorted(cache) == ["URL0", "URL1", "URL2"]
+        m_time.time.return_value = 1003
+        cache["URL0"]
+        m_time.time.return_value = 1004
+        cache["URL3"] = ("ETAG3", None, data, None)
+        assert sorted(cache) == ["URL0", "URL2", "URL3"]
+        m_time.time.return_value = 1005
+        cache["URL4"] = ("ETAG4", None, data * 2, None)
+        assert sorted(cache) == ["URL3", "URL4"]
+
+
+async def test_cache_github_api(tmp_path):
+    etag = '"ETAG"'
+    requests = []
+
+    async def handler(request):
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(
+            dict(tag_name="v1.0"),
+            headers={"ETag": etag})
+
+    app = web.Application()
+    app.router.add_get("/repos/foo/bar/releases/tags/v1.0", handler)
+
+    async with TestServer(app) as server:
+        base_url = str(server.make_url("")).rstrip("/")
+        async with aiohttp.ClientSession() as session:
+            # A new cache for each "run".
+            for bypass in (False, False, True, False):
+                api = github.GithubAPI(
+                    session, "",
+                    base_url=base_url,
+                    cache=DummyGithubResponseCache(
+                        tmp_path / "github.db",
+                        bypass=bypass))
+                assert (
+                    await api.getitem("/repos/foo/bar/releases/tags/v1.0")
+                    == dict(tag_name="v1.0"))
+
+    # Once cached, requests are conditional, unless the cache is bypassed.
+    assert requests == [None, etag, None, etag]
@@ -320,7 +320,8 @@ def test_abstract_issues_inflater(patches, repo1, repo2):
 
 
 @pytest.mark.parametrize("repo", [None, "REPO"])
-def test_abstract_issues_search(patches, repo):
+@pytest.mark.parametrize("kwargs", [{}, dict(parallel=True)])
+def test_abstract_issues_search(patches, repo, kwargs):
     github = MagicMock()
     args = (
         (repo, )
@@ -334,13 +335,13 @@ def test_abstract_issues_search(patches, repo):
 
     with patched as (m_inflater, m_query):
         assert (
-            issues.search("QUERY", *args)
+            issues.search("QUERY", *args, **kwargs)
             == github.getiter.return_value)
 
     assert (
         github.getiter.call_args
         == [(m_query.return_value, ),
-            dict(inflate=m_inflater.return_value)])
+            dict(inflate=m_inflater.return_value, **kwargs)])
     assert (
         m_query.call_args
         == [("QUERY", ), {}])
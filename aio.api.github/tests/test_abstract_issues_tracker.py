@@ -569,7 +569,8 @@ def test_abstract_tracked_issues_iter_issues(patches):
 
     assert (
         m_repo.return_value.issues.search.call_args
-        == [(m_issues_search.return_value.format.return_value, ), {}])
+        == [(m_issues_search.return_value.format.return_value, ),
+            dict(parallel=True)])
     assert (
         m_issues_search.return_value.format.call_args
         == [(), dict(self=issues)])
@@ -25,14 +25,35 @@ def test_abstract_iterator_constructor(args, kwargs):
     assert iterator.query == "QUERY"
     assert iterator.args == args
     assert iterator.kwargs == kwargs
-
-
-async def test_abstract_iterator_dunder_aiter(iters, patches):
-    iterator = DummyGithubIterator("API", "QUERY")
+    assert iterator._inflate is None
+    assert iterator.parallel is False
+    assert iterator.ordered is True
+    assert iterator.concurrency is None
+
+
+def test_abstract_iterator_constructor_parallel():
+    iterator = DummyGithubIterator(
+        "API", "QUERY",
+        inflate="INFLATE",
+        parallel=True,
+        ordered=False,
+        concurrency=23,
+        K="V")
+    assert iterator.kwargs == dict(K="V")
+    assert iterator._inflate == "INFLATE"
+    assert iterator.parallel is True
+    assert iterator.ordered is False
+    assert iterator.concurrency == 23
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+async def test_abstract_iterator_dunder_aiter(iters, patches, parallel):
+    iterator = DummyGithubIterator("API", "QUERY", parallel=parallel)
     iterator.args = iters(tuple, count=3)
     iterator.kwargs = iters(dict, count=3)
     patched = patches(
         "AGithubIterator.inflate",
+        "AGithubIterator.iter_pages",
         prefix="aio.api.github.abstract.iterator")
     iterables = iters(tuple, count=3)
     iterator.api = MagicMock()
@@ -43,9 +64,14 @@ async def test_abstract_iterator_dunder_aiter(iters, patches):
         for item in iterables:
             yield item
 
+    async def iter_pages():
+        for item in iterables:
+            yield item
+
     iterator.api.getiter = getiter
 
-    with patched as (m_inflate, ):
+    with patched as (m_inflate, m_pages):
+        m_pages.side_effect = iter_pages
         async for result in iterator.__aiter__():
             results.append(result)
 
@@ -53,6 +79,13 @@ async def test_abstract_iterator_dunder_aiter(iters, patches):
     assert (
         m_inflate.call_args_list
         == [[(result,), {}] for result in iterables])
+    if parallel:
+        assert not iterator.api.api_iter.called
+        assert (
+            m_pages.call_args
+            == [(), {}])
+        return
+    assert not m_pages.called
     assert (
         iterator.api.api_iter.call_args
         == [('QUERY', ) + iterator.args, iterator.kwargs])
@@ -87,21 +120,38 @@ def test_abstract_iterator_count_url(patches):
     iterator = DummyGithubIterator(MagicMock(), "QUERY")
     patched = patches(
         "gidgethub",
+        "AGithubIterator.page_query",
         prefix="aio.api.github.abstract.iterator")
 
-    with patched as (m_gidget, ):
+    with patched as (m_gidget, m_query):
         assert (
             iterator.count_url
             == m_gidget.sansio.format_url.return_value)
 
     assert (
         m_gidget.sansio.format_url.call_args
-        == [("QUERY&per_page=1", {}),
+        == [(m_query.return_value, {}),
             dict(base_url=iterator.api.base_url)])
-
+    assert (
+        m_query.call_args
+        == [(), dict(per_page=1)])
     assert "count_url" not in iterator.__dict__
 
 
+@pytest.mark.parametrize(
+    "query",
+    [("commits", 100),
+     ("commits?since=SINCE", 100),
+     ("releases?per_page=30", 30),
+     ("releases?per_page=30&per_page=50", 50),
+     ("https://api.github.com/repos/foo/bar/releases?per_page=7", 7)])
+def test_abstract_iterator_per_page(query):
+    query, expected = query
+    iterator = DummyGithubIterator("API", query)
+    assert iterator.per_page == expected
+    assert "per_page" in iterator.__dict__
+
+
 @pytest.mark.parametrize("rate_limit", [None] + list(range(0, 6)))
 async def test_abstract_iterator_total_count(patches, rate_limit):
     iterator = DummyGithubIterator(MagicMock(), "QUERY")
@@ -222,7 +272,7 @@ def test_abstract_iterator_count_from_headers(patches, headers):
 
 
 @pytest.mark.parametrize("header", [None, True])
-@pytest.mark.parametrize("data", [False, True])
+@pytest.mark.parametrize("data", [False, True, "list"])
 @pytest.mark.parametrize("code", [200, 300, 400])
 def test_abstract_iterator_count_from_response(patches, header, data, code):
     iterator = DummyGithubIterator(MagicMock(), "QUERY")
@@ -237,9 +287,14 @@ def test_abstract_iterator_count_from_response(patches, header, data, code):
     else:
         response = [code, {}, "DATA"]
 
+    if data == "list":
+        _data = ["ITEM1", "ITEM2"]
+    else:
+        _data = data and dict(total_count=23) or {}
+
     with patched as (m_gidgethub, m_data, m_headers):
         m_gidgethub.sansio.decipher_response.return_value = (
-            data and dict(total_count=23) or {}, 73, "XX")
+            _data, 73, "XX")
         if code != 200:
             m_gidgethub.sansio.decipher_response.side_effect = (
                 gidgethub.GitHubException("BOOM"))
@@ -247,11 +302,13 @@ def test_abstract_iterator_count_from_response(patches, header, data, code):
             with pytest.raises(gidgethub.GitHubException):
                 iterator.count_from_response(response)
         else:
-            assert (
-                iterator.count_from_response(response)
-                == (m_headers.return_value
-                    if response[1]
-                    else m_data.return_value))
+            if response[1]:
+                expected = m_headers.return_value
+            elif data == "list":
+                expected = 2
+            else:
+                expected = m_data.return_value
+            assert iterator.count_from_response(response) == expected
 
     assert (
         m_gidgethub.sansio.decipher_response.call_args
@@ -270,9 +327,27 @@ def test_abstract_iterator_count_from_response(patches, header, data, code):
         assert not m_data.called
         return
     assert not m_headers.called
+    if data == "list":
+        assert not m_data.called
+        return
     assert (
         m_data.call_args
-        == [(data and dict(total_count=23) or {}, ), {}])
+        == [(_data, ), {}])
+
+
+@pytest.mark.parametrize(
+    "body",
+    [(b'[]', 0),
+     (b'[{"id": 1}]', 1),
+     (b'{"total_count": 23, "items": [{"id": 1}]}', 23)])
+def test_abstract_iterator_count_from_response_no_link(body):
+    iterator = DummyGithubIterator(MagicMock(), "QUERY")
+    body, expected = body
+    response = (
+        200,
+        {"content-type": "application/json; charset=utf-8"},
+        body)
+    assert iterator.count_from_response(response) == expected
 
 
 @pytest.mark.parametrize("inflate", [True, False])
@@ -295,3 +370,103 @@ def test_abstract_iterator_inflate(inflate):
     assert (
         iterator._inflate.call_args
         == [(result, ), {}])
+
+
+@pytest.mark.parametrize("data", [["A", "B"], dict(items=["A", "B"])])
+async def test_abstract_iterator_fetch_page(iters, patches, data):
+    iterator = DummyGithubIterator(MagicMock(), "QUERY")
+    iterator.args = iters(tuple, count=3)
+    iterator.kwargs = iters(dict, count=3)
+    patched = patches(
+        ("AGithubIterator.per_page",
+         dict(new_callable=PropertyMock)),
+        "AGithubIterator.page_query",
+        prefix="aio.api.github.abstract.iterator")
+    iterator.api.getitem = AsyncMock(return_value=data)
+
+    with patched as (m_per_page, m_query):
+        assert (
+            await iterator.fetch_page(23)
+            == (23, ["A", "B"]))
+
+    assert (
+        iterator.api.getitem.call_args
+        == [(m_query.return_value, *iterator.args), iterator.kwargs])
+    assert (
+        m_query.call_args
+        == [(), dict(per_page=m_per_page.return_value, page=23)])
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+@pytest.mark.parametrize(
+    "total",
+    [(0, 0), (1, 1), (3, 1), (4, 2), (10, 4)])
+async def test_abstract_iterator_iter_pages(patches, ordered, total):
+    total, pages = total
+    iterator = DummyGithubIterator(
+        "API", "QUERY",
+        ordered=ordered,
+        concurrency=2)
+    patched = patches(
+        "concurrent",
+        ("AGithubIterator.per_page",
+         dict(new_callable=PropertyMock)),
+        ("AGithubIterator.total_count",
+         dict(new_callable=PropertyMock)),
+        ("AGithubIterator.fetch_page",
+         dict(new_callable=MagicMock)),
+        prefix="aio.api.github.abstract.iterator")
+    fetched = []
+    # Pages complete out of order.
+    completed = sorted(
+        range(1, pages + 1),
+        key=lambda page: (page % 2, page),
+        reverse=True)
+
+    async def concurrent(coros, limit):
+        fetched.extend(coros)
+        for page in completed:
+            yield page, [f"ITEM{page}.{i}" for i in range(0, 3)]
+
+    with patched as (m_concurrent, m_per_page, m_total, m_fetch):
+        m_concurrent.side_effect = concurrent
+        m_per_page.return_value = 3
+        m_total.side_effect = AsyncMock(return_value=total)
+        results = [item async for item in iterator.iter_pages()]
+
+    assert (
+        m_fetch.call_args_list
+        == [[(page, ), {}]
+            for page
+            in range(1, pages + 1)])
+    assert (
+        m_concurrent.call_args
+        == [(m_concurrent.call_args[0][0], ), dict(limit=2)])
+    assert fetched == [m_fetch.return_value] * pages
+    assert (
+        results
+        == [f"ITEM{page}.{i}"
+            for page
+            in (range(1, pages + 1)
+                if ordered
+                else completed)
+            for i
+            in range(0, 3)])
+
+
+@pytest.mark.parametrize(
+    "query",
+    [("commits", dict(per_page=1), "commits?per_page=1"),
+     ("commits?since=2021-01-01T00:00:00Z",
+      dict(per_page=100, page=2),
+      "commits?since=2021-01-01T00%3A00%3A00Z&per_page=100&page=2"),
+     ("releases?per_page=30",
+      dict(per_page=1),
+      "releases?per_page=1"),
+     ("/search/issues?q=repo%3Afoo%20bar",
+      dict(per_page=100, page=3),
+      "/search/issues?q=repo%3Afoo%20bar&per_page=100&page=3")])
+def test_abstract_iterator_page_query(query):
+    query, params, expected = query
+    iterator = DummyGithubIterator("API", query)
+    assert iterator.page_query(**params) == expected
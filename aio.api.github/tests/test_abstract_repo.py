@@ -143,7 +143,8 @@ async def test_abstract_repo_commit(patches):
 
 
 @pytest.mark.parametrize("since", [None, "SINCE"])
-def test_abstract_repo_commits(patches, since):
+@pytest.mark.parametrize("kwargs", [{}, dict(parallel=True)])
+def test_abstract_repo_commits(patches, since, kwargs):
     github = MagicMock()
     repo = DummyGithubRepo(github, "NAME")
     args = (
@@ -158,7 +159,7 @@ def test_abstract_repo_commits(patches, since):
 
     with patched as (m_partial, m_utils, m_getiter):
         assert (
-            repo.commits(*args)
+            repo.commits(*args, **kwargs)
             == m_getiter.return_value)
 
     query = "commits"
@@ -171,7 +172,7 @@ def test_abstract_repo_commits(patches, since):
         assert not m_utils.dt_to_js_isoformat.called
     assert (
         m_getiter.call_args
-        == [(query, ), dict(inflate=m_partial.return_value)])
+        == [(query, ), dict(inflate=m_partial.return_value, **kwargs)])
     assert (
         m_partial.call_args
         == [(github.commit_class, repo), {}])
@@ -403,7 +404,8 @@ async def test_abstract_repo_release(patches, data, dry_run):
         == [("releases/tags/RELEASE_NAME", ), {}])
 
 
-def test_abstract_repo_releases(patches):
+@pytest.mark.parametrize("kwargs", [{}, dict(parallel=True)])
+def test_abstract_repo_releases(patches, kwargs):
     github = MagicMock()
     repo = DummyGithubRepo(github, "NAME")
     patched = patches(
@@ -412,12 +414,12 @@ def test_abstract_repo_releases(patches):
 
     with patched as (m_iter, ):
         assert (
-            repo.releases()
+            repo.releases(**kwargs)
             == m_iter.return_value)
 
     assert (
         m_iter.call_args
-        == [(github.release_class, "releases?per_page=100"), {}])
+        == [(github.release_class, "releases?per_page=100"), kwargs])
 
 
 @pytest.mark.parametrize("is_tag", [True, False])
@@ -0,0 +1,487 @@
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import gidgethub
+import gidgethub.sansio
+
+import abstracts
+
+from aio.api import github
+from aio.api.github.abstract import scheduler as _scheduler
+
+
+@abstracts.implementer(github.AGithubRequestScheduler)
+class DummyGithubRequestScheduler:
+    pass
+
+
+@pytest.mark.parametrize("limit", [None, 0, 23])
+@pytest.mark.parametrize("retries", [None, 0, 5])
+@pytest.mark.parametrize("max_wait", [None, 0, 17])
+def test_scheduler_constructor(limit, retries, max_wait):
+    kwargs = {}
+    if limit is not None:
+        kwargs["limit"] = limit
+    if retries is not None:
+        kwargs["retries"] = retries
+    if max_wait is not None:
+        kwargs["max_wait"] = max_wait
+    scheduler = DummyGithubRequestScheduler(**kwargs)
+    assert scheduler.limit == (limit or _scheduler.DEFAULT_LIMIT)
+    assert (
+        scheduler.retries
+        == (retries
+            if retries is not None
+            else _scheduler.DEFAULT_RETRIES))
+    assert (
+        scheduler.max_wait
+        == (max_wait
+            if max_wait is not None
+            else _scheduler.MAX_WAIT))
+    assert scheduler._resume_at == 0
+
+
+def test_scheduler_semaphore(patches):
+    scheduler = DummyGithubRequestScheduler()
+    patched = patches(
+        "asyncio",
+        prefix="aio.api.github.abstract.scheduler")
+
+    with patched as (m_aio, ):
+        assert (
+            scheduler.semaphore
+            == m_aio.Semaphore.return_value)
+
+    assert (
+        m_aio.Semaphore.call_args
+        == [(scheduler.limit, ), {}])
+    assert "semaphore" in scheduler.__dict__
+
+
+@pytest.mark.parametrize("resume_at", [0, 1010, 1030])
+def test_scheduler_pause(patches, resume_at):
+    scheduler = DummyGithubRequestScheduler()
+    scheduler._resume_at = resume_at
+    patched = patches(
+        "time",
+        prefix="aio.api.github.abstract.scheduler")
+
+    with patched as (m_time, ):
+        m_time.monotonic.return_value = 1000
+        assert not scheduler.pause(20)
+
+    assert scheduler._resume_at == max(resume_at, 1020)
+
+
+@pytest.mark.parametrize(
+    "resume_at",
+    [[990], [1000], [1010], [1010, 1015], [1010, 1010]])
+async def test_scheduler_resumed(patches, resume_at):
+    scheduler = DummyGithubRequestScheduler()
+    scheduler._resume_at = resume_at[0]
+    times = [1000] + resume_at[1:] + [resume_at[-1]]
+    patched = patches(
+        "asyncio",
+        "time",
+        prefix="aio.api.github.abstract.scheduler")
+
+    with patched as (m_aio, m_time):
+        m_aio.sleep = AsyncMock()
+        m_time.monotonic.side_effect = times
+        assert not await scheduler.resumed()
+
+    waits = [
+        resume_at[0] - t
+        for t
+        in times[:-1]
+        if resume_at[0] > t]
+    assert (
+        m_aio.sleep.call_args_list
+        == [[(wait, ), {}]
+            for wait
+            in waits])
+
+
+def _api(scheduler=None):
+    kwargs = (
+        dict(scheduler=scheduler)
+        if scheduler
+        else {})
+    return github.GithubScheduledAPI(MagicMock(), "REQUESTER", **kwargs)
+
+
+def _rate_limit(remaining, reset_in):
+    return gidgethub.sansio.RateLimit(
+        limit=5000,
+        remaining=remaining,
+        reset_epoch=(
+            datetime.now(timezone.utc)
+            + timedelta(seconds=reset_in)).timestamp())
+
+
+@pytest.mark.parametrize("scheduler", [None, "SCHEDULER"])
+def test_scheduled_api_constructor(scheduler):
+    api = _api(scheduler)
+    assert isinstance(api, gidgethub.aiohttp.GitHubAPI)
+    assert api.requester == "REQUESTER"
+    assert api.scheduler == scheduler
+    assert api._in_flight == {}
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [(gidgethub.BadRequest(HTTPStatus(403)), None),
+     (gidgethub.BadRequest(
+         HTTPStatus(404),
+         headers={"retry-after": "5"}),
+      None),
+     (gidgethub.GitHubBroken(
+         HTTPStatus(503),
+         headers={"retry-after": "5"}),
+      None),
+     (gidgethub.BadRequest(HTTPStatus(403), headers={"retry-after": "5"}), 5),
+     (gidgethub.BadRequest(HTTPStatus(429), headers={"retry-after": "7"}), 7),
+     (gidgethub.BadRequest(HTTPStatus(429)),
+      _scheduler.SECONDARY_RATE_LIMIT_WAIT),
+     (gidgethub.RateLimitExceeded("RATE_LIMIT"), 11),
+     (gidgethub.RateLimitExceeded("RATE_LIMIT"), 1)])
+def test_scheduled_api_backoff(patches, exception):
+    api = _api()
+    exception, expected = exception
+    patched = patches(
+        "GithubScheduledAPI.until_reset",
+        prefix="aio.api.github.abstract.scheduler")
+
+    with patched as (m_until, ):
+        m_until.return_value = (
+            10
+            if expected == 11
+            else -10)
+        assert api.backoff(exception) == expected
+
+    if not isinstance(exception, gidgethub.RateLimitExceeded):
+        assert not m_until.called
+        return
+    assert (
+        m_until.call_args
+        == [("RATE_LIMIT", ), {}])
+
+
+@pytest.mark.parametrize("scheduler", [True, False])
+@pytest.mark.parametrize("wait", [None, 5, 100, 101])
+@pytest.mark.parametrize("attempt", [1, 3, 4])
+async def test_scheduled_api_handle_rate_limit_error(
+        patches, scheduler, wait, attempt):
+    _scheduler = (
+        MagicMock(retries=3, max_wait=100)
+        if scheduler
+        else None)
+    api = _api(_scheduler)
+    patched = patches(
+        "logger",
+        "gidgethub.aiohttp.GitHubAPI.handle_rate_limit_error",
+        ("GithubScheduledAPI.backoff",
+         dict(new_callable=MagicMock)),
+        prefix="aio.api.github.abstract.scheduler")
+    expected = bool(
+        wait is not None
+        and attempt <= 3
+        and wait <= 100)
+
+    with patched as (m_log, m_super, m_backoff):
+        m_backoff.return_value = wait
+        assert (
+            await api.handle_rate_limit_error(
+                method="METHOD",
+                url="URL",
+                exception="EXCEPTION",
+                attempt=attempt)
+            == (expected
+                if scheduler
+                else m_super.return_value))
+
+    if not scheduler:
+        assert (
+            m_super.call_args
+            == [(),
+                dict(method="METHOD",
+                     url="URL",
+                     exception="EXCEPTION",
+                     attempt=attempt)])
+        assert not m_backoff.called
+        return
+    assert not m_super.called
+    assert (
+        m_backoff.call_args
+        == [("EXCEPTION", ), {}])
+    if not expected:
+        assert not _scheduler.pause.called
+        assert not m_log.warning.called
+        return
+    assert (
+        _scheduler.pause.call_args
+        == [(wait, ), {}])
+    assert (
+        m_log.warning.call_args
+        == [(f"Github rate limit hit, pausing requests for {wait:.0f}s: "
+             "URL", ), {}])
+
+
+@pytest.mark.parametrize("scheduler", [True, False])
+@pytest.mark.parametrize("remaining", [None, 1, 0, -1])
+@pytest.mark.parametrize("reset_in", [-10, 10, 1000])
+async def test_scheduled_api_manage_rate_limit(
+        patches, scheduler, remaining, reset_in):
+    _scheduler = (
+        MagicMock(max_wait=100)
+        if scheduler
+        else None)
+    api = _api(_scheduler)
+    api.rate_limit = (
+        MagicMock(remaining=remaining)
+        if remaining is not None
+        else None)
+    patched = patches(
+        ("GithubScheduledAPI.until_reset",
+         dict(new_callable=MagicMock)),
+        prefix="aio.api.github.abstract.scheduler")
+
+    with patched as (m_until, ):
+        m_until.return_value = reset_in
+        assert not await api.manage_rate_limit(method="METHOD", url="URL")
+
+    exhausted = bool(
+        scheduler
+        and remaining is not None
+        and remaining < 0)
+    if not exhausted:
+        assert not m_until.called
+        if scheduler:
+            assert not _scheduler.pause.called
+        return
+    assert (
+        m_until.call_args
+        == [(api.rate_limit, ), {}])
+    if 0 < reset_in <= 100:
+        assert (
+            _scheduler.pause.call_args
+            == [(reset_in + 1, ), {}])
+    else:
+        assert not _scheduler.pause.called
+
+
+@pytest.mark.parametrize("reset_in", [-30, 0, 30])
+def test_scheduled_api_until_reset(reset_in):
+    api = _api()
+    assert (
+        reset_in - 1
+        < api.until_reset(_rate_limit(0, reset_in))
+        <= reset_in)
+
+
+@pytest.mark.parametrize("scheduler", [True, False])
+@pytest.mark.parametrize("method", ["GET", "POST"])
+@pytest.mark.parametrize("body", [b"", b"BODY"])
+async def test_scheduled_api__request(patches, scheduler, method, body):
+    _scheduler = (
+        MagicMock()
+        if scheduler
+        else None)
+    api = _api(_scheduler)
+    patched = patches(
+        "gidgethub.aiohttp.GitHubAPI._request",
+        "GithubScheduledAPI._scheduled_request",
+        prefix="aio.api.github.abstract.scheduler")
+    headers = dict(b="B", a="A")
+
+    with patched as (m_super, m_scheduled):
+        assert (
+            await api._request(method, "URL", headers, body)
+            == (m_scheduled.return_value
+                if scheduler
+                else m_super.return_value))
+
+    if not scheduler:
+        assert (
+            m_super.call_args
+            == [(method, "URL", headers, body), {}])
+        assert not m_scheduled.called
+        return
+    assert not m_super.called
+    assert (
+        m_scheduled.call_args
+        == [(_scheduler, method, "URL", headers, body), {}])
+    assert api._in_flight == {}
+
+
+async def test_scheduled_api__request_shared(patches):
+    api = _api(DummyGithubRequestScheduler())
+    responses: asyncio.Queue = asyncio.Queue()
+    requests = []
+    patched = patches(
+        "gidgethub.aiohttp.GitHubAPI._request",
+        prefix="aio.api.github.abstract.scheduler")
+
+    async def request(*args):
+        requests.append(args)
+        return await responses.get()
+
+    headers = dict(accept="ACCEPT")
+
+    with patched as (m_super, ):
+        m_super.side_effect = request
+        calls = [
+            asyncio.create_task(api._request("GET", url, headers))
+            for url
+            in ["URL1", "URL1", "URL2", "URL1"]]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert len(api._in_flight) == 2
+        response1 = (200, {}, b"RESPONSE1")
+        response2 = (200, {}, b"RESPONSE2")
+        responses.put_nowait(response1)
+        responses.put_nowait(response2)
+        assert (
+            await asyncio.gather(*calls)
+            == [response1, response1, response2, response1])
+        assert (
+            requests
+            == [("GET", "URL1", headers, b""),
+                ("GET", "URL2", headers, b"")])
+        assert api._in_flight == {}
+        responses.put_nowait(response1)
+        assert await api._request("GET", "URL1", headers) == response1
+        assert len(requests) == 3
+
+
+async def test_scheduled_api__request_cancelled(patches):
+    api = _api(DummyGithubRequestScheduler())
+    response = asyncio.Event()
+    patched = patches(
+        "gidgethub.aiohttp.GitHubAPI._request",
+        prefix="aio.api.github.abstract.scheduler")
+
+    async def request(*args):
+        await response.wait()
+        return 200, {}, b"RESPONSE"
+
+    with patched as (m_super, ):
+        m_super.side_effect = request
+        calls = [
+            asyncio.create_task(api._request("GET", "URL", {}))
+            for _
+            in range(0, 2)]
+        await asyncio.sleep(0)
+        calls[0].cancel()
+        await asyncio.sleep(0)
+        response.set()
+        assert await calls[1] == (200, {}, b"RESPONSE")
+        assert calls[0].cancelled()
+
+
+@pytest.mark.parametrize("current", [True, False])
+def test_scheduled_api__forget(current):
+    api = _api()
+    task = MagicMock()
+    api._in_flight["KEY"] = (
+        task
+        if current
+        else MagicMock())
+    api._in_flight["OTHER"] = "OTHER"
+    assert not api._forget("KEY", task)
+    assert ("KEY" in api._in_flight) != current
+    assert api._in_flight["OTHER"] == "OTHER"
+
+
+async def test_scheduled_api__scheduled_request(patches):
+    api = _api()
+    scheduler = MagicMock()
+    scheduler.semaphore = asyncio.Semaphore(1)
+    scheduler.resumed = AsyncMock()
+    patched = patches(
+        "gidgethub.aiohttp.GitHubAPI._request",
+        prefix="aio.api.github.abstract.scheduler")
+
+    with patched as (m_super, ):
+        assert (
+            await api._scheduled_request(
+                scheduler, "METHOD", "URL", "HEADERS", "BODY")
+            == m_super.return_value)
+
+    assert (
+        m_super.call_args
+        == [("METHOD", "URL", "HEADERS", "BODY"), {}])
+    assert scheduler.resumed.call_count == 1
+
+
+async def test_scheduled_api__scheduled_request_limit(patches):
+    api = _api()
+    scheduler = DummyGithubRequestScheduler(limit=2)
+    running = []
+    max_running = []
+    patched = patches(
+        "gidgethub.aiohttp.GitHubAPI._request",
+        prefix="aio.api.github.abstract.scheduler")
+
+    async def request(*args):
+        running.append(args)
+        max_running.append(len(running))
+        await asyncio.sleep(0)
+        running.pop()
+        return 200, {}, b""
+
+    with patched as (m_super, ):
+        m_super.side_effect = request
+        await asyncio.gather(
+            *(api._scheduled_request(
+                scheduler, "GET", f"URL{i}", {}, b"")
+              for i
+              in range(0, 10)))
+
+    assert len(max_running) == 10
+    assert max(max_running) == 2
+
+
+@pytest.mark.parametrize("limited", [0, 1, 3, 4])
+async def test_scheduled_api_getitem_rate_limited(patches, limited):
+    scheduler = DummyGithubRequestScheduler()
+    api = _api(scheduler)
+    limited_response = (
+        403,
+        {"content-type": "application/json",
+         "x-ratelimit-limit": "5000",
+         "x-ratelimit-remaining": "0",
+         "x-ratelimit-reset": "0"},
+        b'{"message": "API rate limit exceeded"}')
+    ok_response = (
+        200,
+        {"content-type": "application/json",
+         "x-ratelimit-limit": "5000",
+         "x-ratelimit-remaining": "4999",
+         "x-ratelimit-reset": "0"},
+        b'{"ok": true}')
+    patched = patches(
+        "gidgethub.aiohttp.GitHubAPI._request",
+        "AGithubRequestScheduler.pause",
+        prefix="aio.api.github.abstract.scheduler")
+
+    with patched as (m_super, m_pause):
+        m_super.side_effect = (
+            [limited_response] * limited
+            + [ok_response])
+        if limited > scheduler.retries:
+            with pytest.raises(gidgethub.RateLimitExceeded):
+                await api.getitem("/rate/limited")
+        else:
+            assert await api.getitem("/rate/limited") == dict(ok=True)
+
+    retries = min(limited, scheduler.retries)
+    assert m_super.call_count == min(limited + 1, scheduler.retries + 1)
+    assert m_pause.call_args_list == [[(1, ), {}]] * retries
+    if limited <= scheduler.retries:
+        assert api.rate_limit.remaining == 4999
@@ -41,6 +41,16 @@ def test_api_api_class(patches):
         assert api.api_class == m_super.return_value
 
 
+def test_request_scheduler_constructor():
+    scheduler = github.GithubRequestScheduler()
+    assert isinstance(scheduler, github.AGithubRequestScheduler)
+
+
+def test_response_cache_constructor():
+    cache = github.GithubResponseCache("PATH")
+    assert isinstance(cache, github.AGithubResponseCache)
+
+
 def test_commit_constructor():
     commit = github.GithubCommit("GITHUB", "DATA")
     assert isinstance(commit, github.AGithubCommit)
@@ -9,6 +9,8 @@ from aio.api import github
     [github.IGithubIterator,
      github.IGithubAPI,
      github.IGithubIssues,
+     github.IGithubRequestScheduler,
+     github.IGithubResponseCache,
      github.IGithubTrackedIssue,
      github.IGithubTrackedIssues])
 async def test_interfaces(iface, interface):
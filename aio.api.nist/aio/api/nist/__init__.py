@@ -5,12 +5,14 @@ from .abstract import (
     ACPE,
     ACVE,
     ACVEMatcher,
+    ANISTCache,
     ANISTDownloader,
     ANISTParser)
 from .nist import (
     CPE,
     CVE,
     CVEMatcher,
+    NISTCache,
     NISTDownloader,
     NISTParser)
 
@@ -18,6 +20,7 @@ __all__ = (
     "ACPE",
     "ACVE",
     "ACVEMatcher",
+    "ANISTCache",
     "ANISTDownloader",
     "ANISTParser",
     "abstract",
@@ -25,6 +28,7 @@ __all__ = (
     "CVE",
     "CVEMatcher",
     "interface",
+    "NISTCache",
     "NISTDownloader",
     "NISTParser",
     "exceptions",
@@ -1,4 +1,5 @@
 
+from .cache import ANISTCache
 from .cpe import ACPE
 from .cve import ACVE
 from .downloader import ANISTDownloader
@@ -10,5 +11,6 @@ __all__ = (
     "ACPE",
     "ACVE",
     "ACVEMatcher",
+    "ANISTCache",
     "ANISTDownloader",
     "ANISTParser")
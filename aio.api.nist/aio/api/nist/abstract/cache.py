@@ -0,0 +1,122 @@
+"""NIST CVE feed cache."""
+
+import hashlib
+import json
+import pathlib
+import pickle
+from functools import cached_property
+from typing import Dict, Optional, Union
+
+import abstracts
+
+from aio.core import utils
+
+from aio.api.nist import typing
+
+
+class ANISTCache(metaclass=abstracts.Abstraction):
+    """On-disk cache of NIST CVE feeds, and of the data parsed from them.
+
+    Each feed is stored with metadata used to revalidate it, ie the `sha256`
+    from the NVD `.meta` file, and the HTTP `ETag` and `Last-Modified`
+    headers.
+
+    Parsed data is stored in a compact binary format, keyed by the hash of
+    the feed and a fingerprint of the parser configuration.
+    """
+
+    @classmethod
+    def parse_meta(cls, text: str) -> Dict[str, str]:
+        """Parse an NVD `.meta` file, eg `sha256:<hash>`."""
+        return dict(
+            line.strip().split(":", 1)
+            for line
+            in text.splitlines()
+            if ":" in line)
+
+    def __init__(self, path: Union[str, pathlib.Path]) -> None:
+        self._path = path
+
+    @cached_property
+    def path(self) -> pathlib.Path:
+        """Path to the cache directory."""
+        return pathlib.Path(self._path)
+
+    def feed_path(self, url: str) -> pathlib.Path:
+        """Path to the cached feed for a URL."""
+        return self.path.joinpath(url.split("/")[-1])
+
+    def get_feed(self, url: str) -> bytes:
+        """Cached feed data for a URL."""
+        return self.feed_path(url).read_bytes()
+
+    def get_meta(self, url: str) -> Optional["typing.NISTFeedMetaDict"]:
+        """Metadata for a cached feed, if it is cached."""
+        try:
+            meta = json.loads(self.meta_path(url).read_text())
+        except (OSError, ValueError):
+            return None
+        valid = (
+            isinstance(meta, dict)
+            and all(
+                isinstance(meta.get(k), str)
+                for k
+                in ("hash", "sha256", "etag", "last_modified"))
+            and self.feed_path(url).exists())
+        return (
+            meta
+            if valid
+            else None)
+
+    def get_parsed(
+            self,
+            feed_hash: str,
+            fingerprint: str) -> Optional["typing.CVEDataTuple"]:
+        """Cached parsed data for a feed."""
+        try:
+            with self.parsed_path(feed_hash, fingerprint).open("rb") as f:
+                return pickle.load(f)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
+
+    def meta_path(self, url: str) -> pathlib.Path:
+        """Path to the cached metadata for a URL."""
+        return self.path.joinpath(f"{url.split('/')[-1]}.meta.json")
+
+    def parsed_path(self, feed_hash: str, fingerprint: str) -> pathlib.Path:
+        """Path to the cached parsed data for a feed."""
+        return self.path.joinpath(
+            "parsed",
+            f"{feed_hash}-{fingerprint}.pickle")
+
+    def set_feed(
+            self,
+            url: str,
+            data: bytes,
+            sha256: str = "",
+            etag: str = "",
+            last_modified: str = "") -> str:
+        """Store a feed with its metadata, returning the hash of the feed."""
+        feed_hash = hashlib.sha256(data).hexdigest()
+        meta: typing.NISTFeedMetaDict = dict(
+            hash=feed_hash,
+            sha256=sha256,
+            etag=etag,
+            last_modified=last_modified)
+        self._write(self.feed_path(url), data)
+        self._write(self.meta_path(url), json.dumps(meta).encode())
+        return feed_hash
+
+    def set_parsed(
+            self,
+            feed_hash: str,
+            fingerprint: str,
+            parsed: "typing.CVEDataTuple") -> None:
+        """Store parsed data for a feed."""
+        self._write(
+            self.parsed_path(feed_hash, fingerprint),
+            pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _write(self, path: pathlib.Path, data: bytes) -> None:
+        with utils.atomic_write(path, "wb") as f:
+            f.write(data)
@@ -73,7 +73,7 @@ class ACVE(metaclass=abstracts.Abstraction):
         """Recursively gather CPE data from CVE nodes."""
         for node in nodes:
             for cpe_match in node.get('cpe_match', []):
-                cpe = self.cpe_class.from_string(cpe_match.pop('cpe23Uri'))
+                cpe = self.cpe_class.from_string(cpe_match['cpe23Uri'])
                 if self.include_version(cpe_match, cpe):
                     cpe_set.add(cpe)
             if children := node.get('children', []):
@@ -85,9 +85,10 @@ class ACVE(metaclass=abstracts.Abstraction):
             cpe: "abstract.ACPE") -> bool:
         """Determine whether a CPE matches according to installed version of a
         dependency."""
+        matcher = self.tracked_cpes.get(str(cpe))
         return (
-            self.tracked_cpes[str(cpe)](self, cpe, cpe_match)
-            if str(cpe) in self.tracked_cpes
+            matcher(self, cpe, cpe_match)
+            if matcher
             else False)
 
     def update_fields(self, data) -> Optional["typing.CVEDict"]:
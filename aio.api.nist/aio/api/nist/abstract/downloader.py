@@ -2,11 +2,13 @@
 
 import asyncio
 import logging
+import pathlib
 import tarfile
+import tempfile
 from concurrent import futures
 from datetime import datetime
 from functools import cached_property
-from typing import AsyncIterator, Optional, Set, Type
+from typing import AsyncIterator, Dict, Optional, Set, Tuple, Type, Union
 
 import aiohttp
 
@@ -24,6 +26,7 @@ logger = logging.getLogger(__name__)
 NIST_URL_TPL = (
     "https://nvd.nist.gov/feeds/json/cve/1.1/nvdcve-1.1-{year}.json.gz")
 SCAN_FROM_YEAR = 2018
+FEED_CHUNK_SIZE = 2 ** 16
 
 
 @abstracts.implementer(interface.IPredownload)
@@ -36,6 +39,12 @@ class Predownload:
 
 @abstracts.implementer(event.IExecutive)
 class ANISTDownloader(event.AExecutive, metaclass=abstracts.Abstraction):
+    """Downloads and parses NIST CVE feeds.
+
+    If a `cache` directory is provided, feeds are only downloaded if they
+    have changed, and are only parsed if they, or the parser configuration,
+    have changed.
+    """
 
     def __init__(
             self,
@@ -46,7 +55,8 @@ class ANISTDownloader(event.AExecutive, metaclass=abstracts.Abstraction):
             since: Optional[int] = None,
             loop: Optional[asyncio.AbstractEventLoop] = None,
             pool: Optional[futures.Executor] = None,
-            session: Optional[aiohttp.ClientSession] = None) -> None:
+            session: Optional[aiohttp.ClientSession] = None,
+            cache: Optional[Union[str, pathlib.Path]] = None) -> None:
         self._since = since
         self.cve_fields = cve_fields
         self.cve_data = cve_data
@@ -55,11 +65,26 @@ class ANISTDownloader(event.AExecutive, metaclass=abstracts.Abstraction):
         self._session = session
         self._loop = loop
         self._pool = pool
+        self._cache = cache
 
     async def __aiter__(self) -> AsyncIterator[str]:
         async for url in self.downloads:
             yield url
 
+    @cached_property
+    def cache(self) -> Optional["abstract.ANISTCache"]:
+        """Feed cache, if a cache directory is set."""
+        return (
+            self.cache_class(self._cache)
+            if self._cache
+            else None)
+
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def cache_class(self) -> Type["abstract.ANISTCache"]:
+        """NIST cache class."""
+        raise NotImplementedError
+
     @cached_property
     def cpe_revmap(self) -> "typing.CPERevmapDict":
         """Collected reverse mapping of CPEs."""
@@ -150,9 +175,9 @@ class ANISTDownloader(event.AExecutive, metaclass=abstracts.Abstraction):
         self.cves.update(cves)
         self.cpe_revmap.update(cpe_revmap)
 
-    async def download(self, url: str) -> aiohttp.ClientResponse:
+    async def download(self, url: str, **kwargs) -> aiohttp.ClientResponse:
         """Async download of CVE data."""
-        download = await self.session.get(url)
+        download = await self.session.get(url, **kwargs)
         logger.debug(f"Downloading CVE data: {url}")
         return download
 
@@ -163,23 +188,146 @@ class ANISTDownloader(event.AExecutive, metaclass=abstracts.Abstraction):
                 aiohttp.ClientResponse
                 | interface.IPredownload):
         """Async download and parsing of CVE data."""
+        if not data and self.cache:
+            return await self.download_and_parse_cached(self.cache, url)
         download = None
-        if not data:
+        if data:
+            parsed = await self.parse(url, data)
+        else:
             download = await self.download(url)
             if download.status != 200:
                 raise exceptions.CVEDownloadError(
                     f"Download failed {url}: {download.reason}")
-            data = await download.read()
-        self.add(*await self.parse(url, data))
+            parsed = await self.parse_download(url, download)
+        self.add(*parsed)
         logger.debug(f"CVE data saved: {url}")
         return download or Predownload(url)
 
-    async def parse(self, url: str, data: bytes) -> "typing.CVEDataTuple":
-        """Parse incoming data in executor."""
+    async def download_and_parse_cached(
+            self,
+            cache: "abstract.ANISTCache",
+            url: str) -> (
+                aiohttp.ClientResponse
+                | interface.IPredownload):
+        """Async download and parsing of CVE data, using the cache where the
+        feed, or the parser configuration, have not changed."""
+        download, feed_hash = await self.download_cached(cache, url)
+        fingerprint = self.parser.fingerprint
+        parsed = cache.get_parsed(feed_hash, fingerprint)
+        if parsed is None:
+            parsed = await self.parse(url, cache.feed_path(url))
+            cache.set_parsed(feed_hash, fingerprint, parsed)
+        else:
+            logger.debug(f"CVE data loaded from cache: {url}")
+        self.add(*parsed)
+        return download or Predownload(url)
+
+    async def download_cached(
+            self,
+            cache: "abstract.ANISTCache",
+            url: str) -> Tuple[Optional[aiohttp.ClientResponse], str]:
+        """Download a feed to the cache, if it has changed.
+
+        Cached feeds are revalidated with the `sha256` from the NVD `.meta`
+        file, or with a conditional request if that is not available.
+
+        Returns the response, if the feed was downloaded, and the hash of the
+        feed.
+        """
+        cached = cache.get_meta(url)
+        sha256 = (await self.download_meta(url)).get("sha256", "")
+        if cached and sha256 and cached["sha256"] == sha256:
+            return None, cached["hash"]
+        headers: Dict[str, str] = {}
+        if cached and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+        download = await self.download(url, headers=headers)
+        if cached and download.status == 304:
+            return None, cached["hash"]
+        if download.status != 200:
+            raise exceptions.CVEDownloadError(
+                f"Download failed {url}: {download.reason}")
+        return (
+            download,
+            cache.set_feed(
+                url,
+                await download.read(),
+                sha256=sha256,
+                etag=download.headers.get("ETag", ""),
+                last_modified=download.headers.get("Last-Modified", "")))
+
+    async def download_meta(self, url: str) -> Dict[str, str]:
+        """Download and parse the NVD `.meta` file for a feed.
+
+        Returns an empty dict if it could not be downloaded.
+        """
+        try:
+            async with self.session.get(self.meta_url(url)) as response:
+                if response.status != 200:
+                    return {}
+                return self.cache_class.parse_meta(await response.text())
+        except aiohttp.ClientError as e:
+            logger.debug(f"Failed to download CVE metadata for {url}: {e}")
+            return {}
+
+    async def fetch_and_parse(
+            self,
+            url: str,
+            parser: Optional["abstract.ANISTParser"] = None) -> (
+                "typing.CVEDataTuple"):
+        """Download and parse a feed, without adding the parsed data.
+
+        An alternative `parser` can be provided, eg to parse the feed with
+        different tracked CPEs.
+        """
+        if self.cache:
+            await self.download_cached(self.cache, url)
+            return await self.parse(
+                url,
+                self.cache.feed_path(url),
+                parser=parser)
+        download = await self.download(url)
+        if download.status != 200:
+            raise exceptions.CVEDownloadError(
+                f"Download failed {url}: {download.reason}")
+        return await self.parse_download(url, download, parser=parser)
+
+    def meta_url(self, url: str) -> str:
+        """URL of the NVD `.meta` file for a feed."""
+        return f"{url.rsplit('.json.gz', 1)[0]}.meta"
+
+    async def parse(
+            self,
+            url: str,
+            data: "typing.NISTFeedSource",
+            parser: Optional["abstract.ANISTParser"] = None) -> (
+                "typing.CVEDataTuple"):
+        """Parse incoming data in executor.
+
+        If `data` is a path, the feed is read by the executor, rather than
+        being passed to it.
+        """
         # Disable this comment to prevent running the parser in a separate
         # process - useful for debugging.
         # return self.parser(data)
         logger.debug(f"Parsing CVE data: {url}")
-        return await self.execute(
-            self.parser,
-            data)
+        parser = parser or self.parser
+        return await self.execute(parser, data)
+
+    async def parse_download(
+            self,
+            url: str,
+            download: aiohttp.ClientResponse,
+            parser: Optional["abstract.ANISTParser"] = None) -> (
+                "typing.CVEDataTuple"):
+        """Stream a downloaded feed to a temporary file, and parse it from
+        there."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = pathlib.Path(tmpdir).joinpath(url.split("/")[-1])
+            with path.open("wb") as f:
+                async for chunk in download.content.iter_chunked(
+                        FEED_CHUNK_SIZE):
+                    f.write(chunk)
+            return await self.parse(url, path, parser=parser)
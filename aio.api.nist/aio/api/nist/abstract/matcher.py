@@ -2,7 +2,8 @@
 
 import logging
 from datetime import date
-from typing import Dict, Optional
+from functools import cached_property, lru_cache
+from typing import Dict, Optional, Tuple
 
 from packaging import version
 
@@ -15,9 +16,25 @@ from aio.api.nist import abstract, typing
 
 logger = logging.getLogger(__name__)
 
+VERSION_BOUNDS = (
+    "versionEndExcluding",
+    "versionEndIncluding",
+    "versionStartExcluding",
+    "versionStartIncluding")
+
 
 class ACVEMatcher(metaclass=abstracts.Abstraction):
-    """Matcher for CVEs against date and version."""
+    """Matcher for CVEs against date and version.
+
+    Version range checks are cached by their bounds, as many CVEs share
+    the same bounds.
+    """
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def parse_version(cls, version_str: str) -> version.Version:
+        """Parse a version string."""
+        return version.Version(version_str)
 
     def __init__(
             self,
@@ -30,10 +47,11 @@ class ACVEMatcher(metaclass=abstracts.Abstraction):
             cpe: "abstract.ACPE",
             cpe_match: "typing.CVENodeMatchDict") -> bool:
         matched = self.match_cpe(cve, cpe, cpe_match)
-        logger.debug(
-            f"Matched\n  {self._match_debug(cve, cpe, cpe_match)}"
-            if matched
-            else f"No match\n  {self._match_debug(cve, cpe, cpe_match)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Matched\n  {self._match_debug(cve, cpe, cpe_match)}"
+                if matched
+                else f"No match\n  {self._match_debug(cve, cpe, cpe_match)}")
         return matched
 
     def __str__(self) -> str:
@@ -57,6 +75,11 @@ class ACVEMatcher(metaclass=abstracts.Abstraction):
         """Version of tracked CPE (optional)."""
         return self._filter_dict.get("version")
 
+    @cached_property
+    def version_matches(self) -> Dict[Tuple, bool]:
+        """Results of version range checks, keyed by the range bounds."""
+        return {}
+
     def get_version_info(
             self,
             cpe_match: "typing.CVENodeMatchDict") -> Dict[
@@ -112,16 +135,30 @@ class ACVEMatcher(metaclass=abstracts.Abstraction):
         version."""
         if not self.tracked_version:
             return True
+        bounds = tuple(cpe_match.get(k) for k in VERSION_BOUNDS)
+        matched = self.version_matches.get(bounds)
+        if matched is None:
+            matched = self.version_matches[bounds] = self.match_version_range(
+                self.tracked_version,
+                cpe_match)
+        return matched
+
+    def match_version_range(
+            self,
+            tracked_version: version.Version,
+            cpe_match: "typing.CVENodeMatchDict") -> bool:
+        """Check whether the tracked version is within the version range of
+        the provided CVE/CPE data."""
         version_info = self.get_version_info(cpe_match)
         return not (
             (version_info["end_exc"] is not None
-             and self.tracked_version >= version_info["end_exc"])
+             and tracked_version >= version_info["end_exc"])
             or (version_info["end_inc"] is not None
-                and self.tracked_version > version_info["end_inc"])
+                and tracked_version > version_info["end_inc"])
             or (version_info["start_exc"] is not None
-                and self.tracked_version <= version_info["start_exc"])
+                and tracked_version <= version_info["start_exc"])
             or (version_info["start_inc"] is not None
-                and self.tracked_version < version_info["start_inc"]))
+                and tracked_version < version_info["start_inc"]))
 
     def _cpe_version(
             self,
@@ -132,7 +169,7 @@ class ACVEMatcher(metaclass=abstracts.Abstraction):
         version_info = cpe_match.get(
             f"version{action.capitalize()}{ending.capitalize()}luding", None)
         return (
-            version.Version(utils.typed(str, version_info))
+            self.parse_version(utils.typed(str, version_info))
             if version_info is not None
             else None)
 
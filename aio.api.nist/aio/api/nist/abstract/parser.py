@@ -1,9 +1,14 @@
 """NIST CVE data parser."""
 
+import hashlib
+import json
 import logging
+import pathlib
+import re
 from datetime import date
 from functools import cached_property
-from typing import Dict, Iterator, List, Optional, Set, Tuple, Type
+from typing import (
+    Dict, Iterable, Iterator, Optional, Pattern, Set, Tuple, Type)
 
 import abstracts
 
@@ -18,22 +23,33 @@ class ANISTParser(metaclass=abstracts.Abstraction):
     """Sync blocking CVE data parser.
 
     Run me in an executor!.
+
+    By default, CVE items are decompressed and parsed incrementally, one at a
+    time, set `stream` to `False` to load all of the data at once.
+
+    When streaming, items are pre-filtered with `tracked_cpe_re`, and only
+    items that could match a tracked CPE are analyzed further.
+
+    Feed data can be provided as bytes, or as a path for the parser to read
+    it from, so that it does not need to be passed between processes.
     """
 
     def __init__(
             self,
             tracked_cpes: "typing.TrackedCPEDict",
             cve_fields: Optional[QueryDict] = None,
-            ignored_cves: Optional[Set] = None) -> None:
+            ignored_cves: Optional[Set] = None,
+            stream: bool = True) -> None:
         self._tracked_cpes = tracked_cpes
         self.ignored_cves = ignored_cves or set()
         self.cve_fields = cve_fields
+        self.stream = stream
 
     def __call__(
             self,
-            data: bytes) -> "typing.CVEDataTuple":
+            data: "typing.NISTFeedSource") -> "typing.CVEDataTuple":
         """Slow, blocking parser."""
-        return self.parse_cve_data(data)
+        return self.parse_cve_data(self.read_feed(data))
 
     @property  # type:ignore
     @abstracts.interfacemethod
@@ -57,6 +73,24 @@ class ANISTParser(metaclass=abstracts.Abstraction):
         """Collected CVEs."""
         return {}
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """Fingerprint of the parser configuration, ie anything that affects
+        the parsed data."""
+        config = dict(
+            parser=f"{self.__class__.__module__}.{self.__class__.__name__}",
+            tracked_cpes=self._tracked_cpes,
+            cve_fields=(
+                self.cve_fields.query
+                if self.cve_fields
+                else None),
+            ignored_cves=sorted(self.ignored_cves))
+        return hashlib.sha256(
+            json.dumps(
+                config,
+                sort_keys=True,
+                default=str).encode()).hexdigest()
+
     @property  # type:ignore
     @abstracts.interfacemethod
     def matcher_class(self) -> Type["abstract.ACVEMatcher"]:
@@ -71,6 +105,21 @@ class ANISTParser(metaclass=abstracts.Abstraction):
             nodes="configurations/nodes",
             published_date="publishedDate")
 
+    @cached_property
+    def tracked_cpe_re(self) -> Pattern[str]:
+        """Regex to match tracked CPEs in the raw JSON of a CVE item.
+
+        CVE CPEs only match if their `part:vendor:product:version` is
+        tracked, so items without a matching `cpe23Uri` prefix can be skipped.
+        """
+        return re.compile(
+            "|".join(
+                re.escape(f"{json.dumps(cpe)[:-1]}:")
+                for cpe
+                in self._tracked_cpes)
+            # Match nothing if there are no tracked CPEs.
+            or r"(?!)")
+
     @cached_property
     def tracked_cpes(self) -> "typing.TrackedCPEMatchingDict":
         """Mapping of tracked CPEs, with a filter dictionary for matching."""
@@ -139,14 +188,27 @@ class ANISTParser(metaclass=abstracts.Abstraction):
             self.add_cve(cve_item, cve_data)
         return self.cves, self.cpe_revmap
 
+    def read_feed(self, data: "typing.NISTFeedSource") -> bytes:
+        """Feed data, read from a path if required."""
+        return (
+            data
+            if isinstance(data, bytes)
+            else pathlib.Path(data).read_bytes())
+
     def _iso_date(self, date_str: Optional[str]) -> Optional[date]:
         return (
             self.cve_class.parse_date(date_str)
             if date_str
             else None)
 
-    def _junzip_items(self, data: bytes) -> List["typing.CVEItemDict"]:
-        return utils.junzip(data)["CVE_Items"]
+    def _junzip_items(self, data: bytes) -> Iterable["typing.CVEItemDict"]:
+        return (
+            utils.junzip_items(
+                data,
+                "CVE_Items",
+                match=self.tracked_cpe_re)
+            if self.stream
+            else utils.junzip(data)["CVE_Items"])
 
     def _tracked_cpe(
             self,
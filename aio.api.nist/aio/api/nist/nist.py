@@ -16,8 +16,16 @@ class CVEMatcher(nist.ACVEMatcher):
     pass
 
 
+class NISTCache(nist.ANISTCache):
+    pass
+
+
 class NISTDownloader(nist.ANISTDownloader):
 
+    @property
+    def cache_class(self) -> Type[nist.ANISTCache]:
+        return NISTCache
+
     @property
     def parser_class(self) -> Type[nist.ANISTParser]:
         return NISTParser
@@ -1,3 +1,4 @@
+import pathlib
 from datetime import date
 from typing import (
     Any, Coroutine, Dict, Generator, List, Optional, Set,
@@ -40,6 +41,13 @@ class CVEJsonDict(TypedDict, total=False):
     CVE_Items: List[CVEItemDict]
 
 
+class NISTFeedMetaDict(TypedDict):
+    hash: str
+    sha256: str
+    etag: str
+    last_modified: str
+
+
 class TrackedCPEFilterDict(TypedDict, total=False):
     version: Optional[version.Version]
     date: Optional[str]
@@ -63,6 +71,7 @@ CPERevmapDict = Dict[str, Set[str]]
 CVEDict = Dict[str, Dict]
 CVEQueryDict = Dict[str, Dict]
 CVEDataTuple = Tuple[CVEDict, CPERevmapDict]
+NISTFeedSource = Union[bytes, str, pathlib.Path]
 TrackedCPEDict = Dict[str, TrackedCPEFilterDict]
 TrackedCPEMatchingDict = Dict[str, "abstract.ACVEMatcher"]
 DownloadGenerator = Generator[
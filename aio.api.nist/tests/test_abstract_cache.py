@@ -0,0 +1,222 @@
+import hashlib
+import json
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+
+import abstracts
+
+from aio.api import nist
+
+
+@abstracts.implementer(nist.ANISTCache)
+class DummyNISTCache:
+    pass
+
+
+def test_cache_constructor():
+    cache = DummyNISTCache("PATH")
+    assert cache._path == "PATH"
+
+
+def test_cache_parse_meta():
+    meta = (
+        "lastModifiedDate:2022-01-01T03:00:01-05:00\r\n"
+        "size:123\r\n"
+        "\r\n"
+        "sha256:ABC123\r\n")
+    assert (
+        DummyNISTCache.parse_meta(meta)
+        == dict(lastModifiedDate="2022-01-01T03:00:01-05:00",
+                size="123",
+                sha256="ABC123"))
+
+
+def test_cache_path(patches):
+    cache = DummyNISTCache("PATH")
+    patched = patches(
+        "pathlib",
+        prefix="aio.api.nist.abstract.cache")
+
+    with patched as (m_plib, ):
+        assert cache.path == m_plib.Path.return_value
+
+    assert (
+        m_plib.Path.call_args
+        == [("PATH", ), {}])
+    assert "path" in cache.__dict__
+
+
+def test_cache_feed_path(patches):
+    cache = DummyNISTCache("PATH")
+    patched = patches(
+        ("ANISTCache.path",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.api.nist.abstract.cache")
+
+    with patched as (m_path, ):
+        assert (
+            cache.feed_path("https://nvd/feeds/FEED.json.gz")
+            == m_path.return_value.joinpath.return_value)
+
+    assert (
+        m_path.return_value.joinpath.call_args
+        == [("FEED.json.gz", ), {}])
+
+
+def test_cache_meta_path(patches):
+    cache = DummyNISTCache("PATH")
+    patched = patches(
+        ("ANISTCache.path",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.api.nist.abstract.cache")
+
+    with patched as (m_path, ):
+        assert (
+            cache.meta_path("https://nvd/feeds/FEED.json.gz")
+            == m_path.return_value.joinpath.return_value)
+
+    assert (
+        m_path.return_value.joinpath.call_args
+        == [("FEED.json.gz.meta.json", ), {}])
+
+
+def test_cache_parsed_path(patches):
+    cache = DummyNISTCache("PATH")
+    patched = patches(
+        ("ANISTCache.path",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.api.nist.abstract.cache")
+
+    with patched as (m_path, ):
+        assert (
+            cache.parsed_path("HASH", "FINGERPRINT")
+            == m_path.return_value.joinpath.return_value)
+
+    assert (
+        m_path.return_value.joinpath.call_args
+        == [("parsed", "HASH-FINGERPRINT.pickle"), {}])
+
+
+def test_cache_get_feed(patches):
+    cache = DummyNISTCache("PATH")
+    patched = patches(
+        "ANISTCache.feed_path",
+        prefix="aio.api.nist.abstract.cache")
+
+    with patched as (m_path, ):
+        assert (
+            cache.get_feed("URL")
+            == m_path.return_value.read_bytes.return_value)
+
+    assert (
+        m_path.call_args
+        == [("URL", ), {}])
+
+
+def test_cache_feed_roundtrip(tmp_path):
+    url = "https://nvd/feeds/nvdcve-1.1-2022.json.gz"
+    cache = DummyNISTCache(tmp_path / "cache")
+    assert cache.get_meta(url) is None
+
+    feed_hash = cache.set_feed(
+        url,
+        b"FEED",
+        sha256="SHA",
+        etag="ETAG")
+
+    assert feed_hash == hashlib.sha256(b"FEED").hexdigest()
+    assert cache.get_feed(url) == b"FEED"
+    assert (
+        cache.get_meta(url)
+        == dict(hash=feed_hash,
+                sha256="SHA",
+                etag="ETAG",
+                last_modified=""))
+    assert (
+        sorted(p.name for p in cache.path.iterdir())
+        == ["nvdcve-1.1-2022.json.gz",
+            "nvdcve-1.1-2022.json.gz.meta.json"])
+
+
+@pytest.mark.parametrize(
+    "meta",
+    ["",
+     "NOT JSON",
+     "[]",
+     json.dumps(dict(hash="HASH", sha256="SHA", etag="")),
+     json.dumps(
+         dict(hash="HASH", sha256=None, etag="", last_modified=""))])
+def test_cache_get_meta_invalid(tmp_path, meta):
+    url = "https://nvd/feeds/nvdcve-1.1-2022.json.gz"
+    cache = DummyNISTCache(tmp_path)
+    cache.feed_path(url).write_bytes(b"FEED")
+    cache.meta_path(url).write_text(meta)
+    assert cache.get_meta(url) is None
+
+
+def test_cache_get_meta_missing_feed(tmp_path):
+    url = "https://nvd/feeds/nvdcve-1.1-2022.json.gz"
+    cache = DummyNISTCache(tmp_path)
+    cache.set_feed(url, b"FEED")
+    cache.feed_path(url).unlink()
+    assert cache.get_meta(url) is None
+
+
+def test_cache_parsed_roundtrip(tmp_path):
+    cache = DummyNISTCache(tmp_path)
+    parsed = (
+        dict(CVE1=dict(id="CVE1")),
+        {"cpe:2.3:a:vendor:product:*": {"CVE1"}})
+    assert cache.get_parsed("HASH", "FINGERPRINT") is None
+
+    assert not cache.set_parsed("HASH", "FINGERPRINT", parsed)
+
+    assert cache.get_parsed("HASH", "FINGERPRINT") == parsed
+    assert cache.get_parsed("HASH", "OTHER") is None
+    assert cache.get_parsed("OTHER", "FINGERPRINT") is None
+    assert (
+        list((tmp_path / "parsed").iterdir())
+        == [cache.parsed_path("HASH", "FINGERPRINT")])
+
+
+@pytest.mark.parametrize("data", [b"", b"NOT A PICKLE", b"\x80"])
+def test_cache_get_parsed_invalid(tmp_path, data):
+    cache = DummyNISTCache(tmp_path)
+    path = cache.parsed_path("HASH", "FINGERPRINT")
+    path.parent.mkdir()
+    path.write_bytes(data)
+    assert cache.get_parsed("HASH", "FINGERPRINT") is None
+
+
+def test_cache_set_parsed(patches):
+    cache = DummyNISTCache("PATH")
+    patched = patches(
+        "pickle",
+        "ANISTCache.parsed_path",
+        "ANISTCache._write",
+        prefix="aio.api.nist.abstract.cache")
+    parsed = MagicMock()
+
+    with patched as (m_pickle, m_path, m_write):
+        assert not cache.set_parsed("HASH", "FINGERPRINT", parsed)
+
+    assert (
+        m_path.call_args
+        == [("HASH", "FINGERPRINT"), {}])
+    assert (
+        m_pickle.dumps.call_args
+        == [(parsed, ), dict(protocol=m_pickle.HIGHEST_PROTOCOL)])
+    assert (
+        m_write.call_args
+        == [(m_path.return_value, m_pickle.dumps.return_value), {}])
+
+
+def test_cache_write(tmp_path):
+    cache = DummyNISTCache(tmp_path)
+    path = tmp_path / "some" / "path"
+    cache._write(path, b"DATA")
+    assert path.read_bytes() == b"DATA"
+    cache._write(path, b"OTHER")
+    assert path.read_bytes() == b"OTHER"
+    assert list(path.parent.iterdir()) == [path]
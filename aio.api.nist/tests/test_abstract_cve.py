@@ -192,17 +192,28 @@ def test_cve_gather_cpes(patches, include):
     cpe_obj = cpe_class.from_string.return_value
     assert (
         m_include.call_args_list
-        == [[({'data': 'DATA0'}, cpe_obj), {}],
-            [({'data': 'DATA1'}, cpe_obj), {}],
-            [({'data': 'DATA2'}, cpe_obj), {}],
-            [({'data': 'DATA3'}, cpe_obj), {}],
-            [({'data': 'DATA4'}, cpe_obj), {}],
-            [({'data': 'DATAa3'}, cpe_obj), {}],
-            [({'data': 'DATAa4'}, cpe_obj), {}],
-            [({'data': 'DATAa5'}, cpe_obj), {}],
-            [({'data': 'DATAa6'}, cpe_obj), {}],
-            [({'data': 'DATAab5'}, cpe_obj), {}],
-            [({'data': 'DATAab6'}, cpe_obj), {}]])
+        == [[({'cpe23Uri': 'URI0', 'data': 'DATA0'},
+              cpe_obj), {}],
+            [({'cpe23Uri': 'URI1', 'data': 'DATA1'},
+              cpe_obj), {}],
+            [({'cpe23Uri': 'URI2', 'data': 'DATA2'},
+              cpe_obj), {}],
+            [({'cpe23Uri': 'URI3', 'data': 'DATA3'},
+              cpe_obj), {}],
+            [({'cpe23Uri': 'URI4', 'data': 'DATA4'},
+              cpe_obj), {}],
+            [({'cpe23Uri': 'URIa3', 'data': 'DATAa3'},
+              cpe_obj), {}],
+            [({'cpe23Uri': 'URIa4', 'data': 'DATAa4'},
+              cpe_obj), {}],
+            [({'cpe23Uri': 'URIa5', 'data': 'DATAa5'},
+              cpe_obj), {}],
+            [({'cpe23Uri': 'URIa6', 'data': 'DATAa6'},
+              cpe_obj), {}],
+            [({'cpe23Uri': 'URIab5', 'data': 'DATAab5'},
+              cpe_obj), {}],
+            [({'cpe23Uri': 'URIab6', 'data': 'DATAab6'},
+              cpe_obj), {}]])
     expected_cpe_count = (
         6
         if include == "odd"
@@ -216,25 +227,25 @@ def test_cve_gather_cpes(patches, include):
 @pytest.mark.parametrize("matches", [True, False])
 def test_cve_include_version(tracked, matches):
     tracked_cpes = MagicMock()
-    tracked_cpes.__contains__.return_value = tracked
     cve = DummyCVE("CVE", tracked_cpes, "CPE_CLASS")
     cpe_match = MagicMock()
     cpe = MagicMock()
-    tracked_cpes.__getitem__.return_value.return_value = matches
+    matcher = MagicMock(return_value=matches)
+    tracked_cpes.get.return_value = (
+        matcher
+        if tracked
+        else None)
     assert (
         cve.include_version(cpe_match, cpe)
         == (tracked and matches))
     assert (
-        tracked_cpes.__contains__.call_args
+        tracked_cpes.get.call_args
         == [(str(cpe),), {}])
     if not tracked:
-        assert not tracked_cpes.__getitem__.called
+        assert not matcher.called
         return
     assert (
-        tracked_cpes.__getitem__.call_args
-        == [(str(cpe), ), {}])
-    assert (
-        tracked_cpes.__getitem__.return_value.call_args
+        matcher.call_args
         == [(cve, cpe, cpe_match), {}])
 
 
@@ -1,6 +1,7 @@
 
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
+import aiohttp
 import pytest
 
 import abstracts
@@ -11,6 +12,10 @@ from aio.api import nist
 @abstracts.implementer(nist.ANISTDownloader)
 class DummyNISTDownloader:
 
+    @property
+    def cache_class(self):
+        return super().cache_class
+
     @property
     def parser_class(self):
         return super().parser_class
@@ -20,8 +25,12 @@ class DummyNISTDownloader:
 @pytest.mark.parametrize("session", [None, False, "SESSION"])
 @pytest.mark.parametrize("since", [None, False, "SINCE"])
 @pytest.mark.parametrize("cve_fields", [None, False, "CVE_FIELDS"])
-def test_downloader_constructor(ignored_cves, session, since, cve_fields):
+@pytest.mark.parametrize("cache", [None, False, "CACHE"])
+def test_downloader_constructor(
+        ignored_cves, session, since, cve_fields, cache):
     kwargs = {}
+    if cache is not None:
+        kwargs["cache"] = cache
     if ignored_cves is not None:
         kwargs["ignored_cves"] = ignored_cves
     if session is not None:
@@ -41,6 +50,7 @@ def test_downloader_constructor(ignored_cves, session, since, cve_fields):
     assert downloader.cve_fields == cve_fields
     assert downloader._session == session
     assert downloader._since == since
+    assert downloader._cache == cache
     assert (
         downloader.nist_url_tpl
         == nist.abstract.downloader.NIST_URL_TPL)
@@ -50,6 +60,8 @@ def test_downloader_constructor(ignored_cves, session, since, cve_fields):
     assert downloader.cpe_revmap == {}
     assert "cpe_revmap" in downloader.__dict__
 
+    with pytest.raises(NotImplementedError):
+        downloader.cache_class
     with pytest.raises(NotImplementedError):
         downloader.parser_class
 
@@ -76,6 +88,30 @@ async def test_downloader_dunder_aiter(iters, patches):
     assert results == downloads
 
 
+@pytest.mark.parametrize("cache", [None, "", "CACHE"])
+def test_downloader_cache(patches, cache):
+    downloader = DummyNISTDownloader("TRACKED_CPES", cache=cache)
+    patched = patches(
+        ("ANISTDownloader.cache_class",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.api.nist.abstract.downloader")
+
+    with patched as (m_class, ):
+        assert (
+            downloader.cache
+            == (m_class.return_value.return_value
+                if cache
+                else None))
+
+    if cache:
+        assert (
+            m_class.return_value.call_args
+            == [(cache, ), {}])
+    else:
+        assert not m_class.called
+    assert "cache" in downloader.__dict__
+
+
 async def test_downloader_downloads(iters, patches):
     downloader = DummyNISTDownloader("TRACKED_CPES")
     patched = patches(
@@ -284,15 +320,43 @@ def test_downloader_add(patches):
         == [(cpe_revmap, ), {}])
 
 
+@pytest.mark.parametrize("kwargs", [{}, dict(headers="HEADERS")])
+async def test_downloader_download(patches, kwargs):
+    downloader = DummyNISTDownloader("URLS", "TRACKED_CPES")
+    patched = patches(
+        "logger",
+        ("ANISTDownloader.session",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.api.nist.abstract.downloader")
+
+    with patched as (m_logger, m_session):
+        m_session.return_value.get = AsyncMock()
+        assert (
+            await downloader.download("URL", **kwargs)
+            == m_session.return_value.get.return_value)
+
+    assert (
+        m_session.return_value.get.call_args
+        == [("URL", ), kwargs])
+    assert (
+        m_logger.debug.call_args
+        == [("Downloading CVE data: URL", ), {}])
+
+
 @pytest.mark.parametrize("data", [True, False])
 @pytest.mark.parametrize("raises", [True, False])
-async def test_downloader_download_and_parse(patches, data, raises):
+@pytest.mark.parametrize("cache", [True, False])
+async def test_downloader_download_and_parse(patches, data, raises, cache):
     downloader = DummyNISTDownloader("URLS", "TRACKED_CPES")
     patched = patches(
         "logger",
+        ("ANISTDownloader.cache",
+         dict(new_callable=PropertyMock)),
         "ANISTDownloader.download",
+        "ANISTDownloader.download_and_parse_cached",
         "ANISTDownloader.add",
         "ANISTDownloader.parse",
+        "ANISTDownloader.parse_download",
         "Predownload",
         prefix="aio.api.nist.abstract.downloader")
     url = MagicMock()
@@ -302,13 +366,22 @@ async def test_downloader_download_and_parse(patches, data, raises):
         if data
         else {})
 
-    with patched as (m_logger, m_download, m_add, m_parse, m_pre):
+    with patched as patchy:
+        (m_logger, m_cache, m_download, m_cached,
+         m_add, m_parse, m_parse_download, m_pre) = patchy
+        if not cache:
+            m_cache.return_value = None
         m_download.return_value.status = (
             200
             if not raises
             else 500)
         m_parse.return_value = "FOO", "BAR"
-        if raises and not data:
+        m_parse_download.return_value = "FOO", "BAR"
+        if cache and not data:
+            assert (
+                await downloader.download_and_parse(url, **kwargs)
+                == m_cached.return_value)
+        elif raises and not data:
             with pytest.raises(nist.exceptions.CVEDownloadError) as e:
                 await downloader.download_and_parse(url, **kwargs)
         else:
@@ -318,41 +391,50 @@ async def test_downloader_download_and_parse(patches, data, raises):
                     if not data
                     else m_pre.return_value))
 
+    if cache and not data:
+        assert (
+            m_cached.call_args
+            == [(m_cache.return_value, url), {}])
+        assert not m_download.called
+        assert not m_add.called
+        assert not m_parse.called
+        assert not m_parse_download.called
+        assert not m_pre.called
+        return
+    assert not m_cached.called
     if data:
         assert not m_download.called
+        assert not m_parse_download.called
+        assert (
+            m_parse.call_args
+            == [(url, _data), {}])
     else:
         assert not m_pre.called
+        assert not m_parse.called
         assert (
             m_download.call_args
             == [(url, ), {}])
-        if not raises:
-            assert (
-                m_download.return_value.read.call_args
-                == [(), {}])
-        else:
+        if raises:
             assert (
                 e.value.args[0]
                 == f"Download failed {url}: {m_download.return_value.reason}")
             assert not m_add.called
-            assert not m_parse.called
+            assert not m_parse_download.called
             assert not m_logger.debug.called
             return
+        assert (
+            m_parse_download.call_args
+            == [(url, m_download.return_value), {}])
     assert (
         m_logger.debug.call_args
         == [(f"CVE data saved: {url}", ), {}])
     assert (
         m_add.call_args
         == [("FOO", "BAR"), {}])
-    assert (
-        m_parse.call_args
-        == [(url,
-             (m_download.return_value.read.return_value
-              if not data
-              else _data), ),
-            {}])
 
 
-async def test_downloader_parse(patches):
+@pytest.mark.parametrize("parser", [None, "PARSER"])
+async def test_downloader_parse(patches, parser):
     downloader = DummyNISTDownloader("URLS", "TRACKED_CPES")
     patched = patches(
         "logger",
@@ -362,10 +444,15 @@ async def test_downloader_parse(patches):
          dict(new_callable=AsyncMock)),
         prefix="aio.api.nist.abstract.downloader")
     data = MagicMock()
+    kwargs = (
+        dict(parser=MagicMock())
+        if parser
+        else {})
 
     with patched as (m_logger,  m_parser, m_execute):
+        _parser = kwargs.get("parser", m_parser.return_value)
         assert (
-            await downloader.parse("URL", data)
+            await downloader.parse("URL", data, **kwargs)
             == m_execute.return_value)
 
     assert (
@@ -373,6 +460,333 @@ async def test_downloader_parse(patches):
         == [("Parsing CVE data: URL", ), {}])
     assert (
         m_execute.call_args
-        == [(m_parser.return_value,
-             data),
-            {}])
+        == [(_parser, data), {}])
+    if parser:
+        assert not m_parser.called
+
+
+@pytest.mark.parametrize("parser", [None, "PARSER"])
+async def test_downloader_parse_download(patches, parser):
+    downloader = DummyNISTDownloader("URLS", "TRACKED_CPES")
+    patched = patches(
+        "ANISTDownloader.parse",
+        prefix="aio.api.nist.abstract.downloader")
+    download = MagicMock()
+    chunks = [b"FOO", b"BAR", b"BAZ"]
+    parsed = {}
+
+    async def iter_chunked(size):
+        for chunk in chunks:
+            yield chunk
+
+    async def parse(url, path, parser=None):
+        parsed["path"] = path
+        parsed["data"] = path.read_bytes()
+        return "CVES", "REVMAP"
+
+    download.content.iter_chunked.side_effect = iter_chunked
+    kwargs = (
+        dict(parser=parser)
+        if parser
+        else {})
+
+    with patched as (m_parse, ):
+        m_parse.side_effect = parse
+        assert (
+            await downloader.parse_download(
+                "https://nvd/feeds/FEED.json.gz",
+                download,
+                **kwargs)
+            == ("CVES", "REVMAP"))
+
+    assert (
+        download.content.iter_chunked.call_args
+        == [(nist.abstract.downloader.FEED_CHUNK_SIZE, ), {}])
+    assert (
+        m_parse.call_args
+        == [("https://nvd/feeds/FEED.json.gz", parsed["path"]),
+            dict(parser=parser)])
+    assert parsed["path"].name == "FEED.json.gz"
+    assert parsed["data"] == b"FOOBARBAZ"
+    assert not parsed["path"].exists()
+
+
+@pytest.mark.parametrize("parsed", [True, False])
+@pytest.mark.parametrize("download", [True, False])
+async def test_downloader_download_and_parse_cached(patches, parsed, download):
+    downloader = DummyNISTDownloader("URLS", "TRACKED_CPES")
+    patched = patches(
+        "logger",
+        ("ANISTDownloader.parser",
+         dict(new_callable=PropertyMock)),
+        "ANISTDownloader.download_cached",
+        "ANISTDownloader.add",
+        "ANISTDownloader.parse",
+        "Predownload",
+        prefix="aio.api.nist.abstract.downloader")
+    cache = MagicMock()
+    _download = (
+        MagicMock()
+        if download
+        else None)
+    cache.get_parsed.return_value = (
+        ("CACHED_CVES", "CACHED_REVMAP")
+        if parsed
+        else None)
+
+    with patched as (m_logger, m_parser, m_cached, m_add, m_parse, m_pre):
+        m_cached.return_value = _download, "HASH"
+        m_parse.return_value = "CVES", "REVMAP"
+        assert (
+            await downloader.download_and_parse_cached(cache, "URL")
+            == (_download
+                if download
+                else m_pre.return_value))
+
+    fingerprint = m_parser.return_value.fingerprint
+    assert (
+        m_cached.call_args
+        == [(cache, "URL"), {}])
+    assert (
+        cache.get_parsed.call_args
+        == [("HASH", fingerprint), {}])
+    if download:
+        assert not m_pre.called
+    else:
+        assert (
+            m_pre.call_args
+            == [("URL", ), {}])
+    if parsed:
+        assert not m_parse.called
+        assert not cache.feed_path.called
+        assert not cache.set_parsed.called
+        assert (
+            m_logger.debug.call_args
+            == [("CVE data loaded from cache: URL", ), {}])
+        assert (
+            m_add.call_args
+            == [("CACHED_CVES", "CACHED_REVMAP"), {}])
+        return
+    assert not m_logger.debug.called
+    assert (
+        cache.feed_path.call_args
+        == [("URL", ), {}])
+    assert (
+        m_parse.call_args
+        == [("URL", cache.feed_path.return_value), {}])
+    assert (
+        cache.set_parsed.call_args
+        == [("HASH", fingerprint, ("CVES", "REVMAP")), {}])
+    assert (
+        m_add.call_args
+        == [("CVES", "REVMAP"), {}])
+
+
+@pytest.mark.parametrize(
+    "cached",
+    [None,
+     dict(hash="HASH", sha256="SHA", etag="", last_modified=""),
+     dict(hash="HASH", sha256="OTHER", etag="", last_modified=""),
+     dict(hash="HASH", sha256="", etag="ETAG", last_modified="MODIFIED")])
+@pytest.mark.parametrize("sha256", ["", "SHA"])
+@pytest.mark.parametrize("status", [200, 304, 500])
+async def test_downloader_download_cached(patches, cached, sha256, status):
+    downloader = DummyNISTDownloader("URLS", "TRACKED_CPES")
+    patched = patches(
+        "ANISTDownloader.download",
+        "ANISTDownloader.download_meta",
+        prefix="aio.api.nist.abstract.downloader")
+    cache = MagicMock()
+    cache.get_meta.return_value = cached
+    download = MagicMock()
+    download.read = AsyncMock()
+    download.status = status
+    download.headers = dict(ETag="NEW_ETAG")
+    meta = (
+        dict(sha256=sha256)
+        if sha256
+        else {})
+    matches = bool(cached and sha256 and cached["sha256"] == sha256)
+    not_modified = bool(not matches and cached and status == 304)
+    fails = not matches and not not_modified and status != 200
+
+    with patched as (m_download, m_meta):
+        m_meta.return_value = meta
+        m_download.return_value = download
+        if fails:
+            with pytest.raises(nist.exceptions.CVEDownloadError) as e:
+                await downloader.download_cached(cache, "URL")
+        else:
+            assert (
+                await downloader.download_cached(cache, "URL")
+                == ((None, "HASH")
+                    if matches or not_modified
+                    else (download, cache.set_feed.return_value)))
+
+    assert (
+        cache.get_meta.call_args
+        == [("URL", ), {}])
+    assert (
+        m_meta.call_args
+        == [("URL", ), {}])
+    if matches:
+        assert not m_download.called
+        assert not cache.set_feed.called
+        return
+    headers = {}
+    if cached and cached["etag"]:
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached["last_modified"]:
+        headers["If-Modified-Since"] = cached["last_modified"]
+    assert (
+        m_download.call_args
+        == [("URL", ), dict(headers=headers)])
+    if not_modified:
+        assert not cache.set_feed.called
+        return
+    if fails:
+        assert (
+            e.value.args[0]
+            == f"Download failed URL: {download.reason}")
+        assert not cache.set_feed.called
+        return
+    assert (
+        cache.set_feed.call_args
+        == [("URL", download.read.return_value),
+            dict(sha256=sha256,
+                 etag="NEW_ETAG",
+                 last_modified="")])
+
+
+@pytest.mark.parametrize("status", [200, 404])
+@pytest.mark.parametrize("raises", [True, False])
+async def test_downloader_download_meta(patches, status, raises):
+    downloader = DummyNISTDownloader("URLS", "TRACKED_CPES")
+    patched = patches(
+        "logger",
+        ("ANISTDownloader.cache_class",
+         dict(new_callable=PropertyMock)),
+        ("ANISTDownloader.session",
+         dict(new_callable=PropertyMock)),
+        "ANISTDownloader.meta_url",
+        prefix="aio.api.nist.abstract.downloader")
+    response = MagicMock()
+    response.status = status
+    response.text = AsyncMock()
+    error = aiohttp.ClientError("BOOM")
+
+    with patched as (m_logger, m_class, m_session, m_url):
+        get = m_session.return_value.get
+        get.return_value.__aenter__.return_value = response
+        if raises:
+            get.return_value.__aenter__.side_effect = error
+        assert (
+            await downloader.download_meta("URL")
+            == (m_class.return_value.parse_meta.return_value
+                if status == 200 and not raises
+                else {}))
+
+    assert (
+        m_url.call_args
+        == [("URL", ), {}])
+    assert (
+        m_session.return_value.get.call_args
+        == [(m_url.return_value, ), {}])
+    if raises:
+        assert (
+            m_logger.debug.call_args
+            == [(f"Failed to download CVE metadata for URL: {error}", ),
+                {}])
+        assert not m_class.called
+        return
+    assert not m_logger.debug.called
+    # The response is released, whatever its status.
+    assert get.return_value.__aexit__.called
+    if status != 200:
+        assert not response.text.called
+        assert not m_class.called
+        return
+    assert (
+        m_class.return_value.parse_meta.call_args
+        == [(response.text.return_value, ), {}])
+
+
+@pytest.mark.parametrize(
+    "url",
+    [("https://nvd/feeds/nvdcve-1.1-2022.json.gz",
+      "https://nvd/feeds/nvdcve-1.1-2022.meta"),
+     ("https://nvd/feeds/nvdcve-1.1-2022.json.gz.json.gz",
+      "https://nvd/feeds/nvdcve-1.1-2022.json.gz.meta")])
+def test_downloader_meta_url(url):
+    downloader = DummyNISTDownloader("URLS", "TRACKED_CPES")
+    url, expected = url
+    assert downloader.meta_url(url) == expected
+
+
+@pytest.mark.parametrize("cache", [True, False])
+@pytest.mark.parametrize("raises", [True, False])
+@pytest.mark.parametrize("parser", [None, "PARSER"])
+async def test_downloader_fetch_and_parse(patches, cache, raises, parser):
+    downloader = DummyNISTDownloader("URLS", "TRACKED_CPES")
+    patched = patches(
+        ("ANISTDownloader.cache",
+         dict(new_callable=PropertyMock)),
+        "ANISTDownloader.download",
+        "ANISTDownloader.download_cached",
+        "ANISTDownloader.parse",
+        "ANISTDownloader.parse_download",
+        prefix="aio.api.nist.abstract.downloader")
+
+    kwargs = (
+        dict(parser=parser)
+        if parser
+        else {})
+
+    with patched as patchy:
+        (m_cache, m_download, m_cached,
+         m_parse, m_parse_download) = patchy
+        if not cache:
+            m_cache.return_value = None
+        m_download.return_value.status = (
+            200
+            if not raises
+            else 500)
+        if not cache and raises:
+            with pytest.raises(nist.exceptions.CVEDownloadError) as e:
+                await downloader.fetch_and_parse("URL", **kwargs)
+        else:
+            assert (
+                await downloader.fetch_and_parse("URL", **kwargs)
+                == (m_parse.return_value
+                    if cache
+                    else m_parse_download.return_value))
+
+    if cache:
+        assert not m_download.called
+        assert not m_parse_download.called
+        assert (
+            m_cached.call_args
+            == [(m_cache.return_value, "URL"), {}])
+        assert (
+            m_cache.return_value.feed_path.call_args
+            == [("URL", ), {}])
+        assert (
+            m_parse.call_args
+            == [("URL", m_cache.return_value.feed_path.return_value),
+                dict(parser=parser)])
+        return
+    assert not m_cached.called
+    assert not m_parse.called
+    assert (
+        m_download.call_args
+        == [("URL", ), {}])
+    if raises:
+        assert (
+            e.value.args[0]
+            == f"Download failed URL: {m_download.return_value.reason}")
+        assert not m_parse_download.called
+        return
+    assert (
+        m_parse_download.call_args
+        == [("URL", m_download.return_value),
+            dict(parser=parser)])
@@ -1,6 +1,9 @@
 
+import logging
 from unittest.mock import MagicMock, PropertyMock
 
+from packaging import version
+
 import pytest
 
 import abstracts
@@ -13,13 +16,34 @@ class DummyCVEMatcher:
     pass
 
 
+def test_matcher_parse_version(patches):
+    patched = patches(
+        "version",
+        prefix="aio.api.nist.abstract.matcher")
+    DummyCVEMatcher.parse_version.cache_clear()
+
+    with patched as (m_version, ):
+        assert (
+            DummyCVEMatcher.parse_version("1.2.3")
+            == m_version.Version.return_value)
+        assert (
+            DummyCVEMatcher.parse_version("1.2.3")
+            == m_version.Version.return_value)
+
+    assert (
+        m_version.Version.call_args_list
+        == [[("1.2.3", ), {}]])
+    DummyCVEMatcher.parse_version.cache_clear()
+
+
 def test_matcher_constructor():
     matcher = DummyCVEMatcher("FILTER_DICT")
     assert matcher._filter_dict == "FILTER_DICT"
 
 
 @pytest.mark.parametrize("matched", [True, False])
-def test_matcher_dunder_call(patches, matched):
+@pytest.mark.parametrize("debug", [True, False])
+def test_matcher_dunder_call(patches, matched, debug):
     matcher = DummyCVEMatcher("FILTER_DICT")
     patched = patches(
         "logger",
@@ -28,6 +52,7 @@ def test_matcher_dunder_call(patches, matched):
         prefix="aio.api.nist.abstract.matcher")
 
     with patched as (m_log, m_match, m_debug):
+        m_log.isEnabledFor.return_value = debug
         m_match.return_value = matched
         assert (
             matcher("CVE", "CPE", "CPE_MATCH")
@@ -36,6 +61,13 @@ def test_matcher_dunder_call(patches, matched):
     assert (
         m_match.call_args
         == [("CVE", "CPE", "CPE_MATCH"), {}])
+    assert (
+        m_log.isEnabledFor.call_args
+        == [(logging.DEBUG, ), {}])
+    if not debug:
+        assert not m_log.debug.called
+        assert not m_debug.called
+        return
     if matched:
         assert (
             m_log.debug.call_args
@@ -117,6 +149,12 @@ def test_matcher_tracked_version():
     assert "tracked_version" not in matcher.__dict__
 
 
+def test_matcher_version_matches():
+    matcher = DummyCVEMatcher("FILTER_DICT")
+    assert matcher.version_matches == {}
+    assert "version_matches" in matcher.__dict__
+
+
 def test_matcher_get_version_info(patches):
     matcher = DummyCVEMatcher("FILTER_DICT")
     patched = patches(
@@ -237,30 +275,27 @@ def test_matcher_match_parts(patches, part, vendor, product):
             == matches)
 
 
-@pytest.mark.parametrize("version", [None, 0, 7, 23])
+@pytest.mark.parametrize("version", [0, 7, 23])
 @pytest.mark.parametrize("end_exc", [None, 0, 7, 23])
 @pytest.mark.parametrize("end_inc", [None, 0, 7, 23])
 @pytest.mark.parametrize("start_exc", [None, 0, 7, 23])
 @pytest.mark.parametrize("start_inc", [None, 0, 7, 23])
-def test_matcher_match_version(
+def test_matcher_match_version_range(
         patches, version, end_exc, end_inc, start_exc, start_inc):
     matcher = DummyCVEMatcher("FILTER_DICT")
     patched = patches(
-        ("ACVEMatcher.tracked_version",
-         dict(new_callable=PropertyMock)),
         "ACVEMatcher.get_version_info",
         prefix="aio.api.nist.abstract.matcher")
     expected = True
 
-    if version:
-        if end_exc is not None and version >= end_exc:
-            expected = False
-        elif end_inc is not None and version > end_inc:
-            expected = False
-        elif start_exc is not None and version <= start_exc:
-            expected = False
-        elif start_inc is not None and version < start_inc:
-            expected = False
+    if end_exc is not None and version >= end_exc:
+        expected = False
+    elif end_inc is not None and version > end_inc:
+        expected = False
+    elif start_exc is not None and version <= start_exc:
+        expected = False
+    elif start_inc is not None and version < start_inc:
+        expected = False
 
     version_dict = dict(
         end_exc=end_exc,
@@ -268,27 +303,85 @@ def test_matcher_match_version(
         start_exc=start_exc,
         start_inc=start_inc)
 
-    with patched as (m_tracked, m_version):
-        m_tracked.return_value = version
+    with patched as (m_version, ):
         m_version.return_value.__getitem__.side_effect = (
             lambda k: version_dict[k])
         assert (
-            matcher.match_version("CVE", "CPE", "CPE_MATCH")
+            matcher.match_version_range(version, "CPE_MATCH")
             == expected)
 
-    if not version:
-        assert not m_version.called
-        return
     assert (
         m_version.call_args
         == [("CPE_MATCH", ), {}])
 
 
+@pytest.mark.parametrize("version", [None, "", "VERSION"])
+@pytest.mark.parametrize("cached", [None, True, False])
+def test_matcher_match_version(patches, version, cached):
+    matcher = DummyCVEMatcher("FILTER_DICT")
+    patched = patches(
+        ("ACVEMatcher.tracked_version",
+         dict(new_callable=PropertyMock)),
+        ("ACVEMatcher.version_matches",
+         dict(new_callable=PropertyMock)),
+        "ACVEMatcher.match_version_range",
+        prefix="aio.api.nist.abstract.matcher")
+    cpe_match = dict(
+        versionEndExcluding="END_EXC",
+        versionStartIncluding="START_INC",
+        other="OTHER")
+    bounds = ("END_EXC", None, None, "START_INC")
+    version_matches = (
+        {bounds: cached}
+        if cached is not None
+        else {})
+
+    with patched as (m_tracked, m_matches, m_range):
+        m_tracked.return_value = version
+        m_matches.return_value = version_matches
+        assert (
+            matcher.match_version("CVE", "CPE", cpe_match)
+            == (True
+                if not version
+                else (cached
+                      if cached is not None
+                      else m_range.return_value)))
+
+    if not version:
+        assert not m_matches.called
+        assert not m_range.called
+        return
+    if cached is not None:
+        assert not m_range.called
+        return
+    assert (
+        m_range.call_args
+        == [("VERSION", cpe_match), {}])
+    assert version_matches == {bounds: m_range.return_value}
+
+
+def test_matcher_match_version_functional():
+    matcher = DummyCVEMatcher(dict(version=version.Version("1.2.3")))
+    matches = [
+        dict(versionEndExcluding="1.2.3"),
+        dict(versionEndExcluding="1.2.4"),
+        dict(versionEndIncluding="1.2.3"),
+        dict(versionStartExcluding="1.2.3"),
+        dict(versionStartIncluding="1.2.3",
+             versionEndExcluding="2.0"),
+        dict(versionEndExcluding="1.2.4"),
+        {}]
+    assert (
+        [matcher.match_version("CVE", "CPE", m) for m in matches]
+        == [False, True, True, False, True, True, True])
+    assert len(matcher.version_matches) == 6
+
+
 @pytest.mark.parametrize("version_info", [None, 0, 23])
 def test_matcher__cpe_version(patches, version_info):
     matcher = DummyCVEMatcher("FILTER_DICT")
     patched = patches(
-        "version",
+        "ACVEMatcher.parse_version",
         "utils",
         prefix="aio.api.nist.abstract.matcher")
     cpe_match = MagicMock()
@@ -297,7 +390,7 @@ def test_matcher__cpe_version(patches, version_info):
         cpe_match.get.return_value = version_info
         assert (
             matcher._cpe_version(cpe_match, "action", "ending")
-            == (m_version.Version.return_value
+            == (m_version.return_value
                 if version_info is not None
                 else None))
 
@@ -305,11 +398,11 @@ def test_matcher__cpe_version(patches, version_info):
         cpe_match.get.call_args
         == [("versionActionEndingluding", None), {}])
     if version_info is None:
-        assert not m_version.Version.called
+        assert not m_version.called
         assert not m_utils.typed.called
         return
     assert (
-        m_version.Version.call_args
+        m_version.call_args
         == [(m_utils.typed.return_value, ), {}])
     assert (
         m_utils.typed.call_args
@@ -1,4 +1,6 @@
 
+import json
+import pathlib
 import types
 from unittest.mock import MagicMock, PropertyMock
 
@@ -7,6 +9,7 @@ import pytest
 import abstracts
 
 from aio.api import nist
+from aio.core.functional import qdict
 
 
 @abstracts.implementer(nist.ANISTParser)
@@ -27,10 +30,13 @@ class DummyNISTParser:
 
 @pytest.mark.parametrize(
     "ignored_cves", [None, False, (), "IGNORED_CVES"])
-def test_parser_constructor(ignored_cves):
+@pytest.mark.parametrize("stream", [None, True, False])
+def test_parser_constructor(ignored_cves, stream):
     kwargs = {}
     if ignored_cves is not None:
         kwargs["ignored_cves"] = ignored_cves
+    if stream is not None:
+        kwargs["stream"] = stream
 
     with pytest.raises(TypeError):
         nist.ANISTParser("TRACKED_CPES", **kwargs)
@@ -39,6 +45,7 @@ def test_parser_constructor(ignored_cves):
     parser = DummyNISTParser("TRACKED_CPES", **kwargs)
     assert parser._tracked_cpes == "TRACKED_CPES"
     assert parser.ignored_cves == (ignored_cves or set())
+    assert parser.stream == (True if stream is None else stream)
     assert parser.cves == {}
     assert "cves" in parser.__dict__
     assert parser.cpe_revmap == {}
@@ -53,15 +60,19 @@ def test_parser_dunder_call(patches):
     parser = DummyNISTParser("TRACKED_CPES")
     patched = patches(
         "ANISTParser.parse_cve_data",
+        "ANISTParser.read_feed",
         prefix="aio.api.nist.abstract.parser")
     data = MagicMock()
 
-    with patched as (m_parse, ):
+    with patched as (m_parse, m_read):
         assert parser(data) == m_parse.return_value
 
     assert (
-        m_parse.call_args
+        m_read.call_args
         == [(data, ), {}])
+    assert (
+        m_parse.call_args
+        == [(m_read.return_value, ), {}])
 
 
 def test_parser_query_fields(patches):
@@ -85,6 +96,58 @@ def test_parser_query_fields(patches):
     assert "query_fields" in parser.__dict__
 
 
+def test_parser_fingerprint():
+    tracked = {"cpe:2.3:a:vendor:product:*": dict(version="1.2")}
+    parser = DummyNISTParser(tracked, ignored_cves=["CVE-2", "CVE-1"])
+    fingerprint = parser.fingerprint
+    assert fingerprint is parser.fingerprint
+    assert "fingerprint" in parser.__dict__
+    assert len(fingerprint) == 64
+    assert (
+        DummyNISTParser(
+            dict(tracked),
+            ignored_cves=["CVE-1", "CVE-2"]).fingerprint
+        == fingerprint)
+    changed = [
+        DummyNISTParser(tracked),
+        DummyNISTParser(
+            {"cpe:2.3:a:vendor:product:*": dict(version="1.3")},
+            ignored_cves=["CVE-1", "CVE-2"]),
+        DummyNISTParser(
+            tracked,
+            ignored_cves=["CVE-1", "CVE-2"],
+            cve_fields=qdict(foo="bar"))]
+    for other in changed:
+        assert other.fingerprint != fingerprint
+
+
+@pytest.mark.parametrize(
+    "tracked",
+    [{},
+     {"cpe:2.3:a:vendor:product:*": {}},
+     {"cpe:2.3:a:vendor:product:*": {},
+      "cpe:2.3:a:other\\:vendor:product:1.2": {}}])
+def test_parser_tracked_cpe_re(tracked):
+    parser = DummyNISTParser(tracked)
+    tracked_re = parser.tracked_cpe_re
+    assert tracked_re is parser.tracked_cpe_re
+    assert "tracked_cpe_re" in parser.__dict__
+    candidates = [
+        "cpe:2.3:a:vendor:product:*",
+        "cpe:2.3:a:vendor:product:1.2",
+        "cpe:2.3:a:vendor:product2:*",
+        "cpe:2.3:o:vendor:product:*",
+        "cpe:2.3:a:other\\:vendor:product:1.2",
+        "cpe:2.3:a:other\\:vendor:product:1.23"]
+    for candidate in candidates:
+        raw = json.dumps(
+            dict(cpe23Uri=f"{candidate}:*:*:*:*:*:*:*",
+                 other=candidate))
+        assert (
+            bool(tracked_re.search(raw))
+            == (candidate in tracked))
+
+
 def test_parser_tracked_cpes(iters, patches):
     tracked_cpes = MagicMock()
     parser = DummyNISTParser(tracked_cpes)
@@ -321,6 +384,15 @@ def test_parser_parse_cve_data(iters, patches):
         == [[item, {}] for item in cves])
 
 
+@pytest.mark.parametrize("path", [str, pathlib.Path])
+def test_parser_read_feed(tmp_path, path):
+    parser = DummyNISTParser("TRACKED_CPES")
+    feed = tmp_path / "feed.json.gz"
+    feed.write_bytes(b"FEED")
+    assert parser.read_feed(b"DATA") == b"DATA"
+    assert parser.read_feed(path(feed)) == b"FEED"
+
+
 @pytest.mark.parametrize("date_str", [None, "", "DATE"])
 def test_parser__iso_date(patches, date_str):
     parser = DummyNISTParser("TRACKED_CPES")
@@ -344,17 +416,31 @@ def test_parser__iso_date(patches, date_str):
             == [(date_str, ), {}])
 
 
-def test_parser__junzip_items(patches):
-    parser = DummyNISTParser("TRACKED_CPES")
+@pytest.mark.parametrize("stream", [True, False])
+def test_parser__junzip_items(patches, stream):
+    parser = DummyNISTParser("TRACKED_CPES", stream=stream)
     patched = patches(
         "utils",
+        ("ANISTParser.tracked_cpe_re",
+         dict(new_callable=PropertyMock)),
         prefix="aio.api.nist.abstract.parser")
 
-    with patched as (m_utils, ):
+    with patched as (m_utils, m_re):
         assert (
             parser._junzip_items("DATA")
-            == m_utils.junzip.return_value.__getitem__.return_value)
+            == (m_utils.junzip_items.return_value
+                if stream
+                else m_utils.junzip.return_value.__getitem__.return_value))
 
+    if stream:
+        assert not m_utils.junzip.called
+        assert (
+            m_utils.junzip_items.call_args
+            == [("DATA", "CVE_Items"),
+                dict(match=m_re.return_value)])
+        return
+    assert not m_re.called
+    assert not m_utils.junzip_items.called
     assert (
         m_utils.junzip.call_args
         == [("DATA", ), {}])
@@ -1,4 +1,15 @@
 
+
+import gzip
+import hashlib
+import json
+from concurrent import futures
+from datetime import datetime
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from packaging import version
+
 import pytest
 
 from aio.api import nist
@@ -67,6 +78,8 @@ def test_downloader_constructor(patches, ignored_cves):
     assert (
         m_super.call_args
         == [("URLS", ), kwargs])
+    assert downloader.cache_class == nist.NISTCache
+    assert "cache_class" not in downloader.__dict__
     assert downloader.parser_class == nist.NISTParser
     assert "parser_class" not in downloader.__dict__
 
@@ -95,3 +108,91 @@ def test_parser_constructor(patches, ignored_cves):
     assert "cpe_class" not in parser.__dict__
     assert parser.matcher_class == nist.CVEMatcher
     assert "matcher_class" not in parser.__dict__
+
+
+def test_nist_cache_constructor(patches):
+    patched = patches(
+        "nist.ANISTCache.__init__",
+        prefix="aio.api.nist.nist")
+
+    with patched as (m_super, ):
+        m_super.return_value = None
+        cache = nist.NISTCache("PATH")
+
+    assert isinstance(cache, nist.ANISTCache)
+    assert (
+        m_super.call_args
+        == [("PATH", ), {}])
+
+
+async def test_nist_downloader_cache(tmp_path):
+    # Runs the downloader twice against a local stand-in for the NVD feeds,
+    # the second run should neither download nor parse the feed.
+    year = datetime.now().year
+    cpe = "cpe:2.3:a:vendor:product"
+    feed = gzip.compress(
+        json.dumps(
+            dict(CVE_Items=[
+                dict(cve=dict(CVE_data_meta=dict(ID="CVE-1")),
+                     configurations=dict(
+                         nodes=[
+                             dict(cpe_match=[
+                                 dict(cpe23Uri=f"{cpe}:*:*:*:*:*:*:*:*",
+                                      versionEndExcluding="2.0")])]),
+                     impact=dict(baseMetricV3=dict(cvssV3={})),
+                     publishedDate="2022-01-01T00:00Z")])).encode())
+    meta = (
+        "lastModifiedDate:2022-01-01T00:00:00-05:00\r\n"
+        f"sha256:{hashlib.sha256(gzip.decompress(feed)).hexdigest()}\r\n")
+    requests = []
+
+    async def handler(request):
+        requests.append(request.path)
+        if request.path.endswith(".meta"):
+            return web.Response(text=meta)
+        return web.Response(body=feed, headers=dict(ETag='"ETAG"'))
+
+    app = web.Application()
+    app.router.add_get("/{name}", handler)
+    parsed = []
+
+    class Parser(nist.NISTParser):
+
+        def parse_cve_data(self, data):
+            parsed.append(data)
+            return super().parse_cve_data(data)
+
+    async with TestServer(app) as server:
+
+        class Downloader(nist.NISTDownloader):
+            nist_url_tpl = (
+                f"{server.make_url('/')}nvdcve-1.1-{{year}}.json.gz")
+
+            @property
+            def parser_class(self):
+                return Parser
+
+        results = []
+        for _i in range(2):
+            with futures.ThreadPoolExecutor() as pool:
+                downloader = Downloader(
+                    {f"{cpe}:*": dict(
+                        version=version.Version("1.0"),
+                        date="2021-01-01")},
+                    since=year,
+                    pool=pool,
+                    cache=tmp_path)
+                async with downloader.session:
+                    urls = [url async for url in downloader]
+            results.append(
+                (urls, list(downloader.cves), downloader.cpe_revmap))
+
+    assert results[0][1:] == results[1][1:] == (
+        ["CVE-1"],
+        {"cpe:2.3:a:vendor:*:*": {"CVE-1"}})
+    assert len(parsed) == 1
+    assert (
+        requests
+        == [f"/nvdcve-1.1-{year}.meta",
+            f"/nvdcve-1.1-{year}.json.gz",
+            f"/nvdcve-1.1-{year}.meta"])
@@ -1,13 +1,20 @@
 
+import asyncio
+import atexit
 import inspect
+import json
 import logging as _logging
 import os
+import pathlib
+import threading
 import time
+from concurrent import futures
 from functools import cached_property, partial
-from typing import Any, Callable, Iterator, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 
 logger = _logging.getLogger(__name__)
+_profiler: Optional["AProfiler"] = None
 
 
 class ADebugLogging:
@@ -21,6 +28,7 @@ class ADebugLogging:
         self.__doc__ = getattr(fun, '__doc__')
         self._log = kwargs.pop("log", None)
         self._format_result = kwargs.pop("format_result", None)
+        self._profile_name = kwargs.pop("profile_name", None)
         self._show_cpu = kwargs.pop("show_cpu", None)
 
     def __call__(self, *args, **kwargs) -> Optional[Any]:
@@ -166,6 +174,205 @@ class ATraceLogging(ADebugLogging):
         return result
 
 
+class AProfiler:
+    """In memory aggregator of profiled calls.
+
+    Records are dumped at exit, as a JSON summary to `path`, and as a Chrome
+    trace-event file alongside it (eg `profile.json` -> `profile.trace.json`),
+    which can be loaded in `chrome://tracing` or Perfetto.
+
+    Only the process that created the profiler dumps its records, calls made
+    in forked executor processes are not recorded.
+
+    CPU time is only recorded for sync calls, and is `None` for coroutines
+    and generators, as CPU time used while they are suspended belongs to
+    other code running on the same thread.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = pathlib.Path(path)
+        self.pid = os.getpid()
+        self.calls: List[Dict] = []
+        self.start_time = time.perf_counter()
+
+    @property
+    def summary(self) -> Dict:
+        """Calls aggregated by name, ordered by total wall time."""
+        aggregated: Dict[str, Dict] = {}
+        for call in self.calls:
+            summary = aggregated.setdefault(
+                call["name"],
+                dict(calls=0,
+                     wall=0.0,
+                     wall_max=0.0,
+                     cpu=None,
+                     size=0,
+                     executors={}))
+            summary["calls"] += 1
+            summary["wall"] += call["wall"]
+            summary["wall_max"] = max(summary["wall_max"], call["wall"])
+            if call["cpu"] is not None:
+                summary["cpu"] = (summary["cpu"] or 0.0) + call["cpu"]
+            summary["size"] += call["size"] or 0
+            if call["executor"]:
+                executors = summary["executors"]
+                executors[call["executor"]] = (
+                    executors.get(call["executor"], 0) + 1)
+        return dict(
+            sorted(
+                aggregated.items(),
+                key=lambda item: item[1]["wall"],
+                reverse=True))
+
+    @property
+    def trace_events(self) -> List[Dict]:
+        """Calls as Chrome "complete" trace-events."""
+        return [
+            dict(name=call["name"],
+                 cat=call["executor"] or "call",
+                 ph="X",
+                 ts=round((call["start"] - self.start_time) * 1e6),
+                 dur=round(call["wall"] * 1e6),
+                 pid=self.pid,
+                 tid=call["tid"],
+                 args=dict(cpu=call["cpu"], size=call["size"]))
+            for call
+            in self.calls]
+
+    @property
+    def trace_path(self) -> pathlib.Path:
+        return self.path.with_suffix(".trace.json")
+
+    def dump(self) -> None:
+        """Write the summary and trace files."""
+        if os.getpid() != self.pid:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps(
+                dict(wall=time.perf_counter() - self.start_time,
+                     calls=self.summary),
+                indent=2))
+        self.trace_path.write_text(
+            json.dumps(
+                dict(traceEvents=self.trace_events,
+                     displayTimeUnit="ms")))
+
+    def record(
+            self,
+            name: str,
+            start: float,
+            wall: float,
+            cpu: Optional[float],
+            executor: Optional[str] = None,
+            size: Optional[int] = None) -> None:
+        """Record a profiled call."""
+        self.calls.append(
+            dict(name=name,
+                 start=start,
+                 wall=wall,
+                 cpu=cpu,
+                 executor=executor,
+                 size=size,
+                 tid=self._tid()))
+
+    def _tid(self) -> int:
+        # Async calls are grouped by task, otherwise by thread.
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        return (
+            id(task)
+            if task
+            else threading.get_ident())
+
+
+def profiler() -> AProfiler:
+    """Process-wide profiler, writing to the `AIOPROFILE` path at exit."""
+    global _profiler
+    if _profiler is None:
+        _profiler = AProfiler(os.environ["AIOPROFILE"])
+        atexit.register(_profiler.dump)
+    return _profiler
+
+
+class AProfileLogging(ADebugLogging):
+    """Records decorated calls with the `profiler`, as well as debug
+    logging them.
+
+    CPU time is only measured for sync calls, including calls made in an
+    executor.
+    """
+
+    @cached_property
+    def measures_cpu(self) -> bool:
+        """Flag to indicate whether the CPU time of calls can be measured.
+
+        Thread CPU time measured around a coroutine or generator includes
+        any other code that runs on the thread while it is suspended.
+        """
+        return not (
+            inspect.iscoroutinefunction(self.__wrapped__)
+            or inspect.isasyncgenfunction(self.__wrapped__)
+            or inspect.isgeneratorfunction(self.__wrapped__))
+
+    def executor(self, instance: Any) -> Optional[str]:
+        """Type of executor used, if the instance has a pool."""
+        pool = getattr(instance, "__dict__", {}).get("pool")
+        if isinstance(pool, futures.ProcessPoolExecutor):
+            return "process"
+        if isinstance(pool, futures.ThreadPoolExecutor):
+            return "thread"
+        return None
+
+    def log_debug_start(self, instance, *args, **kwargs):
+        call, start_time = super().log_debug_start(instance, *args, **kwargs)
+        return call, (
+            start_time,
+            (time.thread_time()
+             if self.measures_cpu
+             else None))
+
+    def log_debug_complete(self, start, result: Any) -> Any:
+        try:
+            size: Optional[int] = len(result)
+        except TypeError:
+            size = None
+        return super().log_debug_complete(
+            self._record(start, size),
+            result)
+
+    def log_debug_complete_iter(self, start, count) -> None:
+        super().log_debug_complete_iter(
+            self._record(start, count),
+            count)
+
+    def profile_name(self, call: Tuple) -> str:
+        """Name to record the call with, defaults to the qualname."""
+        profile_name = self._profile_name
+        if isinstance(profile_name, str):
+            if profile_name.startswith("self."):
+                profile_name = getattr(call[0], profile_name[5:])
+        return (
+            profile_name(call)
+            if profile_name
+            else self.name)
+
+    def _record(self, start, size: Optional[int]) -> Tuple:
+        call, (start_time, cpu_start) = start
+        profiler().record(
+            self.profile_name(call),
+            start_time,
+            time.perf_counter() - start_time,
+            (time.thread_time() - cpu_start
+             if cpu_start is not None
+             else None),
+            executor=self.executor(call[0]),
+            size=size)
+        return call, start_time
+
+
 class ANullLogging(ADebugLogging):
 
     def log_debug_start(self, instance, *args, **kwargs):
@@ -179,6 +386,11 @@ class ANullLogging(ADebugLogging):
 
 
 def logging(*args, **kwargs):
+    if os.environ.get("AIOPROFILE"):
+        # Create the profiler when decorating, so that it starts before any
+        # calls are recorded.
+        profiler()
+        return AProfileLogging(*args, **kwargs)
     if os.environ.get("AIOTRACEDEBUG"):
         return ATraceLogging(*args, **kwargs)
     if os.environ.get("AIODEBUG"):
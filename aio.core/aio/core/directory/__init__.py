@@ -5,12 +5,14 @@ from .abstract import (
     ADirectory,
     ADirectoryFileFinder,
     AGitDirectory,
-    AGitDirectoryFileFinder)
+    AGitDirectoryFileFinder,
+    AGitIndex)
 from .directory import (
     Directory,
     DirectoryFileFinder,
     GitDirectory,
-    GitDirectoryFileFinder)
+    GitDirectoryFileFinder,
+    GitIndex)
 from . import utils
 
 
@@ -20,9 +22,11 @@ __all__ = (
     "ADirectoryFileFinder",
     "AGitDirectory",
     "AGitDirectoryFileFinder",
+    "AGitIndex",
     "Directory",
     "DirectoryFileFinder",
     "GitDirectory",
     "GitDirectoryFileFinder",
+    "GitIndex",
     "IDirectoryContext",
     "utils")
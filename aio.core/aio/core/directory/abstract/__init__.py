@@ -3,11 +3,13 @@ from .directory import (
     ADirectory,
     ADirectoryFileFinder,
     AGitDirectory,
-    AGitDirectoryFileFinder)
+    AGitDirectoryFileFinder,
+    AGitIndex)
 
 
 __all__ = (
     "ADirectory",
     "ADirectoryFileFinder",
     "AGitDirectory",
-    "AGitDirectoryFileFinder")
+    "AGitDirectoryFileFinder",
+    "AGitIndex")
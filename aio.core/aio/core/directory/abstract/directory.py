@@ -1,5 +1,6 @@
 
 import asyncio
+import os
 import pathlib
 import re
 import shutil
@@ -7,18 +8,25 @@ import subprocess as subprocess
 from concurrent import futures
 from functools import cached_property, partial
 from typing import (
-    AsyncIterator, Dict, Iterable, List, Mapping, Optional,
+    Any, AsyncIterator, Callable, Dict, Iterable, List, Mapping, Optional,
     Pattern, Set, Tuple, Type, Union)
 
 import abstracts
 
-from aio.core import event, subprocess as _subprocess
+from aio.core import event, functional, subprocess as _subprocess
 from aio.core.functional import async_property, async_set, AwaitableGenerator
 
 
 GREP_MIN_BATCH_SIZE = 500
 GREP_MAX_BATCH_SIZE = 2000
 GIT_LS_FILES_EOL_RE = r"^i/[\s]+w/(?P<eol>[a-z]*)[\s]+attr/[\s]+(?P<name>.*)"
+# Empty blob ids for sha1 and sha256 repositories.
+GIT_EMPTY_BLOBS = (
+    "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391",
+    "473a0f4c3be8a93681a267e3b1e9a7dcda1185436fe141f7749120a303721813")
+GIT_SUBMODULE_MODE = "160000"
+# Max paths to pass to a single `git grep` call when checking binary files.
+GIT_GREP_MAX_PATHS = 1000
 
 
 @abstracts.implementer(_subprocess.ISubprocessHandler)
@@ -118,6 +126,131 @@ class AGitDirectoryFileFinder(
             else (None, None))
 
 
+class AGitIndex(metaclass=abstracts.Abstraction):
+    """Snapshot of the files in a `git` index, for a given path.
+
+    The index is listed once with `git ls-files`, and shared between
+    `AGitDirectory`s for the same path, which match their files in memory.
+
+    Files are categorized to match `git grep --cached -l ""`, ie empty files
+    and submodules are not included, and binary files are only included if
+    not `text_only`.
+
+    Git marks more files as `-text` than `grep -I` treats as binary (eg files
+    with a lone CR), so files marked `-text` are checked again with
+    `git grep`.
+
+    Created in a subproc, so *must* be picklable.
+    """
+
+    @classmethod
+    def grep_text(
+            cls,
+            git_command: str,
+            path: str,
+            paths: Iterable[str]) -> Set[str]:
+        """Paths that `git grep -I` treats as text files."""
+        paths = sorted(paths)
+        text_files: Set[str] = set()
+        for i in range(0, len(paths), GIT_GREP_MAX_PATHS):
+            response = subprocess.run(
+                (git_command,
+                 "--literal-pathspecs",
+                 "grep", "--cached", "-I", "-l", "-z", "",
+                 "--",
+                 *paths[i:i + GIT_GREP_MAX_PATHS]),
+                cwd=path,
+                capture_output=True,
+                encoding="utf-8")
+            text_files.update(
+                entry
+                for entry
+                in response.stdout.split("\0")
+                if entry)
+        return text_files
+
+    @classmethod
+    def key(cls, git_command: str, path: str) -> Tuple:
+        """Identify the state of the index, from the `HEAD` commit and the
+        index file's `mtime`/size."""
+        response = subprocess.run(
+            (git_command,
+             "rev-parse",
+             "--git-path", "index",
+             "--verify", "-q", "HEAD"),
+            cwd=path,
+            capture_output=True,
+            encoding="utf-8")
+        index_path, *head = response.stdout.splitlines() or [""]
+        try:
+            index_stat = os.stat(os.path.join(path, index_path))
+        except OSError:
+            return (*head[:1], None, None)
+        return (*head[:1], index_stat.st_mtime_ns, index_stat.st_size)
+
+    @classmethod
+    def ls_files(cls, git_command: str, path: str, *args: str) -> List[str]:
+        response = subprocess.run(
+            (git_command, "ls-files", "-z", *args),
+            cwd=path,
+            capture_output=True,
+            encoding="utf-8")
+        return [
+            entry
+            for entry
+            in response.stdout.split("\0")
+            if entry]
+
+    @classmethod
+    def read(cls, git_command: str, path: str) -> "AGitIndex":
+        """Read the index for a path."""
+        index = cls(
+            cls.ls_files(git_command, path, "--stage", "--eol"),
+            cls.ls_files(git_command, path, "--deleted"))
+        if index.binary_files:
+            text_files = cls.grep_text(git_command, path, index.binary_files)
+            index.binary_files -= text_files
+            index.text_files |= text_files
+        return index
+
+    def __init__(self, entries: Iterable[str], deleted: Iterable[str]) -> None:
+        self.binary_files: Set[str] = set()
+        self.text_files: Set[str] = set()
+        self.deleted_files = set(deleted)
+        for entry in entries:
+            self._add_entry(entry)
+
+    def files(
+            self,
+            text_only: Optional[bool] = True,
+            path_matcher: Optional[Pattern[str]] = None,
+            exclude_matcher: Optional[Pattern[str]] = None) -> Set[str]:
+        """Indexed files, excluding deleted files, and optionally filtered
+        with regex matchers."""
+        files = (
+            self.text_files
+            if text_only
+            else self.text_files | self.binary_files)
+        return set(
+            path
+            for path
+            in files - self.deleted_files
+            if ADirectoryFileFinder.include_path(
+                path,
+                path_matcher,
+                exclude_matcher))
+
+    def _add_entry(self, entry: str) -> None:
+        # Entries are formatted: `<mode> <object> <stage>\t<eol>\t<path>`
+        info, eol, path = entry.split("\t", 2)
+        mode, blob, _stage = info.split(" ")
+        if mode == GIT_SUBMODULE_MODE or blob in GIT_EMPTY_BLOBS:
+            return
+        (self.binary_files
+         if eol.startswith("i/-text")
+         else self.text_files).add(path)
+
+
 @abstracts.implementer(event.IExecutive)
 class ADirectory(event.AExecutive, metaclass=abstracts.Abstraction):
     """A filesystem directory, with an associated fileset, and tools for
@@ -134,6 +267,9 @@ class ADirectory(event.AExecutive, metaclass=abstracts.Abstraction):
 
     By default, only text files (from grep/git grep pov) will be searched,
     you can override this by setting `text_only` to `False`.
+
+    If `async_subprocess` is set, subprocesses are run directly from the
+    event loop, rather than by handlers in the executor.
     """
 
     def __init__(
@@ -145,7 +281,8 @@ class ADirectory(event.AExecutive, metaclass=abstracts.Abstraction):
             exclude_matcher: Optional[Pattern[str]] = None,
             text_only: Optional[bool] = True,
             loop: Optional[asyncio.AbstractEventLoop] = None,
-            pool: Optional[futures.Executor] = None) -> None:
+            pool: Optional[futures.Executor] = None,
+            async_subprocess: bool = False) -> None:
         self._path = path
         self.path_matcher = path_matcher
         self.exclude_matcher = exclude_matcher
@@ -154,6 +291,7 @@ class ADirectory(event.AExecutive, metaclass=abstracts.Abstraction):
         self.exclude_dirs = exclude_dirs or ()
         self._loop = loop
         self._pool = pool
+        self.async_subprocess = async_subprocess
 
     @cached_property
     def absolute_path(self) -> str:
@@ -228,7 +366,8 @@ class ADirectory(event.AExecutive, metaclass=abstracts.Abstraction):
             exclude_matcher=self.exclude_matcher,
             text_only=self.text_only,
             loop=self.loop,
-            pool=self.pool)
+            pool=self.pool,
+            async_subprocess=self.async_subprocess)
 
     @cached_property
     def path(self) -> pathlib.Path:
@@ -246,11 +385,26 @@ class ADirectory(event.AExecutive, metaclass=abstracts.Abstraction):
     def grep(
             self,
             args: Iterable,
-            target: Union[str, Iterable[str]]) -> AwaitableGenerator:
+            target: Union[str, Iterable[str]],
+            stream: bool = False) -> AwaitableGenerator:
+        """Run `grep` in the directory.
+
+        If `stream` is set, `grep` is run directly from the event loop, and
+        results are yielded as they are output, rather than per batch.
+        """
         return AwaitableGenerator(
-            self._grep(args, target),
+            (self._grep_stream(args, target)
+             if stream
+             else self._grep(args, target)),
             collector=async_set)
 
+    def grep_weight(self, path: str) -> int:
+        """Weight a `grep` target by its size, to balance batches."""
+        try:
+            return self.path.joinpath(path).stat().st_size
+        except OSError:
+            return 0
+
     def parse_grep_args(
             self,
             args: Iterable[str],
@@ -271,10 +425,15 @@ class ADirectory(event.AExecutive, metaclass=abstracts.Abstraction):
             grep_args: Tuple[str, ...],
             paths: Iterable[str]) -> AwaitableGenerator:
         return self.execute_in_batches(
-            partial(self.finder, *grep_args),
+            partial(
+                (self.finder.run_async
+                 if self.async_subprocess
+                 else self.finder),
+                *grep_args),
             *paths,
             min_batch_size=self.grep_min_batch_size,
-            max_batch_size=self.grep_max_batch_size)
+            max_batch_size=self.grep_max_batch_size,
+            weight=self.grep_weight)
 
     async def _grep(
             self,
@@ -289,14 +448,101 @@ class ADirectory(event.AExecutive, metaclass=abstracts.Abstraction):
             for result in batch:
                 yield result
 
+    async def _grep_stream(
+            self,
+            args: Iterable[str],
+            target: Union[str, Iterable[str]]) -> AsyncIterator[str]:
+        """Run `grep` subprocesses concurrently, yielding results as they are
+        output."""
+        if not isinstance(target, str) and not target:
+            return
+        grep_args, paths = self.parse_grep_args(args, target)
+        results: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        tasks = []
+        batches = functional.batch_jobs(
+            tuple(paths),
+            min_batch_size=self.grep_min_batch_size,
+            max_batch_size=self.grep_max_batch_size,
+            weight=self.grep_weight)
+        for batch in batches:
+            task = asyncio.ensure_future(
+                self._grep_stream_batch(
+                    semaphore,
+                    results,
+                    grep_args,
+                    batch))
+            # Completed tasks are added to the queue to mark the end of
+            # their results.
+            task.add_done_callback(results.put_nowait)
+            tasks.append(task)
+        pending = len(tasks)
+        try:
+            while pending:
+                result = await results.get()
+                if isinstance(result, asyncio.Future):
+                    # Raise any error from the task.
+                    result.result()
+                    pending -= 1
+                    continue
+                yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _grep_stream_batch(
+            self,
+            semaphore: asyncio.Semaphore,
+            results: asyncio.Queue,
+            grep_args: Tuple[str, ...],
+            paths: Iterable[str]) -> None:
+        async with semaphore:
+            process = await asyncio.create_subprocess_exec(
+                *grep_args,
+                *paths,
+                cwd=str(self.path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE)
+            try:
+                _, stderr = await asyncio.gather(
+                    self._grep_stream_output(process, results),
+                    process.stderr.read())  # type:ignore
+                returncode = await process.wait()
+            finally:
+                if process.returncode is None:
+                    process.kill()
+        # `grep` returns `1` if nothing was matched.
+        if returncode > 1:
+            raise _subprocess.exceptions.OSCommandError(
+                f"`grep` failed ({returncode}): {stderr.decode().strip()}")
+
+    async def _grep_stream_output(
+            self,
+            process: asyncio.subprocess.Process,
+            results: asyncio.Queue) -> None:
+        async for line in process.stdout:  # type:ignore
+            path = line.decode().rstrip("\n")
+            matches = self.finder_class.include_path(
+                path,
+                self.path_matcher,
+                self.exclude_matcher)
+            if matches:
+                results.put_nowait(path)
+
 
 class AGitDirectory(ADirectory):
     """A filesystem directory, with an associated fileset, and tools for
     finding files.
 
     Uses the `git` index cache for faster grepping.
+
+    Tracked files are listed from an `AGitIndex` snapshot, which is shared
+    process-wide for the same path, and refreshed if the index changes.
     """
 
+    # Shared between all instances, keyed by path.
+    _git_indexes: Dict[str, Tuple[Tuple, "asyncio.Future[AGitIndex]"]] = {}
+
     @classmethod
     def find_git_deleted_files(
             cls,
@@ -343,20 +589,15 @@ class AGitDirectory(ADirectory):
     async def changed_files(self) -> Set[str]:
         """Files that have changed since `self.changed`, which can be the name
         of a git object (branch etc) or a commit hash."""
-        return await self.execute(
+        return await self._find_git_files(
             self.find_git_files_changed_since,
-            self.finder,
-            self.git_command,
             self.changed)
 
     @async_property(cache=True)
     async def deleted_files(self) -> Set[str]:
         """Files that have changed since `self.changed`, which can be the name
         of a git object (branch etc) or a commit hash."""
-        return await self.execute(
-            self.find_git_deleted_files,
-            self.finder,
-            self.git_command)
+        return await self._find_git_files(self.find_git_deleted_files)
 
     @async_property(cache=True)
     async def files(self) -> Set[str]:
@@ -385,6 +626,30 @@ class AGitDirectory(ADirectory):
             match_binaries=self.binaries,
             match_all_files=self.untracked)
 
+    @async_property(cache=True)
+    async def git_index(self) -> AGitIndex:
+        """Snapshot of the `git` index for this directory's path."""
+        path = self.absolute_path
+        key = await self.execute(
+            self.git_index_class.key,
+            self.git_command,
+            path)
+        cached = self._git_indexes.get(path)
+        if not cached or cached[0] != key:
+            cached = self._git_indexes[path] = (
+                key,
+                asyncio.ensure_future(
+                    self.execute(
+                        self.git_index_class.read,
+                        self.git_command,
+                        path)))
+        return await cached[1]
+
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def git_index_class(self) -> Type[AGitIndex]:
+        raise NotImplementedError
+
     @property
     def git_command(self) -> str:
         """Path to the `git` command."""
@@ -403,13 +668,28 @@ class AGitDirectory(ADirectory):
 
     @async_property
     async def untracked_files(self):
-        return await self.execute(
-            self.find_git_untracked_files,
-            self.finder,
-            self.git_command)
+        return await self._find_git_files(self.find_git_untracked_files)
 
     async def get_files(self) -> Set[str]:
-        return (
-            await super().get_files() - await self.deleted_files
-            if not self.untracked
-            else await self.untracked_files)
+        if self.untracked:
+            return await self.untracked_files
+        if self.exclude or self.exclude_dirs:
+            # Exclusions are applied by `grep`.
+            return await super().get_files() - await self.deleted_files
+        return (await self.git_index).files(
+            text_only=self.text_only,
+            path_matcher=self.path_matcher,
+            exclude_matcher=self.exclude_matcher)
+
+    async def _find_git_files(
+            self,
+            find: Callable[..., Any],
+            *args: str) -> Set[str]:
+        if not self.async_subprocess:
+            return await self.execute(
+                find,
+                self.finder,
+                self.git_command,
+                *args)
+        # Calling `find` with the finder's `run_async` returns a coroutine.
+        return await find(self.finder.run_async, self.git_command, *args)
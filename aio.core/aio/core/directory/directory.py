@@ -24,3 +24,11 @@ class GitDirectory(directory.AGitDirectory):
     @property
     def finder_class(self) -> Type[directory.AGitDirectoryFileFinder]:
         return GitDirectoryFileFinder
+
+    @property
+    def git_index_class(self) -> Type[directory.AGitIndex]:
+        return GitIndex
+
+
+class GitIndex(directory.AGitIndex):
+    pass
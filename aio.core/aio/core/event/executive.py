@@ -1,4 +1,5 @@
 
+import asyncio
 from functools import partial
 from typing import Any, Callable, Optional
 
@@ -18,7 +19,11 @@ class IExecutive(event.IReactive, metaclass=abstracts.Interface):
             executable: Callable,
             *args,
             **kwargs) -> Any:
-        """Execute a command in a process pool."""
+        """Execute a command in a process pool.
+
+        Coroutine functions are awaited directly, rather than executed in the
+        pool.
+        """
         raise NotImplementedError
 
     @abstracts.interfacemethod
@@ -29,8 +34,13 @@ class IExecutive(event.IReactive, metaclass=abstracts.Interface):
             concurrency: Optional[int] = None,
             min_batch_size: Optional[int] = None,
             max_batch_size: Optional[int] = None,
+            weight: Optional[Callable[[Any], float]] = None,
             **kwargs) -> functional.AwaitableGenerator:
-        """Execute a command in a process pool."""
+        """Execute a command in a process pool, batching the args.
+
+        If a `weight` function is provided, the batches are balanced by the
+        weight of each arg.
+        """
         raise NotImplementedError
 
 
@@ -39,12 +49,15 @@ class AExecutive(metaclass=abstracts.Abstraction):
 
     @debug.logging(
         log=__name__,
-        format_result="self._debug_execute")
+        format_result="self._debug_execute",
+        profile_name="self._profile_execute")
     async def execute(
             self,
             executable: Callable,
             *args,
             **kwargs) -> Any:
+        if asyncio.iscoroutinefunction(executable):
+            return await executable(*args, **kwargs)
         return await self.loop.run_in_executor(
             self.pool,
             *(executable, *args),
@@ -57,6 +70,7 @@ class AExecutive(metaclass=abstracts.Abstraction):
             concurrency: Optional[int] = None,
             min_batch_size: Optional[int] = None,
             max_batch_size: Optional[int] = None,
+            weight: Optional[Callable[[Any], float]] = None,
             **kwargs) -> functional.AwaitableGenerator:
         return tasks.concurrent(
             (self.execute(
@@ -67,7 +81,8 @@ class AExecutive(metaclass=abstracts.Abstraction):
              in functional.batch_jobs(
                  args,
                  min_batch_size=min_batch_size,
-                 max_batch_size=max_batch_size)),
+                 max_batch_size=max_batch_size,
+                 weight=weight)),
             limit=concurrency)
 
     def _debug_execute(self, start, result, time_taken, result_info):
@@ -85,3 +100,12 @@ class AExecutive(metaclass=abstracts.Abstraction):
         return (
             f"{pool_info} {result_info}: "
             f"{executable.__module__}{name}")
+
+    def _profile_execute(self, call) -> str:
+        instance, (executable, *args), kwargs = call
+        if type(executable) is partial:
+            executable = executable.func
+        name = getattr(
+            executable, "__qualname__",
+            executable.__class__.__qualname__)
+        return f"execute {executable.__module__}.{name}"
@@ -16,7 +16,8 @@ from .utils import (
     maybe_awaitable,
     maybe_coro,
     nested,
-    typed)
+    typed,
+    weighted_batches)
 from . import collections, exceptions, utils
 
 
@@ -39,4 +40,5 @@ __all__ = (
     "qdict",
     "QueryDict",
     "typed",
-    "utils")
+    "utils",
+    "weighted_batches")
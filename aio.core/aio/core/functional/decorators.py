@@ -4,8 +4,9 @@
 
 import inspect
 import logging
+import weakref
 from functools import cached_property
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Optional
 
 from aio.core import event
 from aio.core.dev import debug
@@ -60,8 +61,13 @@ class async_property:  # noqa: N801
         return self.async_result(instance)
 
     @cached_property
-    def loaders(self) -> Dict[str, event.Loader]:
-        return {}
+    def loaders(self) -> "weakref.WeakKeyDictionary[Any, event.Loader]":
+        """Loaders for instances that are currently loading.
+
+        Instances are weakly referenced, and their loader is removed once
+        loading is complete, so the registry does not keep instances alive.
+        """
+        return weakref.WeakKeyDictionary()
 
     def fun(self, *args, **kwargs):
         if self._fun:
@@ -105,16 +111,17 @@ class async_property:  # noqa: N801
 
     def get_loader(self, instance: Any) -> Optional[event.Loader]:
         try:
-            hash(instance)
+            if instance not in self.loaders:
+                self.loaders[instance] = event.Loader()
         except TypeError:
+            # Unhashable, or cannot be weakly referenced.
             return None
-        if instance not in self.loaders:
-            self.loaders[instance] = event.Loader()
         return self.loaders[instance]
 
     @debug.logging(
         log=__name__,
-        format_result="self._debug_prop")
+        format_result="self._debug_prop",
+        profile_name="self._profile_prop")
     async def load(self, instance: Any) -> Any:
         # derive the result, set the cache if required, and return the result
         return self.set_prop_cache(instance, await self.fun(instance))
@@ -124,8 +131,14 @@ class async_property:  # noqa: N801
             # Unhashable type, just load
             return await self.load(instance)
         if not await loader:
-            with loader:
-                return await self.load(instance)
+            try:
+                with loader:
+                    return await self.load(instance)
+            finally:
+                # Any concurrent waiters hold a reference to the loader,
+                # later calls will find the cached result.
+                if self.loaders.get(instance) is loader:
+                    del self.loaders[instance]
         return self.get_cached_prop(instance)
 
     def set_prop_cache(self, instance: Any, result: Any) -> Any:
@@ -144,6 +157,13 @@ class async_property:  # noqa: N801
             else "~")
         return f"{cache} {result_info}: {self._repr(instance)}"
 
+    def _profile_prop(self, call) -> str:
+        if self._fun is None:
+            return "async_property"
+        return (
+            "async_property "
+            f"{self._fun.__module__}.{self._fun.__qualname__}")
+
     def _repr(self, instance: Any) -> str:
         if self._fun is None:
             return "async_property"
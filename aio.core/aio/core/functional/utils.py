@@ -1,13 +1,19 @@
 
 import asyncio
+import codecs
 import contextlib
 import gzip
+import heapq
 import inspect
+import json as _json
+import math
 import os
+import re
 import textwrap
+import zlib
 from typing import (
     Any, Awaitable, Callable,
-    Iterable, Iterator, List, Optional, Sized, Type, Union)
+    Iterable, Iterator, List, Optional, Pattern, Sized, Tuple, Type, Union)
 
 from trycast import isassignable  # type:ignore
 
@@ -20,6 +26,11 @@ except ImportError:
 from aio.core.functional import exceptions
 
 
+JUNZIP_CHUNK_SIZE = 2 ** 20
+JSON_NUMBER_TAIL_RE = re.compile(r"[0-9.eE+-]*")
+JSON_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+
+
 def maybe_awaitable(result: Any) -> Awaitable:
     """Make anything awaitable.
 
@@ -83,6 +94,46 @@ def junzip(data: bytes) -> Any:
     return json.loads(gzip.decompress(data))
 
 
+def junzip_items(
+        data: Union[bytes, Iterable[bytes]],
+        key: str,
+        chunk_size: int = JUNZIP_CHUNK_SIZE,
+        match: Optional[Pattern[str]] = None) -> Iterator[Any]:
+    """Incrementally decompress and parse gzipped JSON, yielding the items of
+    the array at the top-level `key` one at a time.
+
+    `data` can be gzipped bytes, or an iterable of gzipped chunks, eg as they
+    are downloaded.
+
+    If a `match` regex is provided, only items with raw JSON text that it
+    matches are yielded.
+
+    Only the current item, and up to `chunk_size` of decompressed data, are
+    held in memory. Other top-level values are parsed and discarded.
+    """
+    stream = _JSONStream(_gunzip_text(data, chunk_size))
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        name = stream.decode()
+        stream.expect(":")
+        if name != key:
+            stream.decode()
+        elif stream.expect("[") and stream.peek() == "]":
+            stream.expect("]")
+        else:
+            item = stream.decode()
+            if not match or stream.matches(match):
+                yield item
+            while stream.expect(",]") == ",":
+                item = stream.decode()
+                if not match or stream.matches(match):
+                    yield item
+        if stream.expect(",}") == "}":
+            return
+
+
 def typed(tocast: Type, value: Any) -> Any:
     """Attempts to cast a value to a given type, TypeVar, or TypeDict.
 
@@ -110,11 +161,59 @@ def batches(items: Iterable, batch_size: int) -> Iterator[List]:
         yield batch
 
 
+def weighted_batches(
+        items: Iterable,
+        batch_size: int,
+        weight: Callable[[Any], float]) -> Iterator[List]:
+    """Yield batches of items balanced by the weight of each item.
+
+    The number of batches, and the maximum size of each batch, is the same
+    as for `batches`.
+
+    Items are assigned heaviest first to the lightest batch that is not
+    full, and the batches are yielded heaviest first, so that when they are
+    consumed with limited concurrency the slowest batches start first.
+    """
+    items = list(items)
+    batch_size = max(batch_size, 1)
+    batched: List[List] = [
+        []
+        for _
+        in range(math.ceil(len(items) / batch_size))]
+    totals = [0.0] * len(batched)
+    lightest: List[Tuple[float, int]] = [
+        (0, i)
+        for i
+        in range(len(batched))]
+    weighted = sorted(
+        ((weight(item), item)
+         for item
+         in items),
+        key=lambda weighted_item: weighted_item[0],
+        reverse=True)
+    for item_weight, item in weighted:
+        total, index = heapq.heappop(lightest)
+        batched[index].append(item)
+        totals[index] = total + item_weight
+        if len(batched[index]) < batch_size:
+            heapq.heappush(lightest, (totals[index], index))
+    for index in sorted(
+            range(len(batched)),
+            key=lambda i: totals[i],
+            reverse=True):
+        yield batched[index]
+
+
 def batch_jobs(
         jobs: Sized,
         max_batch_size: Optional[int] = None,
-        min_batch_size: Optional[int] = None) -> Iterator[List]:
-    """Batch jobs between processors, optionally setting a max batch size."""
+        min_batch_size: Optional[int] = None,
+        weight: Optional[Callable[[Any], float]] = None) -> Iterator[List]:
+    """Batch jobs between processors, optionally setting a max batch size.
+
+    If a `weight` function is provided, eg the size of a file, the batches
+    are balanced by the total weight of their jobs.
+    """
     bad_jobs_type = (
         not isinstance(jobs, Iterable)
         or isinstance(jobs, (str, bytes)))
@@ -127,4 +226,97 @@ def batch_jobs(
         batch_count = min(batch_count, max_batch_size)
     if min_batch_size:
         batch_count = max(batch_count, min_batch_size)
+    if weight:
+        return weighted_batches(
+            typed(Iterable, jobs),
+            batch_size=batch_count,
+            weight=weight)
     return batches(typed(Iterable, jobs), batch_size=batch_count)
+
+
+class _JSONStream:
+    """Reads JSON values from a stream of text chunks."""
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self._chunks = chunks
+        self._decoder = _json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._start = 0
+
+    def decode(self) -> Any:
+        """Decode the next value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(
+                    self._buffer,
+                    self._pos)
+            except _json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may be truncated, eg `7.`
+            # or `1e`, so refill until it is followed by another char.
+            if not self._truncated(end) or not self._fill():
+                self._start, self._pos = self._pos, end
+                return value
+
+    def matches(self, pattern: Pattern[str]) -> bool:
+        """Match a regex against the raw text of the last decoded value."""
+        return bool(pattern.search(self._buffer, self._start, self._pos))
+
+    def expect(self, chars: str) -> str:
+        """Consume the next char, which must be one of `chars`."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(
+                f"Expected one of {chars!r}, got {char or 'EOF'!r}")
+        self._pos += 1
+        return char
+
+    def peek(self) -> str:
+        """Skip whitespace, and return the next char, or an empty string if
+        the stream is exhausted."""
+        while True:
+            self._pos = JSON_WHITESPACE_RE.match(
+                self._buffer,
+                self._pos).end()  # type:ignore
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def _fill(self) -> bool:
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _truncated(self, end: int) -> bool:
+        return (
+            JSON_NUMBER_TAIL_RE.match(
+                self._buffer,
+                end).end()  # type:ignore
+            == len(self._buffer))
+
+
+def _gunzip_text(
+        data: Union[bytes, Iterable[bytes]],
+        chunk_size: int) -> Iterator[str]:
+    chunks = (
+        (data[i:i + chunk_size]
+         for i
+         in range(0, len(data), chunk_size))
+        if isinstance(data, bytes)
+        else data)
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        # Limit the decompressed size of each chunk.
+        while chunk:
+            yield decoder.decode(decompressor.decompress(chunk, chunk_size))
+            chunk = decompressor.unconsumed_tail
+    yield decoder.decode(decompressor.flush(), final=True)
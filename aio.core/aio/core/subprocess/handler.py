@@ -1,9 +1,12 @@
 
 import abc
+import asyncio
+import codecs
+import io
 import logging
 import subprocess
 from functools import cached_property
-from typing import Any, Mapping, Sequence, Tuple
+from typing import Any, Mapping, Optional, Sequence, Tuple, Union
 
 import abstracts
 
@@ -11,6 +14,9 @@ from aio.core import directory
 from aio.core.dev import debug
 
 
+OUTPUT_CHUNK_SIZE = 2 ** 16
+
+
 class ISubprocessHandler(
         directory.IDirectoryContext,
         metaclass=abstracts.Interface):
@@ -57,6 +63,12 @@ class ISubprocessHandler(
         """Run the subprocess, returning handled results."""
         raise NotImplementedError
 
+    @abstracts.interfacemethod
+    async def run_async(self, *args: str, **kwargs) -> Any:
+        """Run the subprocess from the event loop, returning handled
+        results."""
+        raise NotImplementedError
+
     @abstracts.interfacemethod
     def run_subprocess(
             self,
@@ -65,6 +77,14 @@ class ISubprocessHandler(
         """Run the subprocess."""
         raise NotImplementedError
 
+    @abstracts.interfacemethod
+    async def run_subprocess_async(
+            self,
+            *args: str,
+            **kwargs) -> subprocess.CompletedProcess:
+        """Run the subprocess from the event loop."""
+        raise NotImplementedError
+
     @abstracts.interfacemethod
     def subprocess_args(self, *args: str) -> Tuple[Sequence[str], ...]:
         """Derive the subprocess args, from init args and supplied args."""
@@ -166,14 +186,76 @@ class ASubprocessHandler(
                 *self.subprocess_args(*args),
                 **self.subprocess_kwargs(**kwargs)))
 
+    @debug.logging(
+        log="self.log",
+        show_cpu=True)
+    async def run_async(self, *args, **kwargs) -> Any:
+        """Run the subprocess from the event loop and handle the results.
+
+        As this does not block, it does not need to be run in an executor.
+        """
+        return self.handle_response(
+            await self.run_subprocess_async(
+                *self.subprocess_args(*args),
+                **self.subprocess_kwargs(**kwargs)))
+
     def run_subprocess(
             self,
             *args,
             **kwargs) -> subprocess.CompletedProcess:
         return subprocess.run(*args, **kwargs)
 
+    async def run_subprocess_async(
+            self,
+            args: Sequence[str],
+            *,
+            capture_output: bool = False,
+            encoding: Optional[str] = None,
+            **kwargs) -> subprocess.CompletedProcess:
+        """Run the subprocess with `asyncio`, and return a
+        `subprocess.CompletedProcess`, as `subprocess.run` would.
+
+        Output is read and decoded while the process is running.
+        """
+        pipe = (
+            asyncio.subprocess.PIPE
+            if capture_output
+            else None)
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=pipe,
+            stderr=pipe,
+            **kwargs)
+        try:
+            stdout, stderr = await asyncio.gather(
+                self._read_output(process.stdout, encoding),
+                self._read_output(process.stderr, encoding))
+            returncode = await process.wait()
+        finally:
+            if process.returncode is None:
+                process.kill()
+        return subprocess.CompletedProcess(args, returncode, stdout, stderr)
+
     def subprocess_args(self, *args) -> Tuple[Sequence[str], ...]:
         return ((*self.args, *args), )
 
     def subprocess_kwargs(self, **kwargs) -> Mapping:
         return {**self.kwargs, **kwargs}
+
+    async def _read_output(
+            self,
+            stream: Optional[asyncio.StreamReader],
+            encoding: Optional[str]) -> Union[str, bytes, None]:
+        if stream is None:
+            return None
+        if not encoding:
+            return await stream.read()
+        # Newlines are translated, as with `subprocess.run` in text mode.
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(),
+            translate=True)
+        output = []
+        while chunk := await stream.read(OUTPUT_CHUNK_SIZE):
+            output.append(decoder.decode(chunk))
+        output.append(decoder.decode(b"", final=True))
+        return "".join(output)
@@ -1,5 +1,6 @@
 
 from .data import (
+    atomic_write,
     ellipsize,
     extract,
     from_json,
@@ -16,6 +17,7 @@ dottedname_resolve = dottedname
 
 
 __all__ = (
+    "atomic_write",
     "Captured",
     "captured_warnings",
     "dottedname",
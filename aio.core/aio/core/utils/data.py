@@ -1,8 +1,11 @@
 
+import contextlib
 import json
+import os
 import pathlib
 import tarfile
-from typing import Any, Optional, Type, Union
+import tempfile
+from typing import IO, Any, Iterator, Optional, Type, Union
 
 import yaml
 
@@ -16,6 +19,29 @@ from aio.core import functional, utils
 TAR_EXTS: set[str] = {"tar", "tar.gz", "tar.xz", "tar.bz2"}
 
 
+@contextlib.contextmanager
+def atomic_write(
+        path: Union[pathlib.Path, str],
+        mode: str = "w") -> Iterator[IO]:
+    """Open a temporary file to write to, that is moved to `path` once the
+    context exits without error.
+
+    An interrupted or failed write cannot leave a partially written file at
+    `path`, and the temporary file is removed if the write fails.
+    """
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
 def ellipsize(text: str, max_len: int) -> str:
     """Truncate strings to a given length with an ellipsis suffix where
     required."""
@@ -1,4 +1,8 @@
 
+import asyncio
+import json
+import time
+from concurrent import futures
 from unittest.mock import MagicMock
 
 import pytest
@@ -39,3 +43,240 @@ def test_dev_timing(patches, args, kwargs):
     assert (
         m_print.call_args
         == [(f"Finished 'some_fun' in {time_taken} secs", ), {}])
+
+
+@pytest.mark.parametrize("profile", [None, "", "PATH"])
+@pytest.mark.parametrize("trace", [None, "", "TRACE"])
+@pytest.mark.parametrize("debug", [None, "", "DEBUG"])
+def test_dev_debug_logging(patches, profile, trace, debug):
+    patched = patches(
+        "os",
+        "profiler",
+        "AProfileLogging",
+        "ATraceLogging",
+        "ADebugLogging",
+        "ANullLogging",
+        prefix="aio.core.dev.debug")
+    env = dict(
+        AIOPROFILE=profile,
+        AIOTRACEDEBUG=trace,
+        AIODEBUG=debug)
+
+    with patched as (m_os, m_profiler, m_profile, m_trace, m_debug, m_null):
+        m_os.environ.get.side_effect = env.get
+        result = dev.debug.logging("ARG", kwarg="KWARG")
+
+    expected = (
+        m_profile
+        if profile
+        else (m_trace
+              if trace
+              else (m_debug
+                    if debug
+                    else m_null)))
+    assert result == expected.return_value
+    assert (
+        expected.call_args
+        == [("ARG", ), dict(kwarg="KWARG")])
+    assert (
+        m_profiler.call_args
+        == ([(), {}]
+            if profile
+            else None))
+
+
+def test_dev_debug_profiler(patches):
+    patched = patches(
+        "atexit",
+        "os",
+        "AProfiler",
+        prefix="aio.core.dev.debug")
+
+    with patched as (m_atexit, m_os, m_profiler):
+        dev.debug._profiler = None
+        profiler = dev.debug.profiler()
+        assert dev.debug.profiler() is profiler
+        dev.debug._profiler = None
+
+    assert profiler == m_profiler.return_value
+    assert (
+        m_profiler.call_args_list
+        == [[(m_os.environ.__getitem__.return_value, ), {}]])
+    assert (
+        m_os.environ.__getitem__.call_args
+        == [("AIOPROFILE", ), {}])
+    assert (
+        m_atexit.register.call_args_list
+        == [[(m_profiler.return_value.dump, ), {}]])
+
+
+def test_dev_debug_aprofiler(tmp_path):
+    path = tmp_path / "some" / "profile.json"
+    profiler = dev.debug.AProfiler(str(path))
+    assert profiler.path == path
+    assert profiler.calls == []
+    assert profiler.trace_path == tmp_path / "some" / "profile.trace.json"
+    start = profiler.start_time
+    profiler.record("CALL1", start + 1, 2, 1, size=3)
+    profiler.record("CALL2", start + 2, 5, 4, executor="process")
+    profiler.record("CALL1", start + 3, 1, 0.5, executor="thread", size=2)
+    profiler.record("CALL2", start + 4, 3, 1, executor="process", size=7)
+    profiler.record("CALL1", start + 5, 0.5, None)
+    profiler.record("CALL3", start + 6, 0.5, None, size=1)
+    assert (
+        profiler.summary
+        == dict(
+            CALL2=dict(
+                calls=2, wall=8, wall_max=5, cpu=5, size=7,
+                executors=dict(process=2)),
+            CALL1=dict(
+                calls=3, wall=3.5, wall_max=2, cpu=1.5, size=5,
+                executors=dict(thread=1)),
+            CALL3=dict(
+                calls=1, wall=0.5, wall_max=0.5, cpu=None, size=1,
+                executors={})))
+    assert list(profiler.summary) == ["CALL2", "CALL1", "CALL3"]
+    events = profiler.trace_events
+    assert (
+        [(e["name"], e["cat"], e["ph"], e["ts"], e["dur"]) for e in events]
+        == [("CALL1", "call", "X", 1000000, 2000000),
+            ("CALL2", "process", "X", 2000000, 5000000),
+            ("CALL1", "thread", "X", 3000000, 1000000),
+            ("CALL2", "process", "X", 4000000, 3000000),
+            ("CALL1", "call", "X", 5000000, 500000),
+            ("CALL3", "call", "X", 6000000, 500000)])
+    assert all(e["pid"] == profiler.pid for e in events)
+    assert events[1]["args"] == dict(cpu=4, size=None)
+    assert events[5]["args"] == dict(cpu=None, size=1)
+
+    profiler.dump()
+    summary = json.loads(path.read_text())
+    assert summary["calls"] == json.loads(json.dumps(profiler.summary))
+    assert summary["wall"] > 0
+    trace = json.loads(profiler.trace_path.read_text())
+    assert trace["traceEvents"] == events
+    assert trace["displayTimeUnit"] == "ms"
+
+
+def test_dev_debug_aprofiler_dump_forked(tmp_path):
+    path = tmp_path / "profile.json"
+    profiler = dev.debug.AProfiler(str(path))
+    profiler.pid = -1
+    profiler.dump()
+    assert not path.exists()
+    assert not profiler.trace_path.exists()
+
+
+async def test_dev_debug_aprofiler_tid():
+    profiler = dev.debug.AProfiler("PATH")
+    task_ids = set()
+
+    async def record():
+        profiler.record("CALL", 0, 0, 0)
+        task_ids.add(id(asyncio.current_task()))
+
+    await asyncio.gather(record(), record())
+    await asyncio.get_running_loop().run_in_executor(
+        None, profiler.record, "THREAD", 0, 0, 0)
+    assert set(call["tid"] for call in profiler.calls[:2]) == task_ids
+    assert profiler.calls[2]["tid"] not in task_ids
+
+
+async def test_dev_debug_aprofilelogging(patches, tmp_path):
+    profiler = dev.debug.AProfiler(str(tmp_path / "profile.json"))
+    patched = patches(
+        "profiler",
+        prefix="aio.core.dev.debug")
+
+    class Executive:
+
+        def __init__(self, pool=None):
+            if pool:
+                self.pool = pool
+
+        @dev.debug.AProfileLogging
+        def fun(self, *args):
+            return args
+
+        @dev.debug.AProfileLogging(profile_name="self.name_call")
+        async def fun_async(self):
+            return "RESULT"
+
+        @dev.debug.AProfileLogging
+        def fun_gen(self):
+            yield from range(0, 3)
+
+        @dev.debug.AProfileLogging(profile_name=lambda call: "NAMED")
+        async def fun_async_gen(self):
+            for x in range(0, 4):
+                yield x
+
+        def name_call(self, call):
+            instance, args, kwargs = call
+            assert instance is self
+            return "CUSTOM"
+
+    process = Executive(futures.ProcessPoolExecutor())
+    thread = Executive(futures.ThreadPoolExecutor())
+
+    with patched as (m_profiler, ):
+        m_profiler.return_value = profiler
+        assert Executive().fun(1, 2) == (1, 2)
+        assert process.fun() == ()
+        assert await thread.fun_async() == "RESULT"
+        assert list(thread.fun_gen()) == [0, 1, 2]
+        assert [x async for x in Executive().fun_async_gen()] == [0, 1, 2, 3]
+
+    process.pool.shutdown()
+    thread.pool.shutdown()
+    assert (
+        [(c["name"], c["executor"], c["size"]) for c in profiler.calls]
+        == [("test_dev_debug_aprofilelogging.<locals>.Executive.fun",
+             None, 2),
+            ("test_dev_debug_aprofilelogging.<locals>.Executive.fun",
+             "process", 0),
+            ("CUSTOM", "thread", 6),
+            ("test_dev_debug_aprofilelogging.<locals>.Executive.fun_gen",
+             "thread", 3),
+            ("NAMED", None, 4)])
+    assert all(c["wall"] >= 0 for c in profiler.calls)
+    # CPU time is only measured for sync calls.
+    assert all(c["cpu"] >= 0 for c in profiler.calls[:2])
+    assert all(c["cpu"] is None for c in profiler.calls[2:])
+
+
+async def test_dev_debug_aprofilelogging_cpu(patches, tmp_path):
+    profiler = dev.debug.AProfiler(str(tmp_path / "profile.json"))
+    patched = patches(
+        "profiler",
+        prefix="aio.core.dev.debug")
+
+    def spin(duration):
+        end = time.thread_time() + duration
+        while time.thread_time() < end:
+            pass
+
+    class Executive:
+
+        @dev.debug.AProfileLogging
+        def fun(self):
+            spin(0.05)
+
+        @dev.debug.AProfileLogging
+        async def fun_async(self):
+            await asyncio.sleep(0.05)
+
+    async def other():
+        # Uses CPU on the loop thread while `fun_async` is suspended.
+        await asyncio.sleep(0)
+        spin(0.05)
+
+    with patched as (m_profiler, ):
+        m_profiler.return_value = profiler
+        Executive().fun()
+        await asyncio.gather(Executive().fun_async(), other())
+
+    sync_call, async_call = profiler.calls
+    assert sync_call["cpu"] >= 0.05
+    assert async_call["cpu"] is None
+    assert async_call["wall"] >= 0.05
@@ -1,4 +1,7 @@
 
+import asyncio
+import re
+import subprocess as _subprocess
 import types
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
@@ -51,6 +54,12 @@ def test_git_directory_constructor(patches, args, kwargs):
         m_super.call_args
         == [tuple(args), kwargs])
     assert direct.finder_class == directory.GitDirectoryFileFinder
+    assert direct.git_index_class == directory.GitIndex
+
+
+def test_git_index_constructor():
+    index = directory.GitIndex([], [])
+    assert isinstance(index, directory.AGitIndex)
 
 
 @abstracts.implementer(directory.ADirectory)
@@ -68,6 +77,15 @@ class DummyGitDirectory:
     def finder_class(self):
         return super().finder_class
 
+    @property
+    def git_index_class(self):
+        return super().git_index_class
+
+
+@abstracts.implementer(directory.AGitIndex)
+class DummyGitIndex:
+    pass
+
 
 @pytest.mark.parametrize("exclude", [None, 0, [], (), "EXCLUDE"])
 @pytest.mark.parametrize("exclude_dirs", [None, 0, [], (), "EXCLUDE"])
@@ -99,6 +117,7 @@ def test_abstract_directory_constructor(
         == (True if text_only is None else text_only))
     assert direct.exclude == (exclude or ())
     assert direct.exclude_dirs == (exclude_dirs or ())
+    assert direct.async_subprocess is False
     assert (
         direct.grep_max_batch_size
         == directory.abstract.directory.GREP_MAX_BATCH_SIZE)
@@ -208,11 +227,13 @@ def test_abstract_directory_init_kwargs(patches):
     matcher = MagicMock()
     exclude = MagicMock()
     text_only = MagicMock()
+    async_subprocess = MagicMock()
     direct = DummyDirectory(
         "PATH",
         path_matcher=matcher,
         exclude_matcher=exclude,
-        text_only=text_only)
+        text_only=text_only,
+        async_subprocess=async_subprocess)
     patched = patches(
         "dict",
         ("ADirectory.path",
@@ -236,7 +257,8 @@ def test_abstract_directory_init_kwargs(patches):
                  exclude_matcher=exclude,
                  text_only=text_only,
                  loop=m_loop.return_value,
-                 pool=m_pool.return_value)])
+                 pool=m_pool.return_value,
+                 async_subprocess=async_subprocess)])
     assert "init_kwargs" not in direct.__dict__
 
 
@@ -324,26 +346,37 @@ def test_abstract_directory_absolute_path(patches):
     assert "absolute_path" in direct.__dict__
 
 
-def test_abstract_directory_grep(patches):
+@pytest.mark.parametrize("stream", [None, True, False])
+def test_abstract_directory_grep(patches, stream):
     direct = DummyDirectory("PATH")
     patched = patches(
         "async_set",
         "AwaitableGenerator",
         "ADirectory._grep",
+        "ADirectory._grep_stream",
         prefix="aio.core.directory.abstract.directory")
+    kwargs = (
+        dict(stream=stream)
+        if stream is not None
+        else {})
 
-    with patched as (m_set, m_gen, m_grep):
+    with patched as (m_set, m_gen, m_grep, m_stream):
         assert (
-            direct.grep("ARGS", "TARGET")
+            direct.grep("ARGS", "TARGET", **kwargs)
             == m_gen.return_value)
 
+    grep = (
+        m_stream
+        if stream
+        else m_grep)
     assert (
         m_gen.call_args
-        == [(m_grep.return_value, ),
+        == [(grep.return_value, ),
             dict(collector=m_set)])
     assert (
-        m_grep.call_args
+        grep.call_args
         == [("ARGS", "TARGET"), {}])
+    assert not (m_grep if stream else m_stream).called
 
 
 @pytest.mark.parametrize("is_str", [True, False])
@@ -422,8 +455,9 @@ async def test_abstract_directory__grep(patches, is_str, target):
         == [("ARGS_", "TARGET_"), {}])
 
 
-def test_abstract_directory__batched_grep(patches):
-    direct = DummyDirectory("PATH")
+@pytest.mark.parametrize("async_subprocess", [True, False])
+def test_abstract_directory__batched_grep(patches, async_subprocess):
+    direct = DummyDirectory("PATH", async_subprocess=async_subprocess)
     patched = patches(
         "partial",
         "ADirectory.execute_in_batches",
@@ -433,6 +467,7 @@ def test_abstract_directory__batched_grep(patches):
          dict(new_callable=PropertyMock)),
         ("ADirectory.grep_min_batch_size",
          dict(new_callable=PropertyMock)),
+        "ADirectory.grep_weight",
         prefix="aio.core.directory.abstract.directory")
     grep_args = [f"GARG{i}" for i in range(0, 5)]
     paths = [f"PATH{i}" for i in range(0, 5)]
@@ -441,7 +476,7 @@ def test_abstract_directory__batched_grep(patches):
 
     with patched as patchy:
         (m_partial, m_exec,
-         m_finder, m_max, m_min) = patchy
+         m_finder, m_max, m_min, m_weight) = patchy
         assert (
             direct._batched_grep(grep_args, paths)
             == m_exec.return_value)
@@ -450,13 +485,128 @@ def test_abstract_directory__batched_grep(patches):
         m_exec.call_args
         == [(m_partial.return_value, *paths),
             dict(min_batch_size=m_min.return_value,
-                 max_batch_size=m_max.return_value)])
+                 max_batch_size=m_max.return_value,
+                 weight=m_weight)])
     assert (
         m_partial.call_args
-        == [(m_finder.return_value,
+        == [((m_finder.return_value.run_async
+              if async_subprocess
+              else m_finder.return_value),
              *grep_args)])
 
 
+def test_abstract_directory_grep_weight(tmp_path):
+    direct = DummyDirectory(tmp_path)
+    tmp_path.joinpath("some_file").write_text("X" * 23)
+    assert direct.grep_weight("some_file") == 23
+    assert direct.grep_weight("missing_file") == 0
+
+
+@pytest.mark.parametrize("target", [None, "", [], "TARGET", ["T1", "T2"]])
+async def test_abstract_directory__grep_stream(patches, target):
+    direct = DummyDirectory("PATH")
+    patched = patches(
+        "functional",
+        "ADirectory.parse_grep_args",
+        "ADirectory._grep_stream_batch",
+        ("ADirectory.grep_max_batch_size",
+         dict(new_callable=PropertyMock)),
+        ("ADirectory.grep_min_batch_size",
+         dict(new_callable=PropertyMock)),
+        "ADirectory.grep_weight",
+        prefix="aio.core.directory.abstract.directory")
+    batches = [["B1", "B2"], ["B3"], ["B4"]]
+
+    async def grep_batch(semaphore, results, grep_args, batch):
+        for path in batch:
+            await asyncio.sleep(0)
+            results.put_nowait(f"RESULT:{path}")
+
+    with patched as (m_func, m_parse, m_batch, m_max, m_min, m_weight):
+        m_parse.return_value = ("GREP_ARGS", "PATHS")
+        m_func.batch_jobs.return_value = batches
+        m_batch.side_effect = grep_batch
+        results = [
+            result
+            async for result
+            in direct._grep_stream("ARGS", target)]
+
+    if not isinstance(target, str) and not target:
+        assert results == []
+        assert not m_parse.called
+        return
+    assert (
+        sorted(results)
+        == [f"RESULT:B{i}" for i in range(1, 5)])
+    assert (
+        m_parse.call_args
+        == [("ARGS", target), {}])
+    assert (
+        m_func.batch_jobs.call_args
+        == [(tuple("PATHS"), ),
+            dict(min_batch_size=m_min.return_value,
+                 max_batch_size=m_max.return_value,
+                 weight=m_weight)])
+    assert (
+        [c[0][2:] for c in m_batch.call_args_list]
+        == [("GREP_ARGS", batch) for batch in batches])
+
+
+async def test_abstract_directory__grep_stream_fails(patches):
+    direct = DummyDirectory("PATH")
+    patched = patches(
+        "functional",
+        "ADirectory.parse_grep_args",
+        "ADirectory._grep_stream_batch",
+        prefix="aio.core.directory.abstract.directory")
+    cancelled = []
+
+    async def grep_batch(semaphore, results, grep_args, batch):
+        if batch == ["FAIL"]:
+            raise subprocess.exceptions.OSCommandError("FAILED")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(batch)
+            raise
+
+    with patched as (m_func, m_parse, m_batch):
+        m_parse.return_value = ("GREP_ARGS", "PATHS")
+        m_func.batch_jobs.return_value = [["SLOW"], ["FAIL"]]
+        m_batch.side_effect = grep_batch
+        with pytest.raises(subprocess.exceptions.OSCommandError):
+            async for result in direct._grep_stream("ARGS", "TARGET"):
+                pass
+        await asyncio.sleep(0)
+
+    assert cancelled == [["SLOW"]]
+
+
+@pytest.mark.parametrize("path_matcher", [None, r".*\.txt$"])
+async def test_abstract_directory__grep_stream_functional(
+        tmp_path, path_matcher):
+    for name, content in (("a.txt", "X\n"), ("b.txt", "Y\n"), ("c.py", "X")):
+        tmp_path.joinpath(name).write_text(content)
+    direct = directory.Directory(
+        tmp_path,
+        path_matcher=(
+            re.compile(path_matcher)
+            if path_matcher
+            else None))
+    assert (
+        await direct.grep(["-l", "X"], ["a.txt", "b.txt", "c.py"], stream=True)
+        == ({"a.txt"}
+            if path_matcher
+            else {"a.txt", "c.py"}))
+    assert (
+        await direct.grep(["-l", "Z"], ["a.txt", "b.txt"], stream=True)
+        == set())
+    with pytest.raises(subprocess.exceptions.OSCommandError) as e:
+        await direct.grep(["-l", "X"], ["missing.txt"], stream=True)
+    assert e.value.args[0].startswith("`grep` failed (2): ")
+    assert "missing.txt" in e.value.args[0]
+
+
 def test_abstract_git_directory_find_git_deleted_files():
     finder = MagicMock()
     git_command = MagicMock()
@@ -538,7 +688,7 @@ def test_abstract_git_directory_constructor(patches, args, kwargs, changed):
         m_super.call_args
         == [tuple(args), kwargs])
     assert direct.changed == changed
-    iface_props = ["finder_class"]
+    iface_props = ["finder_class", "git_index_class"]
     for prop in iface_props:
         with pytest.raises(NotImplementedError):
             getattr(direct, prop)
@@ -548,57 +698,42 @@ async def test_abstract_git_directory_changed_files(patches):
     direct = DummyGitDirectory("PATH", changed="CHANGED")
     patched = patches(
         "AGitDirectory.find_git_files_changed_since",
-        ("AGitDirectory.finder",
-         dict(new_callable=PropertyMock)),
-        ("AGitDirectory.git_command",
-         dict(new_callable=PropertyMock)),
-        ("AGitDirectory.execute",
-         dict(new_callable=AsyncMock)),
+        "AGitDirectory._find_git_files",
         prefix="aio.core.directory.abstract.directory")
 
-    with patched as (m_find, m_finder, m_command, m_execute):
+    with patched as (m_find, m_find_files):
         assert (
             await direct.changed_files
-            == m_execute.return_value
+            == m_find_files.return_value
             == getattr(
                 direct,
                 directory.AGitDirectory.changed_files.cache_name)[
                     "changed_files"])
 
     assert (
-        m_execute.call_args
-        == [(m_find,
-             m_finder.return_value,
-             m_command.return_value,
-             "CHANGED"), {}])
+        m_find_files.call_args
+        == [(m_find, "CHANGED"), {}])
 
 
 async def test_abstract_git_directory_deleted_files(patches):
     direct = DummyGitDirectory("PATH")
     patched = patches(
         "AGitDirectory.find_git_deleted_files",
-        ("AGitDirectory.finder",
-         dict(new_callable=PropertyMock)),
-        ("AGitDirectory.git_command",
-         dict(new_callable=PropertyMock)),
-        ("AGitDirectory.execute",
-         dict(new_callable=AsyncMock)),
+        "AGitDirectory._find_git_files",
         prefix="aio.core.directory.abstract.directory")
 
-    with patched as (m_find, m_finder, m_command, m_execute):
+    with patched as (m_find, m_find_files):
         assert (
             await direct.deleted_files
-            == m_execute.return_value
+            == m_find_files.return_value
             == getattr(
                 direct,
                 directory.AGitDirectory.deleted_files.cache_name)[
                     "deleted_files"])
 
     assert (
-        m_execute.call_args
-        == [(m_find,
-             m_finder.return_value,
-             m_command.return_value), {}])
+        m_find_files.call_args
+        == [(m_find, ), {}])
 
 
 @pytest.mark.parametrize(
@@ -769,47 +904,423 @@ async def test_abstract_git_directory_untracked_files(patches):
     direct = DummyGitDirectory("PATH")
     patched = patches(
         "AGitDirectory.find_git_untracked_files",
-        ("AGitDirectory.finder",
-         dict(new_callable=PropertyMock)),
-        ("AGitDirectory.git_command",
-         dict(new_callable=PropertyMock)),
-        ("AGitDirectory.execute",
-         dict(new_callable=AsyncMock)),
+        "AGitDirectory._find_git_files",
         prefix="aio.core.directory.abstract.directory")
 
-    with patched as (m_files, m_finder, m_git, m_exec):
+    with patched as (m_files, m_find_files):
         assert (
             await direct.untracked_files
-            == m_exec.return_value)
+            == m_find_files.return_value)
 
     assert (
-        m_exec.call_args
-        == [(m_files, m_finder.return_value, m_git.return_value), {}])
+        m_find_files.call_args
+        == [(m_files, ), {}])
     assert not hasattr(
         direct,
         directory.AGitDirectory.untracked_files.cache_name)
 
 
-async def test_abstract_git_directory_get_files(patches):
-    direct = DummyGitDirectory("PATH")
+@pytest.mark.parametrize("untracked", [True, False])
+@pytest.mark.parametrize("exclude", [[], ["EXCLUDE"]])
+@pytest.mark.parametrize("exclude_dirs", [[], ["EXCLUDE_DIR"]])
+async def test_abstract_git_directory_get_files(
+        patches, untracked, exclude, exclude_dirs):
+    direct = DummyGitDirectory(
+        "PATH",
+        untracked=untracked,
+        exclude=exclude,
+        exclude_dirs=exclude_dirs,
+        path_matcher="PATH_MATCHER",
+        exclude_matcher="EXCLUDE_MATCHER",
+        text_only="TEXT_ONLY")
     patched = patches(
         "ADirectory.get_files",
         ("AGitDirectory.deleted_files",
          dict(new_callable=PropertyMock)),
+        ("AGitDirectory.git_index",
+         dict(new_callable=PropertyMock)),
+        ("AGitDirectory.untracked_files",
+         dict(new_callable=PropertyMock)),
         prefix="aio.core.directory.abstract.directory")
     files = set([f"F{i}" for i in range(0, 10)])
     deleted = set([f"F{i}" for i in range(7, 13)])
+    index = MagicMock()
+    untracked_files = MagicMock()
 
-    with patched as (m_super, m_deleted):
+    with patched as (m_super, m_deleted, m_index, m_untracked):
         m_super.return_value = files
         m_deleted.side_effect = AsyncMock(return_value=deleted)
+        m_index.side_effect = AsyncMock(return_value=index)
+        m_untracked.side_effect = AsyncMock(return_value=untracked_files)
+        result = await direct.get_files()
+
+    if untracked:
+        assert result == untracked_files
+        assert not m_super.called
+        assert not m_index.called
+        return
+    assert not m_untracked.called
+    if exclude or exclude_dirs:
+        assert result == (files - deleted)
+        assert (
+            m_super.call_args
+            == [(), {}])
+        assert not m_index.called
+        return
+    assert not m_super.called
+    assert not m_deleted.called
+    assert result == index.files.return_value
+    assert (
+        index.files.call_args
+        == [(),
+            dict(text_only="TEXT_ONLY",
+                 path_matcher="PATH_MATCHER",
+                 exclude_matcher="EXCLUDE_MATCHER")])
+
+
+@pytest.mark.parametrize("cached", [None, "KEY", "OTHER_KEY"])
+async def test_abstract_git_directory_git_index(patches, cached):
+    direct = DummyGitDirectory("PATH")
+    patched = patches(
+        "asyncio",
+        ("AGitDirectory.absolute_path",
+         dict(new_callable=PropertyMock)),
+        ("AGitDirectory.execute",
+         dict(new_callable=MagicMock)),
+        ("AGitDirectory.git_command",
+         dict(new_callable=PropertyMock)),
+        ("AGitDirectory.git_index_class",
+         dict(new_callable=PropertyMock)),
+        ("AGitDirectory._git_indexes",
+         dict(new_callable=dict)),
+        prefix="aio.core.directory.abstract.directory")
+    loop = asyncio.get_running_loop()
+    cached_index = loop.create_future()
+    cached_index.set_result("CACHED_INDEX")
+    new_index = loop.create_future()
+    new_index.set_result("NEW_INDEX")
+
+    with patched as (m_aio, m_path, m_exec, m_git, m_class, m_indexes):
+        if cached:
+            m_indexes[m_path.return_value] = (cached, cached_index)
+        m_exec.side_effect = [AsyncMock(return_value="KEY")(), "READ"]
+        m_aio.ensure_future.return_value = new_index
         assert (
-            await direct.get_files()
-            == (files - deleted))
+            await direct.git_index
+            == ("CACHED_INDEX"
+                if cached == "KEY"
+                else "NEW_INDEX"))
 
     assert (
-        m_super.call_args
-        == [(), {}])
+        getattr(
+            direct,
+            directory.AGitDirectory.git_index.cache_name)["git_index"]
+        == ("CACHED_INDEX"
+            if cached == "KEY"
+            else "NEW_INDEX"))
+    assert (
+        m_exec.call_args_list[0]
+        == [(m_class.return_value.key,
+             m_git.return_value,
+             m_path.return_value), {}])
+    if cached == "KEY":
+        assert len(m_exec.call_args_list) == 1
+        assert not m_aio.ensure_future.called
+        assert m_indexes[m_path.return_value] == ("KEY", cached_index)
+        return
+    assert (
+        m_exec.call_args_list[1]
+        == [(m_class.return_value.read,
+             m_git.return_value,
+             m_path.return_value), {}])
+    assert (
+        m_aio.ensure_future.call_args
+        == [("READ", ), {}])
+    assert m_indexes[m_path.return_value] == ("KEY", new_index)
+
+
+@pytest.mark.parametrize("async_subprocess", [True, False])
+async def test_abstract_git_directory__find_git_files(
+        iters, patches, async_subprocess):
+    direct = DummyGitDirectory("PATH", async_subprocess=async_subprocess)
+    patched = patches(
+        ("AGitDirectory.finder",
+         dict(new_callable=PropertyMock)),
+        ("AGitDirectory.git_command",
+         dict(new_callable=PropertyMock)),
+        ("AGitDirectory.execute",
+         dict(new_callable=AsyncMock)),
+        prefix="aio.core.directory.abstract.directory")
+    find = AsyncMock()
+    args = iters()
+
+    with patched as (m_finder, m_command, m_execute):
+        assert (
+            await direct._find_git_files(find, *args)
+            == (find.return_value
+                if async_subprocess
+                else m_execute.return_value))
+
+    if async_subprocess:
+        assert not m_execute.called
+        assert (
+            find.call_args
+            == [(m_finder.return_value.run_async,
+                 m_command.return_value,
+                 *args), {}])
+        return
+    assert not find.called
+    assert (
+        m_execute.call_args
+        == [(find,
+             m_finder.return_value,
+             m_command.return_value,
+             *args), {}])
+
+
+def test_abstract_git_index_grep_text(patches):
+    patched = patches(
+        "subprocess",
+        ("GIT_GREP_MAX_PATHS",
+         dict(new=2)),
+        prefix="aio.core.directory.abstract.directory")
+
+    with patched as (m_subproc, m_max):
+        m_subproc.run.return_value.stdout = "A\0B C\0"
+        assert (
+            DummyGitIndex.grep_text("GIT", "PATH", ["P3", "P1", "P2"])
+            == {"A", "B C"})
+
+    assert (
+        m_subproc.run.call_args_list
+        == [[(("GIT", "--literal-pathspecs",
+               "grep", "--cached", "-I", "-l", "-z", "",
+               "--", *paths), ),
+             dict(cwd="PATH",
+                  capture_output=True,
+                  encoding="utf-8")]
+            for paths
+            in [("P1", "P2"), ("P3", )]])
+
+
+@pytest.mark.parametrize("head", [True, False])
+@pytest.mark.parametrize("index", [True, False])
+def test_abstract_git_index_key(patches, head, index):
+    patched = patches(
+        "os",
+        "subprocess",
+        prefix="aio.core.directory.abstract.directory")
+    lines = ["INDEX_PATH", *(["HEAD_SHA"] if head else [])]
+
+    with patched as (m_os, m_subproc):
+        m_subproc.run.return_value.stdout.splitlines.return_value = lines
+        if not index:
+            m_os.stat.side_effect = OSError
+        assert (
+            DummyGitIndex.key("GIT", "PATH")
+            == (*(["HEAD_SHA"] if head else []),
+                *((m_os.stat.return_value.st_mtime_ns,
+                   m_os.stat.return_value.st_size)
+                  if index
+                  else (None, None))))
+
+    assert (
+        m_subproc.run.call_args
+        == [(("GIT",
+              "rev-parse",
+              "--git-path", "index",
+              "--verify", "-q", "HEAD"), ),
+            dict(cwd="PATH",
+                 capture_output=True,
+                 encoding="utf-8")])
+    assert (
+        m_os.stat.call_args
+        == [(m_os.path.join.return_value, ), {}])
+    assert (
+        m_os.path.join.call_args
+        == [("PATH", "INDEX_PATH"), {}])
+
+
+def test_abstract_git_index_ls_files(patches):
+    patched = patches(
+        "subprocess",
+        prefix="aio.core.directory.abstract.directory")
+
+    with patched as (m_subproc, ):
+        m_subproc.run.return_value.stdout = "A\0B C\0\0D\0"
+        assert (
+            DummyGitIndex.ls_files("GIT", "PATH", "ARG1", "ARG2")
+            == ["A", "B C", "D"])
+
+    assert (
+        m_subproc.run.call_args
+        == [(("GIT", "ls-files", "-z", "ARG1", "ARG2"), ),
+            dict(cwd="PATH",
+                 capture_output=True,
+                 encoding="utf-8")])
+
+
+@pytest.mark.parametrize("binary", [True, False])
+def test_abstract_git_index_read(patches, binary):
+    patched = patches(
+        "AGitIndex.grep_text",
+        "AGitIndex.ls_files",
+        prefix="aio.core.directory.abstract.directory")
+
+    entries = ["100644 aaaa 0\ti/lf    w/lf    attr/                 \tPATH"]
+    if binary:
+        entries.extend(
+            f"100644 bbbb 0\ti/-text w/-text attr/                 \tBIN{i}"
+            for i
+            in range(0, 3))
+
+    grepped = []
+
+    def grep_text(git_command, path, paths):
+        grepped.append((git_command, path, set(paths)))
+        return {"BIN1"}
+
+    with patched as (m_grep, m_ls):
+        m_ls.side_effect = [entries, ["DELETED"]]
+        m_grep.side_effect = grep_text
+        index = DummyGitIndex.read("GIT", "PATH")
+
+    assert isinstance(index, DummyGitIndex)
+    assert index.deleted_files == {"DELETED"}
+    assert (
+        m_ls.call_args_list
+        == [[("GIT", "PATH", "--stage", "--eol"), {}],
+            [("GIT", "PATH", "--deleted"), {}]])
+    if not binary:
+        assert index.text_files == {"PATH"}
+        assert index.binary_files == set()
+        assert not grepped
+        return
+    assert index.text_files == {"PATH", "BIN1"}
+    assert index.binary_files == {"BIN0", "BIN2"}
+    assert grepped == [("GIT", "PATH", {"BIN0", "BIN1", "BIN2"})]
+
+
+def test_abstract_git_index_constructor(patches):
+    patched = patches(
+        "AGitIndex._add_entry",
+        prefix="aio.core.directory.abstract.directory")
+    entries = [f"ENTRY{i}" for i in range(0, 5)]
+
+    with patched as (m_add, ):
+        index = DummyGitIndex(entries, iter(["D1", "D2"]))
+
+    assert index.binary_files == set()
+    assert index.text_files == set()
+    assert index.deleted_files == {"D1", "D2"}
+    assert (
+        m_add.call_args_list
+        == [[(entry, ), {}] for entry in entries])
+
+
+@pytest.mark.parametrize("text_only", [None, True, False])
+def test_abstract_git_index_files(patches, text_only):
+    index = DummyGitIndex([], ["T2", "B2"])
+    index.text_files.update({"T1", "T2", "T3"})
+    index.binary_files.update({"B1", "B2"})
+    patched = patches(
+        "ADirectoryFileFinder.include_path",
+        prefix="aio.core.directory.abstract.directory")
+
+    with patched as (m_include, ):
+        m_include.side_effect = lambda path, p, e: path != "T3"
+        assert (
+            index.files(
+                text_only=text_only,
+                path_matcher="PATH_MATCHER",
+                exclude_matcher="EXCLUDE_MATCHER")
+            == ({"T1"}
+                if text_only
+                else {"T1", "B1"}))
+
+    assert (
+        sorted(m_include.call_args_list)
+        == sorted(
+            [(path, "PATH_MATCHER", "EXCLUDE_MATCHER"), {}]
+            for path
+            in (["T1", "T3"]
+                if text_only
+                else ["T1", "T3", "B1"])))
+
+
+def test_abstract_git_index__add_entry():
+    entries = [
+        "100644 aaaa 0\ti/lf    w/lf    attr/                 \ttext",
+        "100644 bbbb 0\ti/none  w/none  attr/                 \tno eol",
+        "100644 cccc 0\ti/crlf  w/lf    attr/text eol=crlf    \tcrlf",
+        "100644 dddd 0\ti/-text w/-text attr/                 \tbinary",
+        "120000 eeee 0\ti/none  w/none  attr/                 \tlink",
+        ("100644 e69de29bb2d1d6434b8b29ae775ad8c2e48c5391 0"
+         "\ti/none  w/none  attr/                 \tempty"),
+        "160000 ffff 0\ti/      w/      attr/                 \tsubmodule",
+        ("100644 aaaa 1"
+         "\ti/lf    w/lf    attr/                 \tpath/\twith tab")]
+    index = DummyGitIndex(entries, [])
+    assert (
+        index.text_files
+        == {"text", "no eol", "crlf", "link", "path/\twith tab"})
+    assert index.binary_files == {"binary"}
+
+
+def test_abstract_git_index_functional(tmp_path):
+    _subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    tmp_path.joinpath("text").write_text("text\n")
+    tmp_path.joinpath("noeol").write_text("text")
+    tmp_path.joinpath("empty").write_text("")
+    tmp_path.joinpath("binary").write_bytes(b"\0\1\2")
+    # Git marks files with a lone CR as `-text`, but `grep -I` does not.
+    tmp_path.joinpath("lone cr").write_bytes(b"a\rb\n")
+    tmp_path.joinpath("deleted").write_text("deleted\n")
+    _subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    tmp_path.joinpath("deleted").unlink()
+    index = directory.GitIndex.read("git", str(tmp_path))
+    assert index.files() == {"text", "noeol", "lone cr"}
+    assert (
+        index.files(text_only=False)
+        == {"text", "noeol", "lone cr", "binary"})
+    assert (
+        index.files()
+        == set(_subprocess.run(
+            ["git", "grep", "--cached", "-I", "-l", "-z", ""],
+            cwd=tmp_path,
+            capture_output=True,
+            encoding="utf-8").stdout.split("\0")) - {"", "deleted"})
+    key = directory.GitIndex.key("git", str(tmp_path))
+    assert key == directory.GitIndex.key("git", str(tmp_path))
+    _subprocess.run(["git", "add", "-A"], cwd=tmp_path, check=True)
+    assert key != directory.GitIndex.key("git", str(tmp_path))
+
+
+@pytest.mark.parametrize("untracked", [True, False])
+async def test_abstract_git_directory_async_subprocess_functional(
+        tmp_path, untracked):
+    _subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    tmp_path.joinpath("text").write_text("text\n")
+    tmp_path.joinpath("deleted").write_text("deleted\n")
+    _subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+    tmp_path.joinpath("deleted").unlink()
+    tmp_path.joinpath("untracked").write_text("untracked\n")
+    results = []
+    for async_subprocess in [True, False]:
+        direct = directory.GitDirectory(
+            tmp_path,
+            untracked=untracked,
+            async_subprocess=async_subprocess)
+        results.append(
+            (await direct.files,
+             await direct.deleted_files,
+             await direct.grep(["-l"], "text")))
+    assert results[0] == results[1]
+    assert (
+        results[0][0]
+        == ({"untracked"}
+            if untracked
+            else {"text"}))
 
 
 @abstracts.implementer(directory.IDirectoryContext)
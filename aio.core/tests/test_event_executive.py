@@ -1,5 +1,6 @@
 
 import types
+from functools import partial
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
@@ -56,26 +57,42 @@ def test_event_executive_constructor():
     "args", [[], [f"ARG{i}" for i in range(0, 5)]])
 @pytest.mark.parametrize(
     "kwargs", [{}, {f"K{i}": f"V{i}" for i in range(0, 5)}])
-async def test_event_executive_execute(patches, args, kwargs):
+@pytest.mark.parametrize("is_coro", [True, False])
+async def test_event_executive_execute(patches, args, kwargs, is_coro):
     executive = DummyExecutive()
     patched = patches(
+        "asyncio",
         ("AExecutive.loop",
          dict(new_callable=PropertyMock)),
         ("AExecutive.pool",
          dict(new_callable=PropertyMock)),
         prefix="aio.core.event.executive")
+    executable = AsyncMock()
 
-    with patched as (m_loop, m_pool):
+    with patched as (m_asyncio, m_loop, m_pool):
+        m_asyncio.iscoroutinefunction.return_value = is_coro
         execute = AsyncMock()
         m_loop.return_value.run_in_executor = execute
         assert (
             await DummyExecutive.execute.__wrapped__(
-                executive, "EXECUTABLE", *args, **kwargs)
-            == m_loop.return_value.run_in_executor.return_value)
+                executive, executable, *args, **kwargs)
+            == (executable.return_value
+                if is_coro
+                else m_loop.return_value.run_in_executor.return_value))
 
+    assert (
+        m_asyncio.iscoroutinefunction.call_args
+        == [(executable, ), {}])
+    if is_coro:
+        assert not execute.called
+        assert (
+            executable.call_args
+            == [tuple(args), kwargs])
+        return
+    assert not executable.called
     assert (
         m_loop.return_value.run_in_executor.call_args
-        == [(m_pool.return_value, "EXECUTABLE", *args), kwargs])
+        == [(m_pool.return_value, executable, *args), kwargs])
 
 
 @pytest.mark.parametrize(
@@ -85,9 +102,10 @@ async def test_event_executive_execute(patches, args, kwargs):
 @pytest.mark.parametrize("concurrency", [None, *range(0, 5)])
 @pytest.mark.parametrize("max_batch_size", [None, *range(0, 5)])
 @pytest.mark.parametrize("min_batch_size", [None, *range(0, 5)])
+@pytest.mark.parametrize("weight", [None, "WEIGHT"])
 async def test_event_executive_execute_in_batches(
         iters, patches, args, kwargs, concurrency, max_batch_size,
-        min_batch_size):
+        min_batch_size, weight):
     executive = DummyExecutive()
     patched = patches(
         "functional",
@@ -103,6 +121,8 @@ async def test_event_executive_execute_in_batches(
         call_kwargs["max_batch_size"] = max_batch_size
     if min_batch_size is not None:
         call_kwargs["min_batch_size"] = min_batch_size
+    if weight is not None:
+        call_kwargs["weight"] = weight
     c_kwargs["limit"] = concurrency
     batches = iters()
 
@@ -129,9 +149,28 @@ async def test_event_executive_execute_in_batches(
         m_func.batch_jobs.call_args
         == [(tuple(args), ),
             dict(max_batch_size=max_batch_size,
-                 min_batch_size=min_batch_size)])
+                 min_batch_size=min_batch_size,
+                 weight=weight)])
     assert (
         m_exec.call_args_list
         == [[("EXECUTABLE", *batch), kwargs]
             for batch
             in batches])
+
+
+@pytest.mark.parametrize("is_partial", [True, False])
+def test_event_executive__profile_execute(is_partial):
+    executive = DummyExecutive()
+
+    def some_executable():
+        pass
+
+    executable = (
+        partial(some_executable, "ARG")
+        if is_partial
+        else some_executable)
+    assert (
+        executive._profile_execute(
+            (executive, (executable, "ARG1", "ARG2"), {}))
+        == ("execute test_event_executive."
+            "test_event_executive__profile_execute.<locals>.some_executable"))
@@ -1,7 +1,13 @@
 import abc
+import asyncio
 import contextlib
+import gc
+import gzip
+import json
 import math
+import re
 import types
+import weakref
 from typing import Iterable
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
@@ -9,7 +15,7 @@ import pytest
 
 import abstracts
 
-from aio.core import functional
+from aio.core import event, functional
 
 
 # TODO: add a test to make sure that async loading multiple
@@ -584,6 +590,102 @@ def test_utils_junzip(patches):
         == [(data, ), {}])
 
 
+JUNZIP_DATA = dict(
+    BEFORE=dict(nested=[1, {"ITEMS": "]}"}], number=23),
+    ITEMS=[
+        dict(id=i,
+             text="\u2603\"]}," * (i % 5),
+             number=i * 1.5,
+             empty=[] if i % 2 else {})
+        for i in range(0, 50)],
+    AFTER=12345)
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, None])
+@pytest.mark.parametrize("chunked", [True, False])
+def test_utils_junzip_items(indent, chunk_size, chunked):
+    data = gzip.compress(json.dumps(JUNZIP_DATA, indent=indent).encode())
+    kwargs = (
+        dict(chunk_size=chunk_size)
+        if chunk_size
+        else {})
+    if chunked:
+        data = iter([data[i:i + 13] for i in range(0, len(data), 13)])
+    items = functional.utils.junzip_items(data, "ITEMS", **kwargs)
+    assert isinstance(items, types.GeneratorType)
+    assert list(items) == JUNZIP_DATA["ITEMS"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, None])
+@pytest.mark.parametrize(
+    "match",
+    [r"\"id\": 1[0-9],",
+     r"\"number\": 2",
+     r"NOMATCH"])
+def test_utils_junzip_items_match(chunk_size, match):
+    data = gzip.compress(json.dumps(JUNZIP_DATA).encode())
+    kwargs = (
+        dict(chunk_size=chunk_size)
+        if chunk_size
+        else {})
+    matcher = re.compile(match)
+    assert (
+        list(
+            functional.utils.junzip_items(
+                data,
+                "ITEMS",
+                match=matcher,
+                **kwargs))
+        == [item
+            for item
+            in JUNZIP_DATA["ITEMS"]
+            if matcher.search(json.dumps(item))])
+
+
+@pytest.mark.parametrize(
+    "data",
+    [(b"{}", []),
+     (b'{"OTHER": [1, 2]}', []),
+     (b'{"ITEMS": []}', []),
+     (b' {"ITEMS" : [ 1 , 23 ] } ', [1, 23]),
+     (b'{"ITEMS": [1, 2', ValueError),
+     (b'{"ITEMS": [1 2]}', ValueError),
+     (b'{"ITEMS": ["unterminated', ValueError),
+     (b"[1, 2]", ValueError),
+     (b"", ValueError)])
+def test_utils_junzip_items_data(data):
+    data, expected = data
+    items = functional.utils.junzip_items(
+        gzip.compress(data),
+        "ITEMS",
+        chunk_size=1)
+    if expected is ValueError:
+        with pytest.raises(ValueError):
+            list(items)
+        return
+    assert list(items) == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b'{"ITEMS": [7.5]}',
+     b'{"ITEMS": [1e-7, -2]}',
+     b'{"ITEMS": [-12.5E+3], "AFTER": 1.25e2}',
+     b'{"BEFORE": 2.5e-1, "ITEMS": [1, 23.75]}'])
+def test_utils_junzip_items_split_numbers(data):
+    expected = json.loads(data)["ITEMS"]
+    # Split the text at every position, including inside the numbers.
+    for chunk_size in range(1, len(data) + 1):
+        assert (
+            list(
+                functional.utils.junzip_items(
+                    gzip.compress(data),
+                    "ITEMS",
+                    chunk_size=chunk_size))
+            == expected)
+
+
 @pytest.mark.parametrize("assignable", [True, False])
 def test_typed(patches, assignable):
     patched = patches(
@@ -992,12 +1094,57 @@ def test_batches(iters, item_count, batch_size):
     assert results == items
 
 
+@pytest.mark.parametrize("item_count", range(0, 20))
+@pytest.mark.parametrize("batch_size", range(0, 7))
+def test_weighted_batches(item_count, batch_size):
+    items = [f"ITEM{i}" for i in range(0, item_count)]
+    weights = {
+        item: (i * 7) % 5
+        for i, item
+        in enumerate(items)}
+    actual_batch_size = batch_size or 1
+    batch_iter = functional.weighted_batches(
+        items,
+        batch_size,
+        weights.__getitem__)
+    assert isinstance(batch_iter, types.GeneratorType)
+    batches = list(batch_iter)
+    assert all(len(b) <= actual_batch_size for b in batches)
+    assert sorted(item for b in batches for item in b) == sorted(items)
+    assert (
+        len(batches)
+        == math.ceil(item_count / actual_batch_size))
+    totals = [
+        sum(weights[item] for item in b)
+        for b
+        in batches]
+    assert totals == sorted(totals, reverse=True)
+
+
+def test_weighted_batches_skewed():
+    # A few huge items mixed with many small ones, the fixed split puts
+    # all of the huge items in one batch.
+    items = [f"HUGE{i}" for i in range(0, 4)] + [
+        f"SMALL{i}" for i in range(0, 60)]
+
+    def weight(item):
+        return 1000 if item.startswith("HUGE") else 1
+
+    fixed = list(functional.batches(items, 16))
+    weighted = list(functional.weighted_batches(items, 16, weight))
+    assert len(fixed) == len(weighted) == 4
+    assert max(sum(weight(i) for i in b) for b in fixed) == 4012
+    assert max(sum(weight(i) for i in b) for b in weighted) == 1015
+
+
 @pytest.mark.parametrize("is_str_or_bytes", [True, False])
 @pytest.mark.parametrize("is_iterable", [True, False])
 @pytest.mark.parametrize("max_batch_size", [None, 0, 23])
 @pytest.mark.parametrize("min_batch_size", [None, 0, 23])
+@pytest.mark.parametrize("weight", [None, "WEIGHT"])
 def test_batch_jobs(
-        patches, is_str_or_bytes, is_iterable, max_batch_size, min_batch_size):
+        patches, is_str_or_bytes, is_iterable, max_batch_size, min_batch_size,
+        weight):
     patched = patches(
         "len",
         "isinstance",
@@ -1008,9 +1155,12 @@ def test_batch_jobs(
         "type",
         "batches",
         "typed",
+        "weighted_batches",
         prefix="aio.core.functional.utils")
     jobs = MagicMock()
     kwargs = {}
+    if weight is not None:
+        kwargs["weight"] = weight
     if max_batch_size is not None:
         kwargs["max_batch_size"] = max_batch_size
     if min_batch_size is not None:
@@ -1023,7 +1173,7 @@ def test_batch_jobs(
 
     with patched as patchy:
         (m_len, m_isinst, m_max, m_min, m_os, m_round, m_type,
-         m_batches, m_typed) = patchy
+         m_batches, m_typed, m_weighted) = patchy
         m_isinst.side_effect = isinst
         if not is_iterable or is_str_or_bytes:
             with pytest.raises(functional.exceptions.BatchedJobsError) as e:
@@ -1031,7 +1181,9 @@ def test_batch_jobs(
         else:
             assert (
                 functional.batch_jobs(jobs, **kwargs)
-                == m_batches.return_value)
+                == (m_weighted.return_value
+                    if weight
+                    else m_batches.return_value))
 
     assert (
         m_isinst.call_args_list[0]
@@ -1090,7 +1242,122 @@ def test_batch_jobs(
     assert (
         m_typed.call_args
         == [(Iterable, jobs), {}])
+    if weight:
+        assert not m_batches.called
+        assert (
+            m_weighted.call_args
+            == [(m_typed.return_value, ),
+                dict(batch_size=batch_count, weight=weight)])
+        return
+    assert not m_weighted.called
     assert (
         m_batches.call_args
         == [(m_typed.return_value, ),
             dict(batch_size=batch_count)])
+
+
+def test_functional_async_property__profile_prop():
+
+    async def some_prop(self):
+        pass
+
+    assert (
+        functional.async_property()._profile_prop("CALL")
+        == "async_property")
+    assert (
+        functional.async_property(some_prop)._profile_prop("CALL")
+        == ("async_property test_functional."
+            "test_functional_async_property__profile_prop"
+            ".<locals>.some_prop"))
+
+
+def test_functional_async_property_loaders():
+    prop = functional.async_property()
+    assert isinstance(prop.loaders, weakref.WeakKeyDictionary)
+    assert "loaders" in prop.__dict__
+
+
+@pytest.mark.parametrize("instance", ["weakrefable", "unhashable", "slotted"])
+@pytest.mark.parametrize("loading", [True, False])
+def test_functional_async_property_get_loader(instance, loading):
+    prop = functional.async_property()
+
+    class Weakrefable:
+        pass
+
+    class Unhashable:
+        __hash__ = None
+
+    class Slotted:
+        __slots__ = ("foo", )
+
+    instance = dict(
+        weakrefable=Weakrefable,
+        unhashable=Unhashable,
+        slotted=Slotted)[instance]()
+    if not isinstance(instance, Weakrefable):
+        assert not prop.get_loader(instance)
+        assert not prop.loaders
+        return
+    if loading:
+        loader = prop.get_loader(instance)
+        assert prop.loaders[instance] is loader
+    loader = prop.get_loader(instance)
+    assert isinstance(loader, event.Loader)
+    assert prop.get_loader(instance) is loader
+    assert list(prop.loaders.items()) == [(instance, loader)]
+
+
+@pytest.mark.parametrize("raises", [True, False])
+async def test_functional_async_property_load_cooperatively(raises):
+    calls = []
+
+    class SomeError(Exception):
+        pass
+
+    class Prop:
+
+        @functional.async_property(cache=True)
+        async def prop(self):
+            calls.append(self)
+            await asyncio.sleep(0)
+            if raises:
+                raise SomeError()
+            return "RESULT"
+
+    prop = Prop.__dict__["prop"]
+    instance = Prop()
+    results = await asyncio.gather(
+        *[instance.prop for _ in range(0, 5)],
+        return_exceptions=True)
+    assert calls == [instance]
+    assert not prop.loaders
+    if not raises:
+        assert results == ["RESULT"] * 5
+        return
+    assert isinstance(results[0], SomeError)
+    assert all(isinstance(r, KeyError) for r in results[1:])
+    # A later call can retry.
+    with pytest.raises(SomeError):
+        await instance.prop
+    assert calls == [instance, instance]
+    assert not prop.loaders
+
+
+async def test_functional_async_property_loaders_not_leaked():
+    refs = []
+
+    class Prop:
+
+        @functional.async_property(cache=True)
+        async def prop(self):
+            return "RESULT"
+
+    for _ in range(0, 10):
+        instance = Prop()
+        refs.append(weakref.ref(instance))
+        assert await instance.prop == "RESULT"
+    del instance
+    gc.collect()
+    assert not any(ref() for ref in refs)
+    assert not Prop.__dict__["prop"].loaders
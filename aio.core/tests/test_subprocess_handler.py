@@ -1,5 +1,7 @@
 
-from unittest.mock import MagicMock, PropertyMock
+import asyncio
+import sys
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
 
@@ -46,10 +48,18 @@ class DummySubprocessHandlerInterface:
     def run(self, *args, **kwargs):
         return subprocess.ISubprocessHandler.run(self, *args, **kwargs)
 
+    async def run_async(self, *args, **kwargs):
+        return await subprocess.ISubprocessHandler.run_async(
+            self, *args, **kwargs)
+
     def run_subprocess(self, *args, **kwargs):
         return subprocess.ISubprocessHandler.run_subprocess(
             self, *args, **kwargs)
 
+    async def run_subprocess_async(self, *args, **kwargs):
+        return await subprocess.ISubprocessHandler.run_subprocess_async(
+            self, *args, **kwargs)
+
     def subprocess_args(self, *args):
         return subprocess.ISubprocessHandler.subprocess_args(self, *args)
 
@@ -57,7 +67,7 @@ class DummySubprocessHandlerInterface:
         return subprocess.ISubprocessHandler.subprocess_kwargs(self, **kwargs)
 
 
-def test_subprocess_handler_interface():
+async def test_subprocess_handler_interface():
     with pytest.raises(TypeError):
         subprocess.ISubprocessHandler()
 
@@ -77,6 +87,11 @@ def test_subprocess_handler_interface():
     for subproc_method in subproc_methods:
         with pytest.raises(NotImplementedError):
             getattr(iface, subproc_method)("SUBPROC", "ARG", KW="VALUE")
+    async_subproc_methods = [
+        "run_async", "run_subprocess_async"]
+    for subproc_method in async_subproc_methods:
+        with pytest.raises(NotImplementedError):
+            await getattr(iface, subproc_method)("SUBPROC", "ARG", KW="VALUE")
     with pytest.raises(NotImplementedError):
         iface.subprocess_args("SUBPROC", "ARG")
     with pytest.raises(NotImplementedError):
@@ -301,6 +316,38 @@ def test_subprocess_handler_run(iters, patches):
         == [(), kwargs])
 
 
+async def test_subprocess_handler_run_async(iters, patches):
+    handler = DummySubprocessHandler("PATH")
+    patched = patches(
+        "ASubprocessHandler.handle_response",
+        "ASubprocessHandler.run_subprocess_async",
+        "ASubprocessHandler.subprocess_args",
+        "ASubprocessHandler.subprocess_kwargs",
+        prefix="aio.core.subprocess.handler")
+    args = iters()
+    kwargs = iters(dict)
+
+    with patched as (m_handle, m_run, m_args, m_kwargs):
+        m_args.side_effect = lambda *la: la
+        m_kwargs.side_effect = lambda **kwa: kwa
+        assert (
+            await handler.run_async(*args, **kwargs)
+            == m_handle.return_value)
+
+    assert (
+        m_handle.call_args
+        == [(m_run.return_value, ), {}])
+    assert (
+        m_run.call_args
+        == [tuple(args), kwargs])
+    assert (
+        m_args.call_args
+        == [tuple(args), {}])
+    assert (
+        m_kwargs.call_args
+        == [(), kwargs])
+
+
 def test_subprocess_handler_run_subprocess(iters, patches):
     handler = DummySubprocessHandler("PATH")
     patched = patches(
@@ -319,6 +366,126 @@ def test_subprocess_handler_run_subprocess(iters, patches):
         == [tuple(args), kwargs])
 
 
+@pytest.mark.parametrize("capture_output", [None, True, False])
+@pytest.mark.parametrize("encoding", [None, "ENCODING"])
+@pytest.mark.parametrize("returncode", [None, 0, 1])
+@pytest.mark.parametrize("raises", [None, Exception])
+async def test_subprocess_handler_run_subprocess_async(
+        iters, patches, capture_output, encoding, returncode, raises):
+    handler = DummySubprocessHandler("PATH")
+    patched = patches(
+        "asyncio",
+        "subprocess",
+        "ASubprocessHandler._read_output",
+        prefix="aio.core.subprocess.handler")
+    args = iters()
+    kwargs = iters(dict)
+    if capture_output is not None:
+        kwargs["capture_output"] = capture_output
+    if encoding is not None:
+        kwargs["encoding"] = encoding
+    process = MagicMock()
+    process.returncode = returncode
+    process.wait = AsyncMock()
+
+    async def gather(*outputs):
+        outputs = [await output for output in outputs]
+        if raises:
+            raise raises("AN ERROR OCCURRED")
+        return outputs
+
+    with patched as (m_asyncio, m_subproc, m_read):
+        m_asyncio.create_subprocess_exec = AsyncMock(return_value=process)
+        m_asyncio.gather.side_effect = gather
+        m_read.side_effect = lambda stream, _encoding: (stream, _encoding)
+        if raises:
+            with pytest.raises(raises):
+                await handler.run_subprocess_async(args, **kwargs)
+        else:
+            assert (
+                await handler.run_subprocess_async(args, **kwargs)
+                == m_subproc.CompletedProcess.return_value)
+
+    kwargs.pop("capture_output", None)
+    kwargs.pop("encoding", None)
+    pipe = (
+        m_asyncio.subprocess.PIPE
+        if capture_output
+        else None)
+    assert (
+        m_asyncio.create_subprocess_exec.call_args
+        == [tuple(args),
+            dict(stdout=pipe,
+                 stderr=pipe,
+                 **kwargs)])
+    assert (
+        m_read.call_args_list
+        == [[(process.stdout, encoding), {}],
+            [(process.stderr, encoding), {}]])
+    if returncode is None:
+        assert (
+            process.kill.call_args
+            == [(), {}])
+    else:
+        assert not process.kill.called
+    if raises:
+        assert not process.wait.called
+        assert not m_subproc.CompletedProcess.called
+        return
+    assert (
+        process.wait.call_args
+        == [(), {}])
+    assert (
+        m_subproc.CompletedProcess.call_args
+        == [(args,
+             process.wait.return_value,
+             (process.stdout, encoding),
+             (process.stderr, encoding)), {}])
+
+
+async def test_subprocess_handler_run_subprocess_async_functional(tmpdir):
+    handler = DummySubprocessHandler(tmpdir)
+    script = (
+        "import sys;"
+        "sys.stdout.write('\\u2603' * 100000 + '\\r\\nDONE');"
+        "sys.stderr.write('ERR');"
+        "sys.exit(3)")
+    args = (sys.executable, "-c", script)
+    response = await handler.run_subprocess_async(
+        args,
+        **handler.subprocess_kwargs())
+    expected = handler.run_subprocess(args, **handler.subprocess_kwargs())
+    assert response.args == args
+    assert response.returncode == expected.returncode == 3
+    assert response.stdout == expected.stdout
+    assert response.stdout.endswith("\nDONE")
+    assert response.stderr == expected.stderr == "ERR"
+    response = await handler.run_subprocess_async(args)
+    assert response.stdout is None
+    assert response.stderr is None
+
+
+@pytest.mark.parametrize("stream", [None, "STREAM"])
+@pytest.mark.parametrize("encoding", [None, "", "utf-8"])
+async def test_subprocess_handler__read_output(stream, encoding):
+    handler = DummySubprocessHandler("PATH")
+    output = "\u2603 SNOWMAN\r\nLINE\rLINE\n".encode("utf-8")
+    if stream:
+        stream = asyncio.StreamReader()
+        # Split a multibyte char across reads.
+        stream.feed_data(output[:1])
+        stream.feed_data(output[1:])
+        stream.feed_eof()
+    result = await handler._read_output(stream, encoding)
+
+    if not stream:
+        assert result is None
+    elif not encoding:
+        assert result == output
+    else:
+        assert result == "\u2603 SNOWMAN\nLINE\nLINE\n"
+
+
 def test_subprocess_handler_subprocess_args(iters, patches):
     handler = DummySubprocessHandler("PATH")
     patched = patches(
@@ -87,6 +87,49 @@ def test_captured__warnings(patches):
         == [(), dict(record=True)])
 
 
+@pytest.mark.parametrize("exists", [True, False])
+@pytest.mark.parametrize("mode", ["w", "wb"])
+def test_util_atomic_write(tmp_path, exists, mode):
+    path = tmp_path.joinpath("sub", "PATH")
+    if exists:
+        path.parent.mkdir()
+        path.write_text("OLD")
+    data = (
+        b"DATA"
+        if "b" in mode
+        else "DATA")
+
+    with utils.atomic_write(path, mode) as f:
+        f.write(data)
+        if exists:
+            assert path.read_text() == "OLD"
+        else:
+            assert not path.exists()
+
+    assert path.read_text() == "DATA"
+    assert list(path.parent.iterdir()) == [path]
+
+
+@pytest.mark.parametrize("exists", [True, False])
+def test_util_atomic_write_fails(tmp_path, exists):
+    path = tmp_path.joinpath("PATH")
+    if exists:
+        path.write_text("OLD")
+
+    with pytest.raises(TypeError):
+        with utils.atomic_write(str(path)) as f:
+            f.write("PARTIAL")
+            f.write(b"NOT TEXT")
+
+    assert (
+        list(tmp_path.iterdir())
+        == ([path]
+            if exists
+            else []))
+    if exists:
+        assert path.read_text() == "OLD"
+
+
 @pytest.mark.parametrize(
     "tarballs",
     [(), tuple("TARB{i}" for i in range(0, 3))])
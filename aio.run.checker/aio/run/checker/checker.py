@@ -1,5 +1,6 @@
 import argparse
 import asyncio
+import contextvars
 import pathlib
 import time
 from functools import cached_property
@@ -13,6 +14,10 @@ from aio.run.checker import abstract
 
 _sentinel = object()
 
+# Tracks the active check for checks running concurrently in separate tasks.
+_current_check: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "current_check", default="")
+
 
 class Checker(runner.Runner):
     """Runs check methods prefixed with `check_` and named in `self.checks`
@@ -33,7 +38,12 @@ class Checker(runner.Runner):
     @property
     def active_check(self) -> str:
         """Currently active check."""
-        return self._active_check
+        return _current_check.get() or self._active_check
+
+    @property
+    def check_concurrency(self) -> int:
+        """Maximum number of checks to run concurrently."""
+        return max(1, self.args.check_concurrency)
 
     @cached_property
     def checks_to_run(self) -> Sequence[str]:
@@ -189,6 +199,13 @@ class Checker(runner.Runner):
             type=int,
             default=5,
             help="Number of warnings to show in the summary, -1 shows all")
+        parser.add_argument(
+            "--check-concurrency",
+            type=int,
+            default=1,
+            help=(
+                "Maximum number of checks to run concurrently once their "
+                "data has been preloaded"))
         parser.add_argument(
             "--check",
             "-c",
@@ -369,18 +386,25 @@ class Checker(runner.Runner):
 
     @property
     def remaining_checks(self) -> Tuple[str, ...]:
+        """Checks that have not yet been started, completed or removed."""
         return tuple(
             check
             for check
             in self.checks_to_run
             if (check not in self.removed_checks
-                and check not in self.completed_checks))
+                and check not in self.completed_checks
+                and check not in self.running_checks))
 
     @cached_property
     def removed_checks(self) -> Set[str]:
         """Checks removed due to failed preload tasks."""
         return set()
 
+    @cached_property
+    def running_checks(self) -> Set[str]:
+        """Checks that are currently running concurrently."""
+        return set()
+
     async def begin_checks(self) -> None:
         """Start the checks queue, and preloaders, and populate the queue with
         any checks that don't require preloaded data."""
@@ -512,7 +536,23 @@ class Checker(runner.Runner):
         await getattr(self, f"check_{check}")()
         await self.on_check_run(check)
 
+    async def _run_concurrent_check(
+            self,
+            check: str,
+            limit: asyncio.Semaphore) -> None:
+        _current_check.set(check)
+        try:
+            await self._run_check(check)
+            self.check_queue.task_done()
+            self.completed_checks.add(check)
+        finally:
+            self.running_checks.discard(check)
+            limit.release()
+
     async def _run_from_queue(self) -> None:
+        if self.check_concurrency > 1:
+            await self._run_from_queue_concurrently()
+            return
         while True:
             if not self.remaining_checks:
                 break
@@ -522,6 +562,25 @@ class Checker(runner.Runner):
             self.check_queue.task_done()
             self.completed_checks.add(check)
 
+    async def _run_from_queue_concurrently(self) -> None:
+        limit = asyncio.Semaphore(self.check_concurrency)
+        tasks: List[asyncio.Task] = []
+        try:
+            while self.remaining_checks:
+                await limit.acquire()
+                if (check := await self.check_queue.get()) is _sentinel:
+                    limit.release()
+                    break
+                self.running_checks.add(check)
+                tasks.append(
+                    asyncio.create_task(
+                        self._run_concurrent_check(check, limit)))
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
     def _task_should_preload(
             self,
             task: str) -> bool:
@@ -566,7 +625,7 @@ class CheckerSummary(object):
 
     def print_failed(self, problem_type: str) -> None:
         """Print failures of a given problem_type - eg error, warning."""
-        for check, problems in getattr(self.checker, problem_type).items():
+        for check, problems in self.problems_of(problem_type):
             self.print_failed_check(problem_type, check, problems)
 
     def print_failed_check(
@@ -578,6 +637,20 @@ class CheckerSummary(object):
         self.writer_for(problem_type)(
             self.problem_section(problem_type, check, problems))
 
+    def problems_of(self, problem_type: str) -> List[Tuple[str, List[str]]]:
+        """Problems of a given type, in the order that checks were specified.
+
+        Concurrently run checks may record problems in any order, this
+        ensures the summary output is deterministic.
+        """
+        order = list(self.checker.checks_to_run)
+        return sorted(
+            getattr(self.checker, problem_type).items(),
+            key=lambda item: (
+                order.index(item[0])
+                if item[0] in order
+                else len(order)))
+
     def print_status(self) -> None:
         """Print summary status to stderr."""
         if self.checker.errors:
@@ -1,4 +1,5 @@
 
+import asyncio
 import inspect
 from unittest.mock import AsyncMock, MagicMock, patch, PropertyMock
 
@@ -6,6 +7,7 @@ import pytest
 
 from aio.run.checker import (
     abstract, Checker, CheckerSummary, Problems)
+from aio.run.checker.checker import _sentinel
 from aio.run.runner import Runner
 
 
@@ -65,6 +67,37 @@ def test_checker_constructor(patches):
     assert "removed_checks" in checker.__dict__
     assert checker.completed_checks == set()
     assert "completed_checks" in checker.__dict__
+    assert checker.running_checks == set()
+    assert "running_checks" in checker.__dict__
+
+
+@pytest.mark.parametrize("current", ["", "CURRENT"])
+@pytest.mark.parametrize("active", ["", "ACTIVE"])
+def test_checker_active_check(patches, current, active):
+    checker = Checker("path1", "path2", "path3")
+    checker._active_check = active
+    patched = patches(
+        "_current_check",
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_current, ):
+        m_current.get.return_value = current
+        assert checker.active_check == (current or active)
+
+    assert "active_check" not in checker.__dict__
+
+
+@pytest.mark.parametrize("concurrency", [-1, 0, 1, 7])
+def test_checker_check_concurrency(concurrency):
+    checker = Checker("path1", "path2", "path3")
+    args_mock = patch(
+        "aio.run.checker.checker.Checker.args",
+        new_callable=PropertyMock)
+
+    with args_mock as m_args:
+        m_args.return_value.check_concurrency = concurrency
+        assert checker.check_concurrency == max(1, concurrency)
+    assert "check_concurrency" not in checker.__dict__
 
 
 def test_checker_checks_to_run(patches):
@@ -381,6 +414,12 @@ def test_checker_add_arguments(patches):
               'default': 5,
               'help': (
                   "Number of warnings to show in the summary, -1 shows all")}],
+            [('--check-concurrency',),
+             {'type': int,
+              'default': 1,
+              'help': (
+                  "Maximum number of checks to run concurrently once their "
+                  "data has been preloaded")}],
             [('--check', '-c'),
              {'choices': ("check1", "check2"),
               'nargs': '*',
@@ -829,23 +868,47 @@ def test_checker_summary_print_failed(patches, problems):
     checker = DummyChecker()
     summary = CheckerSummary(checker)
     patched = patches(
-        "getattr",
+        "CheckerSummary.problems_of",
         "CheckerSummary.print_failed_check",
         prefix="aio.run.checker.checker")
 
-    with patched as (m_get, m_print):
-        m_get.return_value.items.return_value = problems.items()
+    with patched as (m_problems, m_print):
+        m_problems.return_value = problems.items()
         assert not summary.print_failed("PROBLEM_TYPE")
 
     assert (
-        m_get.call_args
-        == [(checker, "PROBLEM_TYPE"), {}])
+        m_problems.call_args
+        == [("PROBLEM_TYPE", ), {}])
     assert (
         m_print.call_args_list
         == [[("PROBLEM_TYPE", k, v), {}]
             for k, v in problems.items()])
 
 
+@pytest.mark.parametrize(
+    "problems",
+    [{},
+     {"CHECK3": ["P3"], "CHECK1": ["P1"]},
+     {"exiting": ["E"], "CHECK2": ["P2"], "CHECK1": ["P1"]},
+     {"CHECK2": ["P2"], "OTHER": ["O"], "CHECK3": ["P3"]}])
+def test_checker_summary_problems_of(problems):
+    checker = DummyChecker()
+    checker.checks_to_run = ["CHECK1", "CHECK2", "CHECK3"]
+    checker.errors = problems
+    summary = CheckerSummary(checker)
+    expected = [
+        (check, problems[check])
+        for check
+        in ["CHECK1", "CHECK2", "CHECK3"]
+        if check in problems]
+    expected += [
+        (check, problem)
+        for check, problem
+        in problems.items()
+        if check not in checker.checks_to_run]
+    assert summary.problems_of("errors") == expected
+
+
 def test_checker_summary_print_failed_check(patches):
     checker = DummyChecker()
     summary = CheckerSummary(checker)
@@ -1107,7 +1170,13 @@ def test_checker_preload_tasks(patches, checks):
     [[],
      [f"C{i}" for i in range(0, 5)],
      [f"C{i}" for i in range(0, 10)]])
-def test_checker_remaining_checks(patches, checks, removed, completed):
+@pytest.mark.parametrize(
+    "running",
+    [[],
+     ["C3"],
+     [f"C{i}" for i in range(5, 8)]])
+def test_checker_remaining_checks(
+        patches, checks, removed, completed, running):
     checker = Checker()
     patched = patches(
         ("Checker.checks_to_run",
@@ -1116,18 +1185,22 @@ def test_checker_remaining_checks(patches, checks, removed, completed):
          dict(new_callable=PropertyMock)),
         ("Checker.removed_checks",
          dict(new_callable=PropertyMock)),
+        ("Checker.running_checks",
+         dict(new_callable=PropertyMock)),
         prefix="aio.run.checker.checker")
 
     expected = []
     for check in checks:
         if check not in removed:
             if check not in completed:
-                expected.append(check)
+                if check not in running:
+                    expected.append(check)
 
-    with patched as (m_checks, m_completed, m_removed):
+    with patched as (m_checks, m_completed, m_removed, m_running):
         m_checks.return_value = checks
         m_completed.return_value = completed
         m_removed.return_value = removed
+        m_running.return_value = running
         assert checker.remaining_checks == tuple(expected)
 
     assert "remaining_checks" not in checker.__dict__
@@ -1741,6 +1814,9 @@ async def test_checker__run_from_queue(patches, checks):
         "_sentinel",
         "Checker.log",
         "Checker._run_check",
+        "Checker._run_from_queue_concurrently",
+        ("Checker.check_concurrency",
+         dict(new_callable=PropertyMock)),
         ("Checker.check_queue",
          dict(new_callable=PropertyMock)),
         ("Checker.completed_checks",
@@ -1771,14 +1847,17 @@ async def test_checker__run_from_queue(patches, checks):
         expected = checks
 
     with patched as patchy:
-        (m_sentinel, m_log, m_run,
+        (m_sentinel, m_log, m_run, m_concurrent, m_concurrency,
          m_q, m_completed, m_remaining) = patchy
 
+        m_concurrency.return_value = 1
         getter = Getter(m_sentinel)
         m_q.return_value.get = AsyncMock(side_effect=getter.get)
         m_remaining.side_effect = getter.remaining
         assert not await checker._run_from_queue()
 
+    assert not m_concurrent.called
+
     if not checks:
         assert not m_q.called
         assert not m_run.called
@@ -1802,6 +1881,153 @@ async def test_checker__run_from_queue(patches, checks):
         == [[(check, ), {}] for check in expected])
 
 
+async def test_checker__run_from_queue_concurrent(patches):
+    checker = Checker()
+    patched = patches(
+        "Checker._run_check",
+        "Checker._run_from_queue_concurrently",
+        ("Checker.check_concurrency",
+         dict(new_callable=PropertyMock)),
+        ("Checker.check_queue",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_run, m_concurrent, m_concurrency, m_q):
+        m_concurrency.return_value = 2
+        assert not await checker._run_from_queue()
+
+    assert (
+        m_concurrent.call_args
+        == [(), {}])
+    assert not m_q.called
+    assert not m_run.called
+
+
+@pytest.mark.parametrize("raises", [True, False])
+async def test_checker__run_concurrent_check(patches, raises):
+    checker = Checker()
+    limit = MagicMock()
+    patched = patches(
+        "_current_check",
+        "Checker._run_check",
+        ("Checker.check_queue",
+         dict(new_callable=PropertyMock)),
+        ("Checker.completed_checks",
+         dict(new_callable=PropertyMock)),
+        ("Checker.running_checks",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+
+    with patched as (m_current, m_run, m_q, m_completed, m_running):
+        if raises:
+            m_run.side_effect = SomeError("AN ERROR OCCURRED")
+
+            with pytest.raises(SomeError):
+                await checker._run_concurrent_check("CHECK", limit)
+        else:
+            assert not await checker._run_concurrent_check("CHECK", limit)
+
+    assert (
+        m_current.set.call_args
+        == [("CHECK", ), {}])
+    assert (
+        m_run.call_args
+        == [("CHECK", ), {}])
+    assert (
+        m_running.return_value.discard.call_args
+        == [("CHECK", ), {}])
+    assert (
+        limit.release.call_args
+        == [(), {}])
+    if raises:
+        assert not m_q.return_value.task_done.called
+        assert not m_completed.return_value.add.called
+        return
+    assert (
+        m_q.return_value.task_done.call_args
+        == [(), {}])
+    assert (
+        m_completed.return_value.add.call_args
+        == [("CHECK", ), {}])
+
+
+@pytest.mark.parametrize("concurrency", [2, 3, 10])
+@pytest.mark.parametrize("sentinel", [True, False])
+async def test_checker__run_from_queue_concurrently(
+        patches, concurrency, sentinel):
+    checker = Checker()
+    checks = [f"C{i}" for i in range(0, 5)]
+    patched = patches(
+        "Checker._run_check",
+        ("Checker.check_concurrency",
+         dict(new_callable=PropertyMock)),
+        ("Checker.checks_to_run",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+    running = set()
+    ran = []
+    max_running = 0
+
+    async def run_check(check):
+        nonlocal max_running
+        running.add(check)
+        max_running = max(max_running, len(running))
+        assert checker.active_check == check
+        await asyncio.sleep(0)
+        running.remove(check)
+        ran.append(check)
+
+    with patched as (m_run, m_concurrency, m_checks):
+        m_concurrency.return_value = concurrency
+        m_checks.return_value = (
+            checks + ["UNQUEUED"]
+            if sentinel
+            else checks)
+        m_run.side_effect = run_check
+        for check in checks:
+            await checker.check_queue.put(check)
+        if sentinel:
+            await checker.check_queue.put(_sentinel)
+        assert not await checker._run_from_queue_concurrently()
+
+    assert sorted(ran) == checks
+    assert max_running == min(concurrency, len(checks))
+    assert checker.completed_checks == set(checks)
+    assert checker.running_checks == set()
+    assert checker.active_check == ""
+
+
+async def test_checker__run_from_queue_concurrently_fails(patches):
+    checker = Checker()
+    checks = [f"C{i}" for i in range(0, 3)]
+    patched = patches(
+        "Checker._run_check",
+        ("Checker.check_concurrency",
+         dict(new_callable=PropertyMock)),
+        ("Checker.checks_to_run",
+         dict(new_callable=PropertyMock)),
+        prefix="aio.run.checker.checker")
+    blocker = asyncio.Event()
+
+    async def run_check(check):
+        if check == "C0":
+            raise SomeError("AN ERROR OCCURRED")
+        await blocker.wait()
+
+    with patched as (m_run, m_concurrency, m_checks):
+        m_concurrency.return_value = 3
+        m_checks.return_value = checks
+        m_run.side_effect = run_check
+        for check in checks:
+            await checker.check_queue.put(check)
+        with pytest.raises(SomeError):
+            await checker._run_from_queue_concurrently()
+        await asyncio.sleep(0)
+
+    assert checker.completed_checks == set()
+    assert checker.running_checks == set()
+
+
 @pytest.mark.parametrize("pending", [True, False])
 @pytest.mark.parametrize(
     "when", [[], ["C1"], ["C1", "C3", "C6"], ["C7"], ["C8", "C9"]])
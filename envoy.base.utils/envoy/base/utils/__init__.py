@@ -29,11 +29,19 @@ from .utils import (
 from . import interface, typing
 from .parallel_cmd import parallel_cmd
 from .parallel_runner import ParallelRunner
-from .project import Changelog, ChangelogEntry, Changelogs, Project
+from .project import (
+    Changelog,
+    ChangelogEntry,
+    ChangelogIndex,
+    Changelogs,
+    Project)
 from .project_cmd import project_cmd
 from .project_data_cmd import project_data_cmd
 from .project_runner import ProjectDataRunner, ProjectRunner
-from .protobuf import ProtobufSet, ProtobufValidator
+from .protobuf import (
+    ProtobufSet,
+    ProtobufValidationCache,
+    ProtobufValidator)
 from .interface import IProject
 from .data_env import DataEnvironment
 from .data_env_cmd import data_env_cmd
@@ -46,6 +54,7 @@ __all__ = (
     "cd_and_return",
     "Changelog",
     "ChangelogEntry",
+    "ChangelogIndex",
     "Changelogs",
     "DataEnvironment",
     "data_env_cmd",
@@ -75,6 +84,7 @@ __all__ = (
     "project_cmd",
     "project_data_cmd",
     "ProtobufSet",
+    "ProtobufValidationCache",
     "ProtobufValidator",
     "repack",
     "typed",
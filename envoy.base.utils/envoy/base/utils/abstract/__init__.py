@@ -2,16 +2,22 @@
 from .project import (
     AChangelog,
     AChangelogEntry,
+    AChangelogIndex,
     AChangelogs,
     AInventories,
     AProject)
-from .protobuf import AProtobufSet, AProtobufValidator
+from .protobuf import (
+    AProtobufSet,
+    AProtobufValidationCache,
+    AProtobufValidator)
 
 __all__ = (
     "AChangelog",
     "AChangelogEntry",
+    "AChangelogIndex",
     "AChangelogs",
     "AInventories",
     "AProject",
     "AProtobufSet",
+    "AProtobufValidationCache",
     "AProtobufValidator")
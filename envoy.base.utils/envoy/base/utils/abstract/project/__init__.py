@@ -1,5 +1,9 @@
 
-from .changelog import AChangelog, AChangelogEntry, AChangelogs
+from .changelog import (
+    AChangelog,
+    AChangelogEntry,
+    AChangelogIndex,
+    AChangelogs)
 from .inventory import AInventories
 from .project import AProject
 
@@ -7,6 +11,7 @@ from .project import AProject
 __all__ = (
     "AChangelog",
     "AChangelogEntry",
+    "AChangelogIndex",
     "AChangelogs",
     "AInventories",
     "AProject", )
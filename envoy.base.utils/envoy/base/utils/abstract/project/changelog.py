@@ -1,4 +1,5 @@
 
+import json
 import logging
 import pathlib
 import re
@@ -6,8 +7,8 @@ import types
 from datetime import datetime
 from functools import cached_property
 from typing import (
-    cast, Dict, ItemsView, Iterator, KeysView,
-    List, Pattern, Set, Tuple, Type, ValuesView)
+    cast, Dict, ItemsView, Iterator, KeysView, List, Mapping,
+    Optional, Pattern, Set, Tuple, Type, Union, ValuesView)
 
 from frozendict import frozendict
 import jinja2
@@ -17,6 +18,8 @@ import yaml as _yaml
 import abstracts
 
 from aio.core.functional import async_property
+from aio.core.tasks import concurrent
+from aio.core.utils import atomic_write
 
 from envoy.base import utils
 from envoy.base.utils import exceptions, interface, typing
@@ -28,6 +31,9 @@ logger = logging.getLogger(__name__)
 CHANGELOG_PATH_GLOB = "changelogs/*.*.*.yaml"
 CHANGELOG_PATH_FMT = "changelogs/{version}.yaml"
 CHANGELOG_CURRENT_PATH = "changelogs/current.yaml"
+# Bump this if the format of the changelog index changes.
+CHANGELOG_INDEX_VERSION = 1
+CHANGELOG_INDEX_FILE = "index.json"
 CHANGELOG_SECTIONS_PATH = "changelogs/sections.yaml"
 CHANGELOG_URL_TPL = (
     "https://raw.githubusercontent.com/envoyproxy/envoy/"
@@ -40,6 +46,7 @@ date: Pending
 {% endfor %}
 """
 DATE_FORMAT = "%B %-d, %Y"
+RUNTIME_GUARD_MENTION_RE = r"``envoy.reloadable[._][a-z0-9_.]+``"
 
 # These are for parsing pre 1.23 rst changelogs and can be removed when that is
 # no longer required
@@ -56,6 +63,20 @@ OLD_CHANGELOG_SECTIONS = frozendict({
 YAML_CHANGELOGS_VERSION = "1.23"
 
 
+def _changelog_dict(data: Mapping) -> typing.ChangelogDict:
+    return cast(
+        typing.ChangelogDict,
+        {k: (v
+             if k == "date"
+             else [dict(area=c["area"],
+                        change=typing.Change(c["change"]))
+                   for c
+                   in v])
+         for k, v
+         in data.items()
+         if v})
+
+
 class LegacyChangelog:
     # Parser for changelogs < 1.23.0
 
@@ -136,17 +157,7 @@ class AChangelog(metaclass=abstracts.Abstraction):
         except (_yaml.reader.ReaderError, utils.TypeCastingError) as e:
             raise exceptions.ChangelogParseError(
                 f"Failed to parse: {path}\n{e}")
-        return cast(
-            typing.ChangelogDict,
-            {k: (v
-                 if k == "date"
-                 else [dict(area=c["area"],
-                            change=typing.Change(c["change"]))
-                       for c
-                       in v])
-             for k, v
-             in data.items()
-             if v})
+        return _changelog_dict(data)
 
     def __init__(
             self,
@@ -163,22 +174,46 @@ class AChangelog(metaclass=abstracts.Abstraction):
 
     @async_property(cache=True)
     async def data(self) -> typing.ChangelogDict:
+        if (data := self.index.data(self.path)) is not None:
+            return data
+        # Get the key before parsing, so that changes made while parsing
+        # are not indexed with stale data.
+        key = self.index.key(self.path)
         # parse changelog data in executor
-        # return self.get_data(self.path)
-        return await self.project.execute(self.get_data, self.path)
+        # data = self.get_data(self.path)
+        data = await self.project.execute(self.get_data, self.path)
+        self.index.set(self.path, key, data)
+        return data
 
     @property  # type:ignore
     @abstracts.interfacemethod
     def entry_class(self) -> Type[interface.IChangelogEntry]:
         raise NotImplementedError
 
+    @property
+    def index(self) -> interface.IChangelogIndex:
+        return self.project.changelogs.index
+
+    @async_property
+    async def indexed(self) -> typing.ChangelogIndexEntryDict:
+        """Index entry for this changelog, the changelog is only parsed if
+        it has changed since it was indexed."""
+        if entry := self.index.entry(self.path):
+            return entry
+        await self.data
+        return self.index.entries[self.path.name]
+
     @property
     def path(self) -> pathlib.Path:
         return self._path
 
     @async_property
     async def release_date(self) -> str:
-        return (await self.data)["date"]
+        return (await self.indexed)["date"]
+
+    @async_property
+    async def runtime_guards(self) -> Set[str]:
+        return set((await self.indexed)["runtime_guards"])
 
     @property
     def version(self) -> _version.Version:
@@ -191,6 +226,148 @@ class AChangelog(metaclass=abstracts.Abstraction):
             in (await self.data)[section])  # type:ignore
 
 
+@abstracts.implementer(interface.IChangelogIndex)
+class AChangelogIndex(metaclass=abstracts.Abstraction):
+    """Index of parsed changelog data.
+
+    Changelogs are indexed by file name, and index entries are only used
+    while the `st_mtime_ns` and `st_size` of the changelog file are
+    unchanged.
+
+    The index holds the date, sections, and the runtime guards mentioned in
+    each changelog. The parsed changes are stored separately for each
+    changelog, and are only loaded when required.
+
+    If a `path` is set the index is persisted there, otherwise it is only
+    held in memory. Parsed changes are persisted as they are set, and the
+    index itself when it is written.
+    """
+
+    def __init__(
+            self,
+            path: Optional[Union[str, pathlib.Path]] = None) -> None:
+        self._path = path
+        self._changed = False
+
+    @cached_property
+    def changelogs(self) -> Dict[str, typing.ChangelogDict]:
+        """Loaded changelog data, by file name."""
+        return {}
+
+    @cached_property
+    def entries(self) -> typing.ChangelogIndexDict:
+        return self._read()
+
+    @cached_property
+    def index_path(self) -> Optional[pathlib.Path]:
+        return (
+            self.path.joinpath(CHANGELOG_INDEX_FILE)
+            if self.path
+            else None)
+
+    @cached_property
+    def path(self) -> Optional[pathlib.Path]:
+        """Path to the index directory."""
+        return (
+            pathlib.Path(self._path)
+            if self._path
+            else None)
+
+    @cached_property
+    def runtime_guard_re(self) -> Pattern:
+        return re.compile(RUNTIME_GUARD_MENTION_RE)
+
+    def data(self, path: pathlib.Path) -> Optional[typing.ChangelogDict]:
+        if not self.entry(path):
+            return None
+        if path.name not in self.changelogs:
+            if (data := self._read_data(path.name)) is None:
+                return None
+            self.changelogs[path.name] = data
+        return self.changelogs[path.name]
+
+    def data_path(self, name: str) -> pathlib.Path:
+        """Path to the stored data for a changelog."""
+        return cast(pathlib.Path, self.path).joinpath(f"{name}.json")
+
+    def entry(
+            self,
+            path: pathlib.Path) -> Optional[typing.ChangelogIndexEntryDict]:
+        entry = self.entries.get(path.name)
+        return (
+            entry
+            if entry and entry["key"] == self.key(path)
+            else None)
+
+    def key(self, path: pathlib.Path) -> List[int]:
+        stat = path.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def runtime_guards(self, data: typing.ChangelogDict) -> List[str]:
+        """Runtime guards mentioned in changelog data."""
+        return sorted(
+            set(mention.strip("`").replace(".", "_")
+                for section, changes
+                in data.items()
+                if section != "date"
+                for change
+                in cast(typing.ChangeList, changes)
+                for mention
+                in self.runtime_guard_re.findall(change["change"])))
+
+    def set(
+            self,
+            path: pathlib.Path,
+            key: List[int],
+            data: typing.ChangelogDict) -> typing.ChangelogIndexEntryDict:
+        self.changelogs[path.name] = data
+        self.entries[path.name] = dict(
+            date=data["date"],
+            key=key,
+            runtime_guards=self.runtime_guards(data),
+            sections=[k for k in data if k != "date"])
+        self._changed = True
+        if self.path:
+            self._write(self.data_path(path.name), data)
+        return self.entries[path.name]
+
+    def write(self) -> None:
+        if not self.index_path or not self._changed:
+            return
+        self._write(
+            self.index_path,
+            dict(version=CHANGELOG_INDEX_VERSION,
+                 changelogs=self.entries))
+        self._changed = False
+
+    def _read(self) -> typing.ChangelogIndexDict:
+        if not self.index_path:
+            return {}
+        try:
+            index = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        return (
+            index["changelogs"]
+            if (isinstance(index, dict)
+                and index.get("version") == CHANGELOG_INDEX_VERSION
+                and isinstance(index.get("changelogs"), dict))
+            else {})
+
+    def _read_data(self, name: str) -> Optional[typing.ChangelogDict]:
+        if not self.path:
+            return None
+        try:
+            return _changelog_dict(
+                json.loads(self.data_path(name).read_text()))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write(self, path: pathlib.Path, data: Mapping) -> None:
+        with atomic_write(path) as f:
+            json.dump(data, f)
+
+
 @abstracts.implementer(interface.IChangelogs)
 class AChangelogs(metaclass=abstracts.Abstraction):
 
@@ -247,6 +424,15 @@ class AChangelogs(metaclass=abstracts.Abstraction):
     def datestamp(self) -> str:
         return datetime.utcnow().date().strftime(self.date_format)
 
+    @cached_property
+    def index(self) -> interface.IChangelogIndex:
+        return self.index_class(self.project.changelog_index_path)
+
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def index_class(self) -> Type[interface.IChangelogIndex]:
+        raise NotImplementedError
+
     @async_property
     async def is_pending(self) -> bool:
         return (
@@ -263,6 +449,19 @@ class AChangelogs(metaclass=abstracts.Abstraction):
     def rel_current_path(self) -> pathlib.Path:
         return pathlib.Path(CHANGELOG_CURRENT_PATH)
 
+    @async_property(cache=True)
+    async def runtime_guards(self) -> Set[str]:
+        mentioned: Set[str] = set()
+        # Changed changelogs are parsed concurrently.
+        async for guards in concurrent(
+                changelog.runtime_guards
+                for changelog
+                in self.values()):
+            mentioned |= guards
+        # Write the index once, rather than as each changelog is parsed.
+        self.index.write()
+        return mentioned
+
     @cached_property
     def section_re(self) -> Pattern:
         return re.compile(r"\n[a-z_]*:")
@@ -358,14 +557,22 @@ class AChangelogs(metaclass=abstracts.Abstraction):
             and version not in self)
 
     async def sync(self) -> typing.SyncResultDict:
-        change: typing.SyncResultDict = {}
-        async for release in self.project.repo.releases():
-            if self.should_sync(release.version):
-                self.write_changelog(
-                    release.version,
-                    await self.fetch(release.version))
-                change[release.version] = True
-        return change
+        versions = [
+            release.version
+            for release
+            in await self.project.releases
+            if self.should_sync(release.version)]
+        # Changelogs are written as they are fetched.
+        async for version, text in concurrent(
+                (self._fetch(version)
+                 for version
+                 in versions),
+                limit=self.project.sync_concurrency):
+            self.write_changelog(version, text)
+        return {
+            version: True
+            for version
+            in versions}
 
     def values(self) -> ValuesView[interface.IChangelog]:
         return self.changelogs.values()
@@ -408,6 +615,11 @@ class AChangelogs(metaclass=abstracts.Abstraction):
             f"{normal}\n",
             style='|')
 
+    async def _fetch(
+            self,
+            version: _version.Version) -> Tuple[_version.Version, str]:
+        return version, await self.fetch(version)
+
     @cached_property
     def _yaml_changelogs_version(self) -> _version.Version:
         return _version.Version(YAML_CHANGELOGS_VERSION)
@@ -2,7 +2,7 @@
 import pathlib
 import types
 from functools import cached_property
-from typing import Iterator, Optional, Set
+from typing import Iterator, Optional, Set, Tuple
 
 from packaging import version as _version
 import yaml as _yaml
@@ -10,6 +10,7 @@ import yaml as _yaml
 import abstracts
 
 from aio.core.functional import async_property
+from aio.core.tasks import concurrent
 
 from envoy.base import utils
 from envoy.base.utils import interface, typing
@@ -53,7 +54,7 @@ class AInventories(metaclass=abstracts.Abstraction):
     @async_property
     async def syncable(self) -> typing.VersionDict:
         syncable: typing.VersionDict = dict()
-        async for release in self.project.repo.releases():
+        for release in await self.project.releases:
             minor_version = utils.minor_version_for(release.version)
             if self.should_sync(minor_version, release.version):
                 syncable[minor_version] = max(
@@ -121,16 +122,25 @@ class AInventories(metaclass=abstracts.Abstraction):
                  < version))
 
     async def sync(self) -> typing.SyncResultDict:
-        versions = {}
+        synced = set()
         syncable = (await self.syncable).items()
-        for minor, version in syncable:
-            if content := await self.fetch(version):
+        # Inventories are written as they are fetched.
+        async for version, content in concurrent(
+                (self._fetch(version)
+                 for _minor, version
+                 in syncable),
+                limit=self.project.sync_concurrency):
+            if content:
                 self.write_inventory(version, content)
-                versions[minor] = version
-        if versions:
-            self.write_versions(versions)
+                synced.add(version)
+        if synced:
+            self.write_versions({
+                minor: version
+                for minor, version
+                in syncable
+                if version in synced})
         return {
-            version: minor in versions
+            version: version in synced
             for minor, version
             in syncable}
 
@@ -163,3 +173,9 @@ class AInventories(metaclass=abstracts.Abstraction):
             style=('"'
                    if _data.count(".") == 1
                    else None))
+
+    async def _fetch(
+            self,
+            version: _version.Version) -> Tuple[
+                _version.Version, Optional[bytes]]:
+        return version, await self.fetch(version)
@@ -24,6 +24,7 @@ from envoy.base.utils import exceptions, interface, typing
 ENVOY_REPO = "envoyproxy/envoy"
 MAIN_BRANCH = "main"
 VERSION_PATH = "VERSION.txt"
+SYNC_CONCURRENCY = 10
 
 
 @abstracts.implementer(interface.IProject)
@@ -38,7 +39,9 @@ class AProject(event.AExecutive, metaclass=abstracts.Abstraction):
             github_token: Optional[str] = None,
             session: Optional[aiohttp.ClientSession] = None,
             loop: Optional[asyncio.AbstractEventLoop] = None,
-            pool: Optional[futures.Executor] = None) -> None:
+            pool: Optional[futures.Executor] = None,
+            changelog_index_path: Optional[
+                Union[pathlib.Path, str]] = None) -> None:
         self._version = version
         self._path = path
         self._github = github
@@ -47,6 +50,7 @@ class AProject(event.AExecutive, metaclass=abstracts.Abstraction):
         self._session = session
         self._loop = loop
         self._pool = pool
+        self._changelog_index_path = changelog_index_path
 
     @cached_property
     def archived_versions(self) -> Tuple[_version.Version, ...]:
@@ -58,6 +62,13 @@ class AProject(event.AExecutive, metaclass=abstracts.Abstraction):
             reversed(
                 sorted(self.minor_versions.keys())))[non_archive:]
 
+    @cached_property
+    def changelog_index_path(self) -> Optional[pathlib.Path]:
+        return (
+            pathlib.Path(self._changelog_index_path)
+            if self._changelog_index_path
+            else None)
+
     @cached_property
     def changelogs(self) -> interface.IChangelogs:
         return self.changelogs_class(self)
@@ -133,8 +144,7 @@ class AProject(event.AExecutive, metaclass=abstracts.Abstraction):
                 releases=tuple(
                     release.data["tag_name"]
                     for release
-                    in await AwaitableGenerator(
-                        self.repo.releases()))))
+                    in await self.releases)))
 
     @property
     def main_branch(self) -> str:
@@ -161,6 +171,13 @@ class AProject(event.AExecutive, metaclass=abstracts.Abstraction):
     def path(self) -> pathlib.Path:
         return pathlib.Path(self._path)
 
+    @async_property(cache=True)
+    async def releases(self) -> Tuple[_github.IGithubRelease, ...]:
+        """Releases of the project repo, shared by the syncs."""
+        return tuple(
+            await AwaitableGenerator(
+                self.repo.releases(parallel=True)))
+
     @cached_property
     def repo(self) -> _github.IGithubRepo:
         if isinstance(self._repo, _github.IGithubRepo):
@@ -187,6 +204,10 @@ class AProject(event.AExecutive, metaclass=abstracts.Abstraction):
             reversed(
                 sorted(set(self.minor_versions.keys()) - exclude)))
 
+    @property
+    def sync_concurrency(self) -> int:
+        return SYNC_CONCURRENCY
+
     @cached_property
     def version(self) -> _version.Version:
         return (
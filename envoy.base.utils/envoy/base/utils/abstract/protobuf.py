@@ -1,9 +1,14 @@
 
+import hashlib
 import importlib
+import itertools
 import json
 import pathlib
-from functools import cached_property, lru_cache
-from typing import Callable, Type
+from concurrent import futures
+from functools import cached_property
+from typing import (
+    Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar,
+    cast)
 
 from google.protobuf import descriptor, descriptor_pb2
 from google.protobuf import descriptor_pool as _descriptor_pool
@@ -14,12 +19,54 @@ from google.protobuf import (
 
 import abstracts
 
+from aio.core.utils import atomic_write
+
 from envoy.base.utils import interface
 
 
 BOOTSTRAP_PROTO = "envoy.config.bootstrap.v3.Bootstrap"
+# Fragments are quick to validate, so send them to pool workers in batches.
+VALIDATION_CHUNKSIZE = 50
+# Key types that `json.dumps` converts to strings, others are skipped.
+JSON_KEY_TYPES = (str, int, float, bool, type(None))
 
 _envoy_yaml = None
+_envoy_yaml_loader = None
+
+# Validators shared by the process, keyed by validator class, and the
+# resolved path and mtime of the descriptor set.
+_validators: Dict[Tuple[Type, str, int], "AProtobufValidator"] = {}
+
+ProtobufValidatorType = TypeVar(
+    "ProtobufValidatorType",
+    bound="AProtobufValidator")
+
+
+def _json_compatible(value: Any) -> Any:
+    # Keys are converted or skipped as `json.dumps(value, skipkeys=True)`
+    # would, eg to skip `!ignore` keys.
+    if isinstance(value, dict):
+        return {
+            (key
+             if isinstance(key, str)
+             else json.dumps(key)): _json_compatible(item)
+            for key, item
+            in value.items()
+            if isinstance(key, JSON_KEY_TYPES)}
+    if isinstance(value, (list, tuple)):
+        return [_json_compatible(item) for item in value]
+    return value
+
+
+def _validation_error(
+        validator_class: Type["AProtobufValidator"],
+        descriptor_path: str,
+        fragment: str,
+        type_name: str) -> str:
+    # Runs in pool workers, which each share a validator per descriptor set.
+    return validator_class.for_descriptor(descriptor_path).validation_error(
+        fragment,
+        type_name)
 
 
 def _yaml():
@@ -32,6 +79,16 @@ def _yaml():
     return _envoy_yaml
 
 
+def _yaml_loader():
+    # Load this lazily so we dont change the environment unless necessary.
+    global _envoy_yaml_loader
+
+    if not _envoy_yaml_loader:
+        _envoy_yaml_loader = importlib.import_module(
+            "envoy.base.utils.yaml").fast_envoy_yaml
+    return _envoy_yaml_loader
+
+
 class AProtobufSet(metaclass=abstracts.Abstraction):
 
     def __init__(self, descriptor_path: str | pathlib.Path) -> None:
@@ -55,11 +112,75 @@ class AProtobufSet(metaclass=abstracts.Abstraction):
         return descriptor
 
 
+@abstracts.implementer(interface.IProtobufValidationCache)
+class AProtobufValidationCache(metaclass=abstracts.Abstraction):
+    """Persistent cache of protobuf validation results.
+
+    Results are stored on disk, keyed by the hash of the descriptor set, the
+    type name and the fragment, so a fragment is only validated again if
+    one of these changes.
+    """
+
+    def __init__(self, path: str | pathlib.Path) -> None:
+        self._path = path
+
+    @cached_property
+    def path(self) -> pathlib.Path:
+        """Path to the cache directory."""
+        return pathlib.Path(self._path)
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self.result_path(key).read_text()
+        except (OSError, ValueError):
+            return None
+
+    def key(self, descriptor_hash: str, type_name: str, fragment: str) -> str:
+        key = hashlib.sha256()
+        for item in (descriptor_hash, type_name, fragment):
+            key.update(item.encode())
+            key.update(b"\0")
+        return key.hexdigest()
+
+    def result_path(self, key: str) -> pathlib.Path:
+        """Path to the cached result for a key."""
+        return self.path.joinpath(key[:2], key)
+
+    def set(self, key: str, error: str) -> None:
+        # Another process cannot see a partially written result.
+        with atomic_write(self.result_path(key)) as f:
+            f.write(error)
+
+
 class AProtobufValidator(metaclass=abstracts.Abstraction):
 
+    @classmethod
+    def for_descriptor(
+            cls: Type[ProtobufValidatorType],
+            descriptor_path: str | pathlib.Path) -> ProtobufValidatorType:
+        """Validator for a descriptor set, shared by the process.
+
+        Parsing a descriptor set is expensive, so validators are reused for
+        as long as the descriptor set file is unchanged. Processes forked
+        after a validator is created (eg Sphinx parallel readers) inherit
+        it.
+        """
+        path = pathlib.Path(descriptor_path).resolve()
+        key = (cls, str(path), path.stat().st_mtime_ns)
+        if key not in _validators:
+            for stale in [k for k in _validators if k[:2] == key[:2]]:
+                del _validators[stale]
+            _validators[key] = cls(path)
+        return cast(ProtobufValidatorType, _validators[key])
+
     def __init__(self, descriptor_path: str | pathlib.Path) -> None:
         self.descriptor_path = descriptor_path
 
+    @cached_property
+    def descriptor_hash(self) -> str:
+        return hashlib.sha256(
+            pathlib.Path(self.descriptor_path).read_bytes()).hexdigest()
+
     @property
     def descriptor_pool(self) -> _descriptor_pool.DescriptorPool:
         return self.protobuf_set.descriptor_pool
@@ -68,6 +189,11 @@ class AProtobufValidator(metaclass=abstracts.Abstraction):
     def message_factory(self) -> _message_factory.MessageFactory:
         return _message_factory.MessageFactory(pool=self.descriptor_pool)
 
+    @cached_property
+    def message_prototypes(
+            self) -> Dict[str, Callable[[], _message.Message]]:
+        return {}
+
     @cached_property
     def protobuf_set(self) -> interface.IProtobufSet:
         return self.protobuf_set_class(self.descriptor_path)
@@ -81,17 +207,26 @@ class AProtobufValidator(metaclass=abstracts.Abstraction):
     def yaml(self):
         return _yaml()
 
+    @cached_property
+    def yaml_loader(self):
+        """Loader for YAML fragments, which uses the libyaml `CSafeLoader`
+        where available."""
+        return _yaml_loader()
+
     def find_message(self, type_name: str) -> descriptor.Descriptor:
         return self.descriptor_pool.FindMessageTypeByName(type_name)
 
-    @lru_cache
     def message(self, type_name: str) -> _message.Message:
         return self.message_prototype(type_name)()
 
     def message_prototype(
             self,
             type_name: str) -> Callable[[], _message.Message]:
-        return self.message_factory.GetPrototype(self.find_message(type_name))
+        if type_name not in self.message_prototypes:
+            self.message_prototypes[type_name] = (
+                self.message_factory.GetPrototype(
+                    self.find_message(type_name)))
+        return self.message_prototypes[type_name]
 
     def validate_fragment(
             self,
@@ -103,13 +238,76 @@ class AProtobufValidator(metaclass=abstracts.Abstraction):
         Throws Protobuf errors on parsing exceptions, successful
         validations produce no result.
         """
-        json_format.Parse(
-            json.dumps(fragment, skipkeys=True),
+        json_format.ParseDict(
+            _json_compatible(fragment),
             self.message(type_name),
             descriptor_pool=self.descriptor_pool)
 
+    def validate_many(
+            self,
+            fragments: Sequence[Tuple[str, str]],
+            cache: Optional[interface.IProtobufValidationCache] = None,
+            pool: Optional[futures.Executor] = None) -> List[str]:
+        """Validate YAML fragments, as `(fragment, type_name)` tuples.
+
+        Returns the validation error for each fragment, or `""` if it is
+        valid.
+
+        Fragments are validated in a process pool, unless one is provided.
+        If a `cache` is provided, only fragments without cached results
+        are validated, and their results are added to the cache.
+        """
+        keys = [
+            (cache.key(self.descriptor_hash, type_name, fragment)
+             if cache
+             else "")
+            for fragment, type_name
+            in fragments]
+        results = [
+            (cache.get(key)
+             if cache
+             else None)
+            for key
+            in keys]
+        pending = [
+            i
+            for i, result
+            in enumerate(results)
+            if result is None]
+        if not pending:
+            return cast(List[str], results)
+        executor = pool or futures.ProcessPoolExecutor()
+        try:
+            errors = executor.map(
+                _validation_error,
+                itertools.repeat(type(self)),
+                itertools.repeat(str(self.descriptor_path)),
+                *zip(*(fragments[i] for i in pending)),
+                chunksize=VALIDATION_CHUNKSIZE)
+            for i, error in zip(pending, errors):
+                results[i] = error
+                if cache:
+                    cache.set(keys[i], error)
+        finally:
+            if not pool:
+                executor.shutdown()
+        return cast(List[str], results)
+
     def validate_yaml(
             self,
             fragment: str,
             type_name: str = BOOTSTRAP_PROTO) -> None:
-        self.validate_fragment(self.yaml.safe_load(fragment), type_name)
+        self.validate_fragment(
+            self.yaml_loader.safe_load(fragment),
+            type_name)
+
+    def validation_error(
+            self,
+            fragment: str,
+            type_name: str = BOOTSTRAP_PROTO) -> str:
+        """Error validating a YAML fragment, or `""` if it is valid."""
+        try:
+            self.validate_yaml(fragment, type_name)
+        except (json_format.ParseError, KeyError) as e:
+            return str(e) or e.__class__.__name__
+        return ""
@@ -1,8 +1,9 @@
 
 import pathlib
+from concurrent import futures
 from typing import (
     AsyncGenerator, ItemsView, Iterator, KeysView, List,
-    Optional, Set, Tuple, Type, Union, ValuesView)
+    Optional, Sequence, Set, Tuple, Type, Union, ValuesView)
 
 import aiohttp
 from google.protobuf import descriptor_pool
@@ -28,12 +29,42 @@ class IProtobufSet(metaclass=abstracts.Interface):
         raise NotImplementedError
 
 
+class IProtobufValidationCache(metaclass=abstracts.Interface):
+    """Persistent cache of protobuf validation results."""
+
+    @abstracts.interfacemethod
+    def __init__(self, path: str | pathlib.Path) -> None:
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def get(self, key: str) -> Optional[str]:
+        """Cached validation error for a key, `""` if it was valid, or
+        `None` if it is not cached."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def key(self, descriptor_hash: str, type_name: str, fragment: str) -> str:
+        """Cache key for a fragment validated against a type."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def set(self, key: str, error: str) -> None:
+        """Store a validation error, or `""` if it was valid."""
+        raise NotImplementedError
+
+
 class IProtobufValidator(metaclass=abstracts.Interface):
 
     @abstracts.interfacemethod
     def __init__(self, descriptor_path: str | pathlib.Path) -> None:
         raise NotImplementedError
 
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def descriptor_hash(self) -> str:
+        """Hash of the descriptor set."""
+        raise NotImplementedError
+
     @abstracts.interfacemethod
     def protobuf_set_class(self) -> Type[IProtobufSet]:
         raise NotImplementedError
@@ -42,10 +73,25 @@ class IProtobufValidator(metaclass=abstracts.Interface):
     def validate_fragment(self, fragment: str, type_name: str = "") -> None:
         raise NotImplementedError
 
+    @abstracts.interfacemethod
+    def validate_many(
+            self,
+            fragments: Sequence[Tuple[str, str]],
+            cache: Optional[IProtobufValidationCache] = None,
+            pool: Optional[futures.Executor] = None) -> List[str]:
+        """Validate YAML fragments, as `(fragment, type_name)` tuples, in a
+        worker pool."""
+        raise NotImplementedError
+
     @abstracts.interfacemethod
     def validate_yaml(self, fragment: str, type_name: str = "") -> None:
         raise NotImplementedError
 
+    @abstracts.interfacemethod
+    def validation_error(self, fragment: str, type_name: str = "") -> str:
+        """Error validating a YAML fragment, or `""` if it is valid."""
+        raise NotImplementedError
+
 
 class IInventories(metaclass=abstracts.Interface):
     """Manage Sphinx project documentation inventories."""
@@ -127,6 +173,55 @@ class IChangelogEntry(metaclass=abstracts.Interface):
         raise NotImplementedError
 
 
+class IChangelogIndex(metaclass=abstracts.Interface):
+    """Persistent index of parsed changelog data."""
+
+    @abstracts.interfacemethod
+    def __init__(
+            self,
+            path: Optional[Union[str, pathlib.Path]] = None) -> None:
+        raise NotImplementedError
+
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def entries(self) -> typing.ChangelogIndexDict:
+        """Indexed changelogs, by file name."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def data(self, path: pathlib.Path) -> Optional[typing.ChangelogDict]:
+        """Parsed data for a changelog, or `None` if it has changed since it
+        was indexed."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def entry(
+            self,
+            path: pathlib.Path) -> Optional[typing.ChangelogIndexEntryDict]:
+        """Index entry for a changelog, or `None` if it has changed since it
+        was indexed."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def key(self, path: pathlib.Path) -> List[int]:
+        """Key to detect changes to a changelog file."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def set(
+            self,
+            path: pathlib.Path,
+            key: List[int],
+            data: typing.ChangelogDict) -> typing.ChangelogIndexEntryDict:
+        """Index the parsed data for a changelog."""
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def write(self) -> None:
+        """Persist the index, if it has changed."""
+        raise NotImplementedError
+
+
 class IChangelog(metaclass=abstracts.Interface):
     """A changelog."""
 
@@ -148,6 +243,18 @@ class IChangelog(metaclass=abstracts.Interface):
     def entry_class(self) -> Type[IChangelogEntry]:
         raise NotImplementedError
 
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def index(self) -> IChangelogIndex:
+        """Changelog index."""
+        raise NotImplementedError
+
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    async def indexed(self) -> typing.ChangelogIndexEntryDict:
+        """Index entry for this changelog."""
+        raise NotImplementedError
+
     @property  # type:ignore
     @abstracts.interfacemethod
     def path(self) -> pathlib.Path:
@@ -160,6 +267,12 @@ class IChangelog(metaclass=abstracts.Interface):
         """Datestamp of this changelog."""
         raise NotImplementedError
 
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    async def runtime_guards(self) -> Set[str]:
+        """Runtime guards mentioned in this changelog."""
+        raise NotImplementedError
+
     @property  # type:ignore
     @abstracts.interfacemethod
     def version(self) -> str:
@@ -224,6 +337,17 @@ class IChangelogs(metaclass=abstracts.Interface):
         """Formatted current UTC date."""
         raise NotImplementedError
 
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def index(self) -> IChangelogIndex:
+        """Index of parsed changelog data."""
+        raise NotImplementedError
+
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def index_class(self) -> Type[IChangelogIndex]:
+        raise NotImplementedError
+
     @property  # type:ignore
     @abstracts.interfacemethod
     async def is_pending(self) -> bool:
@@ -231,6 +355,12 @@ class IChangelogs(metaclass=abstracts.Interface):
         `Pending`."""
         raise NotImplementedError
 
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    async def runtime_guards(self) -> Set[str]:
+        """Runtime guards mentioned in any of the changelogs."""
+        raise NotImplementedError
+
     @property  # type:ignore
     @abstracts.interfacemethod
     def sections(self) -> typing.ChangelogSectionsDict:
@@ -287,7 +417,9 @@ class IProject(event.IExecutive, metaclass=abstracts.Interface):
             github: Optional[_github.IGithubAPI] = None,
             repo: Optional[_github.IGithubRepo] = None,
             github_token: Optional[str] = None,
-            session: Optional[aiohttp.ClientSession] = None) -> None:
+            session: Optional[aiohttp.ClientSession] = None,
+            changelog_index_path: Optional[
+                Union[pathlib.Path, str]] = None) -> None:
         raise NotImplementedError
 
     @property  # type:ignore
@@ -296,6 +428,12 @@ class IProject(event.IExecutive, metaclass=abstracts.Interface):
         """Non/archived version logic."""
         raise NotImplementedError
 
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def changelog_index_path(self) -> Optional[pathlib.Path]:
+        """Path to persist the changelog index to, if set."""
+        raise NotImplementedError
+
     @property  # type:ignore
     @abstracts.interfacemethod
     def changelogs(self) -> IChangelogs:
@@ -379,6 +517,12 @@ class IProject(event.IExecutive, metaclass=abstracts.Interface):
         """Path to the project version file."""
         raise NotImplementedError
 
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    async def releases(self) -> Tuple[_github.IGithubRelease, ...]:
+        """Releases of the project github repo."""
+        raise NotImplementedError
+
     @property  # type:ignore
     @abstracts.interfacemethod
     def repo(self) -> _github.IGithubRepo:
@@ -397,6 +541,12 @@ class IProject(event.IExecutive, metaclass=abstracts.Interface):
         """Currently supported stable versions."""
         raise NotImplementedError
 
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def sync_concurrency(self) -> int:
+        """Maximum number of concurrent downloads while syncing."""
+        raise NotImplementedError
+
     @property  # type:ignore
     @abstracts.interfacemethod
     def version(self) -> _version.Version:
@@ -21,6 +21,11 @@ class Changelog(abstract.AChangelog):
         return ChangelogEntry
 
 
+@abstracts.implementer(interface.IChangelogIndex)
+class ChangelogIndex(abstract.AChangelogIndex):
+    pass
+
+
 @abstracts.implementer(interface.IChangelogs)
 class Changelogs(abstract.AChangelogs):
 
@@ -28,6 +33,10 @@ class Changelogs(abstract.AChangelogs):
     def changelog_class(self) -> Type[interface.IChangelog]:
         return Changelog
 
+    @property
+    def index_class(self) -> Type[interface.IChangelogIndex]:
+        return ChangelogIndex
+
 
 @abstracts.implementer(interface.IInventories)
 class Inventories(abstract.AInventories):
@@ -11,6 +11,11 @@ class ProtobufSet(abstract.AProtobufSet):
     pass
 
 
+@abstracts.implementer(interface.IProtobufValidationCache)
+class ProtobufValidationCache(abstract.AProtobufValidationCache):
+    pass
+
+
 @abstracts.implementer(interface.IProtobufValidator)
 class ProtobufValidator(abstract.AProtobufValidator):
 
@@ -57,6 +57,15 @@ class ChangelogDict(BaseChangelogDict, ChangelogChangeSectionsDict):
     pass
 
 
+class ChangelogIndexEntryDict(TypedDict):
+    date: str
+    # `st_mtime_ns` and `st_size` of the indexed changelog file.
+    key: List[int]
+    runtime_guards: List[str]
+    sections: List[str]
+
+
+ChangelogIndexDict = Dict[str, ChangelogIndexEntryDict]
 ChangelogPathsDict = Dict[_version.Version, pathlib.Path]
 ChangelogsDict = Dict[_version.Version, "interface.IChangelog"]
 MinorVersionsDict = Dict[_version.Version, Tuple[_version.Version, ...]]
@@ -1,5 +1,6 @@
 
 from functools import cached_property
+from typing import Any, Tuple, Type
 
 import yaml as _yaml
 
@@ -32,12 +33,49 @@ class IgnoredKey(_yaml.YAMLObject):
 
 
 class EnvoyYaml:
+    """Envoy YAML support.
+
+    If `c_loader` is set, `safe_load` uses the libyaml `CSafeLoader`, when
+    PyYAML is built with it.
+    """
+
+    def __init__(self, c_loader: bool = False) -> None:
+        self.c_loader = c_loader
+
+    @cached_property
+    def dumpers(self) -> Tuple[Type, ...]:
+        return tuple(
+            getattr(_yaml, name)
+            for name
+            in ("SafeDumper", "CSafeDumper")
+            if hasattr(_yaml, name))
+
+    @cached_property
+    def loader(self) -> Type:
+        return (
+            getattr(self.yaml, "CSafeLoader", self.yaml.SafeLoader)
+            if self.c_loader
+            else self.yaml.SafeLoader)
+
+    @cached_property
+    def loaders(self) -> Tuple[Type, ...]:
+        return tuple(
+            getattr(_yaml, name)
+            for name
+            in ("SafeLoader", "CSafeLoader")
+            if hasattr(_yaml, name))
 
     @cached_property
     def yaml(self):
-        _yaml.SafeLoader.add_constructor('!ignore', IgnoredKey.from_yaml)
-        _yaml.SafeDumper.add_multi_representer(IgnoredKey, IgnoredKey.to_yaml)
+        for loader in self.loaders:
+            loader.add_constructor('!ignore', IgnoredKey.from_yaml)
+        for dumper in self.dumpers:
+            dumper.add_multi_representer(IgnoredKey, IgnoredKey.to_yaml)
         return _yaml
 
+    def safe_load(self, stream: Any) -> Any:
+        return self.yaml.load(stream, Loader=self.loader)
+
 
 envoy_yaml = EnvoyYaml().yaml
+fast_envoy_yaml = EnvoyYaml(c_loader=True)
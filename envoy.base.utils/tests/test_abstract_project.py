@@ -39,6 +39,7 @@ def test_abstract_project_constructor(path):
 
     project = DummyProject(*args)
     assert project._path == (path or ".")
+    assert project._changelog_index_path is None
 
     iface_props = [
         "changelogs_class",
@@ -97,6 +98,29 @@ def test_abstract_project_archived_versions(patches, main_dev):
     assert "archived_versions" in project.__dict__
 
 
+@pytest.mark.parametrize("index_path", [None, "", "INDEX_PATH"])
+def test_abstract_project_changelog_index_path(patches, index_path):
+    project = DummyProject(changelog_index_path=index_path)
+    patched = patches(
+        "pathlib",
+        prefix="envoy.base.utils.abstract.project.project")
+
+    with patched as (m_plib, ):
+        assert (
+            project.changelog_index_path
+            == (m_plib.Path.return_value
+                if index_path
+                else None))
+
+    if index_path:
+        assert (
+            m_plib.Path.call_args
+            == [(index_path, ), {}])
+    else:
+        assert not m_plib.Path.called
+    assert "changelog_index_path" in project.__dict__
+
+
 def test_abstract_project_changelogs(patches):
     project = DummyProject()
     patched = patches(
@@ -293,8 +317,7 @@ async def test_abstract_project_json_data(patches, iters):
     patched = patches(
         "json",
         "tuple",
-        "AwaitableGenerator",
-        ("AProject.repo",
+        ("AProject.releases",
          dict(new_callable=PropertyMock)),
         ("AProject.version",
          dict(new_callable=PropertyMock)),
@@ -306,10 +329,10 @@ async def test_abstract_project_json_data(patches, iters):
     releases = iters(cb=lambda i: MagicMock())
 
     with patched as patchy:
-        (m_json, m_tuple, m_await,
-         m_repo, m_version, m_stables, m_vstring) = patchy
+        (m_json, m_tuple, m_releases,
+         m_version, m_stables, m_vstring) = patchy
         m_stables.return_value = stables
-        m_await.side_effect = AsyncMock(return_value=releases)
+        m_releases.side_effect = AsyncMock(return_value=releases)
         assert (
             await project.json_data
             == m_json.dumps.return_value)
@@ -337,12 +360,6 @@ async def test_abstract_project_json_data(patches, iters):
         assert (
             release.data.__getitem__.call_args
             == [("tag_name", ), {}])
-    assert (
-        m_await.call_args
-        == [(m_repo.return_value.releases.return_value, ), {}])
-    assert (
-        m_repo.return_value.releases.call_args
-        == [(), {}])
     assert not hasattr(
         project,
         abstract.AProject.json_data.cache_name)
@@ -439,6 +456,36 @@ def test_abstract_project_rel_version_path(patches):
         == [(m_path, ), {}])
 
 
+async def test_abstract_project_releases(patches):
+    project = DummyProject()
+    patched = patches(
+        "tuple",
+        "AwaitableGenerator",
+        ("AProject.repo",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.base.utils.abstract.project.project")
+
+    with patched as (m_tuple, m_await, m_repo):
+        m_await.side_effect = AsyncMock()
+        assert (
+            await project.releases
+            == m_tuple.return_value)
+        # Cached.
+        assert (
+            await project.releases
+            == m_tuple.return_value)
+
+    assert (
+        m_tuple.call_args_list
+        == [[(m_await.side_effect.return_value, ), {}]])
+    assert (
+        m_await.call_args
+        == [(m_repo.return_value.releases.return_value, ), {}])
+    assert (
+        m_repo.return_value.releases.call_args
+        == [(), dict(parallel=True)])
+
+
 @pytest.mark.parametrize("repo", [None, "", "REPO"])
 @pytest.mark.parametrize("is_str", [True, False])
 def test_abstract_project_repo(patches, repo, is_str):
@@ -959,6 +1006,14 @@ async def test_abstract_project_release(patches, is_dev):
         == [(m_version.return_value, ), {}])
 
 
+def test_abstract_project_sync_concurrency():
+    project = DummyProject()
+    assert (
+        project.sync_concurrency
+        == abstract.project.project.SYNC_CONCURRENCY)
+    assert "sync_concurrency" not in project.__dict__
+
+
 async def test_abstract_project_sync(patches):
     project = DummyProject()
     patched = patches(
@@ -1,4 +1,5 @@
 
+import asyncio
 import json
 import pathlib
 import types
@@ -20,6 +21,10 @@ class DummyChangelogs(abstract.AChangelogs):
     def changelog_class(self):
         return super().changelog_class
 
+    @property
+    def index_class(self):
+        return super().index_class
+
 
 def test_abstract_changelogs_constructor():
 
@@ -36,6 +41,9 @@ def test_abstract_changelogs_constructor():
     with pytest.raises(NotImplementedError):
         changelogs.changelog_class
 
+    with pytest.raises(NotImplementedError):
+        changelogs.index_class
+
 
 def test_abstract_changelogs_dunder_contains(patches):
     changelogs = DummyChangelogs("PROJECT")
@@ -235,6 +243,25 @@ def test_abstract_project_datestamp(patches):
     assert "datestamp" not in changelogs.__dict__
 
 
+def test_abstract_changelogs_index(patches):
+    project = MagicMock()
+    changelogs = DummyChangelogs(project)
+    patched = patches(
+        ("AChangelogs.index_class",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.base.utils.abstract.project.changelog")
+
+    with patched as (m_class, ):
+        assert (
+            changelogs.index
+            == m_class.return_value.return_value)
+
+    assert (
+        m_class.return_value.call_args
+        == [(project.changelog_index_path, ), {}])
+    assert "index" in changelogs.__dict__
+
+
 @pytest.mark.parametrize("pending", [None, "Pending", "cabbage"])
 async def test_abstract_changelogs_is_pending(patches, pending):
     changelogs = DummyChangelogs("PROJECT")
@@ -350,6 +377,43 @@ def test_abstract_changelogs_sections(patches, raises):
             f"({m_path.return_value}): {str(error)}"))
 
 
+async def test_abstract_changelogs_runtime_guards(patches):
+    changelogs = DummyChangelogs("PROJECT")
+    patched = patches(
+        "concurrent",
+        ("AChangelogs.index",
+         dict(new_callable=PropertyMock)),
+        "AChangelogs.values",
+        prefix="envoy.base.utils.abstract.project.changelog")
+    guards = [{"GUARD1", "GUARD2"}, set(), {"GUARD2", "GUARD3"}]
+    values = [MagicMock() for _ in guards]
+    runtime_guards = []
+
+    async def _concurrent(coros):
+        runtime_guards.extend(coros)
+        for mentioned in guards:
+            assert not m_index.return_value.write.called
+            yield mentioned
+
+    with patched as (m_concurrent, m_index, m_values):
+        m_values.return_value = values
+        m_concurrent.side_effect = _concurrent
+        assert (
+            await changelogs.runtime_guards
+            == {"GUARD1", "GUARD2", "GUARD3"}
+            == getattr(
+                changelogs,
+                abstract.AChangelogs.runtime_guards.cache_name)[
+                    "runtime_guards"])
+
+    assert (
+        runtime_guards
+        == [value.runtime_guards for value in values])
+    assert (
+        m_index.return_value.write.call_args
+        == [(), {}])
+
+
 def test_abstract_changelogs_sections_path():
     project = MagicMock()
     changelogs = DummyChangelogs(project)
@@ -698,46 +762,77 @@ async def test_abstract_changelogs_sync(iters, patches):
         return release
 
     releases = iters(cb=mock_release, count=10)
-
-    async def repo_releases():
-        for release in releases:
-            yield release
-
     project = MagicMock()
-    project.repo.releases.side_effect = repo_releases
+    project.releases = AsyncMock(return_value=releases)()
+    project.sync_concurrency = 3
     changelogs = DummyChangelogs(project)
     patched = patches(
         "AChangelogs.fetch",
         "AChangelogs.should_sync",
         "AChangelogs.write_changelog",
         prefix="envoy.base.utils.abstract.project.changelog")
+    synced = [
+        release.version
+        for release
+        in releases
+        if release.version % 2]
 
     with patched as (m_fetch, m_should, m_write):
         m_should.side_effect = lambda x: x % 2
-        assert (
-            await changelogs.sync()
-            == {release.version: True
-                for release
-                in releases
-                if release.version % 2})
+        m_fetch.side_effect = lambda x: f"CHANGELOG{x}"
+        result = await changelogs.sync()
 
+    assert (
+        result
+        == {version: True
+            for version
+            in synced})
+    assert list(result) == synced
     assert (
         m_should.call_args_list
         == [[(release.version, ), {}]
             for release
             in releases])
     assert (
-        m_write.call_args_list
-        == [[(release.version, m_fetch.return_value), {}]
-            for release
-            in releases
-            if release.version % 2])
+        sorted(m_write.call_args_list)
+        == [[(version, f"CHANGELOG{version}"), {}]
+            for version
+            in synced])
     assert (
-        m_fetch.call_args_list
-        == [[(release.version, ), {}]
-            for release
-            in releases
-            if release.version % 2])
+        sorted(m_fetch.call_args_list)
+        == [[(version, ), {}]
+            for version
+            in synced])
+
+
+async def test_abstract_changelogs_sync_concurrent(patches):
+    project = MagicMock()
+    releases = [MagicMock() for _ in range(0, 10)]
+    project.releases = AsyncMock(return_value=releases)()
+    project.sync_concurrency = 3
+    changelogs = DummyChangelogs(project)
+    patched = patches(
+        "AChangelogs.fetch",
+        "AChangelogs.should_sync",
+        "AChangelogs.write_changelog",
+        prefix="envoy.base.utils.abstract.project.changelog")
+    fetching = []
+    most = []
+
+    async def fetch(version):
+        fetching.append(version)
+        most.append(len(fetching))
+        await asyncio.sleep(0)
+        fetching.remove(version)
+        return "CHANGELOG"
+
+    with patched as (m_fetch, m_should, m_write):
+        m_should.return_value = True
+        m_fetch.side_effect = fetch
+        await changelogs.sync()
+
+    assert max(most) == 3
+    assert m_write.call_count == 10
 
 
 def test_abstract_changelogs_write_changelog(patches):
@@ -929,6 +1024,22 @@ def test_abstract_changelogs_changelogs_methods(patches, method):
         == [(), {}])
 
 
+async def test_abstract_changelogs__fetch(patches):
+    changelogs = DummyChangelogs("PROJECT")
+    patched = patches(
+        "AChangelogs.fetch",
+        prefix="envoy.base.utils.abstract.project.changelog")
+
+    with patched as (m_fetch, ):
+        assert (
+            await changelogs._fetch("VERSION")
+            == ("VERSION", m_fetch.return_value))
+
+    assert (
+        m_fetch.call_args
+        == [("VERSION", ), {}])
+
+
 def test_abstract_changelogs__yaml_changelogs_version(patches):
     changelogs = DummyChangelogs("PROJECT")
     patched = patches(
@@ -1087,49 +1198,140 @@ def test_abstract_changelog_base_version(patches):
     assert "base_version" not in changelog.__dict__
 
 
-async def test_abstract_changelog_data(patches):
+@pytest.mark.parametrize("indexed", [True, False])
+async def test_abstract_changelog_data(patches, indexed):
     project = MagicMock()
     project.execute = AsyncMock()
     changelog = DummyChangelog(project, "VERSION", "PATH")
     patched = patches(
         "AChangelog.get_data",
+        ("AChangelog.index",
+         dict(new_callable=PropertyMock)),
         ("AChangelog.path",
          dict(new_callable=PropertyMock)),
         prefix="envoy.base.utils.abstract.project.changelog")
 
-    with patched as (m_get, m_path):
+    with patched as (m_get, m_index, m_path):
+        index = m_index.return_value
+        if not indexed:
+            index.data.return_value = None
+        expected = (
+            index.data.return_value
+            if indexed
+            else project.execute.return_value)
         assert (
             await changelog.data
-            == project.execute.return_value
+            == expected
             == getattr(
                 changelog,
                 abstract.AChangelog.data.cache_name)["data"])
 
+    assert (
+        index.data.call_args
+        == [(m_path.return_value, ), {}])
+    if indexed:
+        assert not project.execute.called
+        assert not index.key.called
+        assert not index.set.called
+        return
+    assert (
+        index.key.call_args
+        == [(m_path.return_value, ), {}])
     assert (
         project.execute.call_args
         == [(m_get, m_path.return_value), {}])
+    assert (
+        index.set.call_args
+        == [(m_path.return_value,
+             index.key.return_value,
+             project.execute.return_value), {}])
 
 
-async def test_abstract_changelog_release_date(patches):
-    changelog = DummyChangelog("PROECT", "VERSION", "PATH")
+def test_abstract_changelog_index():
+    project = MagicMock()
+    changelog = DummyChangelog(project, "VERSION", "PATH")
+    assert changelog.index == project.changelogs.index
+    assert "index" not in changelog.__dict__
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+async def test_abstract_changelog_indexed(patches, indexed):
+    changelog = DummyChangelog("PROJECT", "VERSION", "PATH")
     patched = patches(
         ("AChangelog.data",
          dict(new_callable=PropertyMock)),
+        ("AChangelog.index",
+         dict(new_callable=PropertyMock)),
+        ("AChangelog.path",
+         dict(new_callable=PropertyMock)),
         prefix="envoy.base.utils.abstract.project.changelog")
 
-    with patched as (m_data, ):
+    with patched as (m_data, m_index, m_path):
+        index = m_index.return_value
         data = AsyncMock()
         m_data.side_effect = data
+        if not indexed:
+            index.entry.return_value = None
+        assert (
+            await changelog.indexed
+            == (index.entry.return_value
+                if indexed
+                else index.entries.__getitem__.return_value))
+
+    assert (
+        index.entry.call_args
+        == [(m_path.return_value, ), {}])
+    if indexed:
+        assert not data.called
+        assert not index.entries.__getitem__.called
+    else:
+        assert data.called
+        assert (
+            index.entries.__getitem__.call_args
+            == [(m_path.return_value.name, ), {}])
+    assert "indexed" not in changelog.__dict__
+
+
+async def test_abstract_changelog_release_date(patches):
+    changelog = DummyChangelog("PROECT", "VERSION", "PATH")
+    patched = patches(
+        ("AChangelog.data",
+         dict(new_callable=PropertyMock)),
+        ("AChangelog.indexed",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.base.utils.abstract.project.changelog")
+
+    with patched as (m_data, m_indexed):
+        indexed = AsyncMock()
+        m_indexed.side_effect = indexed
         assert (
             await changelog.release_date
-            == data.return_value.__getitem__.return_value)
+            == indexed.return_value.__getitem__.return_value)
 
+    assert not m_data.called
     assert (
-        data.return_value.__getitem__.call_args
+        indexed.return_value.__getitem__.call_args
         == [("date", ), {}])
     assert "release_date" not in changelog.__dict__
 
 
+async def test_abstract_changelog_runtime_guards(patches):
+    changelog = DummyChangelog("PROECT", "VERSION", "PATH")
+    patched = patches(
+        ("AChangelog.indexed",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.base.utils.abstract.project.changelog")
+
+    with patched as (m_indexed, ):
+        m_indexed.side_effect = AsyncMock(
+            return_value=dict(runtime_guards=["GUARD1", "GUARD2"]))
+        assert (
+            await changelog.runtime_guards
+            == {"GUARD1", "GUARD2"})
+
+    assert "runtime_guards" not in changelog.__dict__
+
+
 async def test_abstract_changelog_entries(iters, patches):
     changelog = DummyChangelog("PROECT", "VERSION", "PATH")
     patched = patches(
@@ -1164,6 +1366,214 @@ async def test_abstract_changelog_entries(iters, patches):
         == [("SECTION", ), {}])
 
 
+@abstracts.implementer(interface.IChangelogIndex)
+class DummyChangelogIndex(abstract.AChangelogIndex):
+    pass
+
+
+def _changelog(date, **sections):
+    return dict(
+        date=date,
+        **{section: [dict(area=area, change=typing.Change(change))
+                     for area, change
+                     in changes]
+           for section, changes
+           in sections.items()})
+
+
+@pytest.mark.parametrize("path", [None, "PATH"])
+def test_abstract_changelog_index_constructor(path):
+    args = (
+        (path, )
+        if path is not None
+        else ())
+    index = DummyChangelogIndex(*args)
+    assert index._path == path
+    assert index._changed is False
+    assert index.changelogs == {}
+    assert "changelogs" in index.__dict__
+
+
+@pytest.mark.parametrize("path", [None, "", "PATH"])
+def test_abstract_changelog_index_path(patches, path):
+    index = DummyChangelogIndex(path)
+    patched = patches(
+        "pathlib",
+        prefix="envoy.base.utils.abstract.project.changelog")
+
+    with patched as (m_plib, ):
+        assert (
+            index.path
+            == (m_plib.Path.return_value
+                if path
+                else None))
+        if path:
+            assert (
+                index.index_path
+                == m_plib.Path.return_value.joinpath.return_value)
+            assert (
+                m_plib.Path.return_value.joinpath.call_args
+                == [(abstract.project.changelog.CHANGELOG_INDEX_FILE, ),
+                    {}])
+        else:
+            assert index.index_path is None
+
+    assert "path" in index.__dict__
+    assert "index_path" in index.__dict__
+
+
+def test_abstract_changelog_index_key(tmp_path):
+    index = DummyChangelogIndex()
+    path = tmp_path / "1.23.0.yaml"
+    path.write_text("date: Pending\n")
+    stat = path.stat()
+    assert index.key(path) == [stat.st_mtime_ns, stat.st_size]
+
+
+def test_abstract_changelog_index_runtime_guards():
+    index = DummyChangelogIndex()
+    data = _changelog(
+        "Pending",
+        bug_fixes=[
+            ("area1",
+             "Guarded by ``envoy.reloadable_features.foo_bar``."),
+            ("area2", "Not guarded.")],
+        new_features=[
+            ("area3",
+             "Guarded by ``envoy.reloadable_features.baz`` and "
+             "``envoy_reloadable_features_foo_bar``."),
+            ("area4", "Mentions envoy.reloadable_features.not_quoted")])
+    assert (
+        index.runtime_guards(data)
+        == ["envoy_reloadable_features_baz",
+            "envoy_reloadable_features_foo_bar"])
+    assert "runtime_guard_re" in index.__dict__
+
+
+@pytest.mark.parametrize("persisted", [True, False])
+def test_abstract_changelog_index_roundtrip(tmp_path, persisted):
+    index_path = (
+        tmp_path / "index"
+        if persisted
+        else None)
+    changelog_path = tmp_path / "1.23.0.yaml"
+    changelog_path.write_text("date: January 1, 2023\n")
+    other_path = tmp_path / "current.yaml"
+    other_path.write_text("date: Pending\n")
+    data = _changelog(
+        "January 1, 2023",
+        bug_fixes=[
+            ("area", "Fixed ``envoy.reloadable_features.foo``.")])
+    index = DummyChangelogIndex(index_path)
+    assert index.entry(changelog_path) is None
+    assert index.data(changelog_path) is None
+    key = index.key(changelog_path)
+    entry = index.set(changelog_path, key, data)
+    assert (
+        entry
+        == index.entry(changelog_path)
+        == dict(
+            date="January 1, 2023",
+            key=key,
+            runtime_guards=["envoy_reloadable_features_foo"],
+            sections=["bug_fixes"]))
+    assert index.data(changelog_path) is data
+    assert index.entry(other_path) is None
+
+    # The index is only persisted when written.
+    assert DummyChangelogIndex(index_path).entries == {}
+    index.write()
+    reopened = DummyChangelogIndex(index_path)
+    if not persisted:
+        assert reopened.entries == {}
+        assert reopened.data(changelog_path) is None
+        assert not list(tmp_path.glob("**/*.json"))
+        return
+    assert reopened.entries == {"1.23.0.yaml": entry}
+    assert reopened.changelogs == {}
+    assert reopened.data(changelog_path) == data
+    change = reopened.data(changelog_path)["bug_fixes"][0]["change"]
+    assert isinstance(change, typing.Change)
+    assert list(reopened.changelogs) == ["1.23.0.yaml"]
+
+    # Changed files are not used from the index.
+    changelog_path.write_text("date: January 2, 2023\n")
+    reopened = DummyChangelogIndex(index_path)
+    assert reopened.entry(changelog_path) is None
+    assert reopened.data(changelog_path) is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["",
+     "NOT JSON",
+     json.dumps([]),
+     json.dumps(dict(changelogs={})),
+     json.dumps(dict(version=0, changelogs=dict(FOO="BAR"))),
+     json.dumps(
+         dict(version=abstract.project.changelog.CHANGELOG_INDEX_VERSION,
+              changelogs=[]))])
+def test_abstract_changelog_index_invalid(tmp_path, content):
+    (tmp_path / "index.json").write_text(content)
+    index = DummyChangelogIndex(tmp_path)
+    assert index.entries == {}
+
+
+def test_abstract_changelog_index_invalid_data(tmp_path):
+    changelog_path = tmp_path / "1.23.0.yaml"
+    changelog_path.write_text("date: Pending\n")
+    index = DummyChangelogIndex(tmp_path / "index")
+    index.set(
+        changelog_path,
+        index.key(changelog_path),
+        _changelog("Pending"))
+    index.write()
+    index.data_path(changelog_path.name).write_text("NOT JSON")
+    reopened = DummyChangelogIndex(tmp_path / "index")
+    assert reopened.entry(changelog_path)
+    assert reopened.data(changelog_path) is None
+
+
+@pytest.mark.parametrize("path", [None, "PATH"])
+@pytest.mark.parametrize("changed", [True, False])
+def test_abstract_changelog_index_write(patches, path, changed):
+    index = DummyChangelogIndex(path)
+    index._changed = changed
+    patched = patches(
+        ("AChangelogIndex.entries",
+         dict(new_callable=PropertyMock)),
+        ("AChangelogIndex.index_path",
+         dict(new_callable=PropertyMock)),
+        "AChangelogIndex._write",
+        prefix="envoy.base.utils.abstract.project.changelog")
+
+    with patched as (m_entries, m_path, m_write):
+        if not path:
+            m_path.return_value = None
+        assert not index.write()
+
+    if not path or not changed:
+        assert not m_write.called
+        assert index._changed == changed
+        return
+    assert (
+        m_write.call_args
+        == [(m_path.return_value,
+             dict(version=abstract.project.changelog.CHANGELOG_INDEX_VERSION,
+                  changelogs=m_entries.return_value)),
+            {}])
+    assert index._changed is False
+
+
+def test_abstract_changelog_index__write_fails(tmp_path):
+    index = DummyChangelogIndex(tmp_path)
+
+    with pytest.raises(TypeError):
+        index._write(tmp_path / "index.json", dict(data=object()))
+
+    assert list(tmp_path.iterdir()) == []
+
+
 @abstracts.implementer(interface.IChangelogEntry)
 class DummyChangelogEntry(abstract.AChangelogEntry):
     pass
@@ -119,13 +119,8 @@ async def test_abstract_inventories_syncable(iters, patches):
         return release
 
     releases = iters(cb=lambda i: mock_release(i), count=10)
-
-    async def repo_releases():
-        for release in releases:
-            yield release
-
     project = MagicMock()
-    project.repo.releases.side_effect = repo_releases
+    project.releases = AsyncMock(return_value=releases)()
     inventories = DummyInventories(project)
     patched = patches(
         "_version",
@@ -146,9 +141,6 @@ async def test_abstract_inventories_syncable(iters, patches):
     assert (
         m_dict.call_args
         == [(), {}])
-    assert (
-        project.repo.releases.call_args
-        == [(), {}])
     assert (
         m_utils.minor_version_for.call_args_list
         == [[(r.version, ), {}]
@@ -454,7 +446,9 @@ def test_abstract_inventories_write_inventory(patches):
      (lambda x: False),
      (lambda x: int(x[1:]) % 2)])
 async def test_abstract_inventories_sync(iters, patches, fetch):
-    inventories = DummyInventories("PROJECT")
+    project = MagicMock()
+    project.sync_concurrency = 3
+    inventories = DummyInventories(project)
     patched = patches(
         ("AInventories.syncable",
          dict(new_callable=PropertyMock)),
@@ -476,10 +470,10 @@ async def test_abstract_inventories_sync(iters, patches, fetch):
                 in syncable.values()})
 
     assert (
-        m_fetch.call_args_list
+        sorted(m_fetch.call_args_list)
         == [[(v, ), {}] for v in syncable.values()])
     assert (
-        m_write_inv.call_args_list
+        sorted(m_write_inv.call_args_list)
         == [[(v, True), {}]
             for v
             in syncable.values()
@@ -493,6 +487,7 @@ async def test_abstract_inventories_sync(iters, patches, fetch):
         assert (
             m_write_ver.call_args
             == [(versions, ), {}])
+        assert list(m_write_ver.call_args[0][0]) == list(versions)
     else:
         assert not m_write_ver.called
 
@@ -552,3 +547,19 @@ def test_abstract_inventories_yaml_version_presenter(patches, count):
     assert (
         m_str.call_args
         == [(data, ), {}])
+
+
+async def test_abstract_inventories__fetch(patches):
+    inventories = DummyInventories("PROJECT")
+    patched = patches(
+        "AInventories.fetch",
+        prefix="envoy.base.utils.abstract.project.inventory")
+
+    with patched as (m_fetch, ):
+        assert (
+            await inventories._fetch("VERSION")
+            == ("VERSION", m_fetch.return_value))
+
+    assert (
+        m_fetch.call_args
+        == [("VERSION", ), {}])
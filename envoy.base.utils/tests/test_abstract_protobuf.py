@@ -1,11 +1,17 @@
 
+import hashlib
+import json
+import os
+from concurrent import futures
 from unittest.mock import MagicMock, PropertyMock
 
 import pytest
+import yaml
 
 import abstracts
 
 from envoy.base import utils
+from envoy.base.utils import yaml as envoy_yaml
 
 
 @abstracts.implementer(utils.interface.IProtobufValidator)
@@ -16,22 +22,87 @@ class DummyProtobufValidator(utils.abstract.AProtobufValidator):
         return super().protobuf_set_class
 
 
-def test_protobuf__yaml(patches):
+@abstracts.implementer(utils.interface.IProtobufValidationCache)
+class DummyProtobufValidationCache(utils.abstract.AProtobufValidationCache):
+    pass
+
+
+def test_protobuf__json_compatible():
+    ignored = envoy_yaml.IgnoredKey("IGNORED")
+    fragment = {
+        "str": "STR",
+        2: [dict(nested=True), ("TUPLE", {ignored: "IGNORED"})],
+        1.5: None,
+        True: {None: 0},
+        ignored: dict(ignored=True),
+        ("TUPLE", ): "SKIPPED"}
+    assert (
+        utils.abstract.protobuf._json_compatible(fragment)
+        == json.loads(json.dumps(fragment, skipkeys=True)))
+    assert (
+        utils.abstract.protobuf._json_compatible(fragment)
+        == {"str": "STR",
+            "2": [dict(nested=True), ["TUPLE", {}]],
+            "1.5": None,
+            "true": {"null": 0}})
+    assert utils.abstract.protobuf._json_compatible("STR") == "STR"
+
+
+def test_protobuf__validation_error():
+    validator_class = MagicMock()
+    validator = validator_class.for_descriptor.return_value
+
+    assert (
+        utils.abstract.protobuf._validation_error(
+            validator_class,
+            "DESCRIPTOR_PATH",
+            "FRAGMENT",
+            "TYPE")
+        == validator.validation_error.return_value)
+    assert (
+        validator_class.for_descriptor.call_args
+        == [("DESCRIPTOR_PATH", ), {}])
+    assert (
+        validator.validation_error.call_args
+        == [("FRAGMENT", "TYPE"), {}])
+
+
+@pytest.mark.parametrize(
+    "loader",
+    [("_yaml", "_envoy_yaml", "envoy_yaml"),
+     ("_yaml_loader", "_envoy_yaml_loader", "fast_envoy_yaml")])
+def test_protobuf__yaml(monkeypatch, patches, loader):
+    fun, cached, name = loader
+    monkeypatch.setattr(utils.abstract.protobuf, cached, None)
     patched = patches(
         "importlib",
         prefix="envoy.base.utils.abstract.protobuf")
 
     with patched as (m_import, ):
         assert (
-            utils.abstract.protobuf._yaml()
-            == m_import.import_module.return_value.envoy_yaml)
+            getattr(utils.abstract.protobuf, fun)()
+            == getattr(m_import.import_module.return_value, name))
+        assert (
+            getattr(utils.abstract.protobuf, fun)()
+            == getattr(m_import.import_module.return_value, name))
 
     assert (
-        utils.abstract.protobuf._envoy_yaml
-        == m_import.import_module.return_value.envoy_yaml)
+        getattr(utils.abstract.protobuf, cached)
+        == getattr(m_import.import_module.return_value, name))
     assert (
-        m_import.import_module.call_args
-        == [("envoy.base.utils.yaml", ), {}])
+        m_import.import_module.call_args_list
+        == [[("envoy.base.utils.yaml", ), {}]])
+
+
+def test_protobuf__yaml_types():
+    # `yaml` is the yaml module, with `!ignore` keys registered.
+    assert (
+        utils.abstract.protobuf._yaml()
+        is envoy_yaml.envoy_yaml
+        is yaml)
+    assert (
+        utils.abstract.protobuf._yaml_loader()
+        is envoy_yaml.fast_envoy_yaml)
 
 
 def test_protobufset_constructor():
@@ -105,6 +176,100 @@ def test_protobufset_descriptor_set(patches):
         == [(), {}])
 
 
+def test_protobufvalidationcache_constructor():
+    cache = DummyProtobufValidationCache("CACHE_PATH")
+    assert cache._path == "CACHE_PATH"
+
+
+def test_protobufvalidationcache_path(patches):
+    cache = DummyProtobufValidationCache("CACHE_PATH")
+    patched = patches(
+        "pathlib",
+        prefix="envoy.base.utils.abstract.protobuf")
+
+    with patched as (m_plib, ):
+        assert cache.path == m_plib.Path.return_value
+
+    assert (
+        m_plib.Path.call_args
+        == [("CACHE_PATH", ), {}])
+    assert "path" in cache.__dict__
+
+
+def test_protobufvalidationcache_get(tmp_path):
+    cache = DummyProtobufValidationCache(tmp_path / "cache")
+    key = cache.key("HASH", "TYPE", "FRAGMENT")
+    assert cache.get(key) is None
+    cache.set(key, "")
+    assert cache.get(key) == ""
+    cache.set(key, "ERROR")
+    assert cache.get(key) == "ERROR"
+    assert cache.get(cache.key("HASH", "TYPE", "OTHER")) is None
+    assert (
+        DummyProtobufValidationCache(tmp_path / "cache").get(key)
+        == "ERROR")
+    assert (
+        [path.name
+         for path
+         in tmp_path.joinpath("cache").glob("**/*")
+         if path.is_file()]
+        == [key])
+
+
+def test_protobufvalidationcache_key():
+    cache = DummyProtobufValidationCache("CACHE_PATH")
+    key = cache.key("HASH", "TYPE", "FRAGMENT")
+    assert (
+        key
+        == hashlib.sha256(b"HASH\0TYPE\0FRAGMENT\0").hexdigest())
+    assert key == cache.key("HASH", "TYPE", "FRAGMENT")
+    assert (
+        len({key,
+             cache.key("OTHER", "TYPE", "FRAGMENT"),
+             cache.key("HASH", "OTHER", "FRAGMENT"),
+             cache.key("HASH", "TYPE", "OTHER"),
+             cache.key("HASH", "TYPEF", "RAGMENT")})
+        == 5)
+
+
+def test_protobufvalidationcache_result_path(patches):
+    cache = DummyProtobufValidationCache("CACHE_PATH")
+    patched = patches(
+        ("AProtobufValidationCache.path",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.base.utils.abstract.protobuf")
+
+    with patched as (m_path, ):
+        assert (
+            cache.result_path("ABCDEF")
+            == m_path.return_value.joinpath.return_value)
+
+    assert (
+        m_path.return_value.joinpath.call_args
+        == [("AB", "ABCDEF"), {}])
+
+
+def test_protobufvalidationcache_set(patches):
+    cache = DummyProtobufValidationCache("CACHE_PATH")
+    patched = patches(
+        "atomic_write",
+        "AProtobufValidationCache.result_path",
+        prefix="envoy.base.utils.abstract.protobuf")
+
+    with patched as (m_write, m_result):
+        assert not cache.set("KEY", "ERROR")
+
+    assert (
+        m_result.call_args
+        == [("KEY", ), {}])
+    assert (
+        m_write.call_args
+        == [(m_result.return_value, ), {}])
+    assert (
+        m_write.return_value.__enter__.return_value.write.call_args
+        == [("ERROR", ), {}])
+
+
 def test_protobufvalidator_constructor():
     with pytest.raises(TypeError):
         utils.abstract.AProtobufValidator("DESCRIPTOR_PATH")
@@ -116,6 +281,51 @@ def test_protobufvalidator_constructor():
         proto_validator.protobuf_set_class
 
 
+def test_protobufvalidator_for_descriptor(patches, tmp_path):
+    descriptor_path = tmp_path.joinpath("descriptor.pb")
+    descriptor_path.write_bytes(b"")
+    other_path = tmp_path.joinpath("other.pb")
+    other_path.write_bytes(b"")
+    patched = patches(
+        ("_validators",
+         dict(new={})),
+        prefix="envoy.base.utils.abstract.protobuf")
+
+    with patched:
+        validator = DummyProtobufValidator.for_descriptor(
+            str(descriptor_path))
+        assert isinstance(validator, DummyProtobufValidator)
+        assert validator.descriptor_path == descriptor_path.resolve()
+        other = DummyProtobufValidator.for_descriptor(other_path)
+        assert other is not validator
+        assert (
+            DummyProtobufValidator.for_descriptor(descriptor_path)
+            is validator)
+        stat = descriptor_path.stat()
+        os.utime(
+            descriptor_path,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        updated = DummyProtobufValidator.for_descriptor(descriptor_path)
+        assert updated is not validator
+        assert (
+            DummyProtobufValidator.for_descriptor(descriptor_path)
+            is updated)
+        assert (
+            DummyProtobufValidator.for_descriptor(other_path)
+            is other)
+        assert len(utils.abstract.protobuf._validators) == 2
+
+
+def test_protobufvalidator_descriptor_hash(tmp_path):
+    descriptor_path = tmp_path.joinpath("descriptor.pb")
+    descriptor_path.write_bytes(b"DESCRIPTORS")
+    proto_validator = DummyProtobufValidator(str(descriptor_path))
+    assert (
+        proto_validator.descriptor_hash
+        == hashlib.sha256(b"DESCRIPTORS").hexdigest())
+    assert "descriptor_hash" in proto_validator.__dict__
+
+
 def test_protobufvalidator_descriptor_pool(patches):
     proto_validator = DummyProtobufValidator("DESCRIPTOR_PATH")
     patched = patches(
@@ -168,21 +378,22 @@ def test_protobufvalidator_protobuf_set(patches):
     assert "protobuf_set" in proto_validator.__dict__
 
 
-def test_protobufvalidator_yaml(patches):
+@pytest.mark.parametrize("prop", ["yaml", "yaml_loader"])
+def test_protobufvalidator_yaml(patches, prop):
     proto_validator = DummyProtobufValidator("DESCRIPTOR_PATH")
     patched = patches(
-        "_yaml",
+        f"_{prop}",
         prefix="envoy.base.utils.abstract.protobuf")
 
     with patched as (m_yaml, ):
         assert (
-            proto_validator.yaml
+            getattr(proto_validator, prop)
             == m_yaml.return_value)
 
     assert (
         m_yaml.call_args
         == [(), {}])
-    assert "yaml" in proto_validator.__dict__
+    assert prop in proto_validator.__dict__
 
 
 def test_protobufvalidator_find_message(patches):
@@ -223,34 +434,53 @@ def test_protobufvalidator_message(patches):
         == [(), {}])
 
 
-def test_protobufvalidator_message_prototype(patches):
+@pytest.mark.parametrize("cached", [True, False])
+def test_protobufvalidator_message_prototype(patches, cached):
     proto_validator = DummyProtobufValidator("DESCRIPTOR_PATH")
     patched = patches(
         ("AProtobufValidator.message_factory",
          dict(new_callable=PropertyMock)),
         "AProtobufValidator.find_message",
         prefix="envoy.base.utils.abstract.protobuf")
-    type_name = MagicMock()
+    if cached:
+        proto_validator.message_prototypes["TYPE"] = "PROTOTYPE"
 
     with patched as (m_factory, m_find):
         assert (
-            proto_validator.message_prototype(type_name)
-            == m_factory.return_value.GetPrototype.return_value)
+            proto_validator.message_prototype("TYPE")
+            == ("PROTOTYPE"
+                if cached
+                else m_factory.return_value.GetPrototype.return_value))
 
+    assert (
+        proto_validator.message_prototypes["TYPE"]
+        == ("PROTOTYPE"
+            if cached
+            else m_factory.return_value.GetPrototype.return_value))
+    if cached:
+        assert not m_factory.called
+        assert not m_find.called
+        return
     assert (
         m_factory.return_value.GetPrototype.call_args
         == [(m_find.return_value, ), {}])
     assert (
         m_find.call_args
-        == [(type_name, ), {}])
+        == [("TYPE", ), {}])
+
+
+def test_protobufvalidator_message_prototypes():
+    proto_validator = DummyProtobufValidator("DESCRIPTOR_PATH")
+    assert proto_validator.message_prototypes == {}
+    assert "message_prototypes" in proto_validator.__dict__
 
 
 @pytest.mark.parametrize("type_name", [True, False])
 def test_protobufvalidator_validate_fragment(patches, type_name):
     proto_validator = DummyProtobufValidator("DESCRIPTOR_PATH")
     patched = patches(
-        "json",
         "json_format",
+        "_json_compatible",
         ("AProtobufValidator.descriptor_pool",
          dict(new_callable=PropertyMock)),
         "AProtobufValidator.message",
@@ -262,17 +492,17 @@ def test_protobufvalidator_validate_fragment(patches, type_name):
         if type_name
         else ())
 
-    with patched as (m_json, m_fmt, m_pool, m_msg):
+    with patched as (m_fmt, m_json, m_pool, m_msg):
         assert not proto_validator.validate_fragment(fragment, *args)
 
     assert (
-        m_fmt.Parse.call_args
-        == [(m_json.dumps.return_value,
+        m_fmt.ParseDict.call_args
+        == [(m_json.return_value,
              m_msg.return_value),
             dict(descriptor_pool=m_pool.return_value)])
     assert (
-        m_json.dumps.call_args
-        == [(fragment, ), dict(skipkeys=True)])
+        m_json.call_args
+        == [(fragment, ), {}])
     assert (
         m_msg.call_args
         == [(_type_name
@@ -281,11 +511,102 @@ def test_protobufvalidator_validate_fragment(patches, type_name):
             {}])
 
 
+@pytest.mark.parametrize("cache", [True, False])
+@pytest.mark.parametrize("cached", [[], [0, 2, 3], [0, 1, 2, 3, 4]])
+@pytest.mark.parametrize("pool", [True, False])
+def test_protobufvalidator_validate_many(patches, cache, cached, pool):
+    proto_validator = DummyProtobufValidator("DESCRIPTOR_PATH")
+    patched = patches(
+        "futures",
+        ("_validation_error",
+         dict(new_callable=MagicMock)),
+        ("AProtobufValidator.descriptor_hash",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.base.utils.abstract.protobuf")
+    fragments = [
+        (f"FRAGMENT{i}", f"TYPE{i}")
+        for i
+        in range(0, 5)]
+    executor = MagicMock(wraps=futures.ThreadPoolExecutor())
+    _cache = (
+        MagicMock()
+        if cache
+        else None)
+    if cache:
+        _cache.key.side_effect = (
+            lambda h, type_name, fragment: f"KEY-{fragment}")
+        _cache.get.side_effect = (
+            lambda key: (
+                f"CACHED-{key}"
+                if int(key[-1]) in cached
+                else None))
+    pending = [
+        i
+        for i
+        in range(0, 5)
+        if not cache or i not in cached]
+
+    with patched as (m_futures, m_error, m_hash):
+        m_futures.ProcessPoolExecutor.return_value = executor
+        m_error.side_effect = (
+            lambda cls, path, fragment, type_name: f"ERROR-{fragment}")
+        result = proto_validator.validate_many(
+            fragments,
+            cache=_cache,
+            pool=(executor
+                  if pool
+                  else None))
+
+    assert (
+        result
+        == [(f"ERROR-FRAGMENT{i}"
+             if i in pending
+             else f"CACHED-KEY-FRAGMENT{i}")
+            for i
+            in range(0, 5)])
+    assert (
+        sorted(m_error.call_args_list)
+        == [[(DummyProtobufValidator, "DESCRIPTOR_PATH",
+              f"FRAGMENT{i}", f"TYPE{i}"), {}]
+            for i
+            in pending])
+    if cache:
+        assert (
+            _cache.key.call_args_list
+            == [[(m_hash.return_value, f"TYPE{i}", f"FRAGMENT{i}"), {}]
+                for i
+                in range(0, 5)])
+        assert (
+            _cache.set.call_args_list
+            == [[(f"KEY-FRAGMENT{i}", f"ERROR-FRAGMENT{i}"), {}]
+                for i
+                in pending])
+    else:
+        assert not m_hash.called
+    if not pending or pool:
+        assert not m_futures.ProcessPoolExecutor.called
+        assert not executor.shutdown.called
+    else:
+        assert (
+            m_futures.ProcessPoolExecutor.call_args
+            == [(), {}])
+        assert (
+            executor.shutdown.call_args
+            == [(), {}])
+    if pending:
+        assert (
+            executor.map.call_args.kwargs
+            == dict(chunksize=utils.abstract.protobuf.VALIDATION_CHUNKSIZE))
+    else:
+        assert not executor.map.called
+    executor.shutdown()
+
+
 @pytest.mark.parametrize("type_name", [True, False])
 def test_protobufvalidator_validate_yaml(patches, type_name):
     proto_validator = DummyProtobufValidator("DESCRIPTOR_PATH")
     patched = patches(
-        ("AProtobufValidator.yaml",
+        ("AProtobufValidator.yaml_loader",
          dict(new_callable=PropertyMock)),
         "AProtobufValidator.validate_fragment",
         prefix="envoy.base.utils.abstract.protobuf")
@@ -308,3 +629,53 @@ def test_protobufvalidator_validate_yaml(patches, type_name):
     assert (
         m_yaml.return_value.safe_load.call_args
         == [(fragment, ), {}])
+
+
+@pytest.mark.parametrize("type_name", [True, False])
+@pytest.mark.parametrize(
+    "raises",
+    [None, utils.abstract.protobuf.json_format.ParseError,
+     KeyError, Exception])
+def test_protobufvalidator_validation_error(patches, type_name, raises):
+    proto_validator = DummyProtobufValidator("DESCRIPTOR_PATH")
+    patched = patches(
+        "AProtobufValidator.validate_yaml",
+        prefix="envoy.base.utils.abstract.protobuf")
+    args = (
+        ("TYPE", )
+        if type_name
+        else ())
+
+    with patched as (m_valid, ):
+        if raises:
+            m_valid.side_effect = raises("AN ERROR OCCURRED")
+        if raises == Exception:
+            with pytest.raises(Exception):
+                proto_validator.validation_error("FRAGMENT", *args)
+        else:
+            assert (
+                proto_validator.validation_error("FRAGMENT", *args)
+                == (str(m_valid.side_effect)
+                    if raises
+                    else ""))
+
+    assert (
+        m_valid.call_args
+        == [("FRAGMENT",
+             ("TYPE"
+              if type_name
+              else utils.abstract.protobuf.BOOTSTRAP_PROTO)), {}])
+
+
+def test_protobufvalidator_validation_error_empty(patches):
+    proto_validator = DummyProtobufValidator("DESCRIPTOR_PATH")
+    patched = patches(
+        "AProtobufValidator.validate_yaml",
+        prefix="envoy.base.utils.abstract.protobuf")
+
+    with patched as (m_valid, ):
+        m_valid.side_effect = (
+            utils.abstract.protobuf.json_format.ParseError())
+        assert (
+            proto_validator.validation_error("FRAGMENT")
+            == "ParseError")
@@ -7,11 +7,13 @@ from envoy.base.utils import interface
 @pytest.mark.parametrize(
     "interface",
     [interface.IProtobufSet,
+     interface.IProtobufValidationCache,
      interface.IProtobufValidator,
      interface.IProject,
      interface.IInventories,
      interface.IChangelogs,
      interface.IChangelog,
+     interface.IChangelogIndex,
      interface.IChangelogEntry])
 async def test_interfaces(iface, interface):
     await iface(interface).check()
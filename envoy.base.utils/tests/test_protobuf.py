@@ -19,6 +19,23 @@ def test_protobufset_constructor(iters, patches):
         == [args, kwargs])
 
 
+def test_protobufvalidationcache_constructor(iters, patches):
+    args = iters(tuple, count=3)
+    kwargs = iters(dict, count=3)
+    patched = patches(
+        "abstract.AProtobufValidationCache.__init__",
+        prefix="envoy.base.utils.protobuf")
+
+    with patched as (m_super, ):
+        m_super.return_value = None
+        cache = utils.ProtobufValidationCache(*args, **kwargs)
+
+    assert isinstance(cache, utils.interface.IProtobufValidationCache)
+    assert (
+        m_super.call_args
+        == [args, kwargs])
+
+
 def test_protobufvalidator_constructor(iters, patches):
     args = iters(tuple, count=3)
     kwargs = iters(dict, count=3)
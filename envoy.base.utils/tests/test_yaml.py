@@ -1,5 +1,5 @@
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 
@@ -12,6 +12,27 @@ def test_yaml_envoy_yaml():
     assert _yaml.envoy_yaml == base_yaml
 
 
+def test_yaml_fast_envoy_yaml():
+    assert isinstance(_yaml.fast_envoy_yaml, _yaml.EnvoyYaml)
+    assert _yaml.fast_envoy_yaml.c_loader is True
+
+
+@pytest.mark.parametrize(
+    "envoy_yaml",
+    [_yaml.EnvoyYaml(), _yaml.fast_envoy_yaml])
+def test_yaml_ignored_key_roundtrip(envoy_yaml):
+    loaded = envoy_yaml.safe_load(
+        "!ignore ignored: &anchor\n"
+        "  foo: bar\n"
+        "used: *anchor\n")
+    assert loaded == {_yaml.IgnoredKey("ignored"): dict(foo="bar"),
+                      "used": dict(foo="bar")}
+    for dumper in envoy_yaml.dumpers:
+        dumped = envoy_yaml.yaml.dump(loaded, Dumper=dumper)
+        assert dumped.startswith("!ignore ")
+        assert envoy_yaml.safe_load(dumped) == loaded
+
+
 def test_yaml_ignoredkey_from_yaml():
     loader = MagicMock()
     node = MagicMock()
@@ -31,8 +52,73 @@ def test_yaml_ignoredkey_to_yaml():
         == [(_yaml.IgnoredKey.yaml_tag, data.strval), {}])
 
 
-def test_yaml_envoyyaml_constructor():
-    assert _yaml.EnvoyYaml()
+@pytest.mark.parametrize("c_loader", [None, True, False])
+def test_yaml_envoyyaml_constructor(c_loader):
+    kwargs = (
+        dict(c_loader=c_loader)
+        if c_loader is not None
+        else {})
+    envoy_yaml = _yaml.EnvoyYaml(**kwargs)
+    assert envoy_yaml.c_loader == bool(c_loader)
+
+
+@pytest.mark.parametrize("libyaml", [True, False])
+def test_yaml_envoyyaml_dumpers(patches, libyaml):
+    envoy_yaml = _yaml.EnvoyYaml()
+    patched = patches(
+        "_yaml",
+        prefix="envoy.base.utils.yaml")
+
+    with patched as (m_yaml, ):
+        if not libyaml:
+            del m_yaml.CSafeDumper
+        assert (
+            envoy_yaml.dumpers
+            == ((m_yaml.SafeDumper, m_yaml.CSafeDumper)
+                if libyaml
+                else (m_yaml.SafeDumper, )))
+
+    assert "dumpers" in envoy_yaml.__dict__
+
+
+@pytest.mark.parametrize("c_loader", [True, False])
+@pytest.mark.parametrize("libyaml", [True, False])
+def test_yaml_envoyyaml_loader(patches, c_loader, libyaml):
+    envoy_yaml = _yaml.EnvoyYaml(c_loader=c_loader)
+    patched = patches(
+        ("EnvoyYaml.yaml",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.base.utils.yaml")
+
+    with patched as (m_yaml, ):
+        if not libyaml:
+            del m_yaml.return_value.CSafeLoader
+        assert (
+            envoy_yaml.loader
+            == (m_yaml.return_value.CSafeLoader
+                if c_loader and libyaml
+                else m_yaml.return_value.SafeLoader))
+
+    assert "loader" in envoy_yaml.__dict__
+
+
+@pytest.mark.parametrize("libyaml", [True, False])
+def test_yaml_envoyyaml_loaders(patches, libyaml):
+    envoy_yaml = _yaml.EnvoyYaml()
+    patched = patches(
+        "_yaml",
+        prefix="envoy.base.utils.yaml")
+
+    with patched as (m_yaml, ):
+        if not libyaml:
+            del m_yaml.CSafeLoader
+        assert (
+            envoy_yaml.loaders
+            == ((m_yaml.SafeLoader, m_yaml.CSafeLoader)
+                if libyaml
+                else (m_yaml.SafeLoader, )))
+
+    assert "loaders" in envoy_yaml.__dict__
 
 
 def test_yaml_envoyyaml_yaml(patches):
@@ -40,22 +126,51 @@ def test_yaml_envoyyaml_yaml(patches):
     patched = patches(
         "IgnoredKey",
         "_yaml",
+        ("EnvoyYaml.dumpers",
+         dict(new_callable=PropertyMock)),
+        ("EnvoyYaml.loaders",
+         dict(new_callable=PropertyMock)),
         prefix="envoy.base.utils.yaml")
+    loaders = [MagicMock(), MagicMock()]
+    dumpers = [MagicMock(), MagicMock()]
 
-    with patched as (m_ignore, m_yaml):
+    with patched as (m_ignore, m_yaml, m_dumpers, m_loaders):
+        m_dumpers.return_value = dumpers
+        m_loaders.return_value = loaders
         assert (
             envoy_yaml.yaml
             == m_yaml)
 
-    assert (
-        m_yaml.SafeLoader.add_constructor.call_args
-        == [('!ignore', m_ignore.from_yaml), {}])
-    assert (
-        m_yaml.SafeDumper.add_multi_representer.call_args
-        == [(m_ignore, m_ignore.to_yaml), {}])
+    for loader in loaders:
+        assert (
+            loader.add_constructor.call_args
+            == [('!ignore', m_ignore.from_yaml), {}])
+    for dumper in dumpers:
+        assert (
+            dumper.add_multi_representer.call_args
+            == [(m_ignore, m_ignore.to_yaml), {}])
     assert "yaml" in envoy_yaml.__dict__
 
 
+def test_yaml_envoyyaml_safe_load(patches):
+    envoy_yaml = _yaml.EnvoyYaml()
+    patched = patches(
+        ("EnvoyYaml.loader",
+         dict(new_callable=PropertyMock)),
+        ("EnvoyYaml.yaml",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.base.utils.yaml")
+
+    with patched as (m_loader, m_yaml):
+        assert (
+            envoy_yaml.safe_load("STREAM")
+            == m_yaml.return_value.load.return_value)
+
+    assert (
+        m_yaml.return_value.load.call_args
+        == [("STREAM", ), dict(Loader=m_loader.return_value)])
+
+
 def test_yaml_ignoredkey_constructor():
     ignored = _yaml.IgnoredKey("STRVALUE")
     assert isinstance(ignored, base_yaml.YAMLObject)
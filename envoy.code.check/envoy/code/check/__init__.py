@@ -6,6 +6,7 @@ from .abstract import (
     AChangelogCheck,
     AChangelogStatus,
     ACodeCheck,
+    ACodeCheckCache,
     ACodeChecker,
     AExtensionsCheck,
     AFlake8Check,
@@ -24,6 +25,7 @@ from .checker import (
     ChangelogCheck,
     ChangelogStatus,
     CodeChecker,
+    CodeCheckCache,
     ExtensionsCheck,
     Flake8Check,
     GlintCheck,
@@ -43,6 +45,7 @@ __all__ = (
     "AChangelogCheck",
     "AChangelogStatus",
     "ACodeCheck",
+    "ACodeCheckCache",
     "ACodeChecker",
     "AExtensionsCheck",
     "AFileCodeCheck",
@@ -61,6 +64,7 @@ __all__ = (
     "ChangelogStatus",
     "checker",
     "CodeChecker",
+    "CodeCheckCache",
     "exceptions",
     "ExtensionsCheck",
     "Flake8Check",
@@ -1,5 +1,6 @@
 
 from .base import ACodeCheck, AFileCodeCheck, AProjectCodeCheck
+from .cache import ACodeCheckCache
 from .changelog import (
     AChangelogCheck,
     AChangelogChangesChecker,
@@ -19,6 +20,7 @@ from .yamllint import AYamllintCheck
 from .yapf import AYapfCheck
 from . import (
     base,
+    cache,
     checker,
     extensions,
     flake8,
@@ -36,6 +38,7 @@ __all__ = (
     "AChangelogCheck",
     "AChangelogStatus",
     "ACodeCheck",
+    "ACodeCheckCache",
     "ACodeChecker",
     "AExtensionsCheck",
     "AFileCodeCheck",
@@ -50,6 +53,7 @@ __all__ = (
     "AYamllintCheck",
     "AYapfCheck",
     "base",
+    "cache",
     "checker",
     "extensions",
     "flake8",
@@ -1,7 +1,9 @@
 
 import asyncio
+import pathlib
 from concurrent import futures
-from typing import Dict, List, Optional, Set
+from functools import cached_property, partial
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 import abstracts
 
@@ -10,7 +12,7 @@ from aio.core.directory import ADirectory
 from aio.core.functional import async_property
 
 from envoy.base import utils
-from envoy.code.check import interface
+from envoy.code.check import interface, typing
 
 
 @abstracts.implementer(event.IExecutive)
@@ -22,12 +24,20 @@ class ACodeCheck(event.AExecutive, metaclass=abstracts.Abstraction):
             fix: bool = False,
             binaries: Optional[Dict[str, str]] = None,
             loop: Optional[asyncio.AbstractEventLoop] = None,
-            pool: Optional[futures.Executor] = None) -> None:
+            pool: Optional[futures.Executor] = None,
+            cache: Optional["interface.ICodeCheckCache"] = None) -> None:
         self.directory = directory
         self._fix = fix
         self._loop = loop
         self._pool = pool
         self._binaries = binaries
+        self._cache = cache
+
+    @property
+    def async_subprocess(self) -> bool:
+        """Run subprocesses from the event loop, if the directory is
+        configured to."""
+        return self.directory.async_subprocess
 
     @property
     def binaries(self):
@@ -36,18 +46,113 @@ class ACodeCheck(event.AExecutive, metaclass=abstracts.Abstraction):
 
 @abstracts.implementer(interface.IFileCodeCheck)
 class AFileCodeCheck(ACodeCheck, metaclass=abstracts.Abstraction):
+    """A check that is run against a set of files.
+
+    If a `cache` is provided, files with unchanged content and check
+    configuration are not checked again, and their cached results are used
+    instead.
+
+    The `files` to check exclude any cached files, whereas `all_files`
+    and `all_problem_files` include them.
+    """
+
+    @async_property(cache=True)
+    async def all_files(self) -> Set[str]:
+        """All files that this check applies to."""
+        files = await self.directory.files
+        return (
+            files & await self.checker_files
+            if files
+            else files)
+
+    @async_property(cache=True)
+    async def all_problem_files(self) -> typing.ProblemDict:
+        """Problems for all files, including cached results.
+
+        Results for newly checked files are added to the cache.
+        """
+        problem_files = await self.problem_files
+        if not self.cache:
+            return problem_files
+        self.cache.set(
+            self.cache_key,
+            self.cache_fingerprint,
+            await self.file_hashes,
+            await self.files,
+            problem_files)
+        return {
+            **{path: problems
+               for path, problems
+               in (await self.cached_files).items()
+               if problems.errors or problems.warnings},
+            **problem_files}
+
+    @property
+    def cache(self) -> Optional["interface.ICodeCheckCache"]:
+        """Result cache, results are not cached when fixing files."""
+        return (
+            self._cache
+            if not self.fix
+            else None)
+
+    @property
+    def cache_config(self) -> Tuple[Union[str, pathlib.Path], ...]:
+        """Configuration that affects the check results.
+
+        Paths are fingerprinted by their content.
+        """
+        return ()
+
+    @cached_property
+    def cache_fingerprint(self) -> str:
+        """Fingerprint of the check configuration."""
+        return (
+            self.cache.fingerprint(*self.cache_config)
+            if self.cache
+            else "")
+
+    @property
+    def cache_key(self) -> str:
+        """Name to store cached results for this check."""
+        return self.__class__.__name__
+
+    @async_property(cache=True)
+    async def cached_files(self) -> typing.ProblemDict:
+        """Cached results for files that have not changed."""
+        if not self.cache:
+            return {}
+        return self.cache.get(
+            self.cache_key,
+            self.cache_fingerprint,
+            await self.file_hashes)
 
     @async_property
     @abstracts.interfacemethod
     async def checker_files(self) -> Set[str]:
         raise NotImplementedError
 
+    @async_property(cache=True)
+    async def file_hashes(self) -> Dict[str, str]:
+        """Content hashes of all files, only required if caching."""
+        hashes: Dict[str, str] = {}
+        if not self.cache or not (files := await self.all_files):
+            return hashes
+        batches = self.execute_in_batches(
+            partial(
+                self.cache.hash_files,
+                str(self.directory.path)),
+            *files)
+        async for batch in batches:
+            hashes.update(batch)
+        return hashes
+
     @async_property(cache=True)
     async def files(self) -> Set[str]:
-        files = await self.directory.files
+        """Files to check, excluding any with cached results."""
+        files = await self.all_files
         return (
-            files & await self.checker_files
-            if files
+            files - set(await self.cached_files)
+            if files and self.cache
             else files)
 
     @property
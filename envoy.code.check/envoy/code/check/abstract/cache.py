@@ -0,0 +1,144 @@
+
+import hashlib
+import json
+import pathlib
+from functools import cached_property
+from typing import Dict, Iterable, Optional, Union
+
+import abstracts
+
+from aio.core import utils
+from aio.core.directory.utils import directory_context
+from aio.run import checker
+
+from envoy.code.check import interface, typing
+
+
+@abstracts.implementer(interface.ICodeCheckCache)
+class ACodeCheckCache(metaclass=abstracts.Abstraction):
+    """Persistent cache of file check results.
+
+    Results are stored on disk per check, keyed by file path and content
+    hash.
+
+    Each check provides a fingerprint of its configuration, if this changes
+    all of the cached results for that check are discarded.
+    """
+
+    @classmethod
+    def hash_file(cls, path: Union[str, pathlib.Path]) -> str:
+        """Hash the content of a file."""
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    @classmethod
+    def hash_files(cls, path: str, *paths: str) -> Dict[str, str]:
+        """Hash the content of files relative to `path`."""
+        with directory_context(path):
+            return {
+                target: cls.hash_file(target)
+                for target
+                in paths}
+
+    def __init__(self, path: Union[str, pathlib.Path]) -> None:
+        self._path = path
+
+    @cached_property
+    def data(self) -> Dict[str, typing.CodeCheckCacheDict]:
+        """Loaded cache data for each check."""
+        return {}
+
+    @cached_property
+    def path(self) -> pathlib.Path:
+        """Path to the cache directory."""
+        return pathlib.Path(self._path)
+
+    def cache_path(self, name: str) -> pathlib.Path:
+        """Path to the cache file for a check."""
+        return self.path.joinpath(f"{name}.json")
+
+    def fingerprint(
+            self,
+            *config: Union[str, pathlib.Path]) -> str:
+        """Fingerprint check configuration.
+
+        Paths are fingerprinted by the content of the file if it exists.
+        """
+        fingerprint = hashlib.sha256()
+        for item in config:
+            fingerprint.update(
+                (self.hash_file(item)
+                 if isinstance(item, pathlib.Path) and item.is_file()
+                 else str(item)).encode())
+            fingerprint.update(b"\0")
+        return fingerprint.hexdigest()
+
+    def get(
+            self,
+            name: str,
+            fingerprint: str,
+            hashes: Dict[str, str]) -> typing.ProblemDict:
+        """Cached results for files with matching content hashes.
+
+        Files without any problems are returned with empty `Problems`.
+        """
+        results = self.load(name, fingerprint)["results"]
+        return {
+            path: checker.Problems(
+                errors=list(results[path][1]),
+                warnings=list(results[path][2]))
+            for path, content_hash
+            in hashes.items()
+            if (path in results
+                and results[path][0] == content_hash)}
+
+    def load(
+            self,
+            name: str,
+            fingerprint: str) -> typing.CodeCheckCacheDict:
+        """Load the cache for a check, discarding it if the fingerprint has
+        changed."""
+        if name not in self.data:
+            self.data[name] = self._read(name)
+        if self.data[name]["fingerprint"] != fingerprint:
+            self.data[name] = dict(fingerprint=fingerprint, results={})
+        return self.data[name]
+
+    def set(
+            self,
+            name: str,
+            fingerprint: str,
+            hashes: Dict[str, str],
+            files: Iterable[str],
+            problem_files: typing.ProblemDict) -> None:
+        """Store results for checked files, and write the cache to disk."""
+        results = self.load(name, fingerprint)["results"]
+        for path in files:
+            if path not in hashes:
+                continue
+            problems = problem_files.get(path)
+            results[path] = (
+                hashes[path],
+                problems.errors if problems else [],
+                problems.warnings if problems else [])
+        self._write(name)
+
+    def _read(self, name: str) -> typing.CodeCheckCacheDict:
+        try:
+            data = json.loads(self.cache_path(name).read_text())
+        except (OSError, ValueError):
+            data = None
+        return (
+            data
+            if self._valid(data)
+            else dict(fingerprint="", results={}))
+
+    def _valid(self, data: Optional[Dict]) -> bool:
+        return bool(
+            isinstance(data, dict)
+            and isinstance(data.get("fingerprint"), str)
+            and isinstance(data.get("results"), dict))
+
+    def _write(self, name: str) -> None:
+        with utils.atomic_write(self.cache_path(name)) as f:
+            json.dump(self.data[name], f)
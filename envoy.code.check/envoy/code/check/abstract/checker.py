@@ -18,8 +18,12 @@ from aio.run import checker
 from envoy.base import utils
 from envoy.base.utils import IProject
 from envoy.code.check import exceptions, interface, typing
+from envoy.code.check.abstract.glint import GLINT_BACKENDS
 
 
+# Directory in the `--cache_dir` to index parsed changelogs in.
+CHANGELOG_INDEX_DIR = "changelogs"
+
 # TODO: Add a README in envoy repo with info on how to fix and maybe use
 #   a template
 GLINT_ADVICE = (
@@ -90,6 +94,19 @@ class ACodeChecker(
             disabled["extensions_fuzzed"] = NO_EXTENSIONS_FUZZ_ERROR_MSG
         return disabled
 
+    @cached_property
+    def cache(self) -> Optional["interface.ICodeCheckCache"]:
+        """Persistent result cache for file checks, if enabled."""
+        return (
+            self.cache_class(self.args.cache_dir)
+            if self.args.cache_dir
+            else None)
+
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def cache_class(self) -> Type["interface.ICodeCheckCache"]:
+        raise NotImplementedError
+
     @property
     def changed_since(self) -> Optional[str]:
         return self.args.since
@@ -111,6 +128,7 @@ class ACodeChecker(
         return dict(
             fix=self.fix,
             binaries=self.binaries,
+            cache=self.cache,
             loop=self.loop,
             pool=self.pool)
 
@@ -126,7 +144,8 @@ class ACodeChecker(
         kwargs: Dict = dict(
             exclude_matcher=self.grep_excluding_re,
             path_matcher=self.grep_matching_re,
-            untracked=self.all_files)
+            untracked=self.all_files,
+            async_subprocess=self.args.async_subprocess)
         if not self.all_files:
             kwargs["changed"] = self.changed_since
         return kwargs
@@ -170,7 +189,10 @@ class ACodeChecker(
     @cached_property
     def glint(self) -> "interface.IGlintCheck":
         """Glint checker."""
-        return self.glint_class(self.directory, **self.check_kwargs)
+        return self.glint_class(
+            self.directory,
+            backend=self.args.glint_backend,
+            **self.check_kwargs)
 
     @property  # type:ignore
     @abstracts.interfacemethod
@@ -202,7 +224,13 @@ class ACodeChecker(
 
     @cached_property
     def project(self) -> IProject:
-        return self.project_class(self.path)
+        return self.project_class(
+            self.path,
+            changelog_index_path=(
+                pathlib.Path(self.args.cache_dir).joinpath(
+                    CHANGELOG_INDEX_DIR)
+                if self.args.cache_dir
+                else None))
 
     @property  # type:ignore
     @abstracts.interfacemethod
@@ -267,6 +295,21 @@ class ACodeChecker(
         parser.add_argument("--owners")
         parser.add_argument("--extensions_build_config")
         parser.add_argument("--extensions_fuzzed_count")
+        parser.add_argument(
+            "--cache_dir",
+            help=(
+                "Directory to cache file check results and parsed changelogs "
+                "in, only files that have changed are checked again"))
+        parser.add_argument(
+            "--async_subprocess",
+            action="store_true",
+            help=(
+                "Run subprocesses (eg `git`, `gofmt`, `shellcheck`) from the "
+                "event loop, rather than in the process pool"))
+        parser.add_argument(
+            "--glint_backend",
+            choices=GLINT_BACKENDS,
+            default="grep")
 
     async def check_changelog(self):
         for changelog in self.changelog:
@@ -427,6 +470,7 @@ class ACodeChecker(
 
     def _check_output(
             self,
+            name: str,
             check_files: Set[str],
             problem_files: typing.ProblemDict) -> None:
         # This can be slow/blocking for large result sets, run
@@ -434,24 +478,27 @@ class ACodeChecker(
         for path in sorted(check_files):
             if path not in problem_files:
                 self.succeed(
-                    self.active_check,
+                    name,
                     [path])
                 continue
             if problem_files[path].errors:
                 self.error(
-                    self.active_check,
+                    name,
                     problem_files[path].errors)
             if problem_files[path].warnings:
                 self.warn(
-                    self.active_check,
+                    name,
                     problem_files[path].warnings)
 
     async def _code_check(self, check: "interface.IFileCodeCheck") -> None:
+        # The active check is resolved here, as the executor thread does
+        # not see the context of the check's task.
         await self.loop.run_in_executor(
             None,
             self._check_output,
-            await check.files,
-            await check.problem_files)
+            self.active_check,
+            await check.all_files,
+            await check.all_problem_files)
 
     def _grep_re(self, arg: Optional[str]) -> Optional[Pattern[str]]:
         # When using system `grep` we want to filter out at least some
@@ -3,11 +3,12 @@ import io
 import logging
 import os
 import pathlib
-from functools import cached_property, lru_cache
-from typing import Dict, List, Set, Tuple
+from functools import cached_property, lru_cache, partial
+from typing import Dict, List, Set, Tuple, Union
 
 from flake8.main.application import Application  # type:ignore
 from flake8 import (  # type:ignore
+    __version__ as flake8_version,
     utils as flake8_utils,
     checker as flake8_checker)
 
@@ -50,6 +51,10 @@ class Flake8Application(Application):
             in self.output_fd.read().strip().split("\n")
             if x]
         self._formatter_stop()
+        # The formatter closes the output on stop, replace it so that the
+        # app can be reused.
+        self.__dict__.pop("output_fd", None)
+        self.formatter.output_fd = self.output_fd
 
 
 class Flake8App:
@@ -145,6 +150,17 @@ class Flake8App:
         return match
 
 
+@lru_cache
+def flake8_app(path: str, args: Tuple[str, ...]) -> Flake8App:
+    """Cached `Flake8App` for the current (worker) process.
+
+    Initializing flake8 (plugin discovery, option parsing and config
+    loading) is expensive, so an app is reused for subsequent batches with
+    the same `path` and `args`.
+    """
+    return Flake8App(path, args)
+
+
 @abstracts.implementer(interface.IFlake8Check)
 class AFlake8Check(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
     """Flake8 check for a fileset."""
@@ -154,11 +170,11 @@ class AFlake8Check(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
             cls,
             path: str,
             args: Tuple[str, ...],
-            files: Set[str]) -> List[str]:
+            *files: str) -> List[str]:
         """Flake8 checker."""
-        return Flake8App(
+        return flake8_app(
             path,
-            args).run_checks(files)
+            args).run_checks(set(files))
 
     @classmethod
     def filter_flake8_files(
@@ -167,10 +183,14 @@ class AFlake8Check(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
             args: Tuple[str, ...],
             files: Set[str]) -> Set[str]:
         """Flake8 file discovery."""
-        return Flake8App(
+        return flake8_app(
             path,
             args).include_files(files)
 
+    @property
+    def cache_config(self) -> Tuple[Union[str, pathlib.Path], ...]:
+        return flake8_version, self.flake8_config_path
+
     @async_property
     async def checker_files(self) -> Set[str]:
         return await self.execute(
@@ -182,8 +202,11 @@ class AFlake8Check(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
     @property
     def flake8_args(self) -> Tuple[str, ...]:
         """Flake configuration args."""
+        # Checks are batched across processes, so flake8 should not
+        # spawn its own.
         return (
             "--color=never",
+            "--jobs=1",
             "--config",
             str(self.flake8_config_path),
             str(self.directory.path))
@@ -198,14 +221,18 @@ class AFlake8Check(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
         """Flake8 error list for check files."""
         # Important dont send an empty set to the flake8 checker,
         # as flake8 will check every file in path.
-        return (
-            await self.execute(
+        if not (files := await self.files):
+            return []
+        errors: List[str] = []
+        batches = self.execute_in_batches(
+            partial(
                 self.check_flake8_files,
                 self.directory.absolute_path,
-                self.flake8_args,
-                await self.files)
-            if await self.files
-            else [])
+                self.flake8_args),
+            *files)
+        async for batch in batches:
+            errors.extend(batch)
+        return errors
 
     @async_property(cache=True)
     async def problem_files(self) -> typing.ProblemDict:
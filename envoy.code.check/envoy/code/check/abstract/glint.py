@@ -1,10 +1,12 @@
 
 import asyncio
+import mmap
+import os
 import re
 from functools import cached_property, partial
 from typing import (
     Callable, Iterable, Iterator,
-    Pattern, Set, Tuple)
+    Pattern, Set, Tuple, Union)
 
 import abstracts
 
@@ -23,6 +25,7 @@ NOGLINT_RE = (
     r"^test/[\w/]*_corpus/[\w/]*",
     r"^tools/[\w/]*_corpus/[\w/]*",
     r"[\w/]*password_protected_password.txt$")
+GLINT_BACKENDS = ("grep", "native")
 
 
 @abstracts.implementer(directory.IDirectoryContext)
@@ -46,14 +49,94 @@ class NewlineChecker(directory.ADirectoryContext):
             == b'\n')
 
 
+@abstracts.implementer(directory.IDirectoryContext)
+class GlintScanner(directory.ADirectoryContext):
+    """Single-pass glint scanner.
+
+    Each file is read once, and checked for a final newline, mixed
+    preceeding tabs/spaces, and trailing whitespace.
+
+    As with `grep -I`, files containing null bytes are treated as binary,
+    and are only checked for a final newline.
+    """
+
+    @cached_property
+    def preceeding_space_re(self) -> Pattern[bytes]:
+        return re.compile(rb"^ ", re.MULTILINE)
+
+    @cached_property
+    def preceeding_tab_re(self) -> Pattern[bytes]:
+        return re.compile(rb"^\t", re.MULTILINE)
+
+    @cached_property
+    def trailing_whitespace_re(self) -> Pattern[bytes]:
+        return re.compile(rb"[ \t]$", re.MULTILINE)
+
+    @debug.logging(
+        log=__name__,
+        show_cpu=True)
+    def scan(self, paths: Iterable[str]) -> typing.GlintProblemsTuple:
+        """Scan files for glint problems."""
+        no_newline: Set[str] = set()
+        mixed_tabs: Set[str] = set()
+        trailing_whitespace: Set[str] = set()
+        with self.in_directory:
+            for path in paths:
+                newline, tabs, whitespace = self.scan_file(path)
+                if newline:
+                    no_newline.add(path)
+                if tabs:
+                    mixed_tabs.add(path)
+                if whitespace:
+                    trailing_whitespace.add(path)
+        return no_newline, mixed_tabs, trailing_whitespace
+
+    def scan_content(
+            self,
+            content: Union[bytes, mmap.mmap]) -> Tuple[bool, bool, bool]:
+        """Scan file content, returning flags for a missing final newline,
+        mixed preceeding tabs, and trailing whitespace respectively."""
+        no_newline = content[-1:] != b"\n"
+        if content.find(b"\0") != -1:
+            return no_newline, False, False
+        return (
+            no_newline,
+            bool(
+                self.preceeding_tab_re.search(content)
+                and self.preceeding_space_re.search(content)),
+            bool(self.trailing_whitespace_re.search(content)))
+
+    def scan_file(self, path: str) -> Tuple[bool, bool, bool]:
+        """Scan a file, mapping it into memory rather than reading it."""
+        with open(path, "rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                return False, False, False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                return self.scan_content(content)
+
+
 @abstracts.implementer(interface.IGlintCheck)
 class AGlintCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
+    """Glint checker.
+
+    By default files are checked with `grep`. Setting `backend` to `native`
+    scans each file once with the `GlintScanner` instead.
+    """
 
     @classmethod
     def no_newlines(cls, path: str, *paths: str) -> Set[str]:
         """Check files for final newline."""
         return NewlineChecker(path).no_newlines(paths)
 
+    @classmethod
+    def scan(cls, path: str, *paths: str) -> typing.GlintProblemsTuple:
+        """Scan files for all glint problems."""
+        return GlintScanner(path).scan(paths)
+
+    def __init__(self, *args, **kwargs) -> None:
+        self.backend = kwargs.pop("backend", None) or "grep"
+        super().__init__(*args, **kwargs)
+
     @classmethod
     def filter_files(
             cls, files: Set[str],
@@ -76,14 +159,16 @@ class AGlintCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
         """Files with mixed preceeding tabs and spaces."""
         return await self.directory.grep(
             ["-lP", r"^ "],
-            target=await self.files_with_preceeding_tabs)
+            target=await self.files_with_preceeding_tabs,
+            stream=True)
 
     @async_property
     async def files_with_preceeding_tabs(self) -> Set[str]:
         """Files with preceeding tabs."""
         return await self.directory.grep(
             ["-lP", r"^\t"],
-            target=await self.files)
+            target=await self.files,
+            stream=True)
 
     @async_property
     async def files_with_no_newline(self) -> Set[str]:
@@ -96,33 +181,55 @@ class AGlintCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
             no_newline |= batch
         return no_newline
 
+    @async_property
+    async def files_scanned(self) -> typing.GlintProblemsTuple:
+        """Files with no final newline, mixed tabs, or trailing whitespace,
+        found with a single pass of the native scanner."""
+        no_newline: Set[str] = set()
+        mixed_tabs: Set[str] = set()
+        trailing_whitespace: Set[str] = set()
+        batched = self.execute_in_batches(
+            partial(self.scan, self.directory.path),
+            *await self.files)
+        async for newline, tabs, whitespace in batched:
+            no_newline |= newline
+            mixed_tabs |= tabs
+            trailing_whitespace |= whitespace
+        return no_newline, mixed_tabs, trailing_whitespace
+
     @async_property
     async def files_with_trailing_whitespace(self) -> Set[str]:
         """Files with trailing whitespace."""
         return await self.directory.grep(
             ["-lE", "[[:blank:]]$"],
-            target=await self.files)
+            target=await self.files,
+            stream=True)
 
     @cached_property
     def noglint_re(self) -> Pattern[str]:
         """Regex for matching files that should not be checked."""
         return re.compile(r"|".join(NOGLINT_RE))
 
+    @property
+    def native(self) -> bool:
+        """Use the native scanner rather than `grep`."""
+        return self.backend == "native"
+
     @async_property(cache=True)
     async def problem_files(self) -> typing.ProblemDict:
-        return (
-            await self._check_problems(
-                await asyncio.gather(
-                    self.files_with_no_newline,
-                    self.files_with_mixed_tabs,
-                    self.files_with_trailing_whitespace))
-            if await self.files
-            else {})
+        if not await self.files:
+            return {}
+        return await self._check_problems(
+            await self.files_scanned
+            if self.native
+            else await asyncio.gather(
+                self.files_with_no_newline,
+                self.files_with_mixed_tabs,
+                self.files_with_trailing_whitespace))
 
     async def _check_problems(
             self,
-            problems: Tuple[
-                Set[str], Set[str], Set[str]]) -> typing.ProblemDict:
+            problems: typing.GlintProblemsTuple) -> typing.ProblemDict:
         return {
             path: checker.Problems(
                 errors=list(self._check_path(path, *problems)))
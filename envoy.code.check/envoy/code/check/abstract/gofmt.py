@@ -5,7 +5,7 @@ import shutil
 import subprocess
 from functools import cached_property, partial
 from typing import (
-    Optional, Pattern)
+    Optional, Pattern, Tuple, Union)
 
 import abstracts
 
@@ -119,6 +119,15 @@ class AGofmtCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
         """Run gofmt on files."""
         return Gofmt(path)(*args)
 
+    @classmethod
+    async def gofmt_async(cls, path: str, *args) -> typing.ProblemDict:
+        """Run gofmt on files, from the event loop."""
+        return await Gofmt(path).run_async(*args)
+
+    @property
+    def cache_config(self) -> Tuple[Union[str, pathlib.Path], ...]:
+        return (pathlib.Path(self.gofmt_command), )
+
     @async_property
     async def checker_files(self) -> set[str]:
         return self.filter_files(
@@ -211,7 +220,9 @@ class AGofmtCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
     def _gofmt(self, *args: str) -> partial:
         """Partial with gofmt command and args."""
         return partial(
-            self.gofmt,
+            (self.gofmt_async
+             if self.async_subprocess
+             else self.gofmt),
             self.directory.path,
             self.gofmt_command,
             *args)
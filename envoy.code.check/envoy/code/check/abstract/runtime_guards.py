@@ -1,12 +1,10 @@
 
-import re
 from functools import cached_property
-from typing import (
-    AsyncIterator, Awaitable, Iterable, Optional, Pattern, Set, Tuple)
+from typing import AsyncIterator, Optional, Set, Tuple
 
 import abstracts
 
-from aio.core.functional import async_property
+from aio.core.functional import async_property, AwaitableGenerator
 
 from envoy.code.check import abstract, interface
 
@@ -20,7 +18,6 @@ EXPECTED_MISSING_GUARDS = (
     "envoy_reloadable_features_postpone_h3_client_connect_to_next_loop",
     "envoy_reloadable_features_test_feature_true")
 RELOADABLE_GUARD_GREP_RE = r"^RUNTIME_GUARD\(envoy_reloadable"
-RELOADABLE_MATCH_RE = r"``envoy.reloadable[._][a-z0-9_.]+``"
 RUNTIME_GUARDS_CONFIG_PATH = "source/common/runtime/runtime_features.cc"
 
 
@@ -32,10 +29,10 @@ class ARuntimeGuardsCheck(
 
     @async_property(cache=True)
     async def configured(self) -> Set[str]:
-        return set(
-            line.split(":")[1][14:-2]
-            for line
-            in await self._grepped)
+        configured = set()
+        async for line in self._grepped:
+            configured.add(line.split(":")[1][14:-2])
+        return configured
 
     @cached_property
     def expected_missing(self) -> Set[str]:
@@ -43,10 +40,9 @@ class ARuntimeGuardsCheck(
 
     @async_property
     async def mentioned(self) -> Set[str]:
-        mentioned = set()
-        async for change in self._changes:
-            mentioned |= self._find_mention(change)
-        return mentioned
+        # Mentions are indexed with the changelogs, so only changelogs that
+        # have changed since they were indexed are parsed.
+        return await self.project.changelogs.runtime_guards
 
     @async_property(cache=True)
     async def missing(self) -> Set[str]:
@@ -55,10 +51,6 @@ class ARuntimeGuardsCheck(
             - await self.mentioned
             - self.expected_missing)
 
-    @cached_property
-    def reloadable_match_re(self) -> Pattern:
-        return re.compile(RELOADABLE_MATCH_RE)
-
     @async_property
     async def status(self) -> AsyncIterator[Tuple[str, Optional[bool]]]:
         for guard in sorted(await self.configured):
@@ -69,23 +61,9 @@ class ARuntimeGuardsCheck(
             else:
                 yield guard, True
 
-    @async_property
-    async def _changes(self) -> AsyncIterator[str]:
-        for changelog in self.project.changelogs.values():
-            for section, data in (await changelog.data).items():
-                if section == "date":
-                    continue
-                for change in data:
-                    yield change["change"]
-
     @property
-    def _grepped(self) -> Awaitable[Iterable[str]]:
+    def _grepped(self) -> AwaitableGenerator:
         return self.directory.grep(
             ["-E", RELOADABLE_GUARD_GREP_RE],
-            RUNTIME_GUARDS_CONFIG_PATH)
-
-    def _find_mention(self, change: str) -> Set[str]:
-        return set(
-            m.strip("`").replace(".", "_")
-            for m
-            in self.reloadable_match_re.findall(change))
+            RUNTIME_GUARDS_CONFIG_PATH,
+            stream=True)
@@ -4,7 +4,8 @@ import re
 import shutil
 import subprocess
 from functools import cached_property, partial
-from typing import Iterator, List, Optional, Pattern, Set, Tuple, TypedDict
+from typing import (
+    Iterator, List, Optional, Pattern, Set, Tuple, TypedDict, Union)
 
 import abstracts
 
@@ -134,6 +135,18 @@ class AShellcheckCheck(
         """Run shellcheck on files."""
         return Shellcheck(path)(*args)
 
+    @classmethod
+    async def run_shellcheck_async(
+            cls,
+            path: str,
+            *args) -> typing.ProblemDict:
+        """Run shellcheck on files, from the event loop."""
+        return await Shellcheck(path).run_async(*args)
+
+    @property
+    def cache_config(self) -> Tuple[Union[str, pathlib.Path], ...]:
+        return (pathlib.Path(self.shellcheck_command), )
+
     @async_property
     async def checker_files(self) -> Set[str]:
         return (
@@ -179,7 +192,8 @@ class AShellcheckCheck(
         others, eg md/rst, that may have such lines for other reasons."""
         return await self.directory.grep(
             ["-lE", self.shebang_re_expr],
-            target=await self._possible_shebang_files)
+            target=await self._possible_shebang_files,
+            stream=True)
 
     @property
     def shebang_re_expr(self) -> str:
@@ -200,7 +214,9 @@ class AShellcheckCheck(
     def shellcheck_executable(self) -> partial:
         """Partial with shellcheck command and args."""
         return partial(
-            self.run_shellcheck,
+            (self.run_shellcheck_async
+             if self.async_subprocess
+             else self.run_shellcheck),
             self.directory.path,
             self.shellcheck_command,
             "-x")
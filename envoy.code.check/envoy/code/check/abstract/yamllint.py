@@ -4,9 +4,10 @@ import pathlib
 from functools import cached_property, partial
 from typing import (
     AsyncIterator, Dict, Generator, Iterator, List, Optional,
-    Set, Tuple)
+    Set, Tuple, Union)
 
 import yaml
+import yamllint  # type:ignore
 from yamllint import linter  # type:ignore
 from yamllint.config import YamlLintConfig  # type:ignore
 
@@ -98,6 +99,10 @@ class AYamllintCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
             *args) -> Tuple["typing.YamllintProblemTuple", ...]:
         return YamllintFilesCheck(root_path, config, *args).run_checks()
 
+    @property
+    def cache_config(self) -> Tuple[Union[str, pathlib.Path], ...]:
+        return yamllint.__version__, self.config_path
+
     @async_property
     async def checker_files(self) -> Set[str]:
         return set(
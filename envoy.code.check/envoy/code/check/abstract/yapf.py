@@ -2,7 +2,8 @@
 import os
 import pathlib
 from functools import partial
-from typing import AsyncIterator, Iterable, Iterator, Optional, Set, Tuple
+from typing import (
+    AsyncIterator, Iterable, Iterator, Optional, Set, Tuple, Union)
 
 import yapf  # type:ignore
 
@@ -116,6 +117,10 @@ class AYapfCheck(abstract.AFileCodeCheck, metaclass=abstracts.Abstraction):
         """Run Yapf checks on provided file list."""
         return YapfFormatCheck(root_path, config_path, fix, *args).run_checks()
 
+    @property
+    def cache_config(self) -> Tuple[Union[str, pathlib.Path], ...]:
+        return yapf.__version__, self.config_path
+
     @async_property
     async def checker_files(self) -> Set[str]:
         # todo: add grep for py shebang files
@@ -11,6 +11,11 @@ from envoy.base.utils import IProject, Project
 from envoy.code.check import abstract, interface
 
 
+@abstracts.implementer(interface.ICodeCheckCache)
+class CodeCheckCache(abstract.ACodeCheckCache):
+    pass
+
+
 @abstracts.implementer(interface.IExtensionsCheck)
 class ExtensionsCheck(abstract.AExtensionsCheck):
     pass
@@ -98,6 +103,10 @@ class ChangelogCheck(abstract.AChangelogCheck):
 @abstracts.implementer(interface.ICodeChecker)
 class CodeChecker(abstract.ACodeChecker):
 
+    @property
+    def cache_class(self):
+        return CodeCheckCache
+
     @property
     def extensions_class(self):
         return ExtensionsCheck
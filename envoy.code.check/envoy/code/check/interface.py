@@ -3,7 +3,8 @@ import asyncio
 import pathlib
 from concurrent import futures
 from typing import (
-    AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple, Type)
+    AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set, Tuple,
+    Type, Union)
 
 from packaging import version as _version
 
@@ -15,6 +16,39 @@ from envoy.base import utils
 from envoy.code.check import typing
 
 
+class ICodeCheckCache(metaclass=abstracts.Interface):
+
+    @classmethod
+    @abstracts.interfacemethod
+    def hash_files(cls, path: str, *paths: str) -> Dict[str, str]:
+        raise NotImplementedError
+
+    def __init__(self, path: Union[str, pathlib.Path]) -> None:
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def fingerprint(self, *config: Union[str, pathlib.Path]) -> str:
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def get(
+            self,
+            name: str,
+            fingerprint: str,
+            hashes: Dict[str, str]) -> "typing.ProblemDict":
+        raise NotImplementedError
+
+    @abstracts.interfacemethod
+    def set(
+            self,
+            name: str,
+            fingerprint: str,
+            hashes: Dict[str, str],
+            files: Iterable[str],
+            problem_files: "typing.ProblemDict") -> None:
+        raise NotImplementedError
+
+
 class ICodeCheck(metaclass=abstracts.Interface):
 
     def __init__(
@@ -23,12 +57,23 @@ class ICodeCheck(metaclass=abstracts.Interface):
             fix: bool = False,
             binaries: Optional[Dict[str, str]] = None,
             loop: Optional[asyncio.AbstractEventLoop] = None,
-            pool: Optional[futures.Executor] = None) -> None:
+            pool: Optional[futures.Executor] = None,
+            cache: Optional[ICodeCheckCache] = None) -> None:
         raise NotImplementedError
 
 
 class IFileCodeCheck(ICodeCheck, metaclass=abstracts.Interface):
 
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    async def all_files(self) -> Set[str]:
+        raise NotImplementedError
+
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    async def all_problem_files(self) -> "typing.ProblemDict":
+        raise NotImplementedError
+
     @property  # type:ignore
     @abstracts.interfacemethod
     async def files(self) -> Set[str]:
@@ -96,7 +141,13 @@ class IFlake8Check(IFileCodeCheck, metaclass=abstracts.Interface):
 
 
 class IGlintCheck(IFileCodeCheck, metaclass=abstracts.Interface):
-    pass
+
+    def __init__(
+            self,
+            directory: _directory.ADirectory,
+            backend: Optional[str] = None,
+            **kwargs) -> None:
+        raise NotImplementedError
 
 
 class IGofmtCheck(IFileCodeCheck, metaclass=abstracts.Interface):
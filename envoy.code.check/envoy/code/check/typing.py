@@ -1,5 +1,5 @@
 
-from typing import Dict, List, Optional, Tuple, TypedDict
+from typing import Dict, List, Optional, Set, Tuple, TypedDict
 
 from aio.run import checker
 
@@ -14,6 +14,16 @@ YapfCheckResultTuple = Tuple[str, YapfResultTuple]
 
 GofmtProblemTuple = Tuple[str, checker.interface.IProblems]
 
+GlintProblemsTuple = Tuple[Set[str], Set[str], Set[str]]
+
+# content hash, errors, warnings
+CodeCheckCacheResultTuple = Tuple[str, List[str], List[str]]
+
+
+class CodeCheckCacheDict(TypedDict):
+    fingerprint: str
+    results: Dict[str, CodeCheckCacheResultTuple]
+
 
 class BaseExtensionMetadataDict(TypedDict):
     categories: List[str]
@@ -5,6 +5,8 @@ import pytest
 
 import abstracts
 
+from aio.run import checker
+
 from envoy.code import check
 
 
@@ -24,8 +26,11 @@ class DummyCodeCheck:
 @pytest.mark.parametrize("binaries", [None, "BINARIES"])
 @pytest.mark.parametrize("pool", [None, "POOL"])
 @pytest.mark.parametrize("loop", [None, "LOOP"])
-async def test_code_check_constructor(fix, binaries, pool, loop):
+@pytest.mark.parametrize("cache", [None, "CACHE"])
+async def test_code_check_constructor(fix, binaries, pool, loop, cache):
     kwargs = {}
+    if cache is not None:
+        kwargs["cache"] = cache
     if fix is not None:
         kwargs["fix"] = fix
     if binaries is not None:
@@ -48,12 +53,24 @@ async def test_code_check_constructor(fix, binaries, pool, loop):
     assert "binaries" not in code_check.__dict__
     assert code_check._loop == loop
     assert code_check._pool == pool
+    assert code_check._cache == cache
+    assert code_check.cache_config == ()
+    assert "cache_config" not in code_check.__dict__
+    assert code_check.cache_key == "DummyCodeCheck"
+    assert "cache_key" not in code_check.__dict__
 
     for iface_prop in ["checker_files", "problem_files"]:
         with pytest.raises(NotImplementedError):
             await getattr(code_check, iface_prop)
 
 
+def test_code_check_async_subprocess():
+    directory = MagicMock()
+    code_check = DummyCodeCheck(directory)
+    assert code_check.async_subprocess == directory.async_subprocess
+    assert "async_subprocess" not in code_check.__dict__
+
+
 @pytest.mark.parametrize(
     "files",
     [set(),
@@ -64,7 +81,7 @@ async def test_code_check_constructor(fix, binaries, pool, loop):
     [set(),
      set(f"F{i}" for i in range(0, 5)),
      set(f"F{i}" for i in range(0, 10))])
-async def test_code_check_files(patches, files, dir_files):
+async def test_code_check_all_files(patches, files, dir_files):
     directory = MagicMock()
     code_check = DummyCodeCheck(directory)
     patched = patches(
@@ -77,19 +94,244 @@ async def test_code_check_files(patches, files, dir_files):
     with patched as (m_files, ):
         checker_files = AsyncMock(return_value=files)
         m_files.side_effect = checker_files
-        result = await code_check.files
+        result = await code_check.all_files
 
     assert (
         result
         == dir_files & files)
     if not dir_files:
         assert not checker_files.called
+    assert (
+        getattr(
+            code_check,
+            check.AFileCodeCheck.all_files.cache_name)[
+                "all_files"]
+        == result)
+
+
+@pytest.mark.parametrize("cache", [True, False])
+async def test_code_check_all_problem_files(patches, cache):
+    code_check = DummyCodeCheck("DIRECTORY")
+    patched = patches(
+        ("AFileCodeCheck.cache",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.cache_fingerprint",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.cache_key",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.cached_files",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.file_hashes",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.files",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.problem_files",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.base")
+    cached = dict(
+        CLEAN=checker.Problems(),
+        ERRORS=checker.Problems(errors=["E"]),
+        WARNINGS=checker.Problems(warnings=["W"]),
+        CHANGED=checker.Problems(errors=["OLD"]))
+    problems = dict(
+        CHANGED=checker.Problems(errors=["NEW"]),
+        OTHER=checker.Problems(errors=["O"]))
+
+    with patched as patchy:
+        (m_cache, m_fingerprint, m_key, m_cached,
+         m_hashes, m_files, m_problems) = patchy
+        if not cache:
+            m_cache.return_value = None
+        m_cached.side_effect = AsyncMock(return_value=cached)
+        m_hashes.side_effect = AsyncMock()
+        m_files.side_effect = AsyncMock()
+        m_problems.side_effect = AsyncMock(return_value=problems)
+        result = await code_check.all_problem_files
+
+    assert (
+        getattr(
+            code_check,
+            check.AFileCodeCheck.all_problem_files.cache_name)[
+                "all_problem_files"]
+        == result)
+    if not cache:
+        assert result == problems
+        assert not m_cached.called
+        assert not m_hashes.called
+        return
+    assert (
+        result
+        == dict(
+            ERRORS=cached["ERRORS"],
+            WARNINGS=cached["WARNINGS"],
+            CHANGED=problems["CHANGED"],
+            OTHER=problems["OTHER"]))
+    assert (
+        m_cache.return_value.set.call_args
+        == [(m_key.return_value,
+             m_fingerprint.return_value,
+             m_hashes.side_effect.return_value,
+             m_files.side_effect.return_value,
+             problems), {}])
+
+
+@pytest.mark.parametrize("fix", [True, False])
+@pytest.mark.parametrize("cache", [None, "CACHE"])
+def test_code_check_cache(fix, cache):
+    code_check = DummyCodeCheck("DIRECTORY", fix=fix, cache=cache)
+    assert (
+        code_check.cache
+        == (cache
+            if not fix
+            else None))
+    assert "cache" not in code_check.__dict__
+
+
+@pytest.mark.parametrize("cache", [True, False])
+def test_code_check_cache_fingerprint(patches, cache):
+    code_check = DummyCodeCheck("DIRECTORY")
+    patched = patches(
+        ("AFileCodeCheck.cache",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.cache_config",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.base")
+
+    with patched as (m_cache, m_config):
+        m_config.return_value = ("C1", "C2")
+        if not cache:
+            m_cache.return_value = None
+        assert (
+            code_check.cache_fingerprint
+            == (m_cache.return_value.fingerprint.return_value
+                if cache
+                else ""))
+
+    assert "cache_fingerprint" in code_check.__dict__
+    if cache:
+        assert (
+            m_cache.return_value.fingerprint.call_args
+            == [("C1", "C2"), {}])
+
+
+@pytest.mark.parametrize("cache", [True, False])
+async def test_code_check_cached_files(patches, cache):
+    code_check = DummyCodeCheck("DIRECTORY")
+    patched = patches(
+        ("AFileCodeCheck.cache",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.cache_fingerprint",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.cache_key",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.file_hashes",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.base")
+
+    with patched as (m_cache, m_fingerprint, m_key, m_hashes):
+        if not cache:
+            m_cache.return_value = None
+        m_hashes.side_effect = AsyncMock()
+        assert (
+            await code_check.cached_files
+            == (m_cache.return_value.get.return_value
+                if cache
+                else {})
+            == getattr(
+                code_check,
+                check.AFileCodeCheck.cached_files.cache_name)[
+                    "cached_files"])
+
+    if not cache:
+        assert not m_hashes.called
+        return
+    assert (
+        m_cache.return_value.get.call_args
+        == [(m_key.return_value,
+             m_fingerprint.return_value,
+             m_hashes.side_effect.return_value), {}])
+
+
+@pytest.mark.parametrize("cache", [True, False])
+@pytest.mark.parametrize("files", [set(), set(f"F{i}" for i in range(0, 5))])
+async def test_code_check_file_hashes(patches, cache, files):
+    directory = MagicMock()
+    code_check = DummyCodeCheck(directory)
+    patched = patches(
+        "partial",
+        ("AFileCodeCheck.all_files",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.cache",
+         dict(new_callable=PropertyMock)),
+        "AFileCodeCheck.execute_in_batches",
+        prefix="envoy.code.check.abstract.base")
+    batches = [
+        dict(F1="H1", F2="H2"),
+        dict(F3="H3")]
+
+    async def batch_iter(*args):
+        for batch in batches:
+            yield batch
+
+    with patched as (m_partial, m_files, m_cache, m_execute):
+        if not cache:
+            m_cache.return_value = None
+        m_files.side_effect = AsyncMock(return_value=files)
+        m_execute.side_effect = batch_iter
+        result = await code_check.file_hashes
+
+    assert (
+        getattr(
+            code_check,
+            check.AFileCodeCheck.file_hashes.cache_name)[
+                "file_hashes"]
+        == result)
+    if not cache or not files:
+        assert result == {}
+        assert not m_execute.called
+        return
+    assert result == dict(F1="H1", F2="H2", F3="H3")
+    assert (
+        m_execute.call_args
+        == [(m_partial.return_value, *files), {}])
+    assert (
+        m_partial.call_args
+        == [(m_cache.return_value.hash_files,
+             str(directory.path)), {}])
+
+
+@pytest.mark.parametrize("cache", [True, False])
+@pytest.mark.parametrize("files", [set(), set(f"F{i}" for i in range(0, 5))])
+async def test_code_check_files(patches, cache, files):
+    code_check = DummyCodeCheck("DIRECTORY")
+    patched = patches(
+        ("AFileCodeCheck.all_files",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.cache",
+         dict(new_callable=PropertyMock)),
+        ("AFileCodeCheck.cached_files",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.base")
+    cached = dict(F1="P1", F3="P3", OTHER="P")
+
+    with patched as (m_files, m_cache, m_cached):
+        if not cache:
+            m_cache.return_value = None
+        m_files.side_effect = AsyncMock(return_value=files)
+        m_cached.side_effect = AsyncMock(return_value=cached)
+        result = await code_check.files
+
     assert (
         getattr(
             code_check,
             check.AFileCodeCheck.files.cache_name)[
                 "files"]
         == result)
+    if not cache or not files:
+        assert result == files
+        assert not m_cached.called
+        return
+    assert result == files - set(cached)
 
 
 @abstracts.implementer(check.AProjectCodeCheck)
@@ -0,0 +1,260 @@
+
+import hashlib
+import json
+import pathlib
+
+import pytest
+
+import abstracts
+
+from aio.run import checker
+
+from envoy.code import check
+
+
+@abstracts.implementer(check.ACodeCheckCache)
+class DummyCodeCheckCache:
+    pass
+
+
+def test_cache_constructor():
+    cache = DummyCodeCheckCache("PATH")
+    assert isinstance(cache, check.interface.ICodeCheckCache)
+    assert cache._path == "PATH"
+    assert cache.path == pathlib.Path("PATH")
+    assert "path" in cache.__dict__
+    assert cache.data == {}
+    assert "data" in cache.__dict__
+    assert (
+        cache.cache_path("NAME")
+        == pathlib.Path("PATH").joinpath("NAME.json"))
+
+
+def test_cache_hash_file(tmp_path):
+    path = tmp_path / "somefile"
+    path.write_bytes(b"SOME CONTENT")
+    assert (
+        DummyCodeCheckCache.hash_file(path)
+        == DummyCodeCheckCache.hash_file(str(path))
+        == hashlib.sha256(b"SOME CONTENT").hexdigest())
+
+
+def test_cache_hash_files(patches):
+    patched = patches(
+        "directory_context",
+        "ACodeCheckCache.hash_file",
+        prefix="envoy.code.check.abstract.cache")
+
+    with patched as (m_ctx, m_hash):
+        m_hash.side_effect = lambda path: f"HASH{path}"
+        assert (
+            DummyCodeCheckCache.hash_files("PATH", "A", "B")
+            == dict(A="HASHA", B="HASHB"))
+
+    assert (
+        m_ctx.call_args
+        == [("PATH", ), {}])
+    assert m_ctx.return_value.__enter__.called
+
+
+def test_cache_fingerprint(tmp_path):
+    cache = DummyCodeCheckCache(tmp_path)
+    config_path = tmp_path / "config"
+    missing_path = tmp_path / "missing"
+    config_path.write_text("CONFIG")
+    fingerprint = cache.fingerprint("V1", config_path, missing_path)
+    assert (
+        fingerprint
+        == cache.fingerprint("V1", config_path, missing_path))
+    assert fingerprint != cache.fingerprint("V2", config_path, missing_path)
+    assert fingerprint != cache.fingerprint(config_path, "V1", missing_path)
+    assert fingerprint != cache.fingerprint("V1", config_path)
+    config_path.write_text("OTHER CONFIG")
+    assert (
+        fingerprint
+        != cache.fingerprint("V1", config_path, missing_path))
+    missing_path.write_text("")
+    assert (
+        cache.fingerprint("V1", config_path, missing_path)
+        != cache.fingerprint("V1", config_path, str(missing_path)))
+
+
+def test_cache_get(patches):
+    cache = DummyCodeCheckCache("PATH")
+    patched = patches(
+        "ACodeCheckCache.load",
+        prefix="envoy.code.check.abstract.cache")
+    results = dict(
+        CLEAN=["H1", [], []],
+        PROBLEMS=["H2", ["E1", "E2"], ["W1"]],
+        CHANGED=["H3", ["E3"], []],
+        NOT_CHECKED=["H4", [], []])
+    hashes = dict(
+        CLEAN="H1",
+        PROBLEMS="H2",
+        CHANGED="CHANGED",
+        NEW="H5")
+
+    with patched as (m_load, ):
+        m_load.return_value = dict(results=results)
+        result = cache.get("NAME", "FINGERPRINT", hashes)
+
+    assert list(result) == ["CLEAN", "PROBLEMS"]
+    assert all(isinstance(p, checker.Problems) for p in result.values())
+    assert result["CLEAN"].errors == []
+    assert result["CLEAN"].warnings == []
+    assert result["PROBLEMS"].errors == ["E1", "E2"]
+    assert result["PROBLEMS"].warnings == ["W1"]
+    assert (
+        m_load.call_args
+        == [("NAME", "FINGERPRINT"), {}])
+
+
+@pytest.mark.parametrize("loaded", [True, False])
+@pytest.mark.parametrize("fingerprint", ["FINGERPRINT", "OTHER"])
+def test_cache_load(patches, loaded, fingerprint):
+    cache = DummyCodeCheckCache("PATH")
+    patched = patches(
+        "ACodeCheckCache._read",
+        prefix="envoy.code.check.abstract.cache")
+    data = dict(fingerprint="FINGERPRINT", results=dict(FOO="BAR"))
+    if loaded:
+        cache.data["NAME"] = data
+
+    with patched as (m_read, ):
+        m_read.return_value = data
+        result = cache.load("NAME", fingerprint)
+
+    assert result is cache.data["NAME"]
+    assert (
+        result
+        == (data
+            if fingerprint == "FINGERPRINT"
+            else dict(fingerprint=fingerprint, results={})))
+    if loaded:
+        assert not m_read.called
+        return
+    assert (
+        m_read.call_args
+        == [("NAME", ), {}])
+
+
+def test_cache_set(patches):
+    cache = DummyCodeCheckCache("PATH")
+    patched = patches(
+        "ACodeCheckCache.load",
+        "ACodeCheckCache._write",
+        prefix="envoy.code.check.abstract.cache")
+    results = dict(
+        UNCHANGED=["H0", ["E0"], []],
+        CHANGED=["OLD", ["OLD_ERROR"], []])
+    hashes = dict(
+        UNCHANGED="H0",
+        CHANGED="H1",
+        CLEAN="H2",
+        PROBLEMS="H3")
+    problems = dict(
+        CHANGED=checker.Problems(warnings=["W1"]),
+        PROBLEMS=checker.Problems(errors=["E3"], warnings=["W3"]),
+        SOURCED=checker.Problems(errors=["E4"]))
+
+    with patched as (m_load, m_write):
+        m_load.return_value = dict(results=results)
+        assert not cache.set(
+            "NAME",
+            "FINGERPRINT",
+            hashes,
+            ["CHANGED", "CLEAN", "PROBLEMS", "UNHASHED"],
+            problems)
+
+    assert (
+        results
+        == dict(
+            UNCHANGED=["H0", ["E0"], []],
+            CHANGED=("H1", [], ["W1"]),
+            CLEAN=("H2", [], []),
+            PROBLEMS=("H3", ["E3"], ["W3"])))
+    assert (
+        m_load.call_args
+        == [("NAME", "FINGERPRINT"), {}])
+    assert (
+        m_write.call_args
+        == [("NAME", ), {}])
+
+
+@pytest.mark.parametrize(
+    "content",
+    [None,
+     "NOT JSON",
+     "[]",
+     json.dumps(dict(fingerprint="FINGERPRINT")),
+     json.dumps(dict(fingerprint=23, results={})),
+     json.dumps(dict(fingerprint="FINGERPRINT", results=[])),
+     json.dumps(dict(fingerprint="FINGERPRINT", results=dict(A="B")))])
+def test_cache__read(tmp_path, content):
+    cache = DummyCodeCheckCache(tmp_path)
+    if content is not None:
+        cache.cache_path("NAME").write_text(content)
+    data = json.loads(content) if content and content[0] == "{" else None
+    assert (
+        cache._read("NAME")
+        == (data
+            if (data
+                and isinstance(data.get("fingerprint"), str)
+                and isinstance(data.get("results"), dict))
+            else dict(fingerprint="", results={})))
+
+
+def test_cache__write(tmp_path):
+    cache_dir = tmp_path / "cache" / "dir"
+    cache = DummyCodeCheckCache(cache_dir)
+    data = dict(
+        fingerprint="FINGERPRINT",
+        results=dict(PATH=("HASH", ["ERROR"], [])))
+    cache.data["NAME"] = data
+    assert not cache._write("NAME")
+    assert (
+        json.loads(cache.cache_path("NAME").read_text())
+        == dict(
+            fingerprint="FINGERPRINT",
+            results=dict(PATH=["HASH", ["ERROR"], []])))
+    assert list(cache_dir.iterdir()) == [cache.cache_path("NAME")]
+
+
+def test_cache__write_fails(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache = DummyCodeCheckCache(cache_dir)
+    cache.data["NAME"] = dict(fingerprint="FINGERPRINT", results=object())
+
+    with pytest.raises(TypeError):
+        cache._write("NAME")
+
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_cache_roundtrip(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "clean.py").write_text("CLEAN")
+    (src / "dirty.py").write_text("DIRTY")
+    cache_dir = tmp_path / "cache"
+    cache = DummyCodeCheckCache(cache_dir)
+    hashes = DummyCodeCheckCache.hash_files(str(src), "clean.py", "dirty.py")
+    assert cache.get("NAME", "FINGERPRINT", hashes) == {}
+    cache.set(
+        "NAME",
+        "FINGERPRINT",
+        hashes,
+        hashes,
+        {"dirty.py": checker.Problems(errors=["dirty.py: ERROR"])})
+
+    cache = DummyCodeCheckCache(cache_dir)
+    result = cache.get("NAME", "FINGERPRINT", hashes)
+    assert result["clean.py"].errors == []
+    assert result["dirty.py"].errors == ["dirty.py: ERROR"]
+    assert DummyCodeCheckCache(cache_dir).get("NAME", "OTHER", hashes) == {}
+
+    (src / "dirty.py").write_text("FIXED")
+    hashes = DummyCodeCheckCache.hash_files(str(src), "clean.py", "dirty.py")
+    result = DummyCodeCheckCache(cache_dir).get("NAME", "FINGERPRINT", hashes)
+    assert list(result) == ["clean.py"]
@@ -1,4 +1,5 @@
 
+import asyncio
 import types
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
@@ -52,6 +53,10 @@ def test_checker_summary_print_summary(patches, glint_errors):
 @abstracts.implementer(check.ACodeChecker)
 class DummyCodeChecker:
 
+    @property
+    def cache_class(self):
+        return super().cache_class
+
     @property
     def changelog_class(self):
         return super().changelog_class
@@ -116,9 +121,10 @@ def test_abstract_checker_constructor(patches, args, kwargs):
         "checker.Checker.__init__",
         prefix="envoy.code.check.abstract.checker")
     iface_props = [
-        "extensions_class", "fs_directory_class", "flake8_class",
-        "git_directory_class", "glint_class", "gofmt_class", "project_class",
-        "runtime_guards_class", "shellcheck_class", "yapf_class",
+        "cache_class", "extensions_class", "fs_directory_class",
+        "flake8_class", "git_directory_class", "glint_class", "gofmt_class",
+        "project_class", "runtime_guards_class", "shellcheck_class",
+        "yapf_class",
         "changelog_class", "yamllint_class"]
 
     with patched as (m_super, ):
@@ -209,10 +215,37 @@ def test_abstract_checker_extensions(iters, patches):
     assert "extensions" in checker.__dict__
 
 
+def test_abstract_checker_glint(iters, patches):
+    checker = DummyCodeChecker()
+    patched = patches(
+        ("ACodeChecker.args",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.directory",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.check_kwargs",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.glint_class",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.checker")
+    kwargs = iters(dict)
+
+    with patched as (m_args, m_dir, m_kwargs, m_tool):
+        m_kwargs.return_value = kwargs
+        assert (
+            checker.glint
+            == m_tool.return_value.return_value)
+
+    kwargs["backend"] = m_args.return_value.glint_backend
+    assert (
+        m_tool.return_value.call_args
+        == [(m_dir.return_value,),
+            kwargs])
+    assert "glint" in checker.__dict__
+
+
 @pytest.mark.parametrize(
     "tool",
-    (("glint",
-      "gofmt",
+    (("gofmt",
       "flake8",
       "yapf",
       "shellcheck",
@@ -490,12 +523,41 @@ def test_abstract_checker_changelog(iters, patches):
     assert "changelog" in checker.__dict__
 
 
+@pytest.mark.parametrize("cache_dir", [None, "", "CACHE_DIR"])
+def test_abstract_checker_cache(patches, cache_dir):
+    checker = DummyCodeChecker()
+    patched = patches(
+        ("ACodeChecker.args",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.cache_class",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.checker")
+
+    with patched as (m_args, m_class):
+        m_args.return_value.cache_dir = cache_dir
+        assert (
+            checker.cache
+            == (m_class.return_value.return_value
+                if cache_dir
+                else None))
+
+    assert "cache" in checker.__dict__
+    if not cache_dir:
+        assert not m_class.called
+        return
+    assert (
+        m_class.return_value.call_args
+        == [(cache_dir, ), {}])
+
+
 def test_abstract_checker_check_kwargs(patches):
     checker = DummyCodeChecker()
     patched = patches(
         "dict",
         ("ACodeChecker.binaries",
          dict(new_callable=PropertyMock)),
+        ("ACodeChecker.cache",
+         dict(new_callable=PropertyMock)),
         ("ACodeChecker.fix",
          dict(new_callable=PropertyMock)),
         ("ACodeChecker.loop",
@@ -504,7 +566,7 @@ def test_abstract_checker_check_kwargs(patches):
          dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.checker")
 
-    with patched as (m_dict, m_bin, m_fix, m_loop, m_pool):
+    with patched as (m_dict, m_bin, m_cache, m_fix, m_loop, m_pool):
         assert (
             checker.check_kwargs
             == m_dict.return_value)
@@ -513,6 +575,7 @@ def test_abstract_checker_check_kwargs(patches):
         m_dict.call_args
         == [(),
             dict(binaries=m_bin.return_value,
+                 cache=m_cache.return_value,
                  fix=m_fix.return_value,
                  loop=m_loop.return_value,
                  pool=m_pool.return_value)])
@@ -547,6 +610,8 @@ def test_abstract_checker_directory_kwargs(patches, all_files):
         "dict",
         ("ACodeChecker.all_files",
          dict(new_callable=PropertyMock)),
+        ("ACodeChecker.args",
+         dict(new_callable=PropertyMock)),
         ("ACodeChecker.changed_since",
          dict(new_callable=PropertyMock)),
         ("ACodeChecker.grep_excluding_re",
@@ -556,7 +621,7 @@ def test_abstract_checker_directory_kwargs(patches, all_files):
         prefix="envoy.code.check.abstract.checker")
 
     with patched as patchy:
-        (m_dict, m_all, m_changed, m_exc_re,
+        (m_dict, m_all, m_args, m_changed, m_exc_re,
          m_match_re) = patchy
         m_all.return_value = all_files
         assert (
@@ -568,7 +633,8 @@ def test_abstract_checker_directory_kwargs(patches, all_files):
         == [(),
             dict(exclude_matcher=m_exc_re.return_value,
                  path_matcher=m_match_re.return_value,
-                 untracked=all_files)])
+                 untracked=all_files,
+                 async_subprocess=m_args.return_value.async_subprocess)])
     if all_files:
         assert not m_dict.return_value.__setitem__.called
         assert not m_changed.called
@@ -632,23 +698,42 @@ def test_abstract_checker_path(patches):
     assert "path" not in checker.__dict__
 
 
-def test_abstract_checker_project(patches):
+@pytest.mark.parametrize("cache_dir", [None, "", "CACHE_DIR"])
+def test_abstract_checker_project(patches, cache_dir):
     checker = DummyCodeChecker()
     patched = patches(
+        "pathlib",
+        ("ACodeChecker.args",
+         dict(new_callable=PropertyMock)),
         ("ACodeChecker.path",
          dict(new_callable=PropertyMock)),
         ("ACodeChecker.project_class",
          dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.checker")
 
-    with patched as (m_path, m_class):
+    with patched as (m_plib, m_args, m_path, m_class):
+        m_args.return_value.cache_dir = cache_dir
         assert (
             checker.project
             == m_class.return_value.return_value)
 
+    index_path = (
+        m_plib.Path.return_value.joinpath.return_value
+        if cache_dir
+        else None)
     assert (
         m_class.return_value.call_args
-        == [(m_path.return_value, ), {}])
+        == [(m_path.return_value, ),
+            dict(changelog_index_path=index_path)])
+    if cache_dir:
+        assert (
+            m_plib.Path.call_args
+            == [(cache_dir, ), {}])
+        assert (
+            m_plib.Path.return_value.joinpath.call_args
+            == [(check.abstract.checker.CHANGELOG_INDEX_DIR, ), {}])
+    else:
+        assert not m_plib.Path.called
     assert "project" in checker.__dict__
 
 
@@ -908,8 +993,6 @@ def test_abstract_checker__check_output(
     checker = DummyCodeChecker()
     patched = patches(
         "sorted",
-        ("ACodeChecker.active_check",
-         dict(new_callable=PropertyMock)),
         "ACodeChecker.error",
         "ACodeChecker.succeed",
         "ACodeChecker.warn",
@@ -943,42 +1026,44 @@ def test_abstract_checker__check_output(
             continue
         problems[f].warnings.append(warning_files[f])
 
-    with patched as (m_sorted, m_active, m_error, m_succeed, m_warning):
+    with patched as (m_sorted, m_error, m_succeed, m_warning):
         m_sorted.return_value = files
         assert not checker._check_output(
-            check_files, problems)
+            "CHECK", check_files, problems)
 
     assert (
         m_sorted.call_args
         == [(check_files, ), {}])
     assert (
         m_error.call_args_list
-        == [[(m_active.return_value, [error_files[error]]), {}]
+        == [[("CHECK", [error_files[error]]), {}]
             for error in errors])
     assert (
         m_warning.call_args_list
-        == [[(m_active.return_value, [warning_files[warning]]), {}]
+        == [[("CHECK", [warning_files[warning]]), {}]
             for warning in warnings])
     assert (
         m_succeed.call_args_list
-        == [[(m_active.return_value, [succeed]), {}]
+        == [[("CHECK", [succeed]), {}]
             for succeed in success])
 
 
 async def test_abstract_checker__code_check(patches):
     checker = DummyCodeChecker()
     patched = patches(
+        ("ACodeChecker.active_check",
+         dict(new_callable=PropertyMock)),
         ("ACodeChecker.loop",
          dict(new_callable=PropertyMock)),
         "ACodeChecker._check_output",
         prefix="envoy.code.check.abstract.checker")
     check = MagicMock()
     files_mock = AsyncMock()
-    check.files = files_mock()
+    check.all_files = files_mock()
     problems_mock = AsyncMock()
-    check.problem_files = problems_mock()
+    check.all_problem_files = problems_mock()
 
-    with patched as (m_loop, m_check):
+    with patched as (m_active, m_loop, m_check):
         execute = AsyncMock()
         m_loop.return_value.run_in_executor = execute
         assert not await checker._code_check(check)
@@ -987,10 +1072,59 @@ async def test_abstract_checker__code_check(patches):
         execute.call_args
         == [(None,
              m_check,
+             m_active.return_value,
              files_mock.return_value,
              problems_mock.return_value), {}])
 
 
+async def test_abstract_checker__code_check_concurrently(patches):
+    checker = DummyCodeChecker()
+    checks = ["python_flake8", "python_yapf"]
+    patched = patches(
+        ("ACodeChecker.check_concurrency",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.checks_to_run",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.flake8",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.log",
+         dict(new_callable=PropertyMock)),
+        ("ACodeChecker.yapf",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.checker")
+    slow = asyncio.Event()
+
+    def code_check(name):
+        tool = MagicMock()
+        files_mock = AsyncMock(return_value={f"{name}.py"})
+        tool.all_files = files_mock()
+
+        async def problem_files():
+            if name == "python_flake8":
+                # Hold the slow check until the fast check has started.
+                await slow.wait()
+            else:
+                slow.set()
+            return {}
+
+        tool.all_problem_files = problem_files()
+        return tool
+
+    with patched as (m_concurrency, m_checks, m_flake8, m_log, m_yapf):
+        m_concurrency.return_value = 2
+        m_checks.return_value = checks
+        m_flake8.return_value = code_check("python_flake8")
+        m_yapf.return_value = code_check("python_yapf")
+        for name in checks:
+            await checker.check_queue.put(name)
+        assert not await checker._run_from_queue_concurrently()
+
+    assert (
+        checker.success
+        == {name: [f"{name}.py"] for name in checks})
+    assert checker.completed_checks == set(checks)
+
+
 @pytest.mark.parametrize("arg", [None, False, (), ["A1"], ["A1", "A2"]])
 def test_abstract_checker__grep_re(patches, arg):
     checker = DummyCodeChecker()
@@ -10,15 +10,16 @@ from envoy.code import check
 
 def test_check_flake8_files(patches):
     patched = patches(
-        "Flake8App",
+        "set",
+        "flake8_app",
         prefix="envoy.code.check.abstract.flake8")
     path = MagicMock()
-    files = MagicMock()
+    files = [f"FILE{i}" for i in range(0, 5)]
     args = MagicMock()
 
-    with patched as (m_app, ):
+    with patched as (m_set, m_app):
         assert (
-            check.AFlake8Check.check_flake8_files(path, args, files)
+            check.AFlake8Check.check_flake8_files(path, args, *files)
             == m_app.return_value.run_checks.return_value)
 
     assert (
@@ -26,12 +27,15 @@ def test_check_flake8_files(patches):
         == [(path, args), {}])
     assert (
         m_app.return_value.run_checks.call_args
-        == [(files, ), {}])
+        == [(m_set.return_value, ), {}])
+    assert (
+        m_set.call_args
+        == [(tuple(files), ), {}])
 
 
 def test_filter_flake8_files(patches):
     patched = patches(
-        "Flake8App",
+        "flake8_app",
         prefix="envoy.code.check.abstract.flake8")
     path = MagicMock()
     files = MagicMock()
@@ -50,6 +54,28 @@ def test_filter_flake8_files(patches):
         == [(files, ), {}])
 
 
+def test_flake8_app(patches):
+    patched = patches(
+        "Flake8App",
+        prefix="envoy.code.check.abstract.flake8")
+    flake8_app = check.abstract.flake8.flake8_app
+    flake8_app.cache_clear()
+
+    with patched as (m_app, ):
+        app = flake8_app("PATH", ("ARG1", "ARG2"))
+        assert app == m_app.return_value
+        assert flake8_app("PATH", ("ARG1", "ARG2")) is app
+        flake8_app("OTHERPATH", ("ARG1", "ARG2"))
+        flake8_app("PATH", ("ARG1", ))
+
+    flake8_app.cache_clear()
+    assert (
+        m_app.call_args_list
+        == [[("PATH", ("ARG1", "ARG2")), {}],
+            [("OTHERPATH", ("ARG1", "ARG2")), {}],
+            [("PATH", ("ARG1", )), {}]])
+
+
 def test_flake8_constructor():
     flake8 = check.AFlake8Check("DIRECTORY")
     assert flake8.directory == "DIRECTORY"
@@ -122,6 +148,7 @@ def test_flake8_flake8_args(patches):
         assert (
             flake8.flake8_args
             == ("--color=never",
+                "--jobs=1",
                 "--config",
                 str(m_config.return_value),
                 str(directory.path)))
@@ -129,6 +156,22 @@ def test_flake8_flake8_args(patches):
     assert "flake8_args" not in flake8.__dict__
 
 
+def test_flake8_cache_config(patches):
+    flake8 = check.AFlake8Check("DIRECTORY")
+    patched = patches(
+        "flake8_version",
+        ("AFlake8Check.flake8_config_path",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.flake8")
+
+    with patched as (m_version, m_config):
+        assert (
+            flake8.cache_config
+            == (m_version, m_config.return_value))
+
+    assert "cache_config" not in flake8.__dict__
+
+
 def test_flake8_flake8_config_path():
     directory = MagicMock()
     flake8 = check.AFlake8Check(directory)
@@ -141,36 +184,57 @@ def test_flake8_flake8_config_path():
     assert "flake8_config_path" not in flake8.__dict__
 
 
-async def test_flake8_flake8_errors(patches):
+@pytest.mark.parametrize("files", [True, False])
+async def test_flake8_flake8_errors(patches, files):
     directory = MagicMock()
     flake8 = check.AFlake8Check(directory)
     patched = patches(
+        "partial",
         ("AFlake8Check.files",
          dict(new_callable=PropertyMock)),
         ("AFlake8Check.flake8_args",
          dict(new_callable=PropertyMock)),
         "AFlake8Check.check_flake8_files",
-        ("AFlake8Check.execute",
-         dict(new_callable=AsyncMock)),
+        "AFlake8Check.execute_in_batches",
         prefix="envoy.code.check.abstract.flake8")
-
-    with patched as (m_files, m_args, m_checks, m_execute):
-        files = AsyncMock()
-        m_files.side_effect = files
+    batched = [
+        [f"ERROR{x}" for x in range(0, 3)],
+        [],
+        [f"ERROR{x}" for x in range(3, 7)]]
+    files = (
+        [f"FILE{i}" for i in range(0, 5)]
+        if files
+        else [])
+
+    async def batch_iter(*x):
+        for batch in batched:
+            yield batch
+
+    with patched as (m_partial, m_files, m_args, m_checks, m_execute):
+        m_files.side_effect = AsyncMock(return_value=files)
+        m_execute.side_effect = batch_iter
         assert (
             await flake8.flake8_errors
-            == m_execute.return_value)
+            == ([f"ERROR{x}" for x in range(0, 7)]
+                if files
+                else []))
 
-    assert (
-        m_execute.call_args
-        == [(m_checks,
-             directory.absolute_path,
-             m_args.return_value,
-             files.return_value), {}])
     assert not (
         hasattr(
             flake8,
             check.AFlake8Check.flake8_errors.cache_name))
+    if not files:
+        assert not m_execute.called
+        assert not m_partial.called
+        return
+    assert (
+        m_execute.call_args
+        == [(m_partial.return_value, *files), {}])
+    assert (
+        m_partial.call_args
+        == [(m_checks,
+             directory.absolute_path,
+             m_args.return_value), {}])
 
 
 def test_flake8_handle_errors(iters, patches):
@@ -607,6 +671,8 @@ def test_flake8application__stop(patches, n):
          dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.flake8")
     app._formatter_stop = MagicMock()
+    app.formatter = MagicMock()
+    app.__dict__["output_fd"] = "OUTPUT"
     results = [
         ("F{i}"
          if i % n
@@ -636,6 +702,8 @@ def test_flake8application__stop(patches, n):
     assert (
         app._results
         == [r for r in results if r])
+    assert "output_fd" not in app.__dict__
+    assert app.formatter.output_fd == m_out.return_value
 
 
 def test_flake8application_make_formatter(patches):
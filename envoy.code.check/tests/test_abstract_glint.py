@@ -29,9 +29,42 @@ async def test_glint_no_newlines(iters, patches):
         == [(tuple(paths), ), {}])
 
 
-def test_glint_constructor():
-    glint = check.AGlintCheck("DIRECTORY")
+async def test_glint_scan(iters, patches):
+    patched = patches(
+        "GlintScanner",
+        prefix="envoy.code.check.abstract.glint")
+    path = MagicMock()
+    paths = iters(cb=lambda i: MagicMock(), count=3)
+
+    with patched as (m_scanner, ):
+        assert (
+            check.AGlintCheck.scan(path, *paths)
+            == m_scanner.return_value.scan.return_value)
+
+    assert (
+        m_scanner.call_args
+        == [(path, ), {}])
+    assert (
+        m_scanner.return_value.scan.call_args
+        == [(tuple(paths), ), {}])
+
+
+@pytest.mark.parametrize("backend", [None, "", "grep", "native"])
+def test_glint_constructor(backend):
+    kwargs = (
+        dict(backend=backend)
+        if backend is not None
+        else {})
+    glint = check.AGlintCheck("DIRECTORY", **kwargs)
     assert glint.directory == "DIRECTORY"
+    assert glint.backend == (backend or "grep")
+
+
+@pytest.mark.parametrize("backend", ["grep", "native", "OTHER"])
+def test_glint_native(backend):
+    glint = check.AGlintCheck("DIRECTORY", backend=backend)
+    assert glint.native == (backend == "native")
+    assert "native" not in glint.__dict__
 
 
 @pytest.mark.parametrize("files", [True, False])
@@ -86,7 +119,7 @@ async def test_glint_files_with_mixed_tabs(patches):
     assert (
         directory.grep.call_args
         == [(["-lP", r"^ "], ),
-            dict(target=tabs.return_value)])
+            dict(target=tabs.return_value, stream=True)])
     assert not (
         hasattr(
             glint,
@@ -112,7 +145,7 @@ async def test_glint_files_with_preceeding_tabs(patches):
     assert (
         directory.grep.call_args
         == [(["-lP", r"^\t"], ),
-            dict(target=files.return_value)])
+            dict(target=files.return_value, stream=True)])
     assert not (
         hasattr(
             glint,
@@ -159,6 +192,45 @@ async def test_glint_files_with_no_newline(patches):
         == [(m_newlines, directory.path), {}])
 
 
+async def test_glint_files_scanned(patches):
+    directory = MagicMock()
+    glint = check.AGlintCheck(directory)
+    patched = patches(
+        "partial",
+        ("AGlintCheck.files",
+         dict(new_callable=PropertyMock)),
+        "AGlintCheck.execute_in_batches",
+        "AGlintCheck.scan",
+        prefix="envoy.code.check.abstract.glint")
+    batched = [
+        ({"A", "B"}, {"C"}, set()),
+        ({"D"}, set(), {"A", "E"}),
+        (set(), {"F"}, {"G"})]
+
+    async def batch_iter(*args):
+        for batch in batched:
+            yield batch
+
+    with patched as (m_partial, m_files, m_execute, m_scan):
+        m_files.side_effect = AsyncMock(
+            [f"FILE{i}" for i in range(0, 5)])
+        m_execute.side_effect = batch_iter
+        assert (
+            await glint.files_scanned
+            == ({"A", "B", "D"}, {"C", "F"}, {"A", "E", "G"}))
+
+    assert not (
+        hasattr(
+            glint,
+            check.AGlintCheck.files_scanned.cache_name))
+    assert (
+        m_execute.call_args
+        == [(m_partial.return_value, *m_files.return_value), {}])
+    assert (
+        m_partial.call_args
+        == [(m_scan, directory.path), {}])
+
+
 async def test_glint__check_problems(patches):
     glint = check.AGlintCheck("DIRECTORY")
     patched = patches(
@@ -215,7 +287,7 @@ async def test_glint_files_with_trailing_whitespace(patches, files):
     assert (
         directory.grep.call_args
         == [(["-lE", r"[[:blank:]]$"], ),
-            dict(target=files.return_value)])
+            dict(target=files.return_value, stream=True)])
     assert not (
         hasattr(
             glint,
@@ -241,12 +313,17 @@ def test_glint_noglint_re(patches):
 
 
 @pytest.mark.parametrize("files", [True, False])
-async def test_glint_problem_files(patches, files):
+@pytest.mark.parametrize("native", [True, False])
+async def test_glint_problem_files(patches, files, native):
     glint = check.AGlintCheck("DIRECTORY")
     patched = patches(
         "asyncio",
+        ("AGlintCheck.native",
+         dict(new_callable=PropertyMock)),
         ("AGlintCheck.files",
          dict(new_callable=PropertyMock)),
+        ("AGlintCheck.files_scanned",
+         dict(new_callable=PropertyMock)),
         ("AGlintCheck.files_with_no_newline",
          dict(new_callable=PropertyMock)),
         ("AGlintCheck.files_with_mixed_tabs",
@@ -257,9 +334,11 @@ async def test_glint_problem_files(patches, files):
         prefix="envoy.code.check.abstract.glint")
 
     with patched as patchy:
-        (m_asyncio, m_files, m_newline, m_tabs,
+        (m_asyncio, m_native, m_files, m_scanned, m_newline, m_tabs,
          m_ws, m_checks) = patchy
+        m_native.return_value = native
         m_files.side_effect = AsyncMock(return_value=files)
+        m_scanned.side_effect = AsyncMock()
         gather = AsyncMock()
         m_asyncio.gather = gather
         assert (
@@ -275,10 +354,21 @@ async def test_glint_problem_files(patches, files):
     if not files:
         assert not m_checks.called
         assert not gather.called
+        assert not m_scanned.called
         assert not m_newline.called
         assert not m_tabs.called
         assert not m_ws.called
         return
+    if native:
+        assert (
+            m_checks.call_args
+            == [(m_scanned.side_effect.return_value, ), {}])
+        assert not gather.called
+        assert not m_newline.called
+        assert not m_tabs.called
+        assert not m_ws.called
+        return
+    assert not m_scanned.called
     assert (
         m_checks.call_args
         == [(gather.return_value, ), {}])
@@ -356,3 +446,93 @@ def test_glint_newline_checker_no_newlines(patches, n):
         m_utils.last_n_bytes_of.call_args_list
         == [[(p, ), {}]
             for p in paths])
+
+
+def test_glint_scanner_constructor():
+    scanner = check.abstract.glint.GlintScanner("PATH")
+    assert isinstance(scanner, directory.IDirectoryContext)
+    assert isinstance(scanner, directory.ADirectoryContext)
+
+
+@pytest.mark.parametrize(
+    "regex",
+    [("preceeding_space_re", rb"^ "),
+     ("preceeding_tab_re", rb"^\t"),
+     ("trailing_whitespace_re", rb"[ \t]$")])
+def test_glint_scanner_regexes(patches, regex):
+    scanner = check.abstract.glint.GlintScanner("PATH")
+    patched = patches(
+        "re",
+        prefix="envoy.code.check.abstract.glint")
+    prop, pattern = regex
+
+    with patched as (m_re, ):
+        assert (
+            getattr(scanner, prop)
+            == m_re.compile.return_value)
+
+    assert (
+        m_re.compile.call_args
+        == [(pattern, m_re.MULTILINE), {}])
+    assert prop in scanner.__dict__
+
+
+def test_glint_scanner_scan(patches):
+    scanner = check.abstract.glint.GlintScanner("PATH")
+    patched = patches(
+        ("GlintScanner.in_directory",
+         dict(new_callable=PropertyMock)),
+        "GlintScanner.scan_file",
+        prefix="envoy.code.check.abstract.glint")
+    results = dict(
+        A=(True, False, False),
+        B=(False, True, True),
+        C=(False, False, False),
+        D=(True, True, False))
+
+    with patched as (m_dir_ctx, m_scan):
+        m_scan.side_effect = lambda path: results[path]
+        assert (
+            scanner.scan(list(results))
+            == ({"A", "D"}, {"B", "D"}, {"B"}))
+
+    assert m_dir_ctx.return_value.__enter__.called
+    assert (
+        m_scan.call_args_list
+        == [[(path, ), {}] for path in results])
+
+
+@pytest.mark.parametrize(
+    "content",
+    [(b"foo\n", (False, False, False)),
+     (b"foo", (True, False, False)),
+     (b"foo \nbar\n", (False, False, True)),
+     (b"foo\t\nbar\n", (False, False, True)),
+     (b"foo\nbar ", (True, False, True)),
+     (b"\tfoo\n\tbar\n", (False, False, False)),
+     (b" foo\n bar\n", (False, False, False)),
+     (b"\tfoo\n bar\n", (False, True, False)),
+     (b"foo\n\tbar\n baz \n", (False, True, True)),
+     (b"foo\0 \n\tbar\n baz \n", (False, False, False)),
+     (b"foo\0", (True, False, False))])
+def test_glint_scanner_scan_content(content):
+    scanner = check.abstract.glint.GlintScanner("PATH")
+    text, expected = content
+    assert scanner.scan_content(text) == expected
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"",
+     b"foo\n",
+     b"foo",
+     b"\tfoo\n bar \n"])
+def test_glint_scanner_scan_file(tmp_path, content):
+    scanner = check.abstract.glint.GlintScanner(tmp_path)
+    path = tmp_path / "somefile"
+    path.write_bytes(content)
+    assert (
+        scanner.scan_file(str(path))
+        == (scanner.scan_content(content)
+            if content
+            else (False, False, False)))
@@ -265,6 +265,29 @@ def test_gofmt_check_gofmt(patches, iters):
         == [tuple(args), {}])
 
 
+async def test_gofmt_check_gofmt_async(patches, iters):
+    gofmt = check.AGofmtCheck("DIRECTORY")
+    patched = patches(
+        "Gofmt",
+        prefix="envoy.code.check.abstract.gofmt")
+    path = MagicMock()
+    args = iters()
+
+    with patched as (m_gofmt, ):
+        run_async = AsyncMock()
+        m_gofmt.return_value.run_async = run_async
+        assert (
+            await gofmt.gofmt_async(path, *args)
+            == run_async.return_value)
+
+    assert (
+        m_gofmt.call_args
+        == [(path, ), {}])
+    assert (
+        run_async.call_args
+        == [tuple(args), {}])
+
+
 @pytest.mark.parametrize(
     "cmd",
     [["diff", "-d"],
@@ -439,6 +462,25 @@ async def test_gofmt_check_go_files(patches, iters):
             == [(".go", ), {}])
 
 
+def test_gofmt_cache_config(patches):
+    gofmt = check.AGofmtCheck("DIRECTORY")
+    patched = patches(
+        "pathlib",
+        ("AGofmtCheck.gofmt_command",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.gofmt")
+
+    with patched as (m_plib, m_command):
+        assert (
+            gofmt.cache_config
+            == (m_plib.Path.return_value, ))
+
+    assert (
+        m_plib.Path.call_args
+        == [(m_command.return_value, ), {}])
+    assert "cache_config" not in gofmt.__dict__
+
+
 @pytest.mark.parametrize("binfile", [True, False])
 @pytest.mark.parametrize("command", [None, False, "", "COMMAND"])
 def test_gofmt_gofmt_command(patches, command, binfile):
@@ -569,24 +611,31 @@ async def test_gofmt_problem_files(patches, iters, fix):
         == [(m_diff, ) + tuple(files), {}])
 
 
-def test_gofmt__gofmt(patches, iters):
+@pytest.mark.parametrize("async_subprocess", [True, False])
+def test_gofmt__gofmt(patches, iters, async_subprocess):
     directory = MagicMock()
     gofmt = check.AGofmtCheck(directory)
     patched = patches(
         "partial",
         "AGofmtCheck.gofmt",
+        "AGofmtCheck.gofmt_async",
+        ("AGofmtCheck.async_subprocess",
+         dict(new_callable=PropertyMock)),
         ("AGofmtCheck.gofmt_command",
          dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.gofmt")
     args = iters()
 
-    with patched as (m_partial, m_gofmt, m_cmd):
+    with patched as (m_partial, m_gofmt, m_gofmt_async, m_async, m_cmd):
+        m_async.return_value = async_subprocess
         assert (
             gofmt._gofmt(*args)
             == m_partial.return_value)
 
     assert (
         m_partial.call_args
-        == [(m_gofmt,
+        == [((m_gofmt_async
+              if async_subprocess
+              else m_gofmt),
              directory.path,
              m_cmd.return_value) + tuple(args), {}])
@@ -1,10 +1,12 @@
 
-import types
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 from envoy.code import check
 
 
+RUNTIME_GUARDS_PATH = check.abstract.runtime_guards.RUNTIME_GUARDS_CONFIG_PATH
+
+
 class _DummyRuntimeGuardsCheck(check.ARuntimeGuardsCheck):
     pass
 
@@ -33,43 +35,26 @@ def test_runtimeguardscheck_constructor(patches):
 async def test_runtimeguardscheck_configured(iters, patches):
     guards = DummyRuntimeGuardsCheck()
     patched = patches(
-        "set",
         ("ARuntimeGuardsCheck._grepped",
          dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.runtime_guards")
-    grepped = iters(cb=lambda i: MagicMock())
+    grepped = [
+        f"{RUNTIME_GUARDS_PATH}:RUNTIME_GUARD(GUARD{i});"
+        for i
+        in range(0, 5)]
+
+    async def iter_grepped():
+        for line in grepped:
+            yield line
 
-    with patched as (m_set, m_grepped):
-        m_grepped.side_effect = AsyncMock(return_value=grepped)
+    with patched as (m_grepped, ):
+        m_grepped.side_effect = iter_grepped
         assert (
             await guards.configured
-            == m_set.return_value
+            == set(f"GUARD{i}" for i in range(0, 5))
             == getattr(
                 guards,
                 check.ARuntimeGuardsCheck.configured.cache_name)["configured"])
-        resultgen = m_set.call_args[0][0]
-        resultlist = list(resultgen)
-
-    assert isinstance(resultgen, types.GeneratorType)
-    assert (
-        resultlist
-        == [(g.split.return_value.__getitem__
-                    .return_value.__getitem__.return_value)
-            for g
-            in grepped])
-    assert (
-        m_set.call_args
-        == [(resultgen, ), {}])
-    for g in grepped:
-        assert (
-            g.split.call_args
-            == [(":", ), {}])
-        assert (
-            g.split.return_value.__getitem__.call_args
-            == [(1, ), {}])
-        assert (
-            g.split.return_value.__getitem__.return_value.__getitem__.call_args
-            == [(slice(14, -2), ), {}])
 
 
 def test_runtimeguardscheck_expected_missing(patches):
@@ -90,28 +75,14 @@ def test_runtimeguardscheck_expected_missing(patches):
     assert "expected_missing" in guards.__dict__
 
 
-async def test_runtimeguardscheck_mentioned(iters, patches):
+async def test_runtimeguardscheck_mentioned():
     guards = DummyRuntimeGuardsCheck()
-    patched = patches(
-        ("ARuntimeGuardsCheck._changes",
-         dict(new_callable=PropertyMock)),
-        "ARuntimeGuardsCheck._find_mention",
-        prefix="envoy.code.check.abstract.runtime_guards")
-
-    def find_mention(x):
-        return iters(set, cb=lambda i: f"X{i}", start=x, count=3)
-
-    async def changes():
-        for x in range(0, 10):
-            yield x
-
-    with patched as (m_changes, m_mention):
-        m_changes.side_effect = changes
-        m_mention.side_effect = find_mention
-        assert (
-            await guards.mentioned
-            == set(f"X{i}" for i in range(0, 12)))
-
+    guards.project = MagicMock()
+    guards.project.changelogs.runtime_guards = AsyncMock(
+        return_value={"GUARD1", "GUARD2"})()
+    assert (
+        await guards.mentioned
+        == {"GUARD1", "GUARD2"})
     assert not hasattr(
         guards,
         check.ARuntimeGuardsCheck.mentioned.cache_name)
@@ -145,24 +116,6 @@ async def test_runtimeguardscheck_missing(patches):
         == [(13, ), {}])
 
 
-def test_runtimeguardscheck_reloadable_match_re(patches):
-    guards = DummyRuntimeGuardsCheck()
-    patched = patches(
-        "re",
-        "RELOADABLE_MATCH_RE",
-        prefix="envoy.code.check.abstract.runtime_guards")
-
-    with patched as (m_re, m_match_re):
-        assert (
-            guards.reloadable_match_re
-            == m_re.compile.return_value)
-
-    assert (
-        m_re.compile.call_args
-        == [(m_match_re, ), {}])
-    assert "reloadable_match_re" in guards.__dict__
-
-
 async def test_runtimeguardscheck_status(iters, patches):
     guards = DummyRuntimeGuardsCheck()
     patched = patches(
@@ -208,41 +161,6 @@ async def test_runtimeguardscheck_status(iters, patches):
         check.ARuntimeGuardsCheck.status.cache_name)
 
 
-async def test_runtimeguardscheck__changes(iters):
-    guards = DummyRuntimeGuardsCheck()
-    guards.project = MagicMock()
-    changelogs = []
-    all_items = []
-    for i in range(0, 5):
-        changelog = MagicMock()
-        data = MagicMock()
-        changelog.data = AsyncMock(return_value=data)()
-        items = {
-            f"K{i}_{x}": iters(cb=lambda i: MagicMock())
-            for x in range(0, 5)}
-        for v in items.values():
-            all_items.extend(v)
-        items["date"] = "DATE"
-        data.items.return_value = items.items()
-        changelogs.append(changelog)
-    guards.project.changelogs.values.return_value = changelogs
-    results = []
-
-    async for result in guards._changes:
-        results.append(result)
-
-    assert (
-        results
-        == [i.__getitem__.return_value for i in all_items])
-    for i in all_items:
-        assert (
-            i.__getitem__.call_args
-            == [("change", ), {}])
-    assert not hasattr(
-        guards,
-        check.ARuntimeGuardsCheck._changes.cache_name)
-
-
 def test_runtimeguardscheck__grepped(patches):
     guards = DummyRuntimeGuardsCheck()
     guards.directory = MagicMock()
@@ -258,44 +176,5 @@ def test_runtimeguardscheck__grepped(patches):
 
     assert (
         guards.directory.grep.call_args
-        == [(["-E", m_re], m_config), {}])
+        == [(["-E", m_re], m_config), dict(stream=True)])
     assert "_grepped" not in guards.__dict__
-
-
-def test_runtimeguardscheck__find_mention(iters, patches):
-    guards = DummyRuntimeGuardsCheck()
-    guards.directory = MagicMock()
-    patched = patches(
-        "set",
-        ("ARuntimeGuardsCheck.reloadable_match_re",
-         dict(new_callable=PropertyMock)),
-        prefix="envoy.code.check.abstract.runtime_guards")
-    change = MagicMock()
-    found = iters(cb=lambda i: MagicMock())
-
-    with patched as (m_set, m_re):
-        m_re.return_value.findall.return_value = found
-        assert (
-            guards._find_mention(change)
-            == m_set.return_value)
-        resultgen = m_set.call_args[0][0]
-        resultlist = list(resultgen)
-
-    assert isinstance(resultgen, types.GeneratorType)
-    assert (
-        resultlist
-        == [f.strip.return_value.replace.return_value
-            for f in found])
-    assert (
-        m_set.call_args
-        == [(resultgen, ), {}])
-    for f in found:
-        assert (
-            f.strip.call_args
-            == [("`", ), {}])
-        assert (
-            f.strip.return_value.replace.call_args
-            == [(".", "_"), {}])
-    assert (
-        m_re.return_value.findall.call_args
-        == [(change, ), {}])
@@ -289,6 +289,28 @@ def test_shellcheck_checker_run_shellcheck(iters, patches):
         == [tuple(args), {}])
 
 
+async def test_shellcheck_checker_run_shellcheck_async(iters, patches):
+    patched = patches(
+        "Shellcheck",
+        prefix="envoy.code.check.abstract.shellcheck")
+    path = MagicMock()
+    args = iters(cb=lambda i: MagicMock())
+
+    with patched as (m_shellcheck, ):
+        run_async = AsyncMock()
+        m_shellcheck.return_value.run_async = run_async
+        assert (
+            await check.AShellcheckCheck.run_shellcheck_async(path, *args)
+            == run_async.return_value)
+
+    assert (
+        m_shellcheck.call_args
+        == [(path, ), {}])
+    assert (
+        run_async.call_args
+        == [tuple(args), {}])
+
+
 def test_shellcheck_checker_constructor():
     shellcheck = check.AShellcheckCheck("DIRECTORY")
     assert shellcheck.directory == "DIRECTORY"
@@ -475,13 +497,32 @@ async def test_shellcheck_shebang_files(patches):
     assert (
         directory.grep.call_args
         == [(['-lE', m_re.return_value], ),
-            dict(target=files.return_value)])
+            dict(target=files.return_value, stream=True)])
     assert not (
         hasattr(
             shellcheck,
             check.AShellcheckCheck.shebang_files.cache_name))
 
 
+def test_shellcheck_cache_config(patches):
+    shellcheck = check.AShellcheckCheck("DIRECTORY")
+    patched = patches(
+        "pathlib",
+        ("AShellcheckCheck.shellcheck_command",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.shellcheck")
+
+    with patched as (m_plib, m_command):
+        assert (
+            shellcheck.cache_config
+            == (m_plib.Path.return_value, ))
+
+    assert (
+        m_plib.Path.call_args
+        == [(m_command.return_value, ), {}])
+    assert "cache_config" not in shellcheck.__dict__
+
+
 @pytest.mark.parametrize("binfile", [True, False])
 @pytest.mark.parametrize("command", [None, False, "", "COMMAND"])
 def test_shellcheck_shellcheck_command(patches, command, binfile):
@@ -531,24 +572,32 @@ def test_shellcheck_shellcheck_command(patches, command, binfile):
             == [("shellcheck", ), {}])
 
 
-def test_shellcheck_shellcheck_executable(patches):
+@pytest.mark.parametrize("async_subprocess", [True, False])
+def test_shellcheck_shellcheck_executable(patches, async_subprocess):
     directory = MagicMock()
     shellcheck = check.AShellcheckCheck(directory)
     patched = patches(
         "partial",
         "AShellcheckCheck.run_shellcheck",
+        "AShellcheckCheck.run_shellcheck_async",
+        ("AShellcheckCheck.async_subprocess",
+         dict(new_callable=PropertyMock)),
         ("AShellcheckCheck.shellcheck_command",
          dict(new_callable=PropertyMock)),
         prefix="envoy.code.check.abstract.shellcheck")
 
-    with patched as (m_partial, m_run, m_command):
+    with patched as patchy:
+        m_partial, m_run, m_run_async, m_async, m_command = patchy
+        m_async.return_value = async_subprocess
         assert (
             shellcheck.shellcheck_executable
             == m_partial.return_value)
 
     assert (
         m_partial.call_args
-        == [(m_run,
+        == [((m_run_async
+              if async_subprocess
+              else m_run),
              directory.path,
              m_command.return_value,
              "-x"), {}])
@@ -270,6 +270,23 @@ def test_yamllint_config(patches):
     assert "config" in yamllint.__dict__
 
 
+def test_yamllint_cache_config(patches):
+    yamllint = check.AYamllintCheck("DIRECTORY")
+    patched = patches(
+        "yamllint",
+        ("AYamllintCheck.config_path",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.yamllint")
+
+    with patched as (m_yamllint, m_config):
+        m_yamllint.__version__ = "VERSION"
+        assert (
+            yamllint.cache_config
+            == ("VERSION", m_config.return_value))
+
+    assert "cache_config" not in yamllint.__dict__
+
+
 def test_yamllint_config_path():
     directory = MagicMock()
     yamllint = check.AYamllintCheck(directory)
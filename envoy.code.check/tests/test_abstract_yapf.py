@@ -298,6 +298,23 @@ async def test_yapf_checker_files(patches, files):
         == [(directory.path, ), {}])
 
 
+def test_yapf_cache_config(patches):
+    yapf = check.AYapfCheck("DIRECTORY")
+    patched = patches(
+        "yapf",
+        ("AYapfCheck.config_path",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.code.check.abstract.yapf")
+
+    with patched as (m_yapf, m_config):
+        m_yapf.__version__ = "VERSION"
+        assert (
+            yapf.cache_config
+            == ("VERSION", m_config.return_value))
+
+    assert "cache_config" not in yapf.__dict__
+
+
 def test_yapf_config_path():
     directory = MagicMock()
     yapf = check.AYapfCheck(directory)
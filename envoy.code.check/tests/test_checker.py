@@ -29,6 +29,8 @@ def test_checker_constructor(patches, args, kwargs):
         m_super.call_args
         == [tuple(args), kwargs])
 
+    assert checker.cache_class == check.CodeCheckCache
+    assert "cache_class" not in directory.__dict__
     assert checker.fs_directory_class == directory.Directory
     assert "fs_directory_class" not in directory.__dict__
     assert checker.extensions_class == check.ExtensionsCheck
@@ -79,6 +81,7 @@ def test_checker_path(patches):
     [check.ChangelogChangesChecker,
      check.ChangelogCheck,
      check.ChangelogStatus,
+     check.CodeCheckCache,
      check.ExtensionsCheck,
      check.Flake8Check,
      check.GlintCheck,
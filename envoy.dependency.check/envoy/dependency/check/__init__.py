@@ -4,6 +4,7 @@ from .abstract import (
     ADependency,
     ADependencyChecker,
     ADependencyCVE,
+    ADependencyCVEIndex,
     ADependencyCVEs,
     ADependencyGithubRelease,
     AGithubDependencyReleaseIssue,
@@ -12,6 +13,7 @@ from .checker import (
     Dependency,
     DependencyChecker,
     DependencyCVE,
+    DependencyCVEIndex,
     DependencyCVEs,
     DependencyGithubRelease,
     GithubDependencyIssuesTracker,
@@ -26,6 +28,7 @@ __all__ = (
     "ADependency",
     "ADependencyChecker",
     "ADependencyCVE",
+    "ADependencyCVEIndex",
     "ADependencyCVEs",
     "ADependencyGithubRelease",
     "AGithubDependencyReleaseIssue",
@@ -35,6 +38,7 @@ __all__ = (
     "Dependency",
     "DependencyChecker",
     "DependencyCVE",
+    "DependencyCVEIndex",
     "DependencyCVEs",
     "DependencyGithubRelease",
     "GithubDependencyIssuesTracker",
@@ -2,6 +2,7 @@
 from .checker import ADependencyChecker
 from .cves import (
     ADependencyCVE,
+    ADependencyCVEIndex,
     ADependencyCVEs)
 from .dependency import ADependency
 from .issues import (
@@ -14,6 +15,7 @@ __all__ = (
     "ADependency",
     "ADependencyChecker",
     "ADependencyCVE",
+    "ADependencyCVEIndex",
     "ADependencyCVEs",
     "ADependencyGithubRelease",
     "AGithubDependencyReleaseIssue",
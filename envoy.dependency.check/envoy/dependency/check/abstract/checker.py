@@ -49,10 +49,18 @@ class ADependencyChecker(
             return pathlib.Path(self.args.github_token).read_text().strip()
         return os.getenv('GITHUB_TOKEN')
 
+    @property
+    def cve_cache(self) -> Optional[str]:
+        return self.args.cve_cache
+
     @property
     def cve_config(self):
         return self.args.cve_config
 
+    @property
+    def cve_index(self) -> Optional[str]:
+        return self.args.cve_index
+
     @cached_property
     def cves(self) -> "abstract.ADependencyCVEs":
         return self.cves_class(
@@ -61,7 +69,9 @@ class ADependencyChecker(
             preloaded_cve_data=self.preloaded_cve_data,
             session=self.session,
             loop=self.loop,
-            pool=self.pool)
+            pool=self.pool,
+            cve_cache=self.cve_cache,
+            cve_index=self.cve_index)
 
     @property  # type:ignore
     @abstracts.interfacemethod
@@ -118,7 +128,22 @@ class ADependencyChecker(
         """Github API."""
         return _github.GithubAPI(
             self.session, "",
-            oauth_token=self.access_token)
+            oauth_token=self.access_token,
+            cache=self.github_cache,
+            scheduler=self.github_scheduler)
+
+    @cached_property
+    def github_cache(self) -> Optional[_github.IGithubResponseCache]:
+        """Persistent cache of Github API responses, if a path is set."""
+        return (
+            _github.GithubResponseCache(self.args.github_cache)
+            if self.args.github_cache
+            else None)
+
+    @property
+    def github_concurrency(self) -> Optional[int]:
+        """Maximum number of concurrent Github API requests."""
+        return self.args.github_concurrency
 
     @cached_property
     def github_dependencies(self) -> Tuple["abstract.ADependency", ...]:
@@ -137,6 +162,16 @@ class ADependencyChecker(
                 deps.append(dep)
         return tuple(deps)
 
+    @cached_property
+    def github_scheduler(self) -> _github.IGithubRequestScheduler:
+        """Github request scheduler, shared by all Github API requests.
+
+        Limits concurrent requests, and backs off when rate-limited, so
+        that dependencies can be checked concurrently.
+        """
+        return _github.GithubRequestScheduler(
+            limit=self.github_concurrency)
+
     @cached_property
     def issues(self) -> _github.IGithubIssuesTracker:
         """Dependency issues."""
@@ -169,9 +204,13 @@ class ADependencyChecker(
     def add_arguments(self, parser: argparse.ArgumentParser) -> None:
         super().add_arguments(parser)
         parser.add_argument('--github_token')
+        parser.add_argument('--github_cache')
+        parser.add_argument('--github_concurrency', type=int)
         parser.add_argument('--repository_locations')
+        parser.add_argument('--cve_cache')
         parser.add_argument('--cve_config')
         parser.add_argument('--cve_data')
+        parser.add_argument('--cve_index')
         parser.add_argument('--download_cves')
 
     async def check_cves(self) -> None:
@@ -407,10 +446,12 @@ class ADependencyChecker(
         unless=["releases", "release_issues"],
         catches=[ConcurrentError, gidgethub.GitHubException])
     async def preload_release_dates(self) -> None:
+        # Github requests are limited by the `github_scheduler`.
         preloader = inflate(
             self.github_dependencies,
             lambda d: (
-                d.release.date, ))
+                d.release.date, ),
+            limit=-1)
         async for dep in preloader:
             self.log.debug(f"Preloaded release date: {dep.id}")
 
@@ -438,11 +479,13 @@ class ADependencyChecker(
         blocks=["release_dates"],
         catches=[ConcurrentError, gidgethub.GitHubException])
     async def preload_releases(self) -> None:
+        # Github requests are limited by the `github_scheduler`.
         preloader = inflate(
             self.github_dependencies,
             lambda d: (
                 d.newer_release,
-                d.recent_commits))
+                d.recent_commits),
+            limit=-1)
         async for dep in preloader:
             self.log.debug(f"Preloaded release data: {dep.id}")
 
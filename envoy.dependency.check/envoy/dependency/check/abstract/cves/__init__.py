@@ -1,8 +1,10 @@
 
 from .cve import ADependencyCVE
 from .cves import ADependencyCVEs
+from .index import ADependencyCVEIndex
 
 
 __all__ = (
     "ADependencyCVE",
+    "ADependencyCVEIndex",
     "ADependencyCVEs")
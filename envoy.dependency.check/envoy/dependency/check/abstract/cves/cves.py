@@ -8,7 +8,9 @@ import tarfile
 from collections import defaultdict
 from concurrent import futures
 from functools import cached_property
-from typing import AsyncIterator, List, Optional, Tuple, Type
+from typing import (
+    AsyncIterator, Awaitable, Dict, Iterable, Iterator, List, Optional, Set,
+    Tuple, Type, cast)
 
 import aiohttp
 
@@ -19,7 +21,9 @@ from aio.core import event
 from aio.core.functional import (
     async_property,
     AwaitableGenerator,
-    qdict)
+    qdict,
+    QueryDict)
+from aio.core.tasks import concurrent
 
 from envoy.base import utils
 from envoy.dependency.check import abstract, typing
@@ -38,13 +42,17 @@ class ADependencyCVEs(event.AReactive, metaclass=abstracts.Abstraction):
             preloaded_cve_data: Optional[str] = None,
             session: Optional[aiohttp.ClientSession] = None,
             loop: Optional[asyncio.AbstractEventLoop] = None,
-            pool: Optional[futures.Executor] = None) -> None:
+            pool: Optional[futures.Executor] = None,
+            cve_cache: Optional[str] = None,
+            cve_index: Optional[str] = None) -> None:
         self.dependencies = dependencies
         self._config_path = config_path
         self._preloaded_cve_data = preloaded_cve_data
         self._session = session
         self._loop = loop
         self._pool = pool
+        self._cve_cache = cve_cache
+        self._cve_index = cve_index
 
     @cached_property
     def config(self) -> "typing.CVEConfigDict":
@@ -74,6 +82,11 @@ class ADependencyCVEs(event.AReactive, metaclass=abstracts.Abstraction):
     def cpe_revmap(self) -> "nist.typing.CPERevmapDict":
         return defaultdict(set)
 
+    @property
+    def cve_cache(self) -> Optional[str]:
+        """Directory to cache NIST CVE feeds, and parsed CVE data, in."""
+        return self._cve_cache
+
     @property  # type:ignore
     @abstracts.interfacemethod
     def cve_class(self) -> Type["abstract.ADependencyCVE"]:
@@ -88,6 +101,28 @@ class ADependencyCVEs(event.AReactive, metaclass=abstracts.Abstraction):
             description="cve/description/description_data/0/value",
             last_modified_date="lastModifiedDate")
 
+    @cached_property
+    def cve_index(self) -> Optional["abstract.ADependencyCVEIndex"]:
+        """Index of parsed CVE data, if an index path is set.
+
+        The index is not used with preloaded CVE data.
+
+        Indexed data is scoped by the configuration of the index parser,
+        which does not include dependency versions.
+        """
+        return (
+            self.cve_index_class(
+                self._cve_index,
+                self.index_parser(()).fingerprint)
+            if self._cve_index and not self.preloaded_cve_data
+            else None)
+
+    @property  # type:ignore
+    @abstracts.interfacemethod
+    def cve_index_class(self) -> Type["abstract.ADependencyCVEIndex"]:
+        """CVE index class."""
+        raise NotImplementedError
+
     @cached_property
     def cves(self) -> "nist.typing.CVEDict":
         return {}
@@ -110,6 +145,10 @@ class ADependencyCVEs(event.AReactive, metaclass=abstracts.Abstraction):
                 yield url
             return
         with self.loader:
+            if self.cve_index:
+                async for url in concurrent(self.indexers(self.cve_index)):
+                    yield url
+                return
             async for url in self.nist_downloader:
                 yield url
             for id, cve in self.nist_downloader.cves.items():
@@ -122,6 +161,14 @@ class ADependencyCVEs(event.AReactive, metaclass=abstracts.Abstraction):
         """List of CVEs to ignore, taken from config file."""
         return self.config.get("ignored_cves", [])
 
+    @property
+    def index_cve_fields(self) -> QueryDict:
+        """CVE fields to index, including the nodes that are required to
+        match dependency versions."""
+        return qdict(
+            **self.cve_fields.query,
+            nodes="configurations/nodes")
+
     @cached_property
     def loader(self) -> event.ILoader:
         return event.Loader()
@@ -135,7 +182,8 @@ class ADependencyCVEs(event.AReactive, metaclass=abstracts.Abstraction):
             cve_data=self.preloaded_cve_data,
             since=self.scan_year_start,
             pool=self.pool,
-            session=self.session)
+            session=self.session,
+            cache=self.cve_cache)
 
     @property  # type:ignore
     @abstracts.interfacemethod
@@ -184,6 +232,17 @@ class ADependencyCVEs(event.AReactive, metaclass=abstracts.Abstraction):
             return
         cves, cpe_revmap = await self.data
         cpe = self.cpe_class.from_string(dep.cpe).vendor_normalized
+        if self.cve_index:
+            products = [
+                product
+                for product
+                in self.tracked_cpes
+                if (self.cpe_class.from_string(product).vendor_normalized
+                    == cpe)]
+            for indexed in self.cve_index.cves(products):
+                if matched := self.match_indexed_cve(indexed, cpe):
+                    yield self.cve_class(matched, self.cpe_class)
+            return
         for cpe_cve in sorted(cpe_revmap.get(cpe, [])):
             yield cves[cpe_cve]
 
@@ -195,3 +254,71 @@ class ADependencyCVEs(event.AReactive, metaclass=abstracts.Abstraction):
                 info = tarfile.TarInfo(name=url.split("/")[-1])
                 info.size = len(data.getvalue())
                 tar.addfile(info, fileobj=data)
+
+    async def index_feed(
+            self,
+            index: "abstract.ADependencyCVEIndex",
+            url: str) -> str:
+        """Parse a NIST feed into the CVE index, for any tracked products
+        that have not been indexed since it last changed."""
+        version = (
+            await self.nist_downloader.download_meta(url)).get("sha256", "")
+        products = (
+            index.unindexed(url, version, self.tracked_cpes)
+            if version
+            else list(self.tracked_cpes))
+        if not products:
+            logger.debug(f"CVE index is up to date: {url}")
+            return url
+        cves, _revmap = await self.nist_downloader.fetch_and_parse(
+            url,
+            parser=self.index_parser(products))
+        product_cves: Dict[str, Set[str]] = defaultdict(set)
+        for id, cve in cves.items():
+            for cve_cpe in cve["cpes"]:
+                product = str(self.cpe_class(**cve_cpe))
+                if product in products:
+                    product_cves[product].add(id)
+        index.upsert(url, version, products, cves, product_cves)
+        logger.debug(f"CVE index updated: {url}")
+        return url
+
+    def index_parser(
+            self,
+            products: Iterable[str]) -> "nist.abstract.ANISTParser":
+        """Parser for indexing CVEs for product CPEs, regardless of the
+        tracked versions."""
+        return self.nist_downloader.parser_class(
+            {product: {} for product in products},
+            cve_fields=self.index_cve_fields)
+
+    def indexers(
+            self,
+            index: "abstract.ADependencyCVEIndex") -> Iterator[
+                Awaitable[str]]:
+        """Feed indexing tasks."""
+        for url in self.nist_downloader.urls:
+            yield self.index_feed(index, url)
+
+    def match_indexed_cve(
+            self,
+            indexed: "typing.DependencyCVEItemDict",
+            cpe: str) -> Optional["typing.DependencyCVEItemDict"]:
+        """Match indexed CVE data against the tracked dependency versions
+        for a vendor-normalized CPE."""
+        parser = self.nist_downloader.parser
+        if indexed["id"] in parser.ignored_cves:
+            return None
+        cve = parser.cve_class(
+            indexed,
+            parser.tracked_cpes,
+            parser.cpe_class)
+        if not any(c.vendor_normalized == cpe for c in cve.cpes):
+            return None
+        matched = {
+            k: v
+            for k, v
+            in indexed.items()
+            if k != "nodes"}
+        matched["cpes"] = cve.gathered_cpes
+        return cast("typing.DependencyCVEItemDict", matched)
@@ -0,0 +1,170 @@
+"""Abstract CVE index."""
+
+import json
+import pathlib
+import sqlite3
+from functools import cached_property
+from typing import Dict, Iterable, Iterator, List, Set, Union
+
+import abstracts
+
+from aio.api import nist
+
+from envoy.dependency.check import typing
+
+
+# Rows are scoped by the fingerprint of the parser configuration, by the
+# feed URL, so that each feed can be replaced when it changes, and by the
+# tracked product CPE, so that checks with different versions of a
+# dependency can share the indexed data.
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feeds (
+    fingerprint TEXT NOT NULL,
+    url TEXT NOT NULL,
+    product TEXT NOT NULL,
+    version TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, url, product));
+CREATE TABLE IF NOT EXISTS cves (
+    fingerprint TEXT NOT NULL,
+    id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, id));
+CREATE TABLE IF NOT EXISTS products (
+    fingerprint TEXT NOT NULL,
+    product TEXT NOT NULL,
+    cve_id TEXT NOT NULL,
+    url TEXT NOT NULL,
+    PRIMARY KEY (fingerprint, product, cve_id));
+CREATE INDEX IF NOT EXISTS cves_url ON cves (fingerprint, url);
+CREATE INDEX IF NOT EXISTS products_url ON products (fingerprint, url);
+"""
+INDEX_TABLES = ("cpes", "cves", "feeds", "products")
+INDEX_TIMEOUT = 60
+INDEX_VERSION = 1
+
+
+class ADependencyCVEIndex(metaclass=abstracts.Abstraction):
+    """SQLite index of parsed CVE data.
+
+    Stores CVEs, and the mapping of tracked product CPEs to CVEs, for each
+    NIST feed, so that CVEs can be queried per dependency without loading
+    all of them.
+
+    Indexed CVEs are not matched against dependency versions, this is done
+    when they are queried.
+    """
+
+    def __init__(
+            self,
+            path: Union[str, pathlib.Path],
+            fingerprint: str) -> None:
+        self._path = path
+        self.fingerprint = fingerprint
+
+    @cached_property
+    def connection(self) -> sqlite3.Connection:
+        """Connection to the index database, creating it if required.
+
+        Tables from a previous version of the schema are dropped.
+        """
+        connection = sqlite3.connect(self._path, timeout=INDEX_TIMEOUT)
+        # Allow other checks to read the index while it is being updated.
+        connection.execute("PRAGMA journal_mode=WAL")
+        (version, ) = connection.execute("PRAGMA user_version").fetchone()
+        if version != INDEX_VERSION:
+            connection.executescript(
+                "".join(
+                    f"DROP TABLE IF EXISTS {table};"
+                    for table
+                    in INDEX_TABLES))
+            connection.execute(f"PRAGMA user_version={INDEX_VERSION}")
+        connection.executescript(INDEX_SCHEMA)
+        return connection
+
+    def cves(
+            self,
+            products: Iterable[str]) -> Iterator[
+                "typing.DependencyCVEItemDict"]:
+        """CVE data for product CPEs, ordered by CVE id."""
+        products = list(products)
+        rows = self.connection.execute(
+            "SELECT DISTINCT cves.id, cves.data FROM products "
+            "JOIN cves "
+            "ON cves.fingerprint = products.fingerprint "
+            "AND cves.id = products.cve_id "
+            "WHERE products.fingerprint = ? "
+            f"AND products.product IN ({self._params(products)}) "
+            "ORDER BY cves.id",
+            (self.fingerprint, *products))
+        for (_id, data) in rows:
+            yield json.loads(data)
+
+    def unindexed(
+            self,
+            url: str,
+            version: str,
+            products: Iterable[str]) -> List[str]:
+        """Product CPEs that are not indexed for a version of a feed."""
+        indexed = {
+            product
+            for (product, )
+            in self.connection.execute(
+                "SELECT product FROM feeds "
+                "WHERE fingerprint = ? AND url = ? AND version = ?",
+                (self.fingerprint, url, version))}
+        return [
+            product
+            for product
+            in products
+            if product not in indexed]
+
+    def upsert(
+            self,
+            url: str,
+            version: str,
+            products: Iterable[str],
+            cves: "nist.typing.CVEDict",
+            product_cves: Dict[str, Set[str]]) -> None:
+        """Replace the indexed data for product CPEs in a feed.
+
+        Rows from other parser configurations, and CVEs that are no longer
+        referenced by any product, are removed.
+        """
+        products = list(products)
+        scope = (self.fingerprint, url)
+        with self.connection:
+            for table in ("cves", "feeds", "products"):
+                self.connection.execute(
+                    f"DELETE FROM {table} WHERE fingerprint != ?",
+                    (self.fingerprint, ))
+            self.connection.execute(
+                "DELETE FROM products WHERE fingerprint = ? AND url = ? "
+                f"AND product IN ({self._params(products)})",
+                (*scope, *products))
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO cves VALUES (?, ?, ?, ?)",
+                ((self.fingerprint, id, url, json.dumps(cve))
+                 for id, cve
+                 in cves.items()))
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO products VALUES (?, ?, ?, ?)",
+                ((self.fingerprint, product, cve_id, url)
+                 for product, cve_ids
+                 in product_cves.items()
+                 for cve_id
+                 in cve_ids))
+            self.connection.execute(
+                "DELETE FROM cves WHERE fingerprint = ? AND url = ? "
+                "AND id NOT IN ("
+                "SELECT cve_id FROM products "
+                "WHERE fingerprint = ? AND url = ?)",
+                (*scope, *scope))
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO feeds VALUES (?, ?, ?, ?)",
+                ((*scope, product, version)
+                 for product
+                 in products))
+
+    def _params(self, values: List[str]) -> str:
+        return ", ".join("?" * len(values))
@@ -26,7 +26,10 @@ from envoy.dependency.check import exceptions
 
 logger = logging.getLogger(__name__)
 
-MIN_DATA_SIZE_TO_HASH_IN_PROC = 1000000
+# Downloaded data is hashed in a thread once this much has been buffered,
+# bounding memory use regardless of the asset size.
+MIN_DATA_SIZE_TO_HASH_IN_THREAD = 2 ** 20
+SHA_CHUNK_SIZE = 2 ** 16
 
 
 @abstracts.implementer(event.IExecutive)
@@ -35,12 +38,6 @@ class ADependencyGithubRelease(
         metaclass=abstracts.Abstraction):
     """Github release associated with a dependency."""
 
-    @classmethod
-    def hash_file_data(cls, data: bytes) -> str:
-        file_hash = hashlib.sha256()
-        file_hash.update(data)
-        return str(file_hash.hexdigest())
-
     def __init__(
             self,
             repo: _github.IGithubRepo,
@@ -80,8 +77,8 @@ class ADependencyGithubRelease(
         return self.repo.github
 
     @property
-    def min_data_size_to_hash_in_proc(self) -> int:
-        return MIN_DATA_SIZE_TO_HASH_IN_PROC
+    def min_data_size_to_hash_in_thread(self) -> int:
+        return MIN_DATA_SIZE_TO_HASH_IN_THREAD
 
     @async_property(cache=True)
     async def release(self) -> Optional[_github.IGithubRelease]:
@@ -108,7 +105,7 @@ class ADependencyGithubRelease(
                 "with no `asset_url`")
         response = await self.session.get(self.asset_url)
         logger.debug(f"SHA download: {self.asset_url}")
-        return await self._hash_file_data(await response.read())
+        return await self._hash_response(response)
 
     @async_property(cache=True)
     async def tag(self) -> Optional[_github.IGithubTag]:
@@ -169,22 +166,43 @@ class ADependencyGithubRelease(
         except version.InvalidVersion:
             return None
 
-    def should_hash_in_proc(self, data: bytes) -> bool:
-        """Conditionally generate SHA hashes based on incoming data."""
-        return len(data) > self.min_data_size_to_hash_in_proc
+    def should_hash_in_thread(self, data: bytearray) -> bool:
+        """Conditionally hash buffered data in a thread, based on its size."""
+        return len(data) >= self.min_data_size_to_hash_in_thread
 
-    async def _hash_file_data(self, data: bytes) -> str:
-        hash_in_proc = self.should_hash_in_proc(data)
+    async def _hash_response(self, response: aiohttp.ClientResponse) -> str:
+        """Hash a response as it is downloaded.
+
+        Chunks are buffered, and nothing is hashed until the buffer is large
+        enough to hash in a thread, or the response ends. Each full buffer
+        is hashed in a thread while the next chunks are downloaded, and the
+        remainder is hashed inline.
+        """
         start = time.perf_counter()
-        sha = (
-            await self.execute(self.hash_file_data, data)
-            if hash_in_proc
-            else self.hash_file_data(data))
+        file_hash = hashlib.sha256()
+        buffer = bytearray()
+        hashing: Optional[asyncio.Future] = None
+        async for chunk in response.content.iter_chunked(SHA_CHUNK_SIZE):
+            buffer += chunk
+            if not self.should_hash_in_thread(buffer):
+                continue
+            # Hash the buffered data in a thread, while the next chunks are
+            # downloaded.
+            if hashing:
+                await hashing
+            hashing = self.loop.run_in_executor(
+                None,
+                file_hash.update,
+                buffer)
+            buffer = bytearray()
+        if hashing:
+            await hashing
+        file_hash.update(buffer)
         logger.debug(
             "SHA parsed in {:.3f}s{}: {}" .format(
                 time.perf_counter() - start,
-                (" (fork: True)"
-                 if hash_in_proc
+                (" (threaded: True)"
+                 if hashing
                  else ""),
                 self.asset_url))
-        return sha
+        return file_hash.hexdigest()
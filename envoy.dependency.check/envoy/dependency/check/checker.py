@@ -13,6 +13,10 @@ class DependencyCVE(check.ADependencyCVE):
     pass
 
 
+class DependencyCVEIndex(check.ADependencyCVEIndex):
+    pass
+
+
 class DependencyCVEs(check.ADependencyCVEs):
 
     @property
@@ -23,6 +27,10 @@ class DependencyCVEs(check.ADependencyCVEs):
     def cve_class(self) -> Type[check.ADependencyCVE]:
         return DependencyCVE
 
+    @property
+    def cve_index_class(self) -> Type[check.ADependencyCVEIndex]:
+        return DependencyCVEIndex
+
     @cached_property
     def ignored_cves(self) -> List[str]:
         return super().ignored_cves
@@ -106,6 +106,19 @@ def test_checker_access_token(patches, arg):
     assert "access_token" not in checker.__dict__
 
 
+def test_checker_cve_cache(patches):
+    checker = DummyDependencyChecker()
+    patched = patches(
+        ("ADependencyChecker.args",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.dependency.check.abstract.checker")
+
+    with patched as (m_args, ):
+        assert checker.cve_cache == m_args.return_value.cve_cache
+
+    assert "cve_cache" not in checker.__dict__
+
+
 def test_checker_cve_config(patches):
     checker = DummyDependencyChecker()
     patched = patches(
@@ -119,13 +132,30 @@ def test_checker_cve_config(patches):
     assert "cve_config" not in checker.__dict__
 
 
+def test_checker_cve_index(patches):
+    checker = DummyDependencyChecker()
+    patched = patches(
+        ("ADependencyChecker.args",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.dependency.check.abstract.checker")
+
+    with patched as (m_args, ):
+        assert checker.cve_index == m_args.return_value.cve_index
+
+    assert "cve_index" not in checker.__dict__
+
+
 def test_checker_cves(patches):
     checker = DummyDependencyChecker()
     patched = patches(
         ("ADependencyChecker.dependencies",
          dict(new_callable=PropertyMock)),
+        ("ADependencyChecker.cve_cache",
+         dict(new_callable=PropertyMock)),
         ("ADependencyChecker.cve_config",
          dict(new_callable=PropertyMock)),
+        ("ADependencyChecker.cve_index",
+         dict(new_callable=PropertyMock)),
         ("ADependencyChecker.cves_class",
          dict(new_callable=PropertyMock)),
         ("ADependencyChecker.loop",
@@ -139,7 +169,7 @@ def test_checker_cves(patches):
         prefix="envoy.dependency.check.abstract.checker")
 
     with patched as patchy:
-        (m_deps, m_config, m_class,
+        (m_deps, m_cache, m_config, m_index, m_class,
          m_loop, m_pool, m_pre, m_session) = patchy
         assert checker.cves == m_class.return_value.return_value
 
@@ -147,6 +177,8 @@ def test_checker_cves(patches):
         m_class.return_value.call_args
         == [(m_deps.return_value, ),
             dict(config_path=m_config.return_value,
+                 cve_cache=m_cache.return_value,
+                 cve_index=m_index.return_value,
                  loop=m_loop.return_value,
                  pool=m_pool.return_value,
                  preloaded_cve_data=m_pre.return_value,
@@ -262,18 +294,66 @@ def test_checker_github(patches):
          dict(new_callable=PropertyMock)),
         ("ADependencyChecker.session",
          dict(new_callable=PropertyMock)),
+        ("ADependencyChecker.github_cache",
+         dict(new_callable=PropertyMock)),
+        ("ADependencyChecker.github_scheduler",
+         dict(new_callable=PropertyMock)),
         prefix="envoy.dependency.check.abstract.checker")
 
-    with patched as (m_github, m_token, m_session):
+    with patched as patchy:
+        m_github, m_token, m_session, m_cache, m_scheduler = patchy
         assert checker.github == m_github.GithubAPI.return_value
 
     assert (
         m_github.GithubAPI.call_args
         == [(m_session.return_value, ""),
-            dict(oauth_token=m_token.return_value)])
+            dict(oauth_token=m_token.return_value,
+                 cache=m_cache.return_value,
+                 scheduler=m_scheduler.return_value)])
     assert "github" in checker.__dict__
 
 
+@pytest.mark.parametrize("path", [None, "", "PATH"])
+def test_checker_github_cache(patches, path):
+    checker = DummyDependencyChecker()
+    patched = patches(
+        "_github",
+        ("ADependencyChecker.args",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.dependency.check.abstract.checker")
+
+    with patched as (m_github, m_args):
+        m_args.return_value.github_cache = path
+        assert (
+            checker.github_cache
+            == (m_github.GithubResponseCache.return_value
+                if path
+                else None))
+
+    if path:
+        assert (
+            m_github.GithubResponseCache.call_args
+            == [(path, ), {}])
+    else:
+        assert not m_github.GithubResponseCache.called
+    assert "github_cache" in checker.__dict__
+
+
+def test_checker_github_concurrency(patches):
+    checker = DummyDependencyChecker()
+    patched = patches(
+        ("ADependencyChecker.args",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.dependency.check.abstract.checker")
+
+    with patched as (m_args, ):
+        assert (
+            checker.github_concurrency
+            == m_args.return_value.github_concurrency)
+
+    assert "github_concurrency" not in checker.__dict__
+
+
 @pytest.mark.parametrize(
     "github_urls",
     [[],
@@ -348,6 +428,25 @@ def test_checker_github_dependencies(
     assert "github_dependencies" in checker.__dict__
 
 
+def test_checker_github_scheduler(patches):
+    checker = DummyDependencyChecker()
+    patched = patches(
+        "_github",
+        ("ADependencyChecker.github_concurrency",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.dependency.check.abstract.checker")
+
+    with patched as (m_github, m_concurrency):
+        assert (
+            checker.github_scheduler
+            == m_github.GithubRequestScheduler.return_value)
+
+    assert (
+        m_github.GithubRequestScheduler.call_args
+        == [(), dict(limit=m_concurrency.return_value)])
+    assert "github_scheduler" in checker.__dict__
+
+
 def test_checker_issues(patches):
     checker = DummyDependencyChecker()
     patched = patches(
@@ -451,9 +550,13 @@ def test_checker_add_arguments(patches):
     assert (
         parser.add_argument.call_args_list
         == [[('--github_token',), {}],
+            [('--github_cache',), {}],
+            [('--github_concurrency',), dict(type=int)],
             [('--repository_locations',), {}],
+            [('--cve_cache',), {}],
             [('--cve_config',), {}],
             [('--cve_data',), {}],
+            [('--cve_index',), {}],
             [('--download_cves',), {}]])
 
 
@@ -1074,7 +1177,7 @@ async def test_checker_preload_releases(patches, deps):
          dict(new_callable=PropertyMock)),
         prefix="envoy.dependency.check.abstract.checker")
 
-    async def iter_deps(iterable, cb):
+    async def iter_deps(iterable, cb, limit):
         for dep in deps:
             mock_dep = MagicMock()
             mock_dep.id = dep
@@ -1089,7 +1192,7 @@ async def test_checker_preload_releases(patches, deps):
     assert cb(item) == (item.newer_release, item.recent_commits)
     assert (
         m_inflate.call_args
-        == [(m_gh_deps.return_value, cb), {}])
+        == [(m_gh_deps.return_value, cb), dict(limit=-1)])
     if deps:
         assert (
             m_log.return_value.debug.call_args_list
@@ -1222,7 +1325,7 @@ async def test_checker_preload_release_dates(patches, deps):
          dict(new_callable=PropertyMock)),
         prefix="envoy.dependency.check.abstract.checker")
 
-    async def iter_deps(iterable, cb):
+    async def iter_deps(iterable, cb, limit):
         for dep in deps:
             mock_dep = MagicMock()
             mock_dep.id = dep
@@ -1237,7 +1340,7 @@ async def test_checker_preload_release_dates(patches, deps):
     assert cb(item) == (item.release.date, )
     assert (
         m_inflate.call_args
-        == [(m_gh_deps.return_value, cb), {}])
+        == [(m_gh_deps.return_value, cb), dict(limit=-1)])
     if deps:
         assert (
             m_log.return_value.debug.call_args_list
@@ -21,6 +21,10 @@ class DummyDependencyCVEs:
     def cve_class(self):
         return super().cve_class
 
+    @property
+    def cve_index_class(self):
+        return super().cve_index_class
+
     @property
     def ignored_cves(self):
         return super().ignored_cves
@@ -34,8 +38,15 @@ class DummyDependencyCVEs:
 @pytest.mark.parametrize("loop", [None, "", "LOOP"])
 @pytest.mark.parametrize("pool", [None, "", "POOL"])
 @pytest.mark.parametrize("session", [None, "", "SESSION"])
-def test_cves_constructor(patches, config_path, loop, pool, session):
+@pytest.mark.parametrize("cve_cache", [None, "", "CACHE"])
+@pytest.mark.parametrize("cve_index", [None, "", "INDEX"])
+def test_cves_constructor(
+        patches, config_path, loop, pool, session, cve_cache, cve_index):
     kwargs = {}
+    if cve_index is not None:
+        kwargs["cve_index"] = cve_index
+    if cve_cache is not None:
+        kwargs["cve_cache"] = cve_cache
     if config_path is not None:
         kwargs["config_path"] = config_path
     if loop is not None:
@@ -54,12 +65,16 @@ def test_cves_constructor(patches, config_path, loop, pool, session):
     assert cves._loop == loop
     assert cves._pool == pool
     assert cves._session == session
+    assert cves._cve_cache == cve_cache
+    assert cves._cve_index == cve_index
     assert isinstance(cves, event.IReactive)
 
     with pytest.raises(NotImplementedError):
         cves.cpe_class
     with pytest.raises(NotImplementedError):
         cves.cve_class
+    with pytest.raises(NotImplementedError):
+        cves.cve_index_class
     with pytest.raises(NotImplementedError):
         cves.nist_downloader_class
 
@@ -139,6 +154,12 @@ def test_cves_cpe_revmap(patches):
     assert "cpe_revmap" in cves.__dict__
 
 
+def test_cves_cve_cache():
+    cves = DummyDependencyCVEs("DEPENDENCIES", cve_cache="CACHE")
+    assert cves.cve_cache == "CACHE"
+    assert "cve_cache" not in cves.__dict__
+
+
 def test_cves_cve_fields(patches):
     cves = DummyDependencyCVEs("DEPENDENCIES")
     patched = patches(
@@ -159,6 +180,40 @@ def test_cves_cve_fields(patches):
     assert "cve_fields" not in cves.__dict__
 
 
+@pytest.mark.parametrize("index", [None, "", "INDEX"])
+@pytest.mark.parametrize("preloaded", [None, "", "PRELOADED"])
+def test_cves_cve_index(patches, index, preloaded):
+    cves = DummyDependencyCVEs("DEPENDENCIES", cve_index=index)
+    patched = patches(
+        ("ADependencyCVEs.cve_index_class",
+         dict(new_callable=PropertyMock)),
+        ("ADependencyCVEs.index_parser",
+         dict(new_callable=MagicMock)),
+        ("ADependencyCVEs.preloaded_cve_data",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.dependency.check.abstract.cves.cves")
+    expected = bool(index and not preloaded)
+
+    with patched as (m_class, m_parser, m_pre):
+        m_pre.return_value = preloaded
+        assert (
+            cves.cve_index
+            == (m_class.return_value.return_value
+                if expected
+                else None))
+
+    assert "cve_index" in cves.__dict__
+    if not expected:
+        assert not m_class.called
+        return
+    assert (
+        m_class.return_value.call_args
+        == [(index, m_parser.return_value.fingerprint), {}])
+    assert (
+        m_parser.call_args
+        == [((), ), {}])
+
+
 @pytest.mark.parametrize("loaded", [True, False])
 async def test_cves_data(patches, loaded):
     cves = DummyDependencyCVEs("DEPENDENCIES")
@@ -198,9 +253,14 @@ async def test_cves_data(patches, loaded):
 
 
 @pytest.mark.parametrize("loaded", [True, False])
-async def test_cves_downloads(iters, patches, loaded):
+@pytest.mark.parametrize("indexed", [True, False])
+async def test_cves_downloads(iters, patches, loaded, indexed):
     cves = DummyDependencyCVEs("DEPENDENCIES")
     patched = patches(
+        "concurrent",
+        "ADependencyCVEs.indexers",
+        ("ADependencyCVEs.cve_index",
+         dict(new_callable=PropertyMock)),
         ("ADependencyCVEs.cpe_class",
          dict(new_callable=PropertyMock)),
         ("ADependencyCVEs.cpe_revmap",
@@ -247,9 +307,17 @@ async def test_cves_downloads(iters, patches, loaded):
     downloader = DummyDownloader()
     loader = DummyLoader()
 
+    async def concurrent(indexers):
+        events("INDEXING")
+        for url in iters():
+            yield url
+
     with patched as patchy:
-        (m_cpe_class, m_revmap,
+        (m_concurrent, m_indexers, m_index, m_cpe_class, m_revmap,
          m_cve_class, m_cves, m_nist, m_loader) = patchy
+        m_concurrent.side_effect = concurrent
+        if not indexed:
+            m_index.return_value = None
         m_nist.return_value = downloader
         m_loader.return_value = loader
         async for download in cves.downloads:
@@ -263,12 +331,31 @@ async def test_cves_downloads(iters, patches, loaded):
         assert (
             events.call_args_list
             == [[("AWAITED", ), {}]])
+        assert not m_index.called
+        assert not m_concurrent.called
         # assert not m_cves.__setitem__.called
         assert not downloader.cves.items.called
         assert not m_cve_class.called
         assert not m_cpe_class.called
         assert not m_revmap.called
         return
+    if indexed:
+        assert (
+            events.call_args_list
+            == [[("AWAITED", ), {}],
+                [("ENTERED", ), {}],
+                [("INDEXING", ), {}],
+                [("EXITED", ), {}]])
+        assert (
+            m_indexers.call_args
+            == [(m_index.return_value, ), {}])
+        assert (
+            m_concurrent.call_args
+            == [(m_indexers.return_value, ), {}])
+        assert not m_cves.called
+        assert not m_revmap.called
+        return
+    assert not m_concurrent.called
     assert (
         events.call_args_list
         == [[("AWAITED", ), {}],
@@ -300,6 +387,26 @@ def test_cves_ignored_cves(patches):
     assert "ignored_cves" not in cves.__dict__
 
 
+def test_cves_index_cve_fields(patches):
+    cves = DummyDependencyCVEs("DEPENDENCIES")
+    patched = patches(
+        "qdict",
+        ("ADependencyCVEs.cve_fields",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.dependency.check.abstract.cves.cves")
+
+    with patched as (m_qdict, m_fields):
+        m_fields.return_value.query = dict(FOO="BAR")
+        assert cves.index_cve_fields == m_qdict.return_value
+
+    assert (
+        m_qdict.call_args
+        == [(),
+            dict(FOO="BAR",
+                 nodes="configurations/nodes")])
+    assert "index_cve_fields" not in cves.__dict__
+
+
 def test_cves_loader(patches):
     cves = DummyDependencyCVEs("DEPENDENCIES")
     patched = patches(
@@ -318,6 +425,8 @@ def test_cves_loader(patches):
 def test_cves_nist_downloader(patches):
     cves = DummyDependencyCVEs("DEPENDENCIES")
     patched = patches(
+        ("ADependencyCVEs.cve_cache",
+         dict(new_callable=PropertyMock)),
         ("ADependencyCVEs.cve_fields",
          dict(new_callable=PropertyMock)),
         ("ADependencyCVEs.ignored_cves",
@@ -337,7 +446,7 @@ def test_cves_nist_downloader(patches):
         prefix="envoy.dependency.check.abstract.cves.cves")
 
     with patched as patchy:
-        (m_fields, m_ignored, m_class, m_pool, m_pre,
+        (m_cache, m_fields, m_ignored, m_class, m_pool, m_pre,
          m_session, m_start, m_tracked) = patchy
         assert cves.nist_downloader == m_class.return_value.return_value
 
@@ -350,7 +459,8 @@ def test_cves_nist_downloader(patches):
                 since=m_start.return_value,
                 pool=m_pool.return_value,
                 cve_data=m_pre.return_value,
-                session=m_session.return_value)])
+                session=m_session.return_value,
+                cache=m_cache.return_value)])
     assert "nist_downloader" in cves.__dict__
 
 
@@ -438,7 +548,8 @@ def test_cves_cpe_filter_dict(patches):
 
 
 @pytest.mark.parametrize("cpe", [True, False])
-async def test_cves_dependency_check(patches, cpe):
+@pytest.mark.parametrize("indexed", [True, False])
+async def test_cves_dependency_check(patches, cpe, indexed):
     cves = DummyDependencyCVEs("DEPENDENCIES")
     patched = patches(
         "sorted",
@@ -446,23 +557,66 @@ async def test_cves_dependency_check(patches, cpe):
          dict(new_callable=PropertyMock)),
         ("ADependencyCVEs.cpe_class",
          dict(new_callable=PropertyMock)),
+        ("ADependencyCVEs.cve_class",
+         dict(new_callable=PropertyMock)),
+        ("ADependencyCVEs.cve_index",
+         dict(new_callable=PropertyMock)),
+        ("ADependencyCVEs.match_indexed_cve",
+         dict(new_callable=MagicMock)),
+        ("ADependencyCVEs.tracked_cpes",
+         dict(new_callable=PropertyMock)),
         prefix="envoy.dependency.check.abstract.cves.cves")
     dep = MagicMock()
-    dep.cpe = cpe
+    dep.cpe = (
+        "DEP_CPE"
+        if cpe
+        else None)
     _cpe_cves = {}
     results = []
     expected = []
     revmap = MagicMock()
+    normalized = dict(
+        DEP_CPE="NORMALIZED",
+        CPE1="NORMALIZED",
+        CPE2="OTHER",
+        CPE3="NORMALIZED")
+
+    indexed_cves = [MagicMock() for i in range(0, 3)]
+
+    def from_string(cpe_str):
+        return MagicMock(vendor_normalized=normalized[cpe_str])
+
+    def match_indexed_cve(cve, cpe):
+        return (
+            None
+            if cve is indexed_cves[1]
+            else (cve, cpe))
 
     for i in range(0, 5):
         cve = MagicMock()
-        if cpe:
+        if cpe and not indexed:
             expected.append(cve)
         _cpe_cves[f"CVE{i}"] = cve
 
-    with patched as (m_sorted, m_data, m_class):
+    with patched as patchy:
+        (m_sorted, m_data, m_class, m_cve_class,
+         m_index, m_match, m_tracked) = patchy
         m_data.side_effect = AsyncMock(return_value=[_cpe_cves, revmap])
         m_sorted.return_value = _cpe_cves.keys()
+        m_index.return_value.cves.return_value = indexed_cves
+        m_class.return_value.from_string.side_effect = from_string
+        m_cve_class.return_value.side_effect = lambda cve, cpe_class: (
+            cve, cpe_class)
+        m_match.side_effect = match_indexed_cve
+        m_tracked.return_value = dict(CPE1="", CPE2="", CPE3="")
+        if not indexed:
+            m_index.return_value = None
+        if cpe and indexed:
+            expected = [
+                ((cve, "NORMALIZED"), m_class.return_value)
+                for cve
+                in indexed_cves
+                if cve is not indexed_cves[1]]
 
         async for result in cves.dependency_check(dep):
             results.append(result)
@@ -473,13 +627,194 @@ async def test_cves_dependency_check(patches, cpe):
         assert not m_class.called
         assert not m_sorted.called
         return
+    if indexed:
+        assert (
+            m_class.return_value.from_string.call_args_list
+            == [[(cpe_str, ), {}]
+                for cpe_str
+                in ["DEP_CPE", "CPE1", "CPE2", "CPE3"]])
+        assert (
+            m_index.return_value.cves.call_args
+            == [(["CPE1", "CPE3"], ), {}])
+        assert (
+            m_match.call_args_list
+            == [[(cve, "NORMALIZED"), {}]
+                for cve
+                in indexed_cves])
+        assert not m_sorted.called
+        return
     assert (
         m_class.return_value.from_string.call_args
         == [(dep.cpe, ), {}])
+    assert not m_match.called
     assert (
         m_sorted.call_args
         == [(revmap.get.return_value, ), {}])
     assert (
         revmap.get.call_args
-        == [(m_class.return_value.from_string.return_value.vendor_normalized,
-             []), {}])
+        == [("NORMALIZED", []), {}])
+
+
+@pytest.mark.parametrize("version", ["", "VERSION"])
+@pytest.mark.parametrize("unindexed", [[], ["P1", "P2"]])
+async def test_cves_index_feed(patches, version, unindexed):
+    cves = DummyDependencyCVEs("DEPENDENCIES")
+    patched = patches(
+        "logger",
+        ("ADependencyCVEs.cpe_class",
+         dict(new_callable=PropertyMock)),
+        ("ADependencyCVEs.index_parser",
+         dict(new_callable=MagicMock)),
+        ("ADependencyCVEs.nist_downloader",
+         dict(new_callable=PropertyMock)),
+        ("ADependencyCVEs.tracked_cpes",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.dependency.check.abstract.cves.cves")
+    index = MagicMock()
+    index.unindexed.return_value = unindexed
+    meta = (
+        dict(sha256=version)
+        if version
+        else {})
+    current = bool(version and not unindexed)
+    products = (
+        unindexed
+        if version
+        else ["P1", "P2", "P3"])
+    parsed = dict(
+        CVE1=dict(cpes=[dict(product="P1"), dict(product="P3")]),
+        CVE2=dict(cpes=[dict(product="P2")]),
+        CVE3=dict(cpes=[dict(product="P3")]))
+    expected = dict(
+        P1={"CVE1"},
+        P2={"CVE2"},
+        P3={"CVE1", "CVE3"})
+
+    with patched as (m_logger, m_cpe, m_parser, m_nist, m_tracked):
+        m_cpe.return_value.side_effect = lambda **kwargs: kwargs["product"]
+        m_tracked.return_value = dict(P1="", P2="", P3="")
+        downloader = m_nist.return_value
+        downloader.download_meta = AsyncMock(return_value=meta)
+        downloader.fetch_and_parse = AsyncMock(
+            return_value=(parsed, "REVMAP"))
+        assert await cves.index_feed(index, "URL") == "URL"
+
+    assert (
+        downloader.download_meta.call_args
+        == [("URL", ), {}])
+    if version:
+        assert (
+            index.unindexed.call_args
+            == [("URL", version, m_tracked.return_value), {}])
+    else:
+        assert not index.unindexed.called
+    if current:
+        assert (
+            m_logger.debug.call_args
+            == [("CVE index is up to date: URL", ), {}])
+        assert not downloader.fetch_and_parse.called
+        assert not index.upsert.called
+        return
+    assert (
+        m_parser.call_args
+        == [(products, ), {}])
+    assert (
+        downloader.fetch_and_parse.call_args
+        == [("URL", ), dict(parser=m_parser.return_value)])
+    assert (
+        index.upsert.call_args
+        == [("URL", version, products, parsed,
+             {k: v
+              for k, v
+              in expected.items()
+              if k in products}),
+            {}])
+    assert (
+        m_logger.debug.call_args
+        == [("CVE index updated: URL", ), {}])
+
+
+def test_cves_index_parser(patches):
+    cves = DummyDependencyCVEs("DEPENDENCIES")
+    patched = patches(
+        ("ADependencyCVEs.index_cve_fields",
+         dict(new_callable=PropertyMock)),
+        ("ADependencyCVEs.nist_downloader",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.dependency.check.abstract.cves.cves")
+
+    with patched as (m_fields, m_nist):
+        assert (
+            cves.index_parser(iter(["P1", "P2"]))
+            == m_nist.return_value.parser_class.return_value)
+
+    assert (
+        m_nist.return_value.parser_class.call_args
+        == [(dict(P1={}, P2={}), ),
+            dict(cve_fields=m_fields.return_value)])
+
+
+def test_cves_indexers(iters, patches):
+    cves = DummyDependencyCVEs("DEPENDENCIES")
+    patched = patches(
+        ("ADependencyCVEs.nist_downloader",
+         dict(new_callable=PropertyMock)),
+        ("ADependencyCVEs.index_feed",
+         dict(new_callable=MagicMock)),
+        prefix="envoy.dependency.check.abstract.cves.cves")
+    index = MagicMock()
+    urls = iters()
+
+    with patched as (m_nist, m_index):
+        m_nist.return_value.urls = urls
+        m_index.side_effect = lambda index, url: url
+        assert list(cves.indexers(index)) == urls
+
+    assert (
+        m_index.call_args_list
+        == [[(index, url), {}] for url in urls])
+
+
+@pytest.mark.parametrize("ignored", [True, False])
+@pytest.mark.parametrize("matches", [True, False])
+def test_cves_match_indexed_cve(patches, ignored, matches):
+    cves = DummyDependencyCVEs("DEPENDENCIES")
+    patched = patches(
+        ("ADependencyCVEs.nist_downloader",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.dependency.check.abstract.cves.cves")
+    indexed = dict(
+        id="CVE-1",
+        nodes="NODES",
+        cpes="INDEXED_CPES",
+        description="DESCRIPTION")
+
+    with patched as (m_nist, ):
+        parser = m_nist.return_value.parser
+        parser.ignored_cves = (
+            {"CVE-1"}
+            if ignored
+            else set())
+        cve = parser.cve_class.return_value
+        cve.cpes = [
+            MagicMock(vendor_normalized="OTHER"),
+            MagicMock(
+                vendor_normalized=(
+                    "CPE"
+                    if matches
+                    else "OTHER"))]
+        assert (
+            cves.match_indexed_cve(indexed, "CPE")
+            == (dict(id="CVE-1",
+                     cpes=cve.gathered_cpes,
+                     description="DESCRIPTION")
+                if matches and not ignored
+                else None))
+
+    if ignored:
+        assert not parser.cve_class.called
+        return
+    assert (
+        parser.cve_class.call_args
+        == [(indexed, parser.tracked_cpes, parser.cpe_class), {}])
+    assert indexed["cpes"] == "INDEXED_CPES"
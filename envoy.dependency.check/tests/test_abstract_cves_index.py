@@ -0,0 +1,245 @@
+import json
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+
+import abstracts
+
+from envoy.dependency import check
+
+
+@abstracts.implementer(check.ADependencyCVEIndex)
+class DummyDependencyCVEIndex:
+    pass
+
+
+PRODUCT = "cpe:2.3:a:vendor:product:*"
+OTHER = "cpe:2.3:a:vendor:other:*"
+
+
+def _cve(id):
+    return dict(
+        id=id,
+        description=f"{id} description",
+        cpes=[dict(part="a", vendor="vendor", product="product",
+                   version="*")])
+
+
+def _count(index, table):
+    return index.connection.execute(
+        f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_cves_index_constructor():
+    index = DummyDependencyCVEIndex("PATH", "FINGERPRINT")
+    assert index._path == "PATH"
+    assert index.fingerprint == "FINGERPRINT"
+
+
+@pytest.mark.parametrize("version", [0, 1, 2])
+def test_cves_index_connection(patches, version):
+    index = DummyDependencyCVEIndex("PATH", "FINGERPRINT")
+    patched = patches(
+        "sqlite3",
+        ("INDEX_TABLES", dict(new=("TABLE1", "TABLE2"))),
+        ("INDEX_VERSION", dict(new=1)),
+        prefix="envoy.dependency.check.abstract.cves.index")
+
+    with patched as (m_sqlite, m_tables, m_version):
+        connection = m_sqlite.connect.return_value
+        connection.execute.return_value.fetchone.return_value = (version, )
+        assert index.connection == connection
+
+    assert (
+        m_sqlite.connect.call_args
+        == [("PATH", ),
+            dict(timeout=check.abstract.cves.index.INDEX_TIMEOUT)])
+    expected = [
+        [("PRAGMA journal_mode=WAL", ), {}],
+        [("PRAGMA user_version", ), {}]]
+    scripts = [[(check.abstract.cves.index.INDEX_SCHEMA, ), {}]]
+    if version != 1:
+        expected.append([("PRAGMA user_version=1", ), {}])
+        scripts.insert(
+            0,
+            [("DROP TABLE IF EXISTS TABLE1;DROP TABLE IF EXISTS TABLE2;", ),
+             {}])
+    assert connection.execute.call_args_list == expected
+    assert connection.executescript.call_args_list == scripts
+    assert "connection" in index.__dict__
+
+
+def test_cves_index_connection_schema_version(tmp_path):
+    path = tmp_path / "cves.db"
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE cpes (cpe TEXT)")
+    connection.execute("CREATE TABLE feeds (url TEXT)")
+    connection.commit()
+    connection.close()
+    index = DummyDependencyCVEIndex(path, "FINGERPRINT")
+
+    index.upsert("URL1", "VERSION1", [PRODUCT], {}, {})
+
+    assert (
+        index.connection.execute("PRAGMA user_version").fetchone()
+        == (check.abstract.cves.index.INDEX_VERSION, ))
+    assert (
+        {name
+         for (name, )
+         in index.connection.execute(
+             "SELECT name FROM sqlite_master WHERE type = 'table'")}
+        == {"cves", "feeds", "products"})
+    assert index.unindexed("URL1", "VERSION1", [PRODUCT]) == []
+
+
+def test_cves_index_roundtrip(tmp_path):
+    path = tmp_path / "cves.db"
+    index = DummyDependencyCVEIndex(path, "FINGERPRINT")
+    assert index.unindexed("URL1", "VERSION1", [PRODUCT]) == [PRODUCT]
+    assert list(index.cves([PRODUCT])) == []
+
+    index.upsert(
+        "URL1",
+        "VERSION1",
+        [PRODUCT, OTHER],
+        {"CVE-2": _cve("CVE-2"),
+         "CVE-1": _cve("CVE-1")},
+        {PRODUCT: {"CVE-2", "CVE-1"},
+         OTHER: {"CVE-2"}})
+    index.upsert(
+        "URL2",
+        "VERSION2",
+        [PRODUCT],
+        {"CVE-3": _cve("CVE-3")},
+        {PRODUCT: {"CVE-3"}})
+
+    assert index.unindexed("URL1", "VERSION1", [PRODUCT, OTHER]) == []
+    assert (
+        index.unindexed("URL1", "VERSION2", [PRODUCT, OTHER])
+        == [PRODUCT, OTHER])
+    assert index.unindexed("URL2", "VERSION2", [PRODUCT, OTHER]) == [OTHER]
+    assert (
+        list(index.cves([PRODUCT]))
+        == [_cve("CVE-1"), _cve("CVE-2"), _cve("CVE-3")])
+    assert (
+        list(index.cves([OTHER]))
+        == [_cve("CVE-2")])
+    assert (
+        list(index.cves([PRODUCT, OTHER]))
+        == [_cve("CVE-1"), _cve("CVE-2"), _cve("CVE-3")])
+    assert list(index.cves([])) == []
+
+    # a new connection sees the stored data
+    assert (
+        list(DummyDependencyCVEIndex(path, "FINGERPRINT").cves([PRODUCT]))
+        == [_cve("CVE-1"), _cve("CVE-2"), _cve("CVE-3")])
+
+
+def test_cves_index_upsert_purges_fingerprints(tmp_path):
+    path = tmp_path / "cves.db"
+    index = DummyDependencyCVEIndex(path, "FINGERPRINT")
+    index.upsert(
+        "URL1",
+        "VERSION1",
+        [PRODUCT],
+        {"CVE-1": _cve("CVE-1")},
+        {PRODUCT: {"CVE-1"}})
+    other = DummyDependencyCVEIndex(path, "OTHER")
+    assert other.unindexed("URL1", "VERSION1", [PRODUCT]) == [PRODUCT]
+    assert list(other.cves([PRODUCT])) == []
+
+    other.upsert(
+        "URL2",
+        "VERSION1",
+        [PRODUCT],
+        {"CVE-2": _cve("CVE-2")},
+        {PRODUCT: {"CVE-2"}})
+
+    assert list(other.cves([PRODUCT])) == [_cve("CVE-2")]
+    assert list(index.cves([PRODUCT])) == []
+    for table in ("cves", "feeds", "products"):
+        assert _count(other, table) == 1
+
+
+def test_cves_index_upsert_replaces_products(tmp_path):
+    index = DummyDependencyCVEIndex(tmp_path / "cves.db", "FINGERPRINT")
+    index.upsert(
+        "URL1",
+        "VERSION1",
+        [PRODUCT, OTHER],
+        {"CVE-1": _cve("CVE-1"),
+         "CVE-2": _cve("CVE-2")},
+        {PRODUCT: {"CVE-1", "CVE-2"},
+         OTHER: {"CVE-1"}})
+    index.upsert(
+        "URL2",
+        "VERSION1",
+        [PRODUCT],
+        {"CVE-3": _cve("CVE-3")},
+        {PRODUCT: {"CVE-3"}})
+    updated = dict(_cve("CVE-2"), description="updated")
+
+    index.upsert(
+        "URL1",
+        "VERSION2",
+        [PRODUCT],
+        {"CVE-2": updated},
+        {PRODUCT: {"CVE-2"}})
+
+    assert index.unindexed("URL1", "VERSION2", [PRODUCT, OTHER]) == [OTHER]
+    assert index.unindexed("URL2", "VERSION1", [PRODUCT]) == []
+    assert (
+        list(index.cves([PRODUCT]))
+        == [updated, _cve("CVE-3")])
+    # other products are kept until they are reindexed
+    assert (
+        list(index.cves([OTHER]))
+        == [_cve("CVE-1")])
+
+    index.upsert("URL1", "VERSION2", [OTHER], {}, {})
+
+    assert index.unindexed("URL1", "VERSION2", [PRODUCT, OTHER]) == []
+    assert list(index.cves([OTHER])) == []
+    # unreferenced CVEs are removed
+    assert _count(index, "cves") == 2
+
+
+def test_cves_index_upsert_rollback(tmp_path):
+    index = DummyDependencyCVEIndex(tmp_path / "cves.db", "FINGERPRINT")
+    index.upsert(
+        "URL1",
+        "VERSION1",
+        [PRODUCT],
+        {"CVE-1": _cve("CVE-1")},
+        {PRODUCT: {"CVE-1"}})
+    unserializable = MagicMock()
+
+    with pytest.raises(TypeError):
+        index.upsert(
+            "URL1",
+            "VERSION2",
+            [PRODUCT],
+            {"CVE-2": unserializable},
+            {PRODUCT: {"CVE-2"}})
+
+    assert index.unindexed("URL1", "VERSION1", [PRODUCT]) == []
+    assert index.unindexed("URL1", "VERSION2", [PRODUCT]) == [PRODUCT]
+    assert (
+        list(index.cves([PRODUCT]))
+        == [_cve("CVE-1")])
+
+
+def test_cves_index_cves_json(tmp_path):
+    index = DummyDependencyCVEIndex(tmp_path / "cves.db", "FINGERPRINT")
+    index.upsert(
+        "URL1",
+        "VERSION1",
+        [PRODUCT],
+        {"CVE-1": _cve("CVE-1")},
+        {PRODUCT: {"CVE-1"}})
+    connection = sqlite3.connect(tmp_path / "cves.db")
+    assert (
+        json.loads(
+            connection.execute("SELECT data FROM cves").fetchone()[0])
+        == _cve("CVE-1"))
@@ -1,10 +1,16 @@
 
+import hashlib
+import tracemalloc
 from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 import pytest
 
 from packaging import version
 
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
 import gidgethub
 
 import abstracts
@@ -21,29 +27,6 @@ class DummyDependencyGithubRelease:
     pass
 
 
-def test_hash_file_data(patches):
-    patched = patches(
-        "hashlib",
-        "str",
-        prefix="envoy.dependency.check.abstract.release")
-    data = MagicMock()
-
-    with patched as (m_hashlib, m_str):
-        assert (
-            DummyDependencyGithubRelease.hash_file_data(data)
-            == m_str.return_value)
-
-    assert (
-        m_str.call_args
-        == [(m_hashlib.sha256.return_value.hexdigest.return_value, ), {}])
-    assert (
-        m_hashlib.sha256.call_args
-        == [(), {}])
-    assert (
-        m_hashlib.sha256.return_value.update.call_args
-        == [(data, ), {}])
-
-
 @pytest.mark.parametrize("asset_url", [None, "", "ASSET_URL"])
 @pytest.mark.parametrize("loop", [None, "", "LOOP"])
 @pytest.mark.parametrize("pool", [None, "", "POOL"])
@@ -69,9 +52,9 @@ def test_release_constructor(asset_url, loop, pool, gh_release):
     assert "tag_name" not in release.__dict__
     assert isinstance(release, event.IReactive)
     assert (
-        release.min_data_size_to_hash_in_proc
-        == check.abstract.release.MIN_DATA_SIZE_TO_HASH_IN_PROC)
-    assert "min_data_size_to_hash_in_proc" not in release.__dict__
+        release.min_data_size_to_hash_in_thread
+        == check.abstract.release.MIN_DATA_SIZE_TO_HASH_IN_THREAD)
+    assert "min_data_size_to_hash_in_thread" not in release.__dict__
 
 
 @pytest.mark.parametrize(
@@ -277,7 +260,7 @@ async def test_release_sha(patches, asset_url):
         "logger",
         ("ADependencyGithubRelease.session",
          dict(new_callable=PropertyMock)),
-        "ADependencyGithubRelease._hash_file_data",
+        "ADependencyGithubRelease._hash_response",
         prefix="envoy.dependency.check.abstract.release")
     result = None
     e = None
@@ -310,12 +293,9 @@ async def test_release_sha(patches, asset_url):
         m_log.debug.call_args
         == [(f"SHA download: {kwargs['asset_url']}", ),
             {}])
-    assert (
-        get.return_value.read.call_args
-        == [(), {}])
     assert (
         m_hash.call_args
-        == [(get.return_value.read.return_value, ), {}])
+        == [(get.return_value, ), {}])
     assert (
         getattr(
             release,
@@ -478,11 +458,11 @@ def test_release_version(patches, raises):
 
 @pytest.mark.parametrize("min_len", range(0, 5))
 @pytest.mark.parametrize("data_len", range(0, 5))
-def test_release_should_hash_in_proc(patches, min_len, data_len):
+def test_release_should_hash_in_thread(patches, min_len, data_len):
     release = DummyDependencyGithubRelease("REPO", "VERSION")
     patched = patches(
         "len",
-        ("ADependencyGithubRelease.min_data_size_to_hash_in_proc",
+        ("ADependencyGithubRelease.min_data_size_to_hash_in_thread",
          dict(new_callable=PropertyMock)),
         prefix="envoy.dependency.check.abstract.release")
     data = MagicMock()
@@ -491,16 +471,22 @@ def test_release_should_hash_in_proc(patches, min_len, data_len):
         m_len.return_value = data_len
         m_min.return_value = min_len
         assert (
-            release.should_hash_in_proc(data)
-            == (data_len > min_len))
+            release.should_hash_in_thread(data)
+            == (data_len >= min_len))
 
     assert (
         m_len.call_args
         == [(data, ), {}])
 
 
-@pytest.mark.parametrize("in_proc", [True, False])
-async def test_release__hash_file_data(patches, in_proc):
+@pytest.mark.parametrize(
+    "chunks",
+    [[],
+     [b"A"],
+     [b"A" * 3, b"B" * 3],
+     [b"A" * 5, b"B", b"C" * 2, b"D" * 7, b"E"],
+     [b"A" * 4, b"B" * 4]])
+async def test_release__hash_response(patches, chunks):
     asset_url = MagicMock()
     release = DummyDependencyGithubRelease(
         "REPO",
@@ -509,12 +495,14 @@ async def test_release__hash_file_data(patches, in_proc):
     patched = patches(
         "logger",
         "time",
-        ("ADependencyGithubRelease.execute",
-         dict(new_callable=AsyncMock)),
-        "ADependencyGithubRelease.hash_file_data",
-        "ADependencyGithubRelease.should_hash_in_proc",
+        ("ADependencyGithubRelease.min_data_size_to_hash_in_thread",
+         dict(new_callable=PropertyMock)),
         prefix="envoy.dependency.check.abstract.release")
-    data = MagicMock()
+    response = MagicMock()
+
+    async def iter_chunked(size):
+        for chunk in chunks:
+            yield chunk
 
     class Time:
         called = False
@@ -526,34 +514,57 @@ async def test_release__hash_file_data(patches, in_proc):
             return .02323232323
 
     time = Time()
+    response.content.iter_chunked.side_effect = iter_chunked
+    expected = hashlib.sha256(b"".join(chunks)).hexdigest()
 
-    with patched as (m_log, m_time, m_execute, m_hash, m_in_proc):
-        m_in_proc.return_value = in_proc
+    with patched as (m_log, m_time, m_min):
+        m_min.return_value = 4
         m_time.perf_counter.side_effect = time.perf_counter
-        assert (
-            await release._hash_file_data(data)
-            == (m_execute.return_value
-                if in_proc
-                else m_hash.return_value))
+        assert await release._hash_response(response) == expected
 
     assert (
-        m_in_proc.call_args
-        == [(data, ), {}])
-    assert (
-        m_time.perf_counter.call_args_list
-        == [[(), {}], [(), {}]])
-    if in_proc:
-        fork = " (fork: True)"
-        assert not m_hash.called
-        assert (
-            m_execute.call_args
-            == [(m_hash, data), {}])
-    else:
-        fork = ""
-        assert not m_execute.called
-        assert (
-            m_hash.call_args
-            == [(data, ), {}])
+        response.content.iter_chunked.call_args
+        == [(check.abstract.release.SHA_CHUNK_SIZE, ), {}])
+    threaded = len(b"".join(chunks)) >= 4
     assert (
         m_log.debug.call_args
-        == [(f"SHA parsed in 0.055s{fork}: {asset_url}", ), {}])
+        == [("SHA parsed in 0.055s"
+             f"{' (threaded: True)' if threaded else ''}: {asset_url}", ),
+            {}])
+
+
+async def test_release_sha_streamed():
+    chunk = b"X" * 2 ** 16
+    count = 2 ** 9
+    expected = hashlib.sha256(chunk * 8)
+
+    async def handler(request):
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for _ in range(0, count):
+            await response.write(chunk)
+        return response
+
+    for _ in range(1, count // 8):
+        expected.update(chunk * 8)
+    app = web.Application()
+    app.router.add_get("/asset.tar.gz", handler)
+
+    async with TestServer(app) as server:
+        async with aiohttp.ClientSession() as session:
+            repo = MagicMock()
+            repo.github.session = session
+            release = DummyDependencyGithubRelease(
+                repo,
+                "VERSION",
+                asset_url=str(server.make_url("/asset.tar.gz")))
+            tracemalloc.start()
+            try:
+                sha = await release.sha
+                _current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+    assert sha == expected.hexdigest()
+    # The asset is 32MiB, but only a few MiB are held at any time.
+    assert peak < 8 * 2 ** 20
@@ -171,6 +171,8 @@ def test_checker_cves_constructor(patches, config):
     assert "cpe_class" not in cves.__dict__
     assert cves.cve_class == check.DependencyCVE
     assert "cve_class" not in cves.__dict__
+    assert cves.cve_index_class == check.DependencyCVEIndex
+    assert "cve_index_class" not in cves.__dict__
     assert cves.nist_downloader_class == nist.NISTDownloader
     assert "nist_downloader_class" not in cves.__dict__
 
@@ -201,3 +203,18 @@ def test_checker_cve_constructor(patches):
     assert (
         m_super.call_args
         == [("CVE_DATA", "TRACKED CPES"), {}])
+
+
+def test_checker_cve_index_constructor(patches):
+    patched = patches(
+        "check.ADependencyCVEIndex.__init__",
+        prefix="envoy.dependency.check.checker")
+
+    with patched as (m_super, ):
+        m_super.return_value = None
+        index = check.DependencyCVEIndex("PATH", "FINGERPRINT")
+
+    assert isinstance(index, check.ADependencyCVEIndex)
+    assert (
+        m_super.call_args
+        == [("PATH", "FINGERPRINT"), {}])
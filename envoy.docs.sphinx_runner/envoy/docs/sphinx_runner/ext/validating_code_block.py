@@ -1,17 +1,24 @@
 
 import os
-from functools import cached_property
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 from docutils.parsers.rst import directives
 
-from google.protobuf.json_format import ParseError
-
 from sphinx.application import Sphinx
 from sphinx.directives.code import CodeBlock
 from sphinx.errors import ExtensionError
 
-from envoy.base.utils import interface, from_yaml, ProtobufValidator
+from envoy.base.utils import (
+    interface, from_yaml, ProtobufValidationCache, ProtobufValidator)
+
+
+@lru_cache
+def load_configs(config_path: Optional[str]) -> Dict:
+    _configs = dict(skip_validation=False)
+    if config_path:
+        _configs.update(from_yaml(config_path))
+    return _configs
 
 
 class ValidatingCodeBlock(CodeBlock):
@@ -21,6 +28,9 @@ class ValidatingCodeBlock(CodeBlock):
     type. An ExtensionError is raised on validation failure. Validation
     will be skipped if SPHINX_SKIP_CONFIG_VALIDATION environment
     variable is set.
+
+    If a `validation_cache` directory is configured, validation results
+    are cached there, and only changed fragments are validated.
     """
     has_content = True
     required_arguments = CodeBlock.required_arguments
@@ -29,20 +39,26 @@ class ValidatingCodeBlock(CodeBlock):
     option_spec = {"type-name": directives.unchanged}  # type:ignore
     option_spec.update(CodeBlock.option_spec)
 
-    @cached_property
+    @property
     def configs(self) -> Dict:
-        _configs = dict(skip_validation=False)
-        if config_path := os.environ.get("ENVOY_DOCS_BUILD_CONFIG"):
-            _configs.update(from_yaml(config_path))
-        return _configs
+        return load_configs(os.environ.get("ENVOY_DOCS_BUILD_CONFIG"))
 
     @property
     def skip_validation(self) -> bool:
         return bool(self.configs["skip_validation"])
 
-    @cached_property
+    @property
     def proto_validator(self) -> interface.IProtobufValidator:
-        return ProtobufValidator(self.configs["descriptor_path"])
+        return ProtobufValidator.for_descriptor(
+            self.configs["descriptor_path"])
+
+    @property
+    def validation_cache(
+            self) -> Optional[interface.IProtobufValidationCache]:
+        return (
+            ProtobufValidationCache(self.configs["validation_cache"])
+            if self.configs.get("validation_cache")
+            else None)
 
     def run(self) -> List:
         source, line = self.state_machine.get_source_and_line(self.lineno)
@@ -58,19 +74,46 @@ class ValidatingCodeBlock(CodeBlock):
         return list(super().run())
 
     def _validate(self, source: str, line: int) -> None:
-        try:
-            self.proto_validator.validate_yaml(
-                '\n'.join(self.content),
-                self.options.get('type-name'))
-        except (ParseError, KeyError):
+        fragment = '\n'.join(self.content)
+        type_name = self.options.get('type-name')
+        cache = self.validation_cache
+        key = (
+            cache.key(
+                self.proto_validator.descriptor_hash,
+                type_name,
+                fragment)
+            if cache
+            else "")
+        error = (
+            cache.get(key)
+            if cache
+            else None)
+        if error is None:
+            error = self.proto_validator.validation_error(fragment, type_name)
+            if cache:
+                cache.set(key, error)
+        if error:
             raise ExtensionError(
                 "Failed config validation for type: "
                 f"'{self.options.get('type-name')}' in: {source} line: "
                 f"{line}")
 
 
+def preload_validator(app: Sphinx) -> None:
+    """Parse the descriptor set before Sphinx forks any parallel readers,
+    so that they share the validator."""
+    configs = load_configs(os.environ.get("ENVOY_DOCS_BUILD_CONFIG"))
+    if configs["skip_validation"] or "descriptor_path" not in configs:
+        return
+    validator = ProtobufValidator.for_descriptor(configs["descriptor_path"])
+    validator.descriptor_pool
+    if configs.get("validation_cache"):
+        validator.descriptor_hash
+
+
 def setup(app: Sphinx) -> Dict:
     app.add_directive("validated-code-block", ValidatingCodeBlock)
+    app.connect("builder-inited", preload_validator)
     return dict(
         version="0.1",
         parallel_read_safe=True,
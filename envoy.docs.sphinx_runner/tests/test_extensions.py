@@ -5,8 +5,6 @@ import pytest
 
 from docutils.parsers.rst import directives
 
-from google.protobuf.json_format import ParseError
-
 from sphinx.directives.code import CodeBlock
 from sphinx.errors import ExtensionError
 
@@ -55,6 +53,93 @@ def test_ext_validating_code_block_setup(patches):
     assert (
         app.add_directive.call_args
         == [("validated-code-block", m_block), {}])
+    assert (
+        app.connect.call_args
+        == [("builder-inited",
+             ext.validating_code_block.preload_validator),
+            {}])
+
+
+@pytest.mark.parametrize("config_path", [True, False])
+def test_ext_validating_code_block_load_configs(patches, config_path):
+    patched = patches(
+        "dict",
+        "from_yaml",
+        prefix="envoy.docs.sphinx_runner.ext.validating_code_block")
+    config = MagicMock() if config_path else None
+    load_configs = ext.validating_code_block.load_configs
+
+    with patched as (m_dict, m_yaml):
+        assert (
+            load_configs.__wrapped__(config)
+            == m_dict.return_value)
+
+    assert (
+        m_dict.call_args
+        == [(), dict(skip_validation=False)])
+    if config_path:
+        assert (
+            m_dict.return_value.update.call_args
+            == [(m_yaml.return_value, )])
+        assert (
+            m_yaml.call_args
+            == [(config, ), {}])
+    else:
+        assert not m_dict.return_value.update.called
+        assert not m_yaml.called
+
+
+def test_ext_validating_code_block_load_configs_cached(tmp_path):
+    load_configs = ext.validating_code_block.load_configs
+    config_path = tmp_path.joinpath("config.yaml")
+    config_path.write_text("descriptor_path: DESCRIPTOR_PATH\n")
+    configs = load_configs(str(config_path))
+    assert (
+        configs
+        == dict(
+            skip_validation=False,
+            descriptor_path="DESCRIPTOR_PATH"))
+    config_path.unlink()
+    assert load_configs(str(config_path)) is configs
+
+
+@pytest.mark.parametrize("skip_validation", [True, False])
+@pytest.mark.parametrize("descriptor_path", [True, False])
+@pytest.mark.parametrize("cache", [True, False])
+def test_ext_validating_code_block_preload_validator(
+        patches, skip_validation, descriptor_path, cache):
+    patched = patches(
+        "os",
+        "load_configs",
+        "ProtobufValidator",
+        prefix="envoy.docs.sphinx_runner.ext.validating_code_block")
+    configs = dict(skip_validation=skip_validation)
+    if descriptor_path:
+        configs["descriptor_path"] = "DESCRIPTOR_PATH"
+    if cache:
+        configs["validation_cache"] = "CACHE_PATH"
+    app = MagicMock()
+    hashed = PropertyMock()
+
+    with patched as (m_os, m_configs, m_valid):
+        m_configs.return_value = configs
+        validator = m_valid.for_descriptor.return_value
+        type(validator).descriptor_hash = hashed
+        assert not ext.validating_code_block.preload_validator(app)
+
+    assert (
+        m_configs.call_args
+        == [(m_os.environ.get.return_value, ), {}])
+    assert (
+        m_os.environ.get.call_args
+        == [("ENVOY_DOCS_BUILD_CONFIG", ), {}])
+    if skip_validation or not descriptor_path:
+        assert not m_valid.for_descriptor.called
+        return
+    assert (
+        m_valid.for_descriptor.call_args
+        == [("DESCRIPTOR_PATH", ), {}])
+    assert hashed.called == cache
 
 
 def test_ext_validating_code_block_vbc_constructor():
@@ -69,39 +154,25 @@ def test_ext_validating_code_block_vbc_constructor():
     assert vbc.option_spec == option_spec
 
 
-@pytest.mark.parametrize("config_path", [True, False])
-def test_ext_validating_code_block_vbc_configs(patches, config_path):
+def test_ext_validating_code_block_vbc_configs(patches):
     vbc = DummyValidatingCodeBlock()
     patched = patches(
-        "dict",
         "os",
-        "from_yaml",
+        "load_configs",
         prefix="envoy.docs.sphinx_runner.ext.validating_code_block")
-    config = MagicMock() if config_path else None
 
-    with patched as (m_dict, m_os, m_yaml):
-        m_os.environ.get.return_value = config
+    with patched as (m_os, m_configs):
         assert (
             vbc.configs
-            == m_dict.return_value)
+            == m_configs.return_value)
 
     assert (
-        m_dict.call_args
-        == [(), dict(skip_validation=False)])
+        m_configs.call_args
+        == [(m_os.environ.get.return_value, ), {}])
     assert (
         m_os.environ.get.call_args
         == [("ENVOY_DOCS_BUILD_CONFIG", ), {}])
-    if config_path:
-        assert (
-            m_dict.return_value.update.call_args
-            == [(m_yaml.return_value, )])
-        assert (
-            m_yaml.call_args
-            == [(config, ), {}])
-    else:
-        assert not m_dict.return_value.update.called
-        assert not m_yaml.called
-    assert "configs" in vbc.__dict__
+    assert "configs" not in vbc.__dict__
 
 
 def test_ext_validating_code_block_vbc_skip_validation(patches):
@@ -137,15 +208,44 @@ def test_ext_validating_code_block_vbc_proto_validator(patches):
     with patched as (m_valid, m_configs):
         assert (
             vbc.proto_validator
-            == m_valid.return_value)
+            == m_valid.for_descriptor.return_value)
 
     assert (
-        m_valid.call_args
+        m_valid.for_descriptor.call_args
         == [(m_configs.return_value.__getitem__.return_value, ), {}])
     assert (
         m_configs.return_value.__getitem__.call_args
         == [("descriptor_path", ), {}])
-    assert "proto_validator" in vbc.__dict__
+    assert "proto_validator" not in vbc.__dict__
+
+
+@pytest.mark.parametrize("cache_path", [None, "", "CACHE_PATH"])
+def test_ext_validating_code_block_vbc_validation_cache(patches, cache_path):
+    vbc = DummyValidatingCodeBlock()
+    patched = patches(
+        "ProtobufValidationCache",
+        ("ValidatingCodeBlock.configs",
+         dict(new_callable=PropertyMock)),
+        prefix="envoy.docs.sphinx_runner.ext.validating_code_block")
+    configs = dict(skip_validation=False)
+    if cache_path is not None:
+        configs["validation_cache"] = cache_path
+
+    with patched as (m_cache, m_configs):
+        m_configs.return_value = configs
+        assert (
+            vbc.validation_cache
+            == (m_cache.return_value
+                if cache_path
+                else None))
+
+    if cache_path:
+        assert (
+            m_cache.call_args
+            == [(cache_path, ), {}])
+    else:
+        assert not m_cache.called
+    assert "validation_cache" not in vbc.__dict__
 
 
 @pytest.mark.parametrize("type_name", [None, "TYPENAME"])
@@ -210,42 +310,68 @@ def test_ext_validating_code_block_vbc_run(
         == [(), {}])
 
 
-@pytest.mark.parametrize("raises", [None, ParseError, KeyError, Exception])
-def test_ext_validating_code_block_vbc__validate(iters, patches, raises):
+@pytest.mark.parametrize("cache", [True, False])
+@pytest.mark.parametrize("cached", [None, "", "CACHED ERROR"])
+@pytest.mark.parametrize("error", ["", "AN ERROR OCCURRED"])
+def test_ext_validating_code_block_vbc__validate(
+        iters, patches, cache, cached, error):
     vbc = DummyValidatingCodeBlock()
     patched = patches(
         ("ValidatingCodeBlock.proto_validator",
          dict(new_callable=PropertyMock)),
+        ("ValidatingCodeBlock.validation_cache",
+         dict(new_callable=PropertyMock)),
         prefix="envoy.docs.sphinx_runner.ext.validating_code_block")
     source = MagicMock()
     line = MagicMock()
     vbc.content = iters()
     vbc.options = MagicMock()
-
-    with patched as (m_valid, ):
-        if raises:
-            m_valid.return_value.validate_yaml.side_effect = raises(
-                "AN ERROR OCCURRED")
-
-        if raises == Exception:
-            with pytest.raises(Exception):
-                vbc._validate(source, line)
-        elif raises:
+    fragment = "\n".join(vbc.content)
+    type_name = vbc.options.get.return_value
+    validated = not cache or cached is None
+    failed = (
+        error
+        if validated
+        else cached)
+
+    with patched as (m_valid, m_cache):
+        if not cache:
+            m_cache.return_value = None
+        else:
+            m_cache.return_value.get.return_value = cached
+        m_valid.return_value.validation_error.return_value = error
+        if failed:
             with pytest.raises(ExtensionError) as e:
                 vbc._validate(source, line)
         else:
             assert not vbc._validate(source, line)
 
     assert (
-        m_valid.return_value.validate_yaml.call_args
-        == [("\n".join(vbc.content),
-             vbc.options.get.return_value), {}])
-    assert (
-        vbc.options.get.call_args
+        vbc.options.get.call_args_list[0]
         == [("type-name", ), {}])
-    if raises and not raises == Exception:
+    if cache:
+        assert (
+            m_cache.return_value.key.call_args
+            == [(m_valid.return_value.descriptor_hash,
+                 type_name,
+                 fragment), {}])
+        assert (
+            m_cache.return_value.get.call_args
+            == [(m_cache.return_value.key.return_value, ), {}])
+    if not validated:
+        assert not m_valid.return_value.validation_error.called
+        assert not m_cache.return_value.set.called
+    else:
+        assert (
+            m_valid.return_value.validation_error.call_args
+            == [(fragment, type_name), {}])
+    if validated and cache:
+        assert (
+            m_cache.return_value.set.call_args
+            == [(m_cache.return_value.key.return_value, error), {}])
+    if failed:
         assert (
             e.value.args[0]
             == ("Failed config validation for type: "
-                f"'{vbc.options.get.return_value}' in: {source} line: "
+                f"'{type_name}' in: {source} line: "
                 f"{line}"))
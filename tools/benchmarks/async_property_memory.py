@@ -0,0 +1,56 @@
+"""Benchmark memory use when short-lived instances load cached async
+properties.
+
+Memory should stay flat as instances are created and discarded, ie the
+`async_property` loader registry should not keep them alive.
+"""
+
+import argparse
+import asyncio
+import gc
+import sys
+import tracemalloc
+
+from aio.core.functional import async_property
+
+
+class Item:
+
+    def __init__(self, i: int) -> None:
+        self.data = bytes(1024)
+        self.i = i
+
+    @async_property(cache=True)
+    async def prop(self) -> int:
+        await asyncio.sleep(0)
+        return self.i
+
+
+async def run(args: argparse.Namespace) -> None:
+    tracemalloc.start()
+    baseline = None
+    for round_ in range(1, args.rounds + 1):
+        for i in range(0, args.instances):
+            await Item(i).prop
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        if baseline is None:
+            baseline = current
+        print(
+            f"round {round_:3}: "
+            f"{round_ * args.instances:8} instances, "
+            f"current {current / 1024:10.1f}KiB "
+            f"({(current - baseline) / 1024:+.1f}KiB), "
+            f"peak {peak / 1024:10.1f}KiB")
+    tracemalloc.stop()
+
+
+def main(*args: str) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--instances", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    asyncio.run(run(parser.parse_args(args)))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
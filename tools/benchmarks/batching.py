@@ -0,0 +1,99 @@
+"""Benchmark fixed vs weighted batching of `grep` over a skewed tree.
+
+The tree has many small files, and a few huge (eg generated) files that
+sort next to each other, so that the fixed split puts them in the same
+batch.
+
+Weighted batching can only help where there is more than one batch, ie
+where there are more jobs than `GREP_MIN_BATCH_SIZE` and more than one
+cpu.
+"""
+
+import argparse
+import asyncio
+import pathlib
+import sys
+import tempfile
+import time
+from concurrent import futures
+from functools import partial
+from typing import List, Type
+
+from aio.core import directory
+
+
+GREP_ARGS = ("-E", "-l", "(ab|cd)+[0-9]{3}x$")
+LINE = b"abcdabcd0123456789 some text that does not match\n"
+
+
+class FixedDirectory(directory.Directory):
+    """Directory that batches `grep` targets with a fixed split."""
+
+    def _batched_grep(self, grep_args, paths):
+        return self.execute_in_batches(
+            partial(self.finder, *grep_args),
+            *paths,
+            min_batch_size=self.grep_min_batch_size,
+            max_batch_size=self.grep_max_batch_size)
+
+
+def make_tree(path: pathlib.Path, args: argparse.Namespace) -> List[str]:
+    small = LINE * (args.small_size // len(LINE) + 1)
+    huge = LINE * (args.huge_size // len(LINE) + 1)
+    files = []
+    for i in range(0, args.huge):
+        files.append(f"generated_{i:04}.txt")
+        path.joinpath(files[-1]).write_bytes(huge)
+    for i in range(0, args.small):
+        files.append(f"source_{i:06}.txt")
+        path.joinpath(files[-1]).write_bytes(small)
+    return files
+
+
+async def time_grep(
+        directory_class: Type[directory.ADirectory],
+        path: pathlib.Path,
+        files: List[str],
+        pool: futures.Executor,
+        runs: int) -> List[float]:
+    grep_directory = directory_class(
+        path,
+        loop=asyncio.get_running_loop(),
+        pool=pool)
+    timings = []
+    for _ in range(0, runs):
+        start = time.perf_counter()
+        await grep_directory.grep(GREP_ARGS, files)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def run(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir)
+        files = make_tree(path, args)
+        with futures.ProcessPoolExecutor() as pool:
+            strategies = (
+                ("fixed", FixedDirectory),
+                ("weighted", directory.Directory))
+            for name, directory_class in strategies:
+                timings = await time_grep(
+                    directory_class, path, files, pool, args.runs)
+                print(
+                    f"{name}: "
+                    f"best {min(timings):.3f}s, "
+                    f"mean {sum(timings) / len(timings):.3f}s")
+
+
+def main(*args: str) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--small", type=int, default=4000)
+    parser.add_argument("--small-size", type=int, default=2_000)
+    parser.add_argument("--huge", type=int, default=8)
+    parser.add_argument("--huge-size", type=int, default=20_000_000)
+    parser.add_argument("--runs", type=int, default=3)
+    asyncio.run(run(parser.parse_args(args)))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,92 @@
+"""Benchmark handing NIST CVE feeds to, and parsed data back from, parser
+worker processes.
+
+Compares passing the feed bytes in, with passing a feed path in. Parse
+results are pickled back from the workers in both cases.
+"""
+
+import argparse
+import pathlib
+import pickle
+import sys
+import tempfile
+import time
+import timeit
+from concurrent import futures
+from typing import Any, Callable, Dict
+
+from packaging import version
+
+from aio.api import nist
+
+from benchmarks.nist_parser import cpe, make_feed
+
+
+def timed(fun: Callable, *args: Any) -> float:
+    return min(timeit.repeat(lambda: fun(*args), number=1, repeat=7))
+
+
+def handoff(parser: nist.NISTParser, data: bytes) -> None:
+    parsed = parser(data)
+    pickled = pickle.dumps(parsed)
+    print(
+        f"pickle: {len(pickled) / 2 ** 20:.2f}MiB, "
+        f"dumps {timed(pickle.dumps, parsed):.3f}s, "
+        f"loads {timed(pickle.loads, pickled):.3f}s")
+
+
+def pooled(
+        args: argparse.Namespace,
+        parser: nist.NISTParser,
+        data: bytes) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir).joinpath("feed.json.gz")
+        path.write_bytes(data)
+        with futures.ProcessPoolExecutor(args.workers) as pool:
+            # Start the workers before timing.
+            list(pool.map(abs, range(0, args.workers)))
+            for name, source in (("bytes", data), ("path", path)):
+                start = time.perf_counter()
+                results = [
+                    pool.submit(parser, source)
+                    for _
+                    in range(0, args.feeds)]
+                for result in futures.as_completed(results):
+                    result.result()
+                print(
+                    f"{name}: {args.feeds} feeds, {args.workers} workers, "
+                    f"{time.perf_counter() - start:.2f}s")
+
+
+def run(args: argparse.Namespace) -> None:
+    data = make_feed(args)
+    tracked_cpes: Dict = {
+        cpe(i): dict(version=version.Version("2.0"), date="2020-01-01")
+        for i
+        in range(0, args.tracked)}
+    print(
+        f"{args.items} items, {len(data) / 2 ** 20:.1f}MiB gzipped, "
+        f"{args.tracked}/{args.vendors} vendors tracked")
+    parser = nist.NISTParser(tracked_cpes)
+    handoff(parser, data)
+    if args.feeds:
+        pooled(args, parser, data)
+
+
+def main(*args: str) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--vendors", type=int, default=200)
+    parser.add_argument("--tracked", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=23)
+    parser.add_argument(
+        "--feeds",
+        type=int,
+        default=0,
+        help="Also time parsing this many feeds in a process pool")
+    parser.add_argument("--workers", type=int, default=4)
+    run(parser.parse_args(args))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
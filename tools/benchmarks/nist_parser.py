@@ -0,0 +1,126 @@
+"""Benchmark parsing a synthetic NIST CVE feed, with and without streaming
+and pre-filtering of CVE items by tracked CPE.
+
+Only a small fraction of the CVE items reference tracked CPEs, as is the
+case for real feeds.
+"""
+
+import argparse
+import gzip
+import io
+import json
+import random
+import re
+import sys
+import time
+from typing import Dict, Iterator, List, Pattern
+
+from packaging import version
+
+from aio.api import nist
+
+
+class UnfilteredNISTParser(nist.NISTParser):
+    """Streaming parser that does not pre-filter CVE items."""
+
+    @property
+    def tracked_cpe_re(self) -> Pattern[str]:
+        return re.compile("")
+
+
+def cpe(i: int) -> str:
+    return f"cpe:2.3:a:vendor{i}:product{i}:*"
+
+
+def cve_item(i: int, args: argparse.Namespace) -> Dict:
+    vendors = random.sample(range(0, args.vendors), random.randint(1, 5))
+    return {
+        "cve": {
+            "CVE_data_meta": {"ID": f"CVE-2021-{i}"},
+            "description": {
+                "description_data": [
+                    {"lang": "en", "value": "x" * random.randint(100, 800)}]},
+            "references": {
+                "reference_data": [
+                    {"url": f"https://example.com/{i}/{j}", "tags": ["Patch"]}
+                    for j in range(0, random.randint(1, 10))]}},
+        "configurations": {
+            "nodes": [
+                {"operator": "OR",
+                 "cpe_match": [
+                     {"vulnerable": True,
+                      "cpe23Uri": f"{cpe(vendor)}:*:*:*:*:*:*:*",
+                      "versionEndExcluding": f"{random.randint(1, 3)}.0"}
+                     for vendor
+                     in vendors]}]},
+        "impact": {
+            "baseMetricV3": (
+                {"cvssV3": {"baseScore": 7.5}}
+                if i % 3
+                else {})},
+        "publishedDate": "2021-01-01T00:00Z",
+        "lastModifiedDate": "2021-02-01T00:00Z"}
+
+
+def make_feed(args: argparse.Namespace) -> bytes:
+    random.seed(args.seed)
+    output = io.BytesIO()
+    with gzip.open(output, "wt", compresslevel=6) as feed:
+        feed.write('{"CVE_data_type": "CVE", "CVE_Items": [')
+        for i in range(0, args.items):
+            if i:
+                feed.write(", ")
+            feed.write(json.dumps(cve_item(i, args)))
+        feed.write("]}")
+    return output.getvalue()
+
+
+def parsers(
+        tracked_cpes: Dict,
+        names: List[str]) -> Iterator[tuple]:
+    classes = dict(
+        full=(nist.NISTParser, dict(stream=False)),
+        stream=(UnfilteredNISTParser, {}),
+        prefilter=(nist.NISTParser, {}))
+    for name in names:
+        parser_class, kwargs = classes[name]
+        yield name, parser_class(tracked_cpes, **kwargs)
+
+
+def run(args: argparse.Namespace) -> None:
+    data = make_feed(args)
+    tracked_cpes = {
+        cpe(i): dict(version=version.Version("2.0"), date="2020-01-01")
+        for i
+        in range(0, args.tracked)}
+    print(
+        f"{args.items} items, {len(data) / 2 ** 20:.1f}MiB gzipped, "
+        f"{args.tracked}/{args.vendors} vendors tracked")
+    results = {}
+    for name, parser in parsers(tracked_cpes, args.parsers):
+        start = time.perf_counter()
+        cves, cpe_revmap = parser(data)
+        print(
+            f"{name}: {time.perf_counter() - start:.2f}s, "
+            f"{len(cves)} CVEs matched")
+        results[name] = (sorted(cves), cpe_revmap)
+    if len(set(json.dumps(r, default=sorted) for r in results.values())) > 1:
+        raise SystemExit("Parser results differ!")
+
+
+def main(*args: str) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--vendors", type=int, default=5_000)
+    parser.add_argument("--tracked", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=23)
+    parser.add_argument(
+        "--parsers",
+        nargs="+",
+        choices=("full", "stream", "prefilter"),
+        default=("full", "stream", "prefilter"))
+    run(parser.parse_args(args))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
@@ -0,0 +1,177 @@
+"""Benchmark validation throughput of YAML config fragments against the
+Envoy API protos.
+
+Compares the previous path (`SafeLoader`, and a JSON round-trip into
+`json_format.Parse`), with parsing the loaded fragment directly with
+`json_format.ParseDict`, using `SafeLoader` and `CSafeLoader`.
+
+Requires a descriptor set of the Envoy API protos, and a corpus of
+fragments, either YAML files of bootstrap configs, or RST files with
+`validated-code-block` directives.
+"""
+
+import argparse
+import json
+import pathlib
+import re
+import sys
+import time
+from functools import cached_property
+from typing import Callable, Iterator, List, Tuple
+
+from google.protobuf import json_format
+
+from envoy.base import utils
+from envoy.base.utils.abstract.protobuf import BOOTSTRAP_PROTO
+from envoy.base.utils.yaml import EnvoyYaml, fast_envoy_yaml
+
+
+CORPUS = pathlib.Path(__file__).parent.joinpath("protobuf_corpus")
+VALIDATED_CODE_BLOCK_RE = re.compile(
+    r"^( *)\.\. validated-code-block:: yaml\n"
+    r"(?:\1 +:(?!type-name).*\n)*"
+    r"\1 +:type-name: (\S+)\n"
+    r"(?:\1 +:.*\n)*"
+    r"\n"
+    r"((?:\1 +.*\n|\n)+)",
+    re.MULTILINE)
+
+
+class JSONProtobufValidator(utils.ProtobufValidator):
+    """Validator that round-trips fragments through JSON."""
+
+    @cached_property
+    def yaml_loader(self):
+        return EnvoyYaml()
+
+    def validate_fragment(
+            self,
+            fragment: str,
+            type_name: str = BOOTSTRAP_PROTO) -> None:
+        json_format.Parse(
+            json.dumps(fragment, skipkeys=True),
+            self.message(type_name),
+            descriptor_pool=self.descriptor_pool)
+
+
+class SafeLoaderProtobufValidator(utils.ProtobufValidator):
+    """Validator that uses `ParseDict`, but not `CSafeLoader`."""
+
+    @cached_property
+    def yaml_loader(self):
+        return EnvoyYaml()
+
+
+def rst_fragments(text: str) -> Iterator[Tuple[str, str]]:
+    for match in VALIDATED_CODE_BLOCK_RE.finditer(text):
+        indent, type_name, content = match.groups()
+        lines = content.rstrip().split("\n")
+        margin = min(
+            len(line) - len(line.lstrip())
+            for line
+            in lines
+            if line.strip())
+        yield "\n".join(line[margin:] for line in lines), type_name
+
+
+def load_corpus(args: argparse.Namespace) -> List[Tuple[str, str]]:
+    fragments: List[Tuple[str, str]] = []
+    for path in sorted(pathlib.Path(args.corpus).glob("**/*")):
+        if path.suffix in (".yaml", ".yml"):
+            fragments.append((path.read_text(), args.type_name))
+        elif path.suffix == ".rst":
+            fragments.extend(rst_fragments(path.read_text()))
+    return fragments
+
+
+def throughput(
+        name: str,
+        fun: Callable[[str, str], object],
+        fragments: List[Tuple[str, str]],
+        args: argparse.Namespace) -> float:
+    timings = []
+    for _ in range(0, args.repeat):
+        start = time.perf_counter()
+        for fragment, type_name in fragments:
+            fun(fragment, type_name)
+        timings.append(time.perf_counter() - start)
+    rate = len(fragments) / min(timings)
+    print(f"{name}: {rate:,.0f} fragments/s")
+    return rate
+
+
+def run(args: argparse.Namespace) -> None:
+    fragments = load_corpus(args)
+    if not fragments:
+        raise SystemExit(f"No fragments found in: {args.corpus}")
+    fragments = fragments * max(1, args.fragments // len(fragments))
+    print(f"{len(fragments)} fragments from {args.corpus}")
+    validators = dict(
+        json=JSONProtobufValidator(args.descriptor_path),
+        dict=SafeLoaderProtobufValidator(args.descriptor_path),
+        fast=utils.ProtobufValidator(args.descriptor_path))
+    # Parse the descriptors and create message classes before timing.
+    errors = {
+        name: [
+            validator.validation_error(fragment, type_name)
+            for fragment, type_name
+            in fragments]
+        for name, validator
+        in validators.items()}
+    if len(set(map(tuple, errors.values()))) != 1:
+        raise SystemExit("Validation results differ!")
+    if invalid := sum(bool(error) for error in errors["fast"]):
+        print(f"{invalid} fragments fail validation")
+    loaded = [
+        (fast_envoy_yaml.safe_load(fragment), type_name)
+        for fragment, type_name
+        in fragments]
+    for name, envoy_yaml in (("SafeLoader", EnvoyYaml()),
+                             ("CSafeLoader", fast_envoy_yaml)):
+        throughput(
+            f"load/{name}",
+            lambda fragment, type_name: envoy_yaml.safe_load(fragment),
+            fragments,
+            args)
+    throughput(
+        "parse/json",
+        validators["json"].validate_fragment,
+        loaded,
+        args)
+    throughput(
+        "parse/dict",
+        validators["fast"].validate_fragment,
+        loaded,
+        args)
+    for name, validator in validators.items():
+        throughput(
+            f"validate/{name}",
+            validator.validation_error,
+            fragments,
+            args)
+
+
+def main(*args: str) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "descriptor_path",
+        help="Path to a descriptor set of the Envoy API protos")
+    parser.add_argument(
+        "--corpus",
+        default=str(CORPUS),
+        help="Directory of YAML and RST files to read fragments from")
+    parser.add_argument(
+        "--type-name",
+        default=BOOTSTRAP_PROTO,
+        help="Type to validate YAML files against")
+    parser.add_argument(
+        "--fragments",
+        type=int,
+        default=1000,
+        help="Repeat the corpus to validate at least this many fragments")
+    parser.add_argument("--repeat", type=int, default=5)
+    run(parser.parse_args(args))
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])